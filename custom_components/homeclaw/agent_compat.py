@@ -5,9 +5,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, AsyncGenerator
 
+from .const import (
+    CONF_FALLBACK_PROVIDERS,
+    CONF_RATE_LIMIT_RPM,
+    CONF_RATE_LIMIT_TPM,
+    CONF_ROUTER_HEDGE_DELAY,
+    CONF_ROUTER_LATENCY_BUDGET,
+    DOMAIN,
+)
 from .core.agent import Agent
 from .core.conversation import ConversationManager
-from .providers.registry import ProviderRegistry
+from .core.prompt_layout import current_time_section
+from .providers.registry import AIProvider, ProviderRegistry
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -81,6 +90,43 @@ class HomeclawAgent:
                 "✅ Fallback provider created: %s", self._provider.__class__.__name__
             )
 
+        self._provider = self._with_failover(self._provider)
+
+    def _with_failover(self, provider: AIProvider) -> AIProvider:
+        """Wrap the provider in a FailoverRouter if a fallback chain is configured.
+
+        Fallbacks are other configured entries, looked up by provider name
+        at request time.
+        """
+        fallbacks = self.config.get(CONF_FALLBACK_PROVIDERS) or []
+        if isinstance(fallbacks, str):
+            fallbacks = [name.strip() for name in fallbacks.split(",")]
+        fallbacks = [
+            name for name in fallbacks if name and name != self._provider_name
+        ]
+        if not fallbacks:
+            return provider
+
+        from .providers.router import FailoverRouter
+
+        def _resolve(name: str) -> AIProvider | None:
+            agent = self.hass.data.get(DOMAIN, {}).get("agents", {}).get(name)
+            return getattr(agent, "_provider", None)
+
+        _LOGGER.info(
+            "Provider failover chain: %s",
+            " -> ".join([self._provider_name, *fallbacks]),
+        )
+        return FailoverRouter(
+            self.hass,
+            self._provider_name,
+            provider,
+            fallbacks,
+            _resolve,
+            hedge_delay=self.config.get(CONF_ROUTER_HEDGE_DELAY),
+            latency_budget=self.config.get(CONF_ROUTER_LATENCY_BUDGET),
+        )
+
     def _get_base_provider_name(self) -> str:
         """Map OAuth provider names to base provider names.
 
@@ -146,6 +192,11 @@ class HomeclawAgent:
         if provider == "zai":
             config["endpoint_type"] = self.config.get("zai_endpoint", "general")
 
+        # Explicit account limits; otherwise learned from response headers
+        for key in (CONF_RATE_LIMIT_RPM, CONF_RATE_LIMIT_TPM):
+            if self.config.get(key):
+                config[key] = self.config[key]
+
         return config
 
     def _get_default_model(self, provider: str) -> str:
@@ -196,7 +247,7 @@ class HomeclawAgent:
             return None
 
         try:
-            from .function_calling import ToolSchemaConverter
+            from .core.tool_schema_cache import ToolSchemaCache
             from .tools import ToolRegistry
 
             tools = ToolRegistry.get_core_tools(
@@ -208,7 +259,7 @@ class HomeclawAgent:
                 _LOGGER.debug("No CORE tools available for native function calling")
                 return None
 
-            openai_tools = ToolSchemaConverter.to_openai_format(tools)
+            openai_tools = ToolSchemaCache.to_openai_format(tools)
             _LOGGER.debug(
                 "Retrieved %d CORE tools for native function calling "
                 "(ON_DEMAND tools available via load_tool)",
@@ -324,11 +375,12 @@ class HomeclawAgent:
             if rag_context:
                 kwargs["rag_context"] = rag_context
 
-        prompt = (
-            system_prompt_override
-            if system_prompt_override
-            else await self._get_system_prompt(user_id or "")
-        )
+        if system_prompt_override:
+            prompt = system_prompt_override
+        else:
+            prompt = await self._get_system_prompt(user_id or "")
+            # Kept out of the stable prompt so providers can cache its prefix
+            kwargs["volatile_prompt"] = current_time_section()
         if prompt:
             kwargs[prompt_key] = prompt
 
@@ -499,7 +551,7 @@ class HomeclawAgent:
         Returns:
             Full system prompt string.
         """
-        return await self._get_system_prompt(user_id)
+        return self._inject_current_time(await self._get_system_prompt(user_id))
 
     async def get_rag_context(
         self, query: str, user_id: str | None = None
@@ -660,7 +712,7 @@ class HomeclawAgent:
         Returns:
             List of tool IDs that were auto-loaded.
         """
-        from .function_calling import ToolSchemaConverter
+        from .core.tool_schema_cache import ToolSchemaCache
         from .tools.base import ToolRegistry
 
         query_lower = query.lower()
@@ -679,7 +731,7 @@ class HomeclawAgent:
             )
             if tool_instance is None:
                 continue
-            new_schemas = ToolSchemaConverter.to_openai_format([tool_instance])
+            new_schemas = ToolSchemaCache.to_openai_format([tool_instance])
             tools.extend(new_schemas)
             loaded.append(tool_id)
 
@@ -695,7 +747,9 @@ class HomeclawAgent:
             Full system prompt string with identity context if available,
             or onboarding prompt for new users, or base prompt as fallback.
             Includes short descriptions of ON_DEMAND tools when the provider
-            supports function calling.
+            supports function calling.  The current time is not included so
+            the prompt stays identical across turns (provider prompt caching);
+            it is passed separately as ``volatile_prompt``.
         """
         from .prompts import BASE_SYSTEM_PROMPT
 
@@ -729,7 +783,7 @@ class HomeclawAgent:
             if on_demand_desc:
                 system_prompt = system_prompt + "\n\n" + on_demand_desc
 
-        return self._inject_current_time(system_prompt)
+        return system_prompt
 
     @staticmethod
     def _inject_current_time(prompt: str) -> str:
@@ -738,15 +792,7 @@ class HomeclawAgent:
         This is critical for scheduling — the agent needs the real current
         time to compute correct cron expressions for 'in 5 minutes' etc.
         """
-        from homeassistant.util import dt as dt_util
-
-        now = dt_util.now()
-        time_block = (
-            f"\n\n[CURRENT TIME]\n"
-            f"Now: {now.strftime('%Y-%m-%d %H:%M:%S %Z')} "
-            f"(weekday: {now.strftime('%A')}, month: {now.month}, day: {now.day})"
-        )
-        return prompt + time_block
+        return prompt + "\n\n" + current_time_section()
 
     # === ENTITY OPERATIONS (delegate to EntityManager) ===
 
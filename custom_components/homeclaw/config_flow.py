@@ -20,9 +20,13 @@ from homeassistant.helpers.selector import (
 
 from . import gemini_oauth
 from .const import (
+    CONF_EMBEDDING_PROVIDER,
+    CONF_LOCAL_EMBEDDING_MODEL,
+    CONF_LOCAL_EMBEDDING_URL,
     CONF_LOCAL_MODEL,
     CONF_LOCAL_URL,
     CONF_RAG_ENABLED,
+    DEFAULT_EMBEDDING_PROVIDER,
     DEFAULT_RAG_ENABLED,
     DOMAIN,
 )
@@ -98,6 +102,11 @@ TOKEN_LABELS = {
 
 DEFAULT_PROVIDER = "openai"
 
+EMBEDDING_PROVIDERS = [
+    {"value": "auto", "label": "Automatic"},
+    {"value": "local", "label": "Local CPU model (fastembed)"},
+]
+
 
 class HomeclawConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg,misc]
     """Handle a config flow for Homeclaw."""
@@ -630,6 +639,30 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.options_data = {}
 
+    def _rag_schema(self, current_rag_enabled: bool) -> dict:
+        """RAG toggle plus the embedding backend options."""
+        data = self.config_entry.data
+        return {
+            vol.Optional(CONF_RAG_ENABLED, default=current_rag_enabled): BooleanSelector(),
+            vol.Optional(
+                CONF_EMBEDDING_PROVIDER, default=data.get(CONF_EMBEDDING_PROVIDER) or DEFAULT_EMBEDDING_PROVIDER
+            ): SelectSelector(SelectSelectorConfig(options=EMBEDDING_PROVIDERS)),
+            vol.Optional(
+                CONF_LOCAL_EMBEDDING_URL, description={"suggested_value": data.get(CONF_LOCAL_EMBEDDING_URL)}
+            ): TextSelector(TextSelectorConfig(type="text")),
+            vol.Optional(
+                CONF_LOCAL_EMBEDDING_MODEL, description={"suggested_value": data.get(CONF_LOCAL_EMBEDDING_MODEL)}
+            ): TextSelector(TextSelectorConfig(type="text")),
+        }
+
+    @staticmethod
+    def _apply_rag_input(updated_data: dict[str, Any], user_input: dict[str, Any], current_rag_enabled: bool) -> None:
+        """Store the RAG options from the submitted form."""
+        updated_data[CONF_RAG_ENABLED] = user_input.get(CONF_RAG_ENABLED, current_rag_enabled)
+        updated_data[CONF_EMBEDDING_PROVIDER] = user_input.get(CONF_EMBEDDING_PROVIDER, DEFAULT_EMBEDDING_PROVIDER)
+        for key in (CONF_LOCAL_EMBEDDING_URL, CONF_LOCAL_EMBEDDING_MODEL):
+            updated_data[key] = (user_input.get(key) or "").strip() or None
+
     async def async_step_init(self, user_input=None):
         """Handle the initial options step - provider selection."""
         current_provider = self.config_entry.data.get("ai_provider", DEFAULT_PROVIDER)
@@ -666,21 +699,17 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
         # OAuth providers - show only RAG option (no token reconfiguration)
         if provider in ("anthropic_oauth", "gemini_oauth"):
             if user_input is not None:
-                # Update RAG setting
+                # Update RAG settings
                 updated_data = dict(self.config_entry.data)
-                updated_data[CONF_RAG_ENABLED] = user_input.get(CONF_RAG_ENABLED, current_rag_enabled)
+                self._apply_rag_input(updated_data, user_input, current_rag_enabled)
                 self.hass.config_entries.async_update_entry(self.config_entry, data=updated_data)
                 # Preserve existing options (e.g. Discord pairing data).
                 return self.async_create_entry(title="", data=dict(self.config_entry.options))
 
-            # Show form with only RAG option for OAuth providers
+            # Show form with only RAG options for OAuth providers
             return self.async_show_form(
                 step_id="configure_options",
-                data_schema=vol.Schema(
-                    {
-                        vol.Optional(CONF_RAG_ENABLED, default=current_rag_enabled): BooleanSelector(),
-                    }
-                ),
+                data_schema=vol.Schema(self._rag_schema(current_rag_enabled)),
                 errors=errors,
                 description_placeholders={
                     "token_label": "OAuth",
@@ -745,8 +774,8 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
 
                     _LOGGER.debug(f"Options flow - Final model config for {provider}: {updated_data['models'].get(provider)}")
 
-                    # Update RAG enabled setting
-                    updated_data[CONF_RAG_ENABLED] = user_input.get(CONF_RAG_ENABLED, current_rag_enabled)
+                    # Update RAG settings
+                    self._apply_rag_input(updated_data, user_input, current_rag_enabled)
 
                     # Update the config entry
                     self.hass.config_entries.async_update_entry(self.config_entry, data=updated_data)
@@ -773,7 +802,7 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 vol.Optional("model", default=current_model): SelectSelector(SelectSelectorConfig(options=model_options)),
                 vol.Optional("custom_model"): TextSelector(TextSelectorConfig(type="text")),
-                vol.Optional(CONF_RAG_ENABLED, default=current_rag_enabled): BooleanSelector(),
+                **self._rag_schema(current_rag_enabled),
             }
 
             return self.async_show_form(
@@ -800,7 +829,7 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
                 SelectSelectorConfig(options=model_options)
             )
             schema_dict[vol.Optional("custom_model")] = TextSelector(TextSelectorConfig(type="text"))
-            schema_dict[vol.Optional(CONF_RAG_ENABLED, default=current_rag_enabled)] = BooleanSelector()
+            schema_dict.update(self._rag_schema(current_rag_enabled))
 
             return self.async_show_form(
                 step_id="configure_options",
@@ -829,8 +858,8 @@ class HomeclawOptionsFlowHandler(config_entries.OptionsFlow):
             )
             schema_dict[vol.Optional("custom_model")] = TextSelector(TextSelectorConfig(type="text"))
 
-        # Add RAG option for all providers
-        schema_dict[vol.Optional(CONF_RAG_ENABLED, default=current_rag_enabled)] = BooleanSelector()
+        # Add RAG options for all providers
+        schema_dict.update(self._rag_schema(current_rag_enabled))
 
         return self.async_show_form(
             step_id="configure_options",
@@ -44,6 +44,15 @@ CONF_MODELS = "models"
 # Supported AI providers
 DEFAULT_AI_PROVIDER = "openai"
 
+# Cross-provider failover (see providers/router.py)
+CONF_FALLBACK_PROVIDERS = "fallback_providers"  # ordered list of provider names
+CONF_ROUTER_HEDGE_DELAY = "router_hedge_delay"  # seconds; unset = no hedging
+CONF_ROUTER_LATENCY_BUDGET = "router_latency_budget"  # p95 first-token seconds
+
+# Per-credential request scheduling (see rate_scheduler.py); unset = learned
+CONF_RATE_LIMIT_RPM = "rate_limit_rpm"  # requests per minute
+CONF_RATE_LIMIT_TPM = "rate_limit_tpm"  # tokens per minute
+
 # Anthropic OAuth
 CONF_ANTHROPIC_OAUTH = "anthropic_oauth"
 ANTHROPIC_OAUTH_PROVIDER = "anthropic_oauth"
@@ -55,3 +64,9 @@ GEMINI_OAUTH_PROVIDER = "gemini_oauth"
 # RAG (Retrieval-Augmented Generation) configuration
 CONF_RAG_ENABLED = "rag_enabled"
 DEFAULT_RAG_ENABLED = False  # Disabled by default for safety
+CONF_EMBEDDING_PROVIDER = "embedding_provider"  # "auto" or "local"
+DEFAULT_EMBEDDING_PROVIDER = "auto"
+CONF_LOCAL_EMBEDDING_URL = "local_embedding_url"
+CONF_LOCAL_EMBEDDING_MODEL = "local_embedding_model"
+CONF_RAG_EMBEDDING_FORMAT = "rag_embedding_format"  # "float32", "float16" or "int8"
+CONF_RAG_HYBRID_FUSION = "rag_hybrid_fusion"  # "weighted" or "rrf"
@@ -29,6 +29,7 @@ from homeassistant.helpers import device_registry as dr, llm
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
+from .core.prompt_layout import current_time_section
 from .storage import Message, SessionStorage
 
 if TYPE_CHECKING:
@@ -252,6 +253,7 @@ class HomeclawConversationEntity(
             auto_load_on_demand=False,
         )
         kwargs["system_prompt_override"] = system_prompt
+        kwargs["volatile_prompt"] = current_time_section()
 
         # RAG context is pre-fetched async in _async_handle_message.
         if rag_context:
@@ -20,9 +20,11 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from .token_estimator import (
+    calibrate,
+    calibration_key,
     compute_context_budget,
+    estimate_message_tokens,
     estimate_messages_tokens,
-    estimate_tokens,
 )
 
 if TYPE_CHECKING:
@@ -109,7 +111,8 @@ async def compact_messages(
     effective_window = min(context_window, EFFECTIVE_MAX_CONTEXT)
     budget = compute_context_budget(effective_window)
     available = budget["available_for_input"]
-    estimated = estimate_messages_tokens(messages)
+    token_key = calibration_key(provider)
+    estimated = estimate_messages_tokens(messages, calibration_key=token_key)
 
     # Check turn-based trigger (count user messages in history, excluding system and current query)
     user_turn_count = sum(1 for m in messages if m.get("role") == "user")
@@ -156,7 +159,7 @@ async def compact_messages(
             len(history),
             MIN_RECENT_MESSAGES + 2,
         )
-        return truncation_fallback(messages, available)
+        return truncation_fallback(messages, available, calibration_key=token_key)
 
     # Keep the most recent messages intact.
     # Find a safe split point (must start with a user message to not break tool sequences)
@@ -185,7 +188,7 @@ async def compact_messages(
 
     if not summary_text:
         _LOGGER.warning("Summarization failed, using truncation fallback")
-        return truncation_fallback(messages, available)
+        return truncation_fallback(messages, available, calibration_key=token_key)
 
     # --- Phase 3: Rebuild message list ---
     compacted: list[dict[str, Any]] = []
@@ -236,14 +239,14 @@ async def compact_messages(
         compacted.append(user_query)
 
     # --- Phase 4: Verify it fits ---
-    new_estimated = estimate_messages_tokens(compacted)
+    new_estimated = estimate_messages_tokens(compacted, calibration_key=token_key)
     if new_estimated > available:
         _LOGGER.warning(
             "Compacted messages still over budget (%d > %d), applying truncation",
             new_estimated,
             available,
         )
-        return truncation_fallback(compacted, available)
+        return truncation_fallback(compacted, available, calibration_key=token_key)
 
     _LOGGER.info(
         "Compaction complete: %d -> %d messages, %d -> %d estimated tokens",
@@ -319,6 +322,8 @@ async def _summarize_messages(
 def truncation_fallback(
     messages: list[dict[str, Any]],
     budget_tokens: int,
+    *,
+    calibration_key: str | None = None,
 ) -> list[dict[str, Any]]:
     """Last-resort truncation: keep system + recent messages within budget.
 
@@ -327,6 +332,7 @@ def truncation_fallback(
     Args:
         messages: Message list to truncate.
         budget_tokens: Maximum token budget.
+        calibration_key: Provider whose token calibration to apply.
 
     Returns:
         Truncated message list.
@@ -351,16 +357,16 @@ def truncation_fallback(
     # Calculate fixed token usage
     fixed_tokens = 0
     if system_msg:
-        fixed_tokens += estimate_tokens(system_msg.get("content", "")) + 4
+        fixed_tokens += calibrate(estimate_message_tokens(system_msg), calibration_key)
     if user_query:
-        fixed_tokens += estimate_tokens(user_query.get("content", "")) + 4
+        fixed_tokens += calibrate(estimate_message_tokens(user_query), calibration_key)
 
     remaining_budget = budget_tokens - fixed_tokens
     kept: list[dict[str, Any]] = []
 
     # Iterate from most recent to oldest
     for msg in reversed(history):
-        msg_tokens = estimate_tokens(msg.get("content", "")) + 4
+        msg_tokens = calibrate(estimate_message_tokens(msg), calibration_key)
         if remaining_budget - msg_tokens >= 0:
             kept.append(msg)
             remaining_budget -= msg_tokens
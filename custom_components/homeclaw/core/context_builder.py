@@ -12,6 +12,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from .compaction import compact_messages, truncation_fallback
+from .prompt_layout import build_system_message, rag_section
 from .token_estimator import (
     DEFAULT_CONTEXT_WINDOW,
     compute_context_budget,
@@ -31,40 +32,35 @@ async def build_messages(
     detect_function_call_fn: Any,
     system_prompt: str | None = None,
     rag_context: str | None = None,
+    volatile_prompt: str | None = None,
     **kwargs: Any,
 ) -> tuple[list[dict[str, Any]], bool]:
     """Build the message list for the AI provider.
 
     Assembles system prompt, conversation history, and the current query
     into a flat list.  Triggers compaction when over context budget.
+    ``volatile_prompt`` (e.g. the current time) and ``rag_context`` are
+    appended after the stable ``system_prompt``.
 
     Returns:
         Tuple of (messages, was_compacted_boolean).
     """
     messages: list[dict[str, Any]] = []
 
-    # Build system prompt with RAG context if available
-    final_system_prompt = system_prompt or ""
-
+    # Stable prompt first, per-turn sections (time, RAG) last so the
+    # provider can cache the prefix (see prompt_layout).
+    system_message = build_system_message(
+        system_prompt,
+        [volatile_prompt, rag_section(rag_context) if rag_context else None],
+    )
     if rag_context:
-        rag_section = (
-            "\n\n--- RELEVANT CONTEXT ---\n"
-            f"{rag_context}\n"
-            "--- END CONTEXT ---\n\n"
-            "The above context may include relevant_entities, previous_conversations, "
-            "and long_term_memories. Use available tools "
-            "(get_entities_by_domain, get_state, etc.) to find other entities if needed."
-        )
-        final_system_prompt = (
-            final_system_prompt + rag_section if final_system_prompt else rag_section
-        )
         _LOGGER.info("RAG context added to system prompt (%d chars)", len(rag_context))
         _LOGGER.debug("RAG context FULL: %s", rag_context)
-        _LOGGER.debug("Final system prompt length: %d chars", len(final_system_prompt))
-
-    # Add system prompt first if we have one
-    if final_system_prompt:
-        messages.append({"role": "system", "content": final_system_prompt})
+    if system_message:
+        _LOGGER.debug(
+            "Final system prompt length: %d chars", len(system_message["content"])
+        )
+        messages.append(system_message)
 
     # Add conversation history
     messages.extend(history)
@@ -268,15 +264,18 @@ async def recompact_if_needed(
     messages: list[dict[str, Any]],
     *,
     context_window: int = DEFAULT_CONTEXT_WINDOW,
+    calibration_key: str | None = None,
 ) -> list[dict[str, Any]]:
     """Trim messages if tool results pushed us over the context budget.
 
     Only truncates long tool result contents to avoid discarding
-    tool call/result pairs that the model needs.
+    tool call/result pairs that the model needs.  Token counts are memoized
+    per message, so the check after each tool loop iteration only tokenizes
+    the new tool results.
     """
     budget = compute_context_budget(context_window)
     available = budget["available_for_input"]
-    estimated = estimate_messages_tokens(messages)
+    estimated = estimate_messages_tokens(messages, calibration_key=calibration_key)
 
     if estimated <= available:
         return messages
@@ -305,7 +304,7 @@ async def recompact_if_needed(
                         + "\n\n... [truncated — showing first and last portion] ...\n\n"
                         + content[-half:]
                     )
-        estimated = estimate_messages_tokens(result)
+        estimated = estimate_messages_tokens(result, calibration_key=calibration_key)
         if estimated <= available:
             _LOGGER.info(
                 "Tool result truncation brought tokens to %d (budget %d, limit %d chars)",
@@ -321,4 +320,4 @@ async def recompact_if_needed(
         estimated,
         available,
     )
-    return truncation_fallback(result, available)
+    return truncation_fallback(result, available, calibration_key=calibration_key)
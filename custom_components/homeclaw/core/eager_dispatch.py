@@ -0,0 +1,91 @@
+"""Eager tool dispatch for the streaming tool loop.
+
+Providers emit each ``tool_call`` chunk as soon as its arguments are
+complete, while the model may still be generating further calls or text.
+``EagerToolDispatcher`` starts read-only calls at that moment instead of
+waiting for the stream to end; ``ToolExecutor.execute_tool_calls`` later
+joins the running tasks (``prefetched``) in call order.
+
+Only the leading run of eligible calls is started early: once a call that
+must not run early shows up (a state-changing tool, a call needing
+approval, anything the pre-execution checks would reject), every later
+call waits for the regular post-stream execution, so reads never overtake
+a preceding write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from ..function_calling import FunctionCall
+from .tool_call_codec import normalize_tool_calls
+from .tool_executor import ToolExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EagerToolDispatcher:
+    """Starts safe tool calls while the provider stream is still running."""
+
+    def __init__(
+        self,
+        *,
+        hass: Any,
+        denied_tools: frozenset[str] | None,
+        user_id: str,
+        call_history_hashes: dict[str, int] | None,
+    ) -> None:
+        """Initialize the dispatcher for one streaming iteration."""
+        self._hass = hass
+        self._denied_tools = denied_tools
+        self._user_id = user_id
+        self._call_history_hashes = call_history_hashes
+        self._tasks: dict[str, asyncio.Task[str]] = {}
+        self._started_hashes: set[str] = set()
+        self._closed = False
+
+    @property
+    def prefetched(self) -> dict[str, asyncio.Task[str]]:
+        """Started calls (call id -> task) for ``execute_tool_calls``."""
+        return self._tasks
+
+    def offer(self, chunk: dict[str, Any]) -> bool:
+        """Consider a ``tool_call`` stream chunk for early execution.
+
+        Returns:
+            True if the call was started.
+        """
+        if self._closed:
+            return False
+
+        normalized = normalize_tool_calls([chunk])
+        if not normalized:
+            self._closed = True
+            return False
+
+        tc = normalized[0]
+        fc = FunctionCall(id=tc["id"], name=tc["name"], arguments=tc["args"])
+        call_hash = ToolExecutor._call_hash(fc)
+        if (
+            fc.id in self._tasks
+            or call_hash in self._started_hashes
+            or not ToolExecutor.can_start_early(
+                fc, self._hass, self._denied_tools, self._call_history_hashes
+            )
+        ):
+            self._closed = True
+            return False
+
+        _LOGGER.debug("Starting tool %s before the stream has finished", fc.name)
+        self._started_hashes.add(call_hash)
+        self._tasks[fc.id] = ToolExecutor.start_early(fc, self._hass, self._user_id)
+        return True
+
+    def cancel_pending(self) -> None:
+        """Cancel started calls whose results were never collected."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        self._tasks.clear()
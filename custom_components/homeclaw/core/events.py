@@ -112,9 +112,16 @@ class ErrorEvent(AgentEvent):
 
 @dataclass
 class CompletionEvent(AgentEvent):
-    """Event emitted when the interaction is complete."""
+    """Event emitted when the interaction is complete.
+
+    ``usage`` sums the token counts reported by the provider over all model
+    calls of the interaction (``input_tokens``, ``output_tokens``,
+    ``cached_tokens`` read from the prompt cache, ``cache_write_tokens``);
+    None when the provider reported nothing.
+    """
 
     messages: list[dict[str, Any]]
+    usage: dict[str, int] | None = None
     type: Literal["complete"] = "complete"
 
 
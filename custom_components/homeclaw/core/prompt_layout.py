@@ -0,0 +1,95 @@
+"""System prompt layout: stable prefix first, per-turn content last.
+
+Provider-side prompt caches (Anthropic ``cache_control``, OpenAI automatic
+prefix caching, Gemini implicit caching) only help when the start of a
+request is byte-identical between calls.  The system prompt is therefore
+assembled from two parts:
+
+- the *stable prefix*: identity / base prompt and the ON_DEMAND tool
+  catalog, identical across turns for the same user;
+- the *volatile suffix*: the current time and RAG context, rebuilt on
+  every turn.
+
+``build_system_message`` joins them into the single canonical system
+message.  When both parts are present it records where the stable prefix
+ends under ``CACHE_PREFIX_KEY`` so provider adapters can place cache
+markers without re-deriving the split; a system message without the key
+is stable as a whole.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+# Private message key: length of the stable prefix of a system message
+CACHE_PREFIX_KEY = "_cache_prefix_len"
+
+_SECTION_SEPARATOR = "\n\n"
+
+
+def current_time_section(now: datetime | None = None) -> str:
+    """Return the ``[CURRENT TIME]`` prompt section.
+
+    The agent needs the real current time to compute correct cron
+    expressions for 'in 5 minutes' etc.
+    """
+    if now is None:
+        from homeassistant.util import dt as dt_util
+
+        now = dt_util.now()
+    return (
+        f"[CURRENT TIME]\n"
+        f"Now: {now.strftime('%Y-%m-%d %H:%M:%S %Z')} "
+        f"(weekday: {now.strftime('%A')}, month: {now.month}, day: {now.day})"
+    )
+
+
+def rag_section(rag_context: str) -> str:
+    """Return the prompt section wrapping retrieved RAG context."""
+    return (
+        "--- RELEVANT CONTEXT ---\n"
+        f"{rag_context}\n"
+        "--- END CONTEXT ---\n\n"
+        "The above context may include relevant_entities, previous_conversations, "
+        "and long_term_memories. Use available tools "
+        "(get_entities_by_domain, get_state, etc.) to find other entities if needed."
+    )
+
+
+def build_system_message(
+    stable: str | None, volatile: list[str | None]
+) -> dict[str, Any] | None:
+    """Build the canonical system message from its stable and volatile parts.
+
+    Args:
+        stable: Prompt text that does not change between turns.
+        volatile: Per-turn sections, appended in order (empty ones skipped).
+
+    Returns:
+        The system message, or None when there is nothing to send.
+    """
+    stable = stable or ""
+    volatile_text = _SECTION_SEPARATOR.join(part for part in volatile if part)
+    if not volatile_text:
+        return {"role": "system", "content": stable} if stable else None
+    if not stable:
+        return {"role": "system", "content": volatile_text}
+    return {
+        "role": "system",
+        "content": stable + _SECTION_SEPARATOR + volatile_text,
+        CACHE_PREFIX_KEY: len(stable),
+    }
+
+
+def split_system_content(message: dict[str, Any]) -> tuple[str, str]:
+    """Split a system message into its (stable, volatile) text.
+
+    Messages built without a recorded boundary (e.g. subagent prompts or
+    compacted histories) are treated as entirely stable.
+    """
+    content = message.get("content") or ""
+    boundary = message.get(CACHE_PREFIX_KEY)
+    if not isinstance(boundary, int) or not 0 < boundary < len(content):
+        return content, ""
+    return content[:boundary], content[boundary:].lstrip("\n")
@@ -74,6 +74,7 @@ class QueryProcessor:
         """Pop shared runtime context keys consumed by QueryProcessor."""
         return {
             "rag_context": kwargs.pop("rag_context", None),
+            "volatile_prompt": kwargs.pop("volatile_prompt", None),
             "denied_tools": kwargs.pop("denied_tools", None),
             "config": kwargs.pop("config", None),
             "context_window": kwargs.pop("context_window", DEFAULT_CONTEXT_WINDOW),
@@ -146,6 +147,7 @@ class QueryProcessor:
         history: list[dict[str, Any]],
         system_prompt: str | None = None,
         rag_context: str | None = None,
+        volatile_prompt: str | None = None,
         **kwargs: Any,
     ) -> tuple[list[dict[str, Any]], bool]:
         """Build the message list. Delegates to ``context_builder.build_messages``."""
@@ -156,6 +158,7 @@ class QueryProcessor:
             self._detect_function_call,
             system_prompt=system_prompt,
             rag_context=rag_context,
+            volatile_prompt=volatile_prompt,
             **kwargs,
         )
 
@@ -214,9 +217,7 @@ class QueryProcessor:
             "effective_tools": effective_tools,
             "effective_max_iterations": effective_max_iterations,
             "detect_function_call_fn": self._detect_function_call,
-            "allowed_names": {
-                t.id for t in ToolRegistry.get_all_tools(hass=None, enabled_only=True)
-            },
+            "allowed_names": ToolRegistry.enabled_tool_ids(),
             "hass": hass,
             "denied_tools": runtime["denied_tools"],
             "config": runtime["config"],
@@ -259,6 +260,7 @@ class QueryProcessor:
             messages,
             system_prompt=system_prompt,
             rag_context=runtime["rag_context"],
+            volatile_prompt=runtime["volatile_prompt"],
             context_window=runtime["context_window"],
             memory_flush_fn=runtime["memory_flush_fn"],
             user_id=runtime["user_id"],
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import TYPE_CHECKING, Any, AsyncGenerator
 
 from ..function_calling import FunctionCall
 from .context_builder import recompact_if_needed
+from .eager_dispatch import EagerToolDispatcher
 from .events import (
     ApprovalRequestEvent,
     CompletionEvent,
@@ -19,9 +21,16 @@ from .events import (
     ToolCallEvent,
     ToolResultEvent,
 )
+from .token_estimator import (
+    calibration_key,
+    estimate_messages_tokens,
+    prompt_tokens_from_usage,
+    record_prompt_usage,
+)
 from .tool_call_codec import build_assistant_tool_message, normalize_tool_calls
 from .tool_executor import ToolExecutor
 from .tool_loop import expand_loaded_tools
+from .tool_schema_cache import ToolSchemaCache
 
 if TYPE_CHECKING:
     from ..providers.registry import AIProvider
@@ -29,6 +38,21 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _merge_usage(totals: dict[str, int], usage: dict[str, int]) -> None:
+    """Add one model call's token usage to the running totals."""
+    for key, value in usage.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def _usage_from_chunk(chunk: dict[str, Any]) -> dict[str, int]:
+    """Token counts carried by a ``usage`` stream chunk."""
+    return {
+        key: value
+        for key, value in chunk.items()
+        if key != "type" and isinstance(value, int)
+    }
+
+
 def _approval_request_event(tool_event: dict[str, Any]) -> ApprovalRequestEvent:
     """Map a raw approval_request tool event to an ApprovalRequestEvent."""
     return ApprovalRequestEvent(
@@ -46,7 +70,7 @@ async def run_tool_loop_stream(
     effective_tools: list[dict[str, Any]] | None,
     effective_max_iterations: int,
     detect_function_call_fn: Any,
-    allowed_names: set[str],
+    allowed_names: frozenset[str],
     hass: Any,
     denied_tools: frozenset[str] | None,
     config: dict[str, Any] | None,
@@ -56,10 +80,17 @@ async def run_tool_loop_stream(
     build_provider_kwargs_fn: Any,
     build_updated_messages_fn: Any,
     kwargs: dict[str, Any],
+    eager_tool_dispatch: bool = True,
 ) -> AsyncGenerator[Any, None]:
-    """Execute the streaming multi-turn tool call loop. Yields AgentEvent objects."""
+    """Execute the streaming multi-turn tool call loop. Yields AgentEvent objects.
+
+    With ``eager_tool_dispatch`` read-only tool calls start as soon as the
+    provider emits them and are joined once the stream has finished.
+    """
     current_iteration = 0
     call_history_hashes: dict[str, int] = {}
+    usage_totals: dict[str, int] = {}
+    token_key = calibration_key(provider)
 
     while current_iteration < effective_max_iterations:
         # Check if provider supports streaming
@@ -92,6 +123,12 @@ async def run_tool_loop_stream(
         provider_kwargs = build_provider_kwargs_fn(kwargs, effective_tools)
         accumulated_text = ""
         accumulated_tool_calls: list[dict[str, Any]] = []
+        # Providers may report usage in several chunks; later values win
+        call_usage: dict[str, int] = {}
+        # Raw estimate of this prompt, compared with the reported usage
+        prompt_estimate = estimate_messages_tokens(
+            built_messages
+        ) + ToolSchemaCache.estimate_tokens(effective_tools)
 
         _LOGGER.debug(
             "Streaming iteration %d: sending %d messages to provider",
@@ -99,41 +136,65 @@ async def run_tool_loop_stream(
             len(built_messages),
         )
 
-        async for chunk in provider.get_response_stream(
-            built_messages, **provider_kwargs
-        ):
-            if chunk.get("type") == "text":
-                content = chunk.get("content", "")
-                if not content:
-                    continue
-                accumulated_text += content
-                yield TextEvent(content=content)
-            elif chunk.get("type") == "reasoning":
-                reasoning_text = chunk.get("content", "")
-                if reasoning_text:
-                    yield ReasoningEvent(content=reasoning_text)
-            elif chunk.get("type") == "reasoning_details":
-                details = chunk.get("details") or []
-                if details:
-                    yield ReasoningDetailsEvent(details=details)
-            elif chunk.get("type") == "tool_call":
-                accumulated_tool_calls.append(chunk)
-                _LOGGER.debug("Tool call detected in stream: %s", chunk.get("name"))
-            elif chunk.get("type") == "error":
-                yield ErrorEvent(message=chunk.get("message", "Unknown error"))
-                return
-
-        if accumulated_tool_calls:
-            async for event in _handle_stream_tool_calls(
-                accumulated_tool_calls=accumulated_tool_calls,
-                built_messages=built_messages,
+        dispatcher = (
+            EagerToolDispatcher(
                 hass=hass,
                 denied_tools=denied_tools,
                 user_id=user_id,
                 call_history_hashes=call_history_hashes,
+            )
+            if eager_tool_dispatch
+            else None
+        )
+        try:
+            async for chunk in provider.get_response_stream(
+                built_messages, **provider_kwargs
             ):
-                yield event
+                if chunk.get("type") == "text":
+                    content = chunk.get("content", "")
+                    if not content:
+                        continue
+                    accumulated_text += content
+                    yield TextEvent(content=content)
+                elif chunk.get("type") == "reasoning":
+                    reasoning_text = chunk.get("content", "")
+                    if reasoning_text:
+                        yield ReasoningEvent(content=reasoning_text)
+                elif chunk.get("type") == "reasoning_details":
+                    details = chunk.get("details") or []
+                    if details:
+                        yield ReasoningDetailsEvent(details=details)
+                elif chunk.get("type") == "tool_call":
+                    accumulated_tool_calls.append(chunk)
+                    _LOGGER.debug("Tool call detected in stream: %s", chunk.get("name"))
+                    if dispatcher is not None:
+                        dispatcher.offer(chunk)
+                elif chunk.get("type") == "usage":
+                    call_usage.update(_usage_from_chunk(chunk))
+                elif chunk.get("type") == "error":
+                    yield ErrorEvent(message=chunk.get("message", "Unknown error"))
+                    return
+
+            _merge_usage(usage_totals, call_usage)
+            record_prompt_usage(
+                token_key, prompt_estimate, prompt_tokens_from_usage(call_usage)
+            )
+            if accumulated_tool_calls:
+                async for event in _handle_stream_tool_calls(
+                    accumulated_tool_calls=accumulated_tool_calls,
+                    built_messages=built_messages,
+                    hass=hass,
+                    denied_tools=denied_tools,
+                    user_id=user_id,
+                    call_history_hashes=call_history_hashes,
+                    prefetched=dispatcher.prefetched if dispatcher else None,
+                ):
+                    yield event
+        finally:
+            if dispatcher is not None:
+                dispatcher.cancel_pending()
 
+        if accumulated_tool_calls:
             # Expand effective_tools if load_tool was called
             effective_tools = expand_loaded_tools(
                 [
@@ -150,7 +211,9 @@ async def run_tool_loop_stream(
                 config=config,
             )
             built_messages = await recompact_if_needed(
-                built_messages, context_window=context_window
+                built_messages,
+                context_window=context_window,
+                calibration_key=token_key,
             )
 
             current_iteration += 1
@@ -171,7 +234,7 @@ async def run_tool_loop_stream(
         updated_messages = build_updated_messages_fn(
             built_messages, accumulated_text, system_prompt=system_prompt
         )
-        yield CompletionEvent(messages=updated_messages)
+        yield CompletionEvent(messages=updated_messages, usage=usage_totals or None)
         return
 
     # Max iterations reached
@@ -183,11 +246,15 @@ async def run_tool_loop_stream(
     provider_kwargs_final.pop("tools", None)
 
     if hasattr(provider, "get_response_stream"):
+        call_usage = {}
         async for chunk in provider.get_response_stream(
             built_messages, **provider_kwargs_final
         ):
             if chunk.get("type") == "text":
                 yield TextEvent(content=chunk.get("content", ""))
+            elif chunk.get("type") == "usage":
+                call_usage.update(_usage_from_chunk(chunk))
+        _merge_usage(usage_totals, call_usage)
     else:
         final_text = await provider.get_response(
             built_messages, **provider_kwargs_final
@@ -195,7 +262,7 @@ async def run_tool_loop_stream(
         if final_text:
             yield TextEvent(content=final_text)
 
-    yield CompletionEvent(messages=list(built_messages))
+    yield CompletionEvent(messages=list(built_messages), usage=usage_totals or None)
 
 
 async def _nonstream_fallback_iteration(
@@ -204,7 +271,7 @@ async def _nonstream_fallback_iteration(
     built_messages: list[dict[str, Any]],
     effective_tools: list[dict[str, Any]] | None,
     detect_function_call_fn: Any,
-    allowed_names: set[str],
+    allowed_names: frozenset[str],
     hass: Any,
     denied_tools: frozenset[str] | None,
     config: dict[str, Any] | None,
@@ -280,7 +347,9 @@ async def _nonstream_fallback_iteration(
     )
     # Recompact messages after tool results
     built_messages[:] = await recompact_if_needed(
-        built_messages, context_window=context_window
+        built_messages,
+        context_window=context_window,
+        calibration_key=calibration_key(provider),
     )
 
 
@@ -292,6 +361,7 @@ async def _handle_stream_tool_calls(
     denied_tools: frozenset[str] | None,
     user_id: str,
     call_history_hashes: dict[str, int],
+    prefetched: dict[str, asyncio.Task[str]] | None = None,
 ) -> AsyncGenerator[Any, None]:
     """Handle tool calls accumulated during a streaming iteration."""
     _LOGGER.info("Processing %d tool call(s) from stream", len(accumulated_tool_calls))
@@ -340,6 +410,7 @@ async def _handle_stream_tool_calls(
         user_id=user_id,
         call_history_hashes=call_history_hashes,
         approval_enabled=True,
+        prefetched=prefetched,
     ):
         if tool_event.get("type") == "approval_request":
             yield ApprovalRequestEvent(
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN
+from ..rate_scheduler import Priority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -244,15 +245,16 @@ class SubagentManager:
             from ..prompts import SUBAGENT_SYSTEM_PROMPT
 
             # Use the agent's process_query with isolated context and denied tools
-            result = await asyncio.wait_for(
-                agent.process_query(
-                    user_query=task.prompt,
-                    conversation_history=[],  # Clean — no history carry-over
-                    denied_tools=DENIED_TOOLS,
-                    system_prompt=SUBAGENT_SYSTEM_PROMPT,
-                ),
-                timeout=TIMEOUT_SECONDS,
-            )
+            with request_priority(Priority.BACKGROUND, "subagent"):
+                result = await asyncio.wait_for(
+                    agent.process_query(
+                        user_query=task.prompt,
+                        conversation_history=[],  # Clean — no history carry-over
+                        denied_tools=DENIED_TOOLS,
+                        system_prompt=SUBAGENT_SYSTEM_PROMPT,
+                    ),
+                    timeout=TIMEOUT_SECONDS,
+                )
 
             task.result = result.get("answer", "") or result.get("response", "")
             task.status = "completed" if result.get("success") else "failed"
@@ -1,16 +1,36 @@
 """Token estimation and context budget utilities.
 
-Provides heuristic-based token counting (chars/4) and context window
-budget calculations for managing conversation history size.
+Token counts come from one of two counters:
 
-No external dependencies — uses character-based approximation with a
-configurable safety margin to avoid context overflow.
+- an exact BPE tokenizer (``tiktoken``, ``o200k_base``) when it is installed
+  and its encoding can be loaded (``load_bpe_tokenizer``, run once in an
+  executor at setup);
+- otherwise a character heuristic (chars/3).
+
+Neither matches every provider's tokenizer, so each provider additionally
+gets a calibration ratio learned from the prompt token counts it reports in
+``usage`` (``record_prompt_usage``); pass its ``calibration_key`` to apply it.
+
+With the BPE tokenizer, message counts are memoized per message object (and
+invalidated when its content changes), so re-counting a growing
+conversation on every tool loop iteration only tokenizes the new or changed
+messages.  Both caches key texts by a (length, hash) fingerprint, so they
+never keep a conversation's texts alive.
+
+Also provides context window budget calculations for managing conversation
+history size, with a configurable safety margin to avoid context overflow.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..providers.registry import AIProvider
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,12 +57,111 @@ MESSAGE_OVERHEAD_TOKENS = 4
 # This reserve is subtracted from available budget as a conservative estimate.
 TOOL_SCHEMA_RESERVE_TOKENS = 5_000
 
+# BPE encoding used when tiktoken is available (GPT-4o family)
+BPE_ENCODING = "o200k_base"
+
+# Memoized message counts (a long conversation plus its compaction copies)
+MESSAGE_CACHE_SIZE = 4_096
+
+# Distinct texts whose BPE count is memoized (system prompts, tool schemas)
+TEXT_CACHE_SIZE = 1_024
+
+# Calibration: weight of each new usage observation, the smallest prompt
+# worth learning from, and the range the ratio is clamped to
+CALIBRATION_ALPHA = 0.2
+CALIBRATION_MIN_TOKENS = 256
+CALIBRATION_MIN_RATIO = 0.5
+CALIBRATION_MAX_RATIO = 2.5
+
+# Exact counter, set by load_bpe_tokenizer()
+_bpe_count: Callable[[str], int] | None = None
+
+# id(message) -> (fingerprint of the content the count was made for, tokens)
+_message_cache: OrderedDict[int, tuple[tuple[int, int], int]] = OrderedDict()
+
+# text fingerprint -> BPE tokens
+_text_cache: OrderedDict[tuple[int, int], int] = OrderedDict()
+
+# calibration key -> learned ratio
+_calibrations: dict[str, TokenCalibration] = {}
+
+
+def load_bpe_tokenizer(encoding_name: str = BPE_ENCODING) -> bool:
+    """Switch token counting to an exact BPE tokenizer if one is available.
+
+    Blocking (the encoding may be read from disk or fetched once by
+    tiktoken) — run it in an executor.
+
+    Args:
+        encoding_name: tiktoken encoding to load.
+
+    Returns:
+        True if the BPE tokenizer is now in use.
+    """
+    global _bpe_count
+
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+    except ImportError:
+        _LOGGER.debug("tiktoken not installed, using heuristic token counts")
+        return False
+    except Exception as err:  # noqa: BLE001 - missing/unfetchable encoding
+        _LOGGER.info(
+            "BPE encoding %s unavailable (%s), using heuristic token counts",
+            encoding_name,
+            err,
+        )
+        return False
+
+    def _count(text: str) -> int:
+        key = _fingerprint(text)
+        tokens = _text_cache.pop(key, None)
+        if tokens is None:
+            tokens = len(encoding.encode_ordinary(text))
+        _text_cache[key] = tokens
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+        return tokens
+
+    _bpe_count = _count
+    _message_cache.clear()
+    _text_cache.clear()
+
+    # Tool schema token estimates were precomputed with the old counter
+    from .tool_schema_cache import ToolSchemaCache
+
+    ToolSchemaCache.clear()
+    _LOGGER.info("Token counting uses the %s BPE tokenizer", encoding_name)
+    return True
+
+
+def _fingerprint(text: str) -> tuple[int, int]:
+    """Cache key of a text that does not keep the text alive."""
+    return len(text), hash(text)
+
+
+def unload_bpe_tokenizer() -> None:
+    """Return to heuristic token counts."""
+    global _bpe_count
+
+    _bpe_count = None
+    _message_cache.clear()
+    _text_cache.clear()
+
+
+def tokenizer_name() -> str:
+    """Name of the active token counter."""
+    return BPE_ENCODING if _bpe_count is not None else "heuristic"
+
 
 def estimate_tokens(text: str) -> int:
-    """Estimate token count from text using character heuristic.
+    """Count the tokens of a text.
 
-    Uses ~3 characters per token, which is conservative for multilingual
-    content (Polish/CJK ~2.5-3.5, English ~3.5-4).
+    Exact with the BPE tokenizer; otherwise uses ~3 characters per token,
+    which is conservative for multilingual content (Polish/CJK ~2.5-3.5,
+    English ~3.5-4).
 
     Args:
         text: Input text to estimate.
@@ -52,24 +171,57 @@ def estimate_tokens(text: str) -> int:
     """
     if not text:
         return 0
+    if _bpe_count is not None:
+        return _bpe_count(text)
     return len(text) // CHARS_PER_TOKEN
 
 
-def estimate_messages_tokens(messages: list[dict[str, Any]]) -> int:
+def estimate_message_tokens(msg: dict[str, Any]) -> int:
+    """Memoized token count of one message (content + overhead)."""
+    content = msg.get("content") or ""
+    if _bpe_count is None:
+        # The heuristic is O(1) for text; the cache would only add overhead
+        text = content if isinstance(content, str) else str(content)
+        return estimate_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+
+    text = content if isinstance(content, str) else str(content)
+    fingerprint = _fingerprint(text)
+    key = id(msg)
+    cached = _message_cache.get(key)
+    # The content fingerprint identifies the count: changing a message's
+    # content (e.g. tool result truncation) invalidates it
+    if cached is not None and cached[0] == fingerprint:
+        _message_cache.move_to_end(key)
+        return cached[1]
+
+    tokens = estimate_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+    _message_cache[key] = (fingerprint, tokens)
+    if len(_message_cache) > MESSAGE_CACHE_SIZE:
+        _message_cache.popitem(last=False)
+    return tokens
+
+
+def estimate_messages_tokens(
+    messages: list[dict[str, Any]], *, calibration_key: str | None = None
+) -> int:
     """Estimate total tokens across a list of messages.
 
-    Accounts for per-message overhead (role tags, separators).
+    Accounts for per-message overhead (role tags, separators).  BPE counts
+    are memoized per message, so only new or changed messages are tokenized.
 
     Args:
         messages: List of message dicts with at least a 'content' key.
+        calibration_key: Provider whose learned calibration to apply
+            (see ``calibration_key``); None for the raw count.
 
     Returns:
         Estimated total token count.
     """
     total = 0
     for msg in messages:
-        content = msg.get("content") or ""
-        total += estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+        total += estimate_message_tokens(msg)
+    if calibration_key is not None:
+        return calibrate(total, calibration_key)
     return total
 
 
@@ -89,15 +241,9 @@ def estimate_total_tokens(
     Returns:
         Estimated total token count for messages + tool schemas.
     """
-    import json
+    from .tool_schema_cache import ToolSchemaCache
 
-    msg_tokens = estimate_messages_tokens(messages)
-    tool_tokens = 0
-    if tools:
-        for tool in tools:
-            tool_json = json.dumps(tool, ensure_ascii=False)
-            tool_tokens += estimate_tokens(tool_json)
-    return msg_tokens + tool_tokens
+    return estimate_messages_tokens(messages) + ToolSchemaCache.estimate_tokens(tools)
 
 
 def compute_context_budget(
@@ -130,3 +276,93 @@ def compute_context_budget(
         "output_reserve": output_reserve,
         "safety_buffer": safety_buffer,
     }
+
+
+@dataclass
+class TokenCalibration:
+    """Ratio of a provider's reported prompt tokens to our raw estimate."""
+
+    ratio: float = 1.0
+    samples: int = 0
+    last_error_pct: float = 0.0
+
+    def observe(self, estimated: int, actual: int) -> None:
+        """Blend one (estimate, reported) pair into the ratio."""
+        self.last_error_pct = (estimated - actual) / actual * 100
+        observed = actual / estimated
+        if self.samples == 0:
+            ratio = observed
+        else:
+            ratio = self.ratio + CALIBRATION_ALPHA * (observed - self.ratio)
+        self.ratio = min(max(ratio, CALIBRATION_MIN_RATIO), CALIBRATION_MAX_RATIO)
+        self.samples += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the learned ratio and the error of the last raw estimate."""
+        return {
+            "ratio": round(self.ratio, 3),
+            "samples": self.samples,
+            "last_error_pct": round(self.last_error_pct, 1),
+        }
+
+
+def calibration_key(provider: AIProvider) -> str:
+    """Key a provider's token calibration is stored under."""
+    return type(provider).__name__
+
+
+def calibrate(tokens: int, key: str | None) -> int:
+    """Scale a raw token estimate by the learned ratio of ``key``."""
+    calibration = _calibrations.get(key) if key is not None else None
+    if calibration is None:
+        return tokens
+    return round(tokens * calibration.ratio)
+
+
+def prompt_tokens_from_usage(usage: dict[str, int]) -> int | None:
+    """Total prompt tokens of a normalized ``usage`` chunk.
+
+    Anthropic reports cache reads and writes separately from
+    ``input_tokens`` (it is the only adapter emitting ``cache_write_tokens``);
+    OpenAI-compatible APIs and Gemini include cached tokens in it.
+    """
+    input_tokens = usage.get("input_tokens")
+    if not isinstance(input_tokens, int):
+        return None
+    if "cache_write_tokens" in usage:
+        input_tokens += usage.get("cached_tokens", 0) + usage["cache_write_tokens"]
+    return input_tokens
+
+
+def record_prompt_usage(key: str, estimated: int, actual: int | None) -> None:
+    """Learn from a provider's reported prompt size.
+
+    Args:
+        key: Provider calibration key.
+        estimated: Raw (uncalibrated) estimate of the prompt that was sent,
+            messages and tool schemas.
+        actual: Prompt tokens the provider reported.
+    """
+    if not actual or actual < CALIBRATION_MIN_TOKENS or estimated <= 0:
+        return
+    calibration = _calibrations.get(key)
+    if calibration is None:
+        calibration = _calibrations[key] = TokenCalibration()
+    calibration.observe(estimated, actual)
+
+
+def reset_calibrations() -> None:
+    """Forget all learned calibrations."""
+    _calibrations.clear()
+
+
+def get_token_accounting_stats() -> dict[str, Any]:
+    """Get the active counter, cache size and per-provider calibrations."""
+    return {
+        "tokenizer": tokenizer_name(),
+        "cached_messages": len(_message_cache),
+        "cached_texts": len(_text_cache),
+        "calibrations": {
+            key: calibration.get_stats() for key, calibration in _calibrations.items()
+        },
+    }
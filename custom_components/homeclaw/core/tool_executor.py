@@ -7,6 +7,7 @@ Supports both streaming and non-streaming modes.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 from typing import TYPE_CHECKING, Any, AsyncGenerator, cast
@@ -26,6 +27,9 @@ MAX_TOOL_RESULT_CHARS = 30_000
 
 APPROVAL_TIMEOUT_SECONDS = 600
 
+# Read-only tool calls of one turn that may be in flight at the same time
+MAX_PARALLEL_TOOL_CALLS = 4
+
 
 class ToolExecutor:
     """Handles tool execution for AI conversations.
@@ -44,9 +48,18 @@ class ToolExecutor:
         user_id: str = "",
         call_history_hashes: dict[str, int] | None = None,
         approval_enabled: bool = False,
+        max_parallel: int = MAX_PARALLEL_TOOL_CALLS,
+        prefetched: dict[str, asyncio.Task[str]] | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
         """Execute a list of tool calls and add results to messages.
 
+        Consecutive calls to read-only tools (``Tool.read_only``) run
+        concurrently, at most ``max_parallel`` at a time.  Every other call —
+        state-changing tools, unknown tools, tools needing approval — runs on
+        its own and acts as a barrier, so reads never overtake a preceding
+        write.  Results are always appended to ``messages`` (and yielded) in
+        the original call order.
+
         Args:
             function_calls: List of FunctionCall objects to execute.
             hass: Home Assistant instance for tool execution.
@@ -62,277 +75,444 @@ class ToolExecutor:
                 without relying on a shared global.
             call_history_hashes: Optional dictionary to track repeated tool calls 
                 (hash -> count) and break infinite loops.
+            approval_enabled: Ask the user before running tools marked
+                ``requires_confirmation``.
+            max_parallel: Maximum number of read-only calls in flight at
+                once (1 disables concurrent execution).
+            prefetched: Results of calls already started while the provider
+                was still streaming (call id -> task, see ``start_early``).
+                Those calls still go through every check in order; their
+                result is awaited instead of executing the tool again.
 
         Yields:
             Dict with type="status" or type="tool_result" depending on yield_mode.
         """
-        import hashlib
-
-        for fc in function_calls:
-            # Circuit Breaker: prevent repeated identical tool calls
-            if call_history_hashes is not None:
-                normalized_args = {
-                    k: v.strip() if isinstance(v, str) else v
-                    for k, v in sorted(fc.arguments.items())
+        index = 0
+        while index < len(function_calls):
+            batch = ToolExecutor._parallel_batch(function_calls, index, max_parallel)
+            if len(batch) > 1:
+                async for event in ToolExecutor._execute_batch(
+                    batch,
+                    hass,
+                    messages,
+                    yield_mode,
+                    denied_tools,
+                    user_id,
+                    call_history_hashes,
+                    max_parallel,
+                    prefetched,
+                ):
+                    yield event
+                index += len(batch)
+                continue
+
+            async for event in ToolExecutor._execute_one(
+                function_calls[index],
+                hass,
+                messages,
+                yield_mode,
+                denied_tools,
+                user_id,
+                call_history_hashes,
+                approval_enabled,
+                prefetched,
+            ):
+                yield event
+            index += 1
+
+    @staticmethod
+    def _is_parallel_safe(fc: FunctionCall) -> bool:
+        """Whether a call may run concurrently with its neighbours."""
+        tool_class = ToolRegistry.get_tool_class(fc.name)
+        if tool_class is None:
+            return False
+        return getattr(tool_class, "read_only", False) is True and not getattr(
+            tool_class, "requires_confirmation", False
+        )
+
+    @staticmethod
+    def _parallel_batch(
+        function_calls: list[FunctionCall], start: int, max_parallel: int
+    ) -> list[FunctionCall]:
+        """Return the run of parallel-safe calls beginning at ``start``.
+
+        Returns a single call when that call must run on its own.
+        """
+        if max_parallel <= 1 or not ToolExecutor._is_parallel_safe(
+            function_calls[start]
+        ):
+            return function_calls[start : start + 1]
+        end = start + 1
+        while end < len(function_calls) and ToolExecutor._is_parallel_safe(
+            function_calls[end]
+        ):
+            end += 1
+        return function_calls[start:end]
+
+    @staticmethod
+    def _precheck(
+        fc: FunctionCall,
+        hass: Any,
+        denied_tools: frozenset[str] | None,
+        call_history_hashes: dict[str, int] | None,
+    ) -> tuple[str, str] | None:
+        """Run the circuit breaker, restriction and validation checks.
+
+        Returns:
+            ``(error_content, status_message)`` if the call must not run,
+            otherwise None.
+        """
+        # Circuit Breaker: prevent repeated identical tool calls
+        if call_history_hashes is not None:
+            tc_hash = ToolExecutor._call_hash(fc)
+            call_history_hashes[tc_hash] = call_history_hashes.get(tc_hash, 0) + 1
+            count = call_history_hashes[tc_hash]
+
+            if count >= 2:
+                _LOGGER.error("Circuit breaker triggered for tool '%s' (called %d times with identical args)", fc.name, count)
+                error_msg = json.dumps({
+                    "error": f"Circuit breaker activated: You called this tool with identical arguments {count} times in a row. Stop repeating yourself and try a different approach or inform the user."
+                })
+                return error_msg, f"✗ Circuit breaker: {fc.name} repeated too many times"
+
+        # Enforce tool restrictions
+        if denied_tools and fc.name in denied_tools:
+            _LOGGER.warning(
+                "Tool '%s' blocked by denied_tools restriction", fc.name
+            )
+            error_msg = json.dumps(
+                {
+                    "error": f"Tool '{fc.name}' is not available in this context.",
+                    "tool": fc.name,
                 }
-                args_str = json.dumps(normalized_args, sort_keys=True)
-                tc_hash = hashlib.md5(f"{fc.name}:{args_str}".encode()).hexdigest()
-                call_history_hashes[tc_hash] = call_history_hashes.get(tc_hash, 0) + 1
-                count = call_history_hashes[tc_hash]
-
-                if count >= 2:
-                    _LOGGER.error("Circuit breaker triggered for tool '%s' (called %d times with identical args)", fc.name, count)
-                    error_msg = json.dumps({
-                        "error": f"Circuit breaker activated: You called this tool with identical arguments {count} times in a row. Stop repeating yourself and try a different approach or inform the user."
-                    })
-                    messages.append({
-                        "role": "function",
-                        "name": fc.name,
-                        "tool_use_id": fc.id,
-                        "content": error_msg,
-                    })
-                    if yield_mode == "status":
-                        yield {
-                            "type": "status",
-                            "message": f"✗ Circuit breaker: {fc.name} repeated too many times",
-                        }
-                    elif yield_mode == "result":
-                        yield {
-                            "type": "tool_result",
-                            "name": fc.name,
-                            "result": error_msg,
-                            "id": fc.id,
-                        }
-                    continue
+            )
+            return error_msg, f"Tool {fc.name} blocked (restricted context)"
 
-            # Enforce tool restrictions
-            if denied_tools and fc.name in denied_tools:
-                _LOGGER.warning(
-                    "Tool '%s' blocked by denied_tools restriction", fc.name
-                )
-                error_msg = json.dumps(
-                    {
-                        "error": f"Tool '{fc.name}' is not available in this context.",
-                        "tool": fc.name,
-                    }
-                )
-                messages.append(
-                    {
-                        "role": "function",
-                        "name": fc.name,
-                        "tool_use_id": fc.id,
-                        "content": error_msg,
-                    }
-                )
-                if yield_mode == "status":
-                    yield {
-                        "type": "status",
-                        "message": f"Tool {fc.name} blocked (restricted context)",
-                    }
-                elif yield_mode == "result":
-                    yield {
-                        "type": "tool_result",
-                        "name": fc.name,
-                        "result": error_msg,
-                        "id": fc.id,
-                    }
-                continue
+        validation_error = ToolExecutor._build_validation_error(fc, hass)
+        if validation_error is not None:
+            _LOGGER.warning(
+                "Tool call validation failed before execution: %s args=%s",
+                fc.name,
+                fc.arguments,
+            )
+            return json.dumps(validation_error), f"✗ {fc.name} invalid arguments"
+
+        return None
+
+    @staticmethod
+    def _call_hash(fc: FunctionCall) -> str:
+        """Hash a call by name and normalized arguments (circuit breaker key)."""
+        normalized_args = {
+            k: v.strip() if isinstance(v, str) else v
+            for k, v in sorted(fc.arguments.items())
+        }
+        args_str = json.dumps(normalized_args, sort_keys=True)
+        return hashlib.md5(f"{fc.name}:{args_str}".encode()).hexdigest()
+
+    @staticmethod
+    def can_start_early(
+        fc: FunctionCall,
+        hass: Any,
+        denied_tools: frozenset[str] | None,
+        call_history_hashes: dict[str, int] | None,
+    ) -> bool:
+        """Whether ``fc`` may start before the provider stream has finished.
+
+        True only for read-only calls that the pre-execution checks are
+        going to accept.  Unlike ``_precheck`` this does not touch the
+        circuit-breaker counters.
+        """
+        if not ToolExecutor._is_parallel_safe(fc):
+            return False
+        if denied_tools and fc.name in denied_tools:
+            return False
+        if call_history_hashes and ToolExecutor._call_hash(fc) in call_history_hashes:
+            return False
+        return ToolExecutor._build_validation_error(fc, hass) is None
+
+    @staticmethod
+    def start_early(fc: FunctionCall, hass: Any, user_id: str) -> asyncio.Task[str]:
+        """Start executing a call in the background (see ``can_start_early``)."""
+        return asyncio.create_task(
+            ToolExecutor._run_tool(fc, ToolExecutor._exec_params(fc, user_id), hass),
+            name=f"homeclaw_tool_{fc.name}",
+        )
+
+    @staticmethod
+    async def _result_for(
+        fc: FunctionCall,
+        exec_params: dict[str, Any],
+        hass: Any,
+        prefetched: dict[str, asyncio.Task[str]] | None,
+    ) -> str:
+        """Await the prefetched result of ``fc`` or execute it now."""
+        task = prefetched.pop(fc.id, None) if prefetched else None
+        if task is not None:
+            return await task
+        return await ToolExecutor._run_tool(fc, exec_params, hass)
+
+    @staticmethod
+    def _discard_prefetched(
+        fc: FunctionCall, prefetched: dict[str, asyncio.Task[str]] | None
+    ) -> None:
+        """Cancel the prefetched result of a call that was rejected."""
+        task = prefetched.pop(fc.id, None) if prefetched else None
+        if task is not None:
+            task.cancel()
+
+    @staticmethod
+    def _record(
+        messages: list[dict[str, Any]],
+        fc: FunctionCall,
+        content: str,
+        status_message: str,
+        yield_mode: str,
+    ) -> dict[str, Any] | None:
+        """Append a tool result to ``messages`` and build the event to yield."""
+        messages.append(
+            {
+                "role": "function",
+                "name": fc.name,
+                "tool_use_id": fc.id,
+                "content": content,
+            }
+        )
+        if yield_mode == "status":
+            return {"type": "status", "message": status_message}
+        if yield_mode == "result":
+            return {
+                "type": "tool_result",
+                "name": fc.name,
+                "result": content,
+                "id": fc.id,
+            }
+        return None
+
+    @staticmethod
+    def _start_event(fc: FunctionCall, yield_mode: str) -> dict[str, Any] | None:
+        """Build the event announcing that a tool starts executing."""
+        if yield_mode == "status":
+            return {"type": "status", "message": f"Executing {fc.name}..."}
+        if yield_mode == "result":
+            return {
+                "type": "tool_call",
+                "name": fc.name,
+                "args": fc.arguments,
+                "id": fc.id,
+            }
+        return None
+
+    @staticmethod
+    def _exec_params(fc: FunctionCall, user_id: str) -> dict[str, Any]:
+        """Build the params passed to the tool.
+
+        ``_user_id`` is injected so tools can scope per-user actions without
+        relying on a shared global.
+        """
+        exec_params = dict(fc.arguments)
+        if user_id:
+            exec_params["_user_id"] = user_id
+        return exec_params
 
-            validation_error = ToolExecutor._build_validation_error(fc, hass)
-            if validation_error is not None:
-                _LOGGER.warning(
-                    "Tool call validation failed before execution: %s args=%s",
-                    fc.name,
-                    fc.arguments,
+    @staticmethod
+    async def _run_tool(
+        fc: FunctionCall, exec_params: dict[str, Any], hass: Any
+    ) -> str:
+        """Execute one tool and return its (size-capped) JSON result."""
+        result = await ToolRegistry.execute_tool(
+            tool_id=fc.name, params=exec_params, hass=hass
+        )
+        result_str = json.dumps(result.to_dict())
+
+        # Safety cap: truncate oversized tool results to prevent context overflow
+        if len(result_str) > MAX_TOOL_RESULT_CHARS:
+            _LOGGER.warning(
+                "Tool %s result truncated: %d -> %d chars",
+                fc.name,
+                len(result_str),
+                MAX_TOOL_RESULT_CHARS,
+            )
+            result_str = (
+                result_str[:MAX_TOOL_RESULT_CHARS]
+                + f"\n... [TRUNCATED — result was {len(result_str)} chars. "
+                + "Use pagination (limit/offset) or get_entity_state for details.]"
+            )
+
+        _LOGGER.debug("Tool %s executed successfully", fc.name)
+        return result_str
+
+    @staticmethod
+    async def _execute_batch(
+        batch: list[FunctionCall],
+        hass: Any,
+        messages: list[dict[str, Any]],
+        yield_mode: str,
+        denied_tools: frozenset[str] | None,
+        user_id: str,
+        call_history_hashes: dict[str, int] | None,
+        max_parallel: int,
+        prefetched: dict[str, asyncio.Task[str]] | None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Run read-only calls concurrently; record results in call order."""
+        blocked: list[tuple[str, str] | None] = []
+        for fc in batch:
+            check = ToolExecutor._precheck(fc, hass, denied_tools, call_history_hashes)
+            blocked.append(check)
+            if check is not None:
+                ToolExecutor._discard_prefetched(fc, prefetched)
+            else:
+                event = ToolExecutor._start_event(fc, yield_mode)
+                if event is not None:
+                    yield event
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _bounded(fc: FunctionCall) -> str:
+            task = prefetched.pop(fc.id, None) if prefetched else None
+            if task is not None:
+                return await task
+            async with semaphore:
+                _LOGGER.debug(
+                    "Executing tool (parallel): %s with args: %s", fc.name, fc.arguments
                 )
-                error_msg = json.dumps(validation_error)
-                messages.append(
-                    {
-                        "role": "function",
-                        "name": fc.name,
-                        "tool_use_id": fc.id,
-                        "content": error_msg,
-                    }
+                return await ToolExecutor._run_tool(
+                    fc, ToolExecutor._exec_params(fc, user_id), hass
                 )
-                if yield_mode == "status":
-                    yield {
-                        "type": "status",
-                        "message": f"✗ {fc.name} invalid arguments",
-                    }
-                elif yield_mode == "result":
-                    yield {
-                        "type": "tool_result",
-                        "name": fc.name,
-                        "result": error_msg,
-                        "id": fc.id,
-                    }
-                continue
 
-            try:
-                _LOGGER.debug("Executing tool: %s with args: %s", fc.name, fc.arguments)
-
-                if yield_mode == "status":
-                    yield {
-                        "type": "status",
-                        "message": f"Executing {fc.name}...",
-                    }
-                elif yield_mode == "result":
-                    yield {
-                        "type": "tool_call",
-                        "name": fc.name,
-                        "args": fc.arguments,
-                        "id": fc.id,
-                    }
-
-                # Execute the tool — inject _user_id into params so tools
-                # can scope per-user actions without a shared global.
-                exec_params = dict(fc.arguments)
-                if user_id:
-                    exec_params["_user_id"] = user_id
-
-                tool_class = (
-                    ToolRegistry.get_tool_class(fc.name) if approval_enabled else None
-                )
-                if tool_class is not None and getattr(
-                    tool_class, "requires_confirmation", False
-                ):
-                    from .pending_actions import discard_approval, register_approval
+        outcomes = iter(
+            await asyncio.gather(
+                *(_bounded(fc) for fc, check in zip(batch, blocked) if check is None),
+                return_exceptions=True,
+            )
+        )
+
+        for fc, check in zip(batch, blocked):
+            if check is not None:
+                content, status_message = check
+            else:
+                outcome = next(outcomes)
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    _LOGGER.error("Tool execution failed: %s - %s", fc.name, outcome)
+                    content = json.dumps({"error": str(outcome), "tool": fc.name})
+                    status_message = f"✗ {fc.name} failed: {str(outcome)}"
+                else:
+                    content = outcome
+                    status_message = f"Tool {fc.name} completed"
+            event = ToolExecutor._record(
+                messages, fc, content, status_message, yield_mode
+            )
+            if event is not None:
+                yield event
 
-                    has_dry_run = any(
-                        getattr(p, "name", None) == "dry_run"
-                        for p in getattr(tool_class, "parameters", [])
-                    )
-                    preview = await ToolExecutor._build_confirmation_preview(
-                        fc.name, exec_params, hass, has_dry_run
-                    )
-                    approval_future = register_approval(fc.id)
-                    yield {
-                        "type": "approval_request",
-                        "name": fc.name,
-                        "args": fc.arguments,
-                        "id": fc.id,
-                        "preview": preview,
-                    }
-                    try:
-                        approved = await asyncio.wait_for(
-                            approval_future, timeout=APPROVAL_TIMEOUT_SECONDS
-                        )
-                    except asyncio.TimeoutError:
-                        approved = False
-                    finally:
-                        discard_approval(fc.id)
-
-                    if not approved:
-                        rejection = json.dumps(
-                            {
-                                "status": "cancelled_by_user",
-                                "rejected": True,
-                                "message": (
-                                    "The user reviewed this action and chose to "
-                                    "CANCEL it — nothing was applied. This is a "
-                                    "deliberate user choice, NOT an error or "
-                                    "failure. Do not retry the same action and do "
-                                    "not apologize for a failure. Briefly confirm "
-                                    "you cancelled it and, if useful, ask what "
-                                    "they would like to change."
-                                ),
-                            }
-                        )
-                        messages.append(
-                            {
-                                "role": "function",
-                                "name": fc.name,
-                                "tool_use_id": fc.id,
-                                "content": rejection,
-                            }
-                        )
-                        if yield_mode == "status":
-                            yield {
-                                "type": "status",
-                                "message": f"✗ {fc.name} rejected by user",
-                            }
-                        elif yield_mode == "result":
-                            yield {
-                                "type": "tool_result",
-                                "name": fc.name,
-                                "result": rejection,
-                                "id": fc.id,
-                            }
-                        continue
-
-                    if has_dry_run:
-                        exec_params["dry_run"] = False
-
-                result = await ToolRegistry.execute_tool(
-                    tool_id=fc.name, params=exec_params, hass=hass
-                )
-                result_str = json.dumps(result.to_dict())
-
-                # Safety cap: truncate oversized tool results to prevent context overflow
-                if len(result_str) > MAX_TOOL_RESULT_CHARS:
-                    _LOGGER.warning(
-                        "Tool %s result truncated: %d -> %d chars",
-                        fc.name,
-                        len(result_str),
-                        MAX_TOOL_RESULT_CHARS,
-                    )
-                    result_str = (
-                        result_str[:MAX_TOOL_RESULT_CHARS]
-                        + f"\n... [TRUNCATED — result was {len(result_str)} chars. "
-                        + "Use pagination (limit/offset) or get_entity_state for details.]"
-                    )
+    @staticmethod
+    async def _execute_one(
+        fc: FunctionCall,
+        hass: Any,
+        messages: list[dict[str, Any]],
+        yield_mode: str,
+        denied_tools: frozenset[str] | None,
+        user_id: str,
+        call_history_hashes: dict[str, int] | None,
+        approval_enabled: bool,
+        prefetched: dict[str, asyncio.Task[str]] | None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Run a single call, including the approval flow."""
+        check = ToolExecutor._precheck(fc, hass, denied_tools, call_history_hashes)
+        if check is not None:
+            ToolExecutor._discard_prefetched(fc, prefetched)
+            event = ToolExecutor._record(messages, fc, *check, yield_mode)
+            if event is not None:
+                yield event
+            return
 
-                _LOGGER.debug("Tool %s executed successfully", fc.name)
+        try:
+            _LOGGER.debug("Executing tool: %s with args: %s", fc.name, fc.arguments)
 
-                # Add result to messages list
-                messages.append(
-                    {
-                        "role": "function",
-                        "name": fc.name,
-                        "tool_use_id": fc.id,
-                        "content": result_str,
-                    }
-                )
+            event = ToolExecutor._start_event(fc, yield_mode)
+            if event is not None:
+                yield event
+
+            exec_params = ToolExecutor._exec_params(fc, user_id)
 
-                if yield_mode == "status":
-                    yield {
-                        "type": "status",
-                        "message": f"Tool {fc.name} completed",
-                    }
-                elif yield_mode == "result":
-                    yield {
-                        "type": "tool_result",
-                        "name": fc.name,
-                        "result": result_str,
-                        "id": fc.id,
-                    }
-
-            except Exception as e:
-                _LOGGER.error("Tool execution failed: %s - %s", fc.name, e)
-                error_msg = json.dumps({"error": str(e), "tool": fc.name})
-
-                # Add error to messages list
-                messages.append(
-                    {
-                        "role": "function",
-                        "name": fc.name,
-                        "tool_use_id": fc.id,
-                        "content": error_msg,
-                    }
+            tool_class = (
+                ToolRegistry.get_tool_class(fc.name) if approval_enabled else None
+            )
+            if tool_class is not None and getattr(
+                tool_class, "requires_confirmation", False
+            ):
+                from .pending_actions import discard_approval, register_approval
+
+                has_dry_run = any(
+                    getattr(p, "name", None) == "dry_run"
+                    for p in getattr(tool_class, "parameters", [])
                 )
+                preview = await ToolExecutor._build_confirmation_preview(
+                    fc.name, exec_params, hass, has_dry_run
+                )
+                approval_future = register_approval(fc.id)
+                yield {
+                    "type": "approval_request",
+                    "name": fc.name,
+                    "args": fc.arguments,
+                    "id": fc.id,
+                    "preview": preview,
+                }
+                try:
+                    approved = await asyncio.wait_for(
+                        approval_future, timeout=APPROVAL_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    approved = False
+                finally:
+                    discard_approval(fc.id)
+
+                if not approved:
+                    rejection = json.dumps(
+                        {
+                            "status": "cancelled_by_user",
+                            "rejected": True,
+                            "message": (
+                                "The user reviewed this action and chose to "
+                                "CANCEL it — nothing was applied. This is a "
+                                "deliberate user choice, NOT an error or "
+                                "failure. Do not retry the same action and do "
+                                "not apologize for a failure. Briefly confirm "
+                                "you cancelled it and, if useful, ask what "
+                                "they would like to change."
+                            ),
+                        }
+                    )
+                    event = ToolExecutor._record(
+                        messages,
+                        fc,
+                        rejection,
+                        f"✗ {fc.name} rejected by user",
+                        yield_mode,
+                    )
+                    if event is not None:
+                        yield event
+                    return
 
-                if yield_mode == "status":
-                    yield {
-                        "type": "status",
-                        "message": f"✗ {fc.name} failed: {str(e)}",
-                    }
-                elif yield_mode == "result":
-                    yield {
-                        "type": "tool_result",
-                        "name": fc.name,
-                        "result": error_msg,
-                        "id": fc.id,
-                    }
+                if has_dry_run:
+                    exec_params["dry_run"] = False
+
+            result_str = await ToolExecutor._result_for(
+                fc, exec_params, hass, prefetched
+            )
+            status_message = f"Tool {fc.name} completed"
+
+        except Exception as e:
+            _LOGGER.error("Tool execution failed: %s - %s", fc.name, e)
+            result_str = json.dumps({"error": str(e), "tool": fc.name})
+            status_message = f"✗ {fc.name} failed: {str(e)}"
+
+        event = ToolExecutor._record(
+            messages, fc, result_str, status_message, yield_mode
+        )
+        if event is not None:
+            yield event
 
     @staticmethod
     async def _build_confirmation_preview(
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 from ..function_calling import FunctionCall
 from .context_builder import recompact_if_needed
+from .token_estimator import calibration_key
 from .tool_executor import ToolExecutor
 
 if TYPE_CHECKING:
@@ -55,8 +56,8 @@ def expand_loaded_tools(
         _LOGGER.debug("load_tool is in denied_tools, skipping all expansion")
         return effective_tools
 
-    from ..function_calling import ToolSchemaConverter
     from ..tools.base import ToolRegistry, ToolTier
+    from .tool_schema_cache import ToolSchemaCache
 
     for fc in function_calls:
         if fc.name != "load_tool":
@@ -105,7 +106,7 @@ def expand_loaded_tools(
             _LOGGER.warning("load_tool: tool %s could not be instantiated", tool_name)
             continue
 
-        new_schemas = ToolSchemaConverter.to_openai_format([tool_instance])
+        new_schemas = ToolSchemaCache.to_openai_format([tool_instance])
         effective_tools.extend(new_schemas)
         _LOGGER.info(
             "load_tool: dynamically added '%s' to effective_tools (%d total)",
@@ -123,7 +124,7 @@ async def run_tool_loop_nonstream(
     effective_tools: list[dict[str, Any]] | None,
     effective_max_iterations: int,
     detect_function_call_fn: Any,
-    allowed_names: set[str],
+    allowed_names: frozenset[str],
     hass: Any,
     denied_tools: frozenset[str] | None,
     config: dict[str, Any] | None,
@@ -185,7 +186,9 @@ async def run_tool_loop_nonstream(
             config=config,
         )
         built_messages = await recompact_if_needed(
-            built_messages, context_window=context_window
+            built_messages,
+            context_window=context_window,
+            calibration_key=calibration_key(provider),
         )
         current_iteration += 1
 
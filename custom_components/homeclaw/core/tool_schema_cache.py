@@ -0,0 +1,142 @@
+"""Memoized tool-schema compilation.
+
+Tool schemas only depend on tool class metadata, yet every agent turn used
+to rebuild them: ``ToolSchemaConverter.to_openai_format`` for the canonical
+(OpenAI) format, then the provider adapter's ``transform_tools`` (plus the
+Gemini schema sanitizer) and ``json.dumps`` for token estimates.
+
+``ToolSchemaCache`` compiles each tool once into a canonical schema with a
+precomputed token estimate, and each provider-specific tool set once per
+adapter and frozenset of tool IDs.  Everything is dropped when the
+``ToolRegistry`` changes (``register``/``clear``).
+
+Canonical schema dicts are shared between turns and must be treated as
+read-only; the lists returned are fresh copies, so callers may extend or
+reorder them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ..function_calling import ToolSchemaConverter
+from ..tools.base import ToolRegistry
+from .token_estimator import estimate_tokens
+
+if TYPE_CHECKING:
+    from ..tools.base import Tool
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ToolSchemaCache:
+    """Process-wide cache of compiled tool schemas."""
+
+    # Registry generation the cached entries belong to
+    _generation: ClassVar[int] = -1
+    # tool id -> (tool class, canonical schema, token estimate)
+    _schemas: ClassVar[dict[str, tuple[type, dict[str, Any], int]]] = {}
+    # (adapter/variant, tool ids) -> (tool id order, provider-format tools)
+    _compiled: ClassVar[
+        dict[tuple[str, frozenset[str]], tuple[tuple[str, ...], Any]]
+    ] = {}
+
+    @classmethod
+    def _sync(cls) -> None:
+        """Drop all entries when the tool registry has changed."""
+        generation = ToolRegistry.generation()
+        if generation != cls._generation:
+            cls._schemas.clear()
+            cls._compiled.clear()
+            cls._generation = generation
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all compiled schemas."""
+        cls._schemas.clear()
+        cls._compiled.clear()
+        cls._generation = -1
+
+    @classmethod
+    def _entry(cls, tool: Tool) -> tuple[type, dict[str, Any], int]:
+        """Return the cached (class, schema, tokens) entry for a tool instance."""
+        entry = cls._schemas.get(tool.id)
+        if entry is None or entry[0] is not type(tool):
+            schema = ToolSchemaConverter.to_openai_format([tool])[0]
+            tokens = estimate_tokens(json.dumps(schema, ensure_ascii=False))
+            entry = (type(tool), schema, tokens)
+            cls._schemas[tool.id] = entry
+        return entry
+
+    @classmethod
+    def to_openai_format(cls, tools: list[Tool]) -> list[dict[str, Any]]:
+        """Cached equivalent of ``ToolSchemaConverter.to_openai_format``."""
+        cls._sync()
+        return [cls._entry(tool)[1] for tool in tools]
+
+    @classmethod
+    def _is_canonical(cls, schema: dict[str, Any]) -> bool:
+        """Whether ``schema`` is the cached canonical dict for its tool."""
+        name = schema.get("function", {}).get("name")
+        entry = cls._schemas.get(name) if isinstance(name, str) else None
+        return entry is not None and entry[1] is schema
+
+    @classmethod
+    def estimate_tokens(cls, tools: list[dict[str, Any]] | None) -> int:
+        """Estimate the prompt tokens taken by OpenAI-format tool schemas.
+
+        Uses the precomputed estimate for cached schemas and falls back to
+        serializing anything else.
+        """
+        if not tools:
+            return 0
+        cls._sync()
+        total = 0
+        for tool in tools:
+            if cls._is_canonical(tool):
+                total += cls._schemas[tool["function"]["name"]][2]
+            else:
+                total += estimate_tokens(json.dumps(tool, ensure_ascii=False))
+        return total
+
+    @classmethod
+    def compile(
+        cls,
+        key: str,
+        tools: list[dict[str, Any]],
+        transform: Callable[[list[dict[str, Any]]], Any],
+    ) -> Any:
+        """Return ``transform(tools)``, memoized per ``key`` and tool set.
+
+        Only tool lists made entirely of cached canonical schemas (see
+        ``to_openai_format``) are memoized; anything else is transformed
+        on every call.  List results are returned as shallow copies.
+
+        Args:
+            key: Identifies the transform, e.g. the adapter class name.
+            tools: Tools in OpenAI format.
+            transform: Converts the tools into the provider format.
+        """
+        cls._sync()
+        if not all(cls._is_canonical(tool) for tool in tools):
+            return transform(tools)
+
+        names = tuple(tool["function"]["name"] for tool in tools)
+        cache_key = (key, frozenset(names))
+        cached = cls._compiled.get(cache_key)
+        if cached is None or cached[0] != names:
+            cached = (names, transform(tools))
+            cls._compiled[cache_key] = cached
+            _LOGGER.debug("Compiled %d tool schemas for %s", len(names), key)
+        result = cached[1]
+        return list(result) if isinstance(result, list) else result
+
+
+def compile_tools(adapter: Any, tools: list[dict[str, Any]], variant: str = "") -> Any:
+    """Convert tools with ``adapter.transform_tools`` through the cache."""
+    return ToolSchemaCache.compile(
+        type(adapter).__name__ + variant, tools, adapter.transform_tools
+    )
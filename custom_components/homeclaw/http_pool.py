@@ -0,0 +1,211 @@
+"""Shared HTTP connection pool for provider, embedding and tool clients.
+
+Every outbound HTTP client in Homeclaw (LLM providers, embedding
+providers, web tools) draws its ``aiohttp.ClientSession`` from one
+``HttpPool`` per Home Assistant instance, so connections, TLS sessions
+and DNS lookups are reused across requests instead of being set up per
+call.  The pool is closed by ``SubsystemLifecycle`` when the last config
+entry is unloaded; a later request simply opens a fresh pool.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HTTP_POOL = "homeclaw_http_pool"
+
+# Connector tuning
+POOL_LIMIT = 100  # total open connections
+POOL_LIMIT_PER_HOST = 10  # per API host (streams + parallel tool/embedding calls)
+DNS_CACHE_TTL = 300  # seconds
+# LLM APIs sit idle between conversation turns; keep connections warm longer
+# than aiohttp's 15 s default so the next turn skips the TLS handshake.
+KEEPALIVE_TIMEOUT = 60.0  # seconds
+
+
+class HttpPool:
+    """Owns the shared aiohttp sessions and their connection metrics.
+
+    One session verifies TLS certificates; a second one (created only when
+    requested) skips verification for providers configured to do so.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = POOL_LIMIT,
+        limit_per_host: int = POOL_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DNS_CACHE_TTL,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """Initialize the pool (sessions are created on first use).
+
+        Args:
+            limit: Maximum open connections per session.
+            limit_per_host: Maximum open connections per host.
+            dns_cache_ttl: DNS cache lifetime in seconds.
+            keepalive_timeout: Idle time before a kept-alive connection closes.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: dict[bool, aiohttp.ClientSession] = {}
+        self._requests = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._queued = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+    def session(self, *, verify_ssl: bool = True) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        Callers must not close the returned session.
+        """
+        session = self._sessions.get(verify_ssl)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+                ssl=None if verify_ssl else False,
+            )
+            # Shared by every provider and tool: never carry cookies from
+            # one request (or API) over to another
+            session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[self._trace_config()],
+            )
+            self._sessions[verify_ssl] = session
+        return session
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get pool utilization and connection-reuse metrics.
+
+        ``connections_created`` counts new TCP (and TLS) handshakes; a high
+        ``reuse_rate_pct`` means keep-alive is saving them.
+        """
+        connections = self._connections_created + self._connections_reused
+        reuse_rate = self._connections_reused / connections * 100 if connections else 0
+        return {
+            "requests": self._requests,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "utilization_pct": round(self._in_flight / self.limit * 100, 1),
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_rate_pct": round(reuse_rate, 1),
+            "queued_for_connection": self._queued,
+            "dns_cache_hits": self._dns_cache_hits,
+            "dns_cache_misses": self._dns_cache_misses,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+        }
+
+    async def async_close(self) -> None:
+        """Close all sessions and their kept-alive connections."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Build the request tracer that feeds the metrics."""
+        trace = aiohttp.TraceConfig()
+
+        async def _on_request_start(*_: Any) -> None:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        async def _on_request_done(*_: Any) -> None:
+            self._in_flight = max(0, self._in_flight - 1)
+
+        async def _on_connection_created(*_: Any) -> None:
+            self._connections_created += 1
+
+        async def _on_connection_reused(*_: Any) -> None:
+            self._connections_reused += 1
+
+        async def _on_connection_queued(*_: Any) -> None:
+            self._queued += 1
+
+        async def _on_dns_cache_hit(*_: Any) -> None:
+            self._dns_cache_hits += 1
+
+        async def _on_dns_cache_miss(*_: Any) -> None:
+            self._dns_cache_misses += 1
+
+        trace.on_request_start.append(_on_request_start)
+        trace.on_request_end.append(_on_request_done)
+        trace.on_request_exception.append(_on_request_done)
+        trace.on_connection_create_end.append(_on_connection_created)
+        trace.on_connection_reuseconn.append(_on_connection_reused)
+        trace.on_connection_queued_start.append(_on_connection_queued)
+        trace.on_dns_cache_hit.append(_on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(_on_dns_cache_miss)
+        return trace
+
+
+def get_http_pool(hass: HomeAssistant) -> HttpPool:
+    """Return the Home Assistant instance's pool, creating it on first use."""
+    pool = hass.data.get(DATA_HTTP_POOL)
+    if pool is None:
+        pool = hass.data[DATA_HTTP_POOL] = HttpPool()
+    return pool
+
+
+def get_pooled_session(
+    hass: HomeAssistant, *, verify_ssl: bool = True
+) -> aiohttp.ClientSession:
+    """Return the shared session for ``hass`` (callers must not close it)."""
+    return get_http_pool(hass).session(verify_ssl=verify_ssl)
+
+
+@asynccontextmanager
+async def borrowed_session(
+    pool: HttpPool | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the pool's shared session, or a short-lived one without a pool.
+
+    Clients may be constructed without a pool or Home Assistant instance
+    (e.g. in scripts); they still work, just without connection reuse.
+    """
+    if pool is None:
+        async with aiohttp.ClientSession() as session:
+            yield session
+    else:
+        yield pool.session()
+
+
+def pooled_session(
+    hass: HomeAssistant | None,
+) -> AbstractAsyncContextManager[aiohttp.ClientSession]:
+    """``borrowed_session`` for the pool of ``hass`` (if any)."""
+    return borrowed_session(get_http_pool(hass) if hass is not None else None)
+
+
+async def async_close_http_pool(hass: HomeAssistant) -> None:
+    """Close and forget the pool for ``hass`` (no-op if none was created)."""
+    pool: HttpPool | None = hass.data.pop(DATA_HTTP_POOL, None)
+    if pool is None:
+        return
+    _LOGGER.debug("Closing HTTP pool: %s", pool.get_metrics())
+    await pool.async_close()
@@ -3,7 +3,8 @@
 A single ``asyncio.Lock`` guarantees mutual exclusion between concurrent
 ``async_setup_entry`` calls and between init/shutdown.
 
-Init order: proactive → channels → rag → services → websocket → frontend.
+Init order: tokenizer → proactive → channels → rag → services → websocket →
+frontend.
 Shutdown is the reverse.  Each subsystem is independent — a failure in one
 does not prevent others from starting or stopping.
 """
@@ -105,6 +106,7 @@ class SubsystemLifecycle:
         self, hass: HomeAssistant, entry: ConfigEntry, config_data: dict[str, Any]
     ) -> None:
         """Start subsystems in order.  Each group is independent."""
+        await self._start_tokenizer(hass)
         await self._start_proactive(hass)
         await self._start_channels(hass, entry)
         await self._start_rag(hass, config_data, entry)
@@ -112,6 +114,15 @@ class SubsystemLifecycle:
         await self._start_websocket(hass)
         await self._start_frontend(hass)
 
+    async def _start_tokenizer(self, hass: HomeAssistant) -> None:
+        """Switch token accounting to the BPE tokenizer if it is installed."""
+        try:
+            from .core.token_estimator import load_bpe_tokenizer
+
+            await hass.async_add_executor_job(load_bpe_tokenizer)
+        except Exception:
+            _LOGGER.warning("Tokenizer load failed", exc_info=True)
+
     async def _start_proactive(self, hass: HomeAssistant) -> None:
         """Start heartbeat, scheduler, and subagent manager."""
         started: list[tuple[str, _StopFn]] = []
@@ -254,6 +265,7 @@ class SubsystemLifecycle:
         await self._stop_channels(hass)
         await self._stop_proactive(hass)
         self._cleanup_storage_cache(hass)
+        await self._stop_http_pool(hass)
 
     async def _stop_frontend(self, hass: HomeAssistant) -> None:
         """Remove the sidebar panel."""
@@ -312,6 +324,15 @@ class SubsystemLifecycle:
         hass.data[DOMAIN].pop("subagent_manager", None)
         self._subagent_mgr = None
 
+    async def _stop_http_pool(self, hass: HomeAssistant) -> None:
+        """Close the shared HTTP connection pool (after everything using it)."""
+        try:
+            from .http_pool import async_close_http_pool
+
+            await async_close_http_pool(hass)
+        except Exception:
+            _LOGGER.warning("HTTP pool shutdown error", exc_info=True)
+
     def _cleanup_storage_cache(self, hass: HomeAssistant) -> None:
         """Remove cached storage instances from hass.data."""
         prefix = f"{DOMAIN}_storage_"
@@ -10,6 +10,7 @@ Tables created:
 from __future__ import annotations
 
 import logging
+import sqlite3
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -52,29 +53,27 @@ class IdentityStore:
         if self._table_created:
             return
 
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             raise RuntimeError("SqliteStore connection not available")
 
-        cursor = conn.cursor()
-
-        # Agent identity table (one row per user)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS agent_identity (
-                user_id TEXT PRIMARY KEY,
-                agent_name TEXT,
-                agent_personality TEXT,
-                agent_emoji TEXT,
-                user_name TEXT,
-                user_info TEXT,
-                language TEXT DEFAULT 'auto',
-                onboarding_completed INTEGER DEFAULT 0,
-                created_at REAL NOT NULL,
-                updated_at REAL NOT NULL
-            )
-        """)
-
-        conn.commit()
+        def _create(conn: sqlite3.Connection) -> None:
+            # Agent identity table (one row per user)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS agent_identity (
+                    user_id TEXT PRIMARY KEY,
+                    agent_name TEXT,
+                    agent_personality TEXT,
+                    agent_emoji TEXT,
+                    user_name TEXT,
+                    user_info TEXT,
+                    language TEXT DEFAULT 'auto',
+                    onboarding_completed INTEGER DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+        await self.store.run_write("identity_initialize", _create)
         self._table_created = True
         _LOGGER.info("Agent identity table initialized")
 
@@ -87,13 +86,15 @@ class IdentityStore:
         Returns:
             AgentIdentity if found, None if user hasn't been onboarded.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return None
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM agent_identity WHERE user_id = ?", (user_id,))
-        row = cursor.fetchone()
+        def _get(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
+                "SELECT * FROM agent_identity WHERE user_id = ?", (user_id,)
+            ).fetchone()
+
+        row = await self.store.run_read("get_identity", _get)
 
         if not row:
             return None
@@ -117,8 +118,7 @@ class IdentityStore:
         Args:
             identity: The identity to save.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return
 
         now = time.time()
@@ -128,28 +128,31 @@ class IdentityStore:
             identity.created_at = now
         identity.updated_at = now
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO agent_identity
-            (user_id, agent_name, agent_personality, agent_emoji, user_name, user_info,
-             language, onboarding_completed, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                identity.user_id,
-                identity.agent_name,
-                identity.agent_personality,
-                identity.agent_emoji,
-                identity.user_name,
-                identity.user_info,
-                identity.language,
-                1 if identity.onboarding_completed else 0,
-                identity.created_at,
-                identity.updated_at,
-            ),
+        row = (
+            identity.user_id,
+            identity.agent_name,
+            identity.agent_personality,
+            identity.agent_emoji,
+            identity.user_name,
+            identity.user_info,
+            identity.language,
+            1 if identity.onboarding_completed else 0,
+            identity.created_at,
+            identity.updated_at,
         )
-        conn.commit()
+
+        def _save(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO agent_identity
+                (user_id, agent_name, agent_personality, agent_emoji, user_name, user_info,
+                 language, onboarding_completed, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                row,
+            )
+
+        await self.store.run_write("save_identity", _save)
 
         _LOGGER.debug(
             "Saved identity for user %s (name=%s, onboarded=%s)",
@@ -12,9 +12,11 @@ so memory embeddings benefit from the same cache and retry logic.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..rate_scheduler import Priority, request_priority
 from .auto_capture import extract_explicit_commands
 from .memory_store import Memory, MemoryStore
 
@@ -37,10 +39,13 @@ class MemoryManager:
     Args:
         store: SqliteStore instance from the RAG system.
         embedding_provider: CachedEmbeddingProvider from the RAG system.
+        on_memories_changed: Optional callback receiving the user ID whose
+            memories changed (None when the user is unknown).
     """
 
     store: Any  # SqliteStore
     embedding_provider: Any  # CachedEmbeddingProvider or EmbeddingProvider
+    on_memories_changed: Callable[[str | None], None] | None = None
     _memory_store: MemoryStore | None = field(default=None, repr=False)
     _initialized: bool = field(default=False, repr=False)
 
@@ -90,35 +95,21 @@ class MemoryManager:
         if not candidates:
             return 0
 
-        captured = 0
-        for candidate in candidates:
-            try:
-                text = candidate["text"]
-                embeddings = await self.embedding_provider.get_embeddings([text])
-                if not embeddings or not embeddings[0]:
-                    continue
-
-                memory_id = await self._memory_store.store_memory(
-                    text=text,
-                    embedding=embeddings[0],
-                    user_id=user_id,
-                    category=candidate["category"],
-                    importance=candidate["importance"],
-                    source="auto",
-                    session_id=session_id,
-                )
-
-                if memory_id:
-                    captured += 1
-                    _LOGGER.info(
-                        "Explicit-captured [%s]: %s",
-                        candidate["category"],
-                        text[:80],
-                    )
-            except Exception as e:
-                _LOGGER.debug("Failed to capture explicit command: %s", e)
+        try:
+            stored = await self._store_batch(
+                candidates, user_id, source="auto", session_id=session_id
+            )
+        except Exception as e:
+            _LOGGER.debug("Failed to capture explicit commands: %s", e)
+            return 0
 
-        return captured
+        for candidate in stored:
+            _LOGGER.info(
+                "Explicit-captured [%s]: %s",
+                candidate["category"],
+                candidate["text"][:80],
+            )
+        return len(stored)
 
     async def recall_for_query(
         self,
@@ -127,6 +118,7 @@ class MemoryManager:
         *,
         top_k: int = RECALL_TOP_K,
         min_similarity: float = RECALL_MIN_SIMILARITY,
+        query_embedding: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Recall relevant memories for a user query.
 
@@ -138,6 +130,7 @@ class MemoryManager:
             user_id: User whose memories to search.
             top_k: Maximum memories to return.
             min_similarity: Minimum relevance threshold.
+            query_embedding: Pre-computed query embedding (embedded here if None).
 
         Returns:
             List of memory dictionaries, or empty list.
@@ -146,11 +139,12 @@ class MemoryManager:
 
         try:
             # Generate query embedding
-            embeddings = await self.embedding_provider.get_embeddings([query])
-            if not embeddings or not embeddings[0]:
-                return []
+            if query_embedding is None:
+                embeddings = await self.embedding_provider.get_embeddings([query])
+                if not embeddings or not embeddings[0]:
+                    return []
 
-            query_embedding = embeddings[0]
+                query_embedding = embeddings[0]
 
             # Vector search
             vector_results = await self._memory_store.search_memories(
@@ -214,7 +208,7 @@ class MemoryManager:
         if not embeddings or not embeddings[0]:
             return None
 
-        return await self._memory_store.store_memory(
+        memory_id = await self._memory_store.store_memory(
             text=text,
             embedding=embeddings[0],
             user_id=user_id,
@@ -224,6 +218,9 @@ class MemoryManager:
             session_id=session_id,
             ttl_days=ttl_days,
         )
+        if memory_id:
+            self._notify_changed(user_id)
+        return memory_id
 
     async def forget_memory(self, memory_id: str) -> bool:
         """Delete a specific memory.
@@ -235,7 +232,10 @@ class MemoryManager:
             True if deleted successfully.
         """
         self._ensure_initialized()
-        return await self._memory_store.delete_memory(memory_id)
+        deleted = await self._memory_store.delete_memory(memory_id)
+        if deleted:
+            self._notify_changed(None)
+        return deleted
 
     async def forget_all_user_memories(self, user_id: str) -> int:
         """Delete all memories for a user (GDPR).
@@ -247,7 +247,10 @@ class MemoryManager:
             Number of memories deleted.
         """
         self._ensure_initialized()
-        return await self._memory_store.delete_user_memories(user_id)
+        deleted = await self._memory_store.delete_user_memories(user_id)
+        if deleted:
+            self._notify_changed(user_id)
+        return deleted
 
     async def search_memories(
         self,
@@ -409,7 +412,8 @@ class MemoryManager:
             if provider.lightweight_model:
                 flush_kwargs["model"] = provider.lightweight_model
 
-            response = await provider.get_response(flush_messages, **flush_kwargs)
+            with request_priority(Priority.BACKGROUND, "memory_flush"):
+                response = await provider.get_response(flush_messages, **flush_kwargs)
             if not response:
                 _LOGGER.debug("AI flush returned empty response")
                 return 0
@@ -428,54 +432,57 @@ class MemoryManager:
             _LOGGER.warning("AI flush failed (%s), falling back to explicit capture", e)
             return await self._explicit_flush(messages, user_id, session_id)
 
-        captured = 0
+        from .auto_capture import ANTI_PATTERNS
+
+        candidates: list[dict[str, Any]] = []
         for mem in memories[: self._FLUSH_MAX_MEMORIES]:
             try:
                 text = mem.get("text", "")
                 category = mem.get("category", "fact")
                 importance = float(mem.get("importance", 0.7))
+            except Exception as e:
+                _LOGGER.debug("Skipping malformed AI-flush memory: %s", e)
+                continue
 
-                if not text or len(text) < 10:
-                    continue
-
-                # Sanitize: reject memories containing control tokens or injections
-                from .auto_capture import ANTI_PATTERNS
-
-                if any(pattern.search(text) for pattern in ANTI_PATTERNS):
-                    _LOGGER.warning(
-                        "AI flush produced unsafe memory, skipping: %s", text[:80]
-                    )
-                    continue
-
-                importance = max(0.1, min(1.0, importance))
-                if category not in (
-                    "preference",
-                    "fact",
-                    "decision",
-                    "observation",
-                    "entity",
-                ):
-                    category = "fact"
-
-                embeddings = await self.embedding_provider.get_embeddings([text])
-                if not embeddings or not embeddings[0]:
-                    continue
+            if not isinstance(text, str) or len(text) < 10:
+                continue
 
-                memory_id = await self._memory_store.store_memory(
-                    text=text,
-                    embedding=embeddings[0],
-                    user_id=user_id,
-                    category=category,
-                    importance=importance,
-                    source="ai_flush",
-                    session_id=session_id,
+            # Sanitize: reject memories containing control tokens or injections
+            if any(pattern.search(text) for pattern in ANTI_PATTERNS):
+                _LOGGER.warning(
+                    "AI flush produced unsafe memory, skipping: %s", text[:80]
                 )
+                continue
+
+            importance = max(0.1, min(1.0, importance))
+            if category not in (
+                "preference",
+                "fact",
+                "decision",
+                "observation",
+                "entity",
+            ):
+                category = "fact"
+            candidates.append(
+                {"text": text, "category": category, "importance": importance}
+            )
 
-                if memory_id:
-                    captured += 1
-                    _LOGGER.info("AI-flush captured [%s]: %s", category, text[:80])
+        captured = 0
+        if candidates:
+            try:
+                stored = await self._store_batch(
+                    candidates, user_id, source="ai_flush", session_id=session_id
+                )
             except Exception as e:
-                _LOGGER.debug("Failed to store AI-flush memory: %s", e)
+                _LOGGER.debug("Failed to store AI-flush memories: %s", e)
+                stored = []
+            for candidate in stored:
+                _LOGGER.info(
+                    "AI-flush captured [%s]: %s",
+                    candidate["category"],
+                    candidate["text"][:80],
+                )
+            captured = len(stored)
 
         _LOGGER.info(
             "AI flush captured %d memories from %d messages", captured, len(messages)
@@ -493,30 +500,66 @@ class MemoryManager:
         if not candidates:
             return 0
 
-        captured = 0
-        for candidate in candidates:
-            try:
-                text = candidate["text"]
-                embeddings = await self.embedding_provider.get_embeddings([text])
-                if not embeddings or not embeddings[0]:
-                    continue
+        try:
+            stored = await self._store_batch(
+                candidates, user_id, source="auto", session_id=session_id
+            )
+        except Exception as e:
+            _LOGGER.debug("Failed to flush explicit commands: %s", e)
+            return 0
+        return len(stored)
 
-                memory_id = await self._memory_store.store_memory(
-                    text=text,
-                    embedding=embeddings[0],
-                    user_id=user_id,
-                    category=candidate["category"],
-                    importance=candidate["importance"],
-                    source="auto",
-                    session_id=session_id,
-                )
+    async def _store_batch(
+        self,
+        candidates: list[dict[str, Any]],
+        user_id: str,
+        *,
+        source: str,
+        session_id: str,
+    ) -> list[dict[str, Any]]:
+        """Embed candidates in one provider call and store them as one batch.
 
-                if memory_id:
-                    captured += 1
-            except Exception as e:
-                _LOGGER.debug("Failed to flush explicit command: %s", e)
+        Args:
+            candidates: Dicts with ``text``, ``category`` and ``importance``.
+            user_id: User who owns the memories.
+            source: Origin recorded on the memories.
+            session_id: Session context.
 
-        return captured
+        Returns:
+            The candidates that were stored (duplicates and candidates
+            without an embedding are left out).
+        """
+        embeddings = await self.embedding_provider.get_embeddings(
+            [candidate["text"] for candidate in candidates]
+        )
+        embedded = [
+            (candidate, embedding)
+            for candidate, embedding in zip(candidates, embeddings or [])
+            if embedding
+        ]
+        if not embedded:
+            return []
+
+        memory_ids = await self._memory_store.store_memories_batch(
+            [candidate for candidate, _ in embedded],
+            [embedding for _, embedding in embedded],
+            user_id,
+            source=source,
+            session_id=session_id,
+        )
+        stored = [
+            candidate
+            for (candidate, _), memory_id in zip(embedded, memory_ids)
+            if memory_id
+        ]
+        if stored:
+            self._notify_changed(user_id)
+        return stored
+
+    def _notify_changed(self, user_id: str | None) -> None:
+        """Report a change to the user's memories (e.g. to drop cached recall)."""
+        if self.on_memories_changed is not None:
+            self.on_memories_changed(user_id)
 
 
 def _build_memory_fts_query(query: str) -> str | None:
@@ -0,0 +1,176 @@
+"""Resident per-user memory vectors for MemoryStore.
+
+Every recall and every dedup check in ``store_memory`` used to ``SELECT *``
+all of a user's memories, decode each embedding and compute cosine in
+Python.  ``MemoryIndex`` keeps one ``VectorIndex`` per user instead, loaded
+lazily on the user's first search and updated by ``MemoryStore`` on every
+store / delete / evict / importance change.
+
+TTL expiry is driven by a heap keyed on ``expires_at``: only memories that
+have actually expired cost work (and a DELETE), rather than running a
+cleanup transaction before each search.  SQLite remains the source of truth.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from ..rag._vector_index import VectorIndex
+
+if TYPE_CHECKING:
+    from .memory_store import Memory
+
+
+@dataclass
+class _UserMemories:
+    """Vectors and records of one user's live memories."""
+
+    vectors: VectorIndex = field(default_factory=VectorIndex)
+    records: dict[str, Memory] = field(default_factory=dict)
+
+
+class MemoryIndex:
+    """Lazily loaded per-user memory vectors with heap-based expiry."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._users: dict[str, _UserMemories] = {}
+        # memory id -> user id (loaded users only)
+        self._owners: dict[str, str] = {}
+        # (expires_at, memory id); entries may be stale, checked on pop
+        self._expiry: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        """Number of indexed memories."""
+        return len(self._owners)
+
+    def is_loaded(self, user_id: str) -> bool:
+        """Whether ``user_id``'s memories are resident."""
+        return user_id in self._users
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def load(self, user_id: str, rows: list[tuple[Memory, Any]]) -> None:
+        """Make a user resident from ``(memory, raw embedding)`` pairs."""
+        self.drop_user(user_id)
+        self._users[user_id] = _UserMemories()
+        for memory, embedding in rows:
+            self.add(memory, embedding)
+
+    def add(self, memory: Memory, embedding: Any) -> None:
+        """Insert or replace a memory (ignored while its user is not loaded)."""
+        user = self._users.get(memory.user_id)
+        if user is None:
+            return
+        user.vectors.upsert(
+            [memory.id], [""], [embedding], [{"category": memory.category}]
+        )
+        user.records[memory.id] = memory
+        self._owners[memory.id] = memory.user_id
+        if memory.expires_at is not None:
+            heapq.heappush(self._expiry, (memory.expires_at, memory.id))
+
+    def remove(self, memory_ids: list[str]) -> None:
+        """Remove memories by ID (unknown IDs are ignored)."""
+        for memory_id in memory_ids:
+            user_id = self._owners.pop(memory_id, None)
+            if user_id is None:
+                continue
+            user = self._users[user_id]
+            user.vectors.remove([memory_id])
+            user.records.pop(memory_id, None)
+
+    def drop_user(self, user_id: str) -> None:
+        """Forget a user's memories (they are reloaded on the next search)."""
+        user = self._users.pop(user_id, None)
+        if user is None:
+            return
+        for memory_id in user.records:
+            self._owners.pop(memory_id, None)
+
+    def set_importance(
+        self, memory_id: str, importance: float, updated_at: float
+    ) -> None:
+        """Mirror an importance update."""
+        user_id = self._owners.get(memory_id)
+        if user_id is None:
+            return
+        records = self._users[user_id].records
+        records[memory_id] = replace(
+            records[memory_id], importance=importance, updated_at=updated_at
+        )
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self._users.clear()
+        self._owners.clear()
+        self._expiry.clear()
+
+    def pop_expired(self, now: float) -> list[str]:
+        """Remove and return the IDs of memories expired at ``now``."""
+        expired: list[str] = []
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, memory_id = heapq.heappop(self._expiry)
+            user_id = self._owners.get(memory_id)
+            if user_id is None:
+                continue
+            memory = self._users[user_id].records[memory_id]
+            if memory.expires_at != expires_at:
+                continue  # superseded entry
+            expired.append(memory_id)
+        self.remove(expired)
+        return expired
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query_embedding: list[float],
+        user_id: str,
+        *,
+        limit: int,
+        min_similarity: float,
+        category: str | None = None,
+    ) -> list[Memory]:
+        """Return a loaded user's closest memories, best first.
+
+        Results are sorted by (score, importance) descending, like the
+        former table scan, and are copies with ``score`` filled in.
+        """
+        user = self._users.get(user_id)
+        if user is None or not user.records:
+            return []
+
+        hits = user.vectors.search(
+            query_embedding,
+            n_results=limit,
+            where={"category": category} if category else None,
+            min_similarity=min_similarity,
+        )
+        results = [
+            replace(user.records[hit.id], score=1.0 - hit.distance) for hit in hits
+        ]
+        results.sort(key=lambda m: (m.score, m.importance), reverse=True)
+        return results
+
+    def nearest(
+        self, user_id: str, embeddings: list[list[float]]
+    ) -> list[tuple[Memory, float] | None]:
+        """Return a loaded user's closest memory to each embedding.
+
+        Answers the whole batch in one pass over the user's vectors (see
+        ``VectorIndex.nearest``); used for dedup checks on ingestion.
+        """
+        user = self._users.get(user_id)
+        if user is None or not user.records:
+            return [None] * len(embeddings)
+        return [
+            (user.records[hit[0]], hit[1]) if hit is not None else None
+            for hit in user.vectors.nearest(embeddings)
+        ]
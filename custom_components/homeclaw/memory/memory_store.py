@@ -7,12 +7,18 @@ search, and cosine similarity for vector search — same stack as the RAG system
 Tables created:
 - memories: Main storage (id, user_id, text, embedding, category, importance, metadata, timestamps)
 - memories_fts: FTS5 virtual table for keyword search on memory text
+
+All statements run through the SqliteStore DB worker (``run_read`` /
+``run_write``), never on the event loop.  Vector search is served from a
+resident per-user ``MemoryIndex`` (see ``memory_index``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import sqlite3
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -20,6 +26,12 @@ from typing import Any
 
 from ..rag._store_utils import bm25_rank_to_score as _bm25_rank_to_score
 from ..rag._store_utils import cosine_similarity as _cosine_similarity
+from .memory_index import MemoryIndex
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant core
+    np = None
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -95,6 +107,9 @@ class MemoryStore:
     its own tables. Reuses the embedding format (binary blob) and search
     patterns (cosine similarity + FTS5) from the RAG system.
 
+    Vector search and dedup checks use a per-user ``MemoryIndex`` that is
+    loaded on the user's first search and kept in sync by every write below.
+
     Args:
         store: The existing SqliteStore instance from the RAG system.
     """
@@ -102,16 +117,30 @@ class MemoryStore:
     store: Any  # SqliteStore — avoid circular import
     _tables_created: bool = field(default=False, repr=False)
     _fts_available: bool = field(default=False, repr=False)
+    _index: MemoryIndex = field(default_factory=MemoryIndex, repr=False)
+    _index_lock: asyncio.Lock | None = field(default=None, repr=False)
 
     async def async_initialize(self) -> None:
         """Create memory tables in the existing SQLite database."""
         if self._tables_created:
             return
 
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             raise RuntimeError("SqliteStore connection not available")
 
+        self._fts_available = await self.store.run_write(
+            "memory_initialize", self._create_tables
+        )
+        self._tables_created = True
+        _LOGGER.info("Memory store tables initialized (fts=%s)", self._fts_available)
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection) -> bool:
+        """Create memory tables (writer job).
+
+        Returns:
+            Whether the FTS5 table is available.
+        """
         cursor = conn.cursor()
 
         # Main memories table
@@ -152,7 +181,6 @@ class MemoryStore:
         except Exception:
             _LOGGER.info("Migrating memories table: adding expires_at column")
             cursor.execute("ALTER TABLE memories ADD COLUMN expires_at REAL")
-            conn.commit()
 
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_memories_expires
@@ -169,15 +197,11 @@ class MemoryStore:
                     category UNINDEXED
                 )
             """)
-            self._fts_available = True
             _LOGGER.debug("Memory FTS5 table created/verified")
+            return True
         except Exception as fts_err:
-            self._fts_available = False
             _LOGGER.debug("Memory FTS5 not available: %s", fts_err)
-
-        conn.commit()
-        self._tables_created = True
-        _LOGGER.info("Memory store tables initialized (fts=%s)", self._fts_available)
+            return False
 
     async def store_memory(
         self,
@@ -208,8 +232,7 @@ class MemoryStore:
         Returns:
             Memory ID if stored, None if duplicate was detected.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return None
 
         # Validate category
@@ -238,51 +261,46 @@ class MemoryStore:
         memory_id = str(uuid.uuid4())
         now = time.time()
 
-        # Calculate expires_at: explicit ttl_days > category default > None (permanent)
-        if ttl_days is not None:
-            expires_at = now + ttl_days * 86400
-        else:
-            default_ttl = DEFAULT_TTL_DAYS.get(category)
-            expires_at = (now + default_ttl * 86400) if default_ttl else None
+        expires_at = _expires_at(category, ttl_days, now)
 
-        # Store embedding as binary blob
-        embedding_blob = self.store._embedding_to_blob(embedding)
+        # Store embedding as binary blob (in the store's configured format)
+        embedding_blob = self.store.encode_embedding(embedding)
+        fts_available = self._fts_available
 
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO memories (id, user_id, text, embedding, category, importance,
-                                  source, session_id, metadata, created_at, updated_at,
-                                  expires_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                memory_id,
-                user_id,
-                text,
-                embedding_blob,
-                category,
-                importance,
-                source,
-                session_id,
-                json.dumps(metadata) if metadata else None,
-                now,
-                now,
-                expires_at,
-            ),
+        row = (
+            memory_id,
+            user_id,
+            text,
+            embedding_blob,
+            category,
+            importance,
+            source,
+            session_id,
+            json.dumps(metadata) if metadata else None,
+            now,
+            now,
+            expires_at,
         )
 
-        # Sync FTS5
-        if self._fts_available:
-            try:
-                cursor.execute(
-                    "INSERT INTO memories_fts (text, memory_id, user_id, category) VALUES (?, ?, ?, ?)",
-                    (text, memory_id, user_id, category),
-                )
-            except Exception as fts_err:
-                _LOGGER.debug("Memory FTS5 sync failed: %s", fts_err)
+        def _insert(conn: sqlite3.Connection) -> None:
+            _insert_memory_rows(conn.cursor(), [row], fts_available)
 
-        conn.commit()
+        await self.store.run_write("store_memory", _insert)
+        self._index.add(
+            Memory(
+                id=memory_id,
+                user_id=user_id,
+                text=text,
+                category=category,
+                importance=importance,
+                created_at=now,
+                updated_at=now,
+                source=source,
+                session_id=session_id,
+                expires_at=expires_at,
+            ),
+            embedding_blob,
+        )
 
         # Enforce per-user limit
         await self._enforce_user_limit(user_id)
@@ -296,6 +314,159 @@ class MemoryStore:
         )
         return memory_id
 
+    async def store_memories_batch(
+        self,
+        candidates: list[dict[str, Any]],
+        embeddings: list[list[float]],
+        user_id: str,
+        *,
+        source: str = "auto",
+        session_id: str = "",
+    ) -> list[str | None]:
+        """Store several memories at once, with the semantics of ``store_memory``.
+
+        Candidates are deduplicated against each other and against the
+        user's stored memories in one vectorized pass each, then written --
+        together with importance bumps of matched duplicates and the
+        per-user limit enforcement -- in a single transaction.
+
+        Args:
+            candidates: Dicts with ``text`` and optional ``category``,
+                ``importance``, ``metadata`` and ``ttl_days`` keys.
+            embeddings: Pre-computed embedding per candidate.
+            user_id: User who owns these memories.
+            source: Origin of the memories (auto, user, agent).
+            session_id: Session where they were captured.
+
+        Returns:
+            Per candidate, the new memory ID or None if it was a duplicate.
+        """
+        if self.store._conn is None or not candidates:
+            return [None] * len(candidates)
+
+        await self._ensure_user_loaded(user_id)
+        await self._expire_due()
+
+        stored = self._index.nearest(user_id, embeddings)
+        in_batch = _batch_duplicates(embeddings)
+
+        now = time.time()
+        memory_ids: list[str | None] = [None] * len(candidates)
+        new_memories: list[tuple[Memory, bytes, dict[str, Any] | None]] = []
+        # existing memory id -> raised importance
+        bumps: dict[str, float] = {}
+        # batch position -> kept Memory, so later in-batch duplicates can bump it
+        kept: dict[int, Memory] = {}
+        # batch position -> stored Memory it duplicated (bumped in its place)
+        matched: dict[int, Memory] = {}
+
+        for i, candidate in enumerate(candidates):
+            text = candidate["text"]
+            category = candidate.get("category", CATEGORY_FACT)
+            if category not in VALID_CATEGORIES:
+                category = CATEGORY_OTHER
+            importance = candidate.get("importance", DEFAULT_IMPORTANCE)
+
+            match = stored[i]
+            if match is not None and match[1] >= DEDUP_SIMILARITY_THRESHOLD:
+                existing = match[0]
+                _LOGGER.debug(
+                    "Duplicate memory detected (score=%.3f), skipping: %s",
+                    match[1],
+                    text[:80],
+                )
+                if importance > bumps.get(existing.id, existing.importance):
+                    bumps[existing.id] = importance
+                matched[i] = existing
+                continue
+            if in_batch[i] is not None:
+                original = kept.get(in_batch[i])
+                if original is None:
+                    # The in-batch original was itself a stored duplicate
+                    existing = matched[in_batch[i]]
+                    if importance > bumps.get(existing.id, existing.importance):
+                        bumps[existing.id] = importance
+                elif importance > original.importance:
+                    original.importance = importance
+                continue
+
+            memory = Memory(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                text=text,
+                category=category,
+                importance=importance,
+                created_at=now,
+                updated_at=now,
+                source=source,
+                session_id=session_id,
+                expires_at=_expires_at(category, candidate.get("ttl_days"), now),
+            )
+            metadata = candidate.get("metadata")
+            kept[i] = memory
+            memory_ids[i] = memory.id
+            new_memories.append(
+                (memory, self.store.encode_embedding(embeddings[i]), metadata)
+            )
+
+        # Rows are built last: in-batch duplicates may have raised importance
+        rows: list[tuple[Any, ...]] = []
+        for memory, blob, metadata in new_memories:
+            rows.append(
+                (
+                    memory.id,
+                    memory.user_id,
+                    memory.text,
+                    blob,
+                    memory.category,
+                    memory.importance,
+                    memory.source,
+                    memory.session_id,
+                    json.dumps(metadata) if metadata else None,
+                    memory.created_at,
+                    memory.updated_at,
+                    memory.expires_at,
+                )
+            )
+        if not rows and not bumps:
+            return memory_ids
+
+        fts_available = self._fts_available
+
+        def _write(conn: sqlite3.Connection) -> list[str]:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE memories SET importance = ?, updated_at = ? WHERE id = ?",
+                [(importance, now, memory_id) for memory_id, importance in bumps.items()],
+            )
+            if not rows:
+                return []
+            _insert_memory_rows(cursor, rows, fts_available)
+            return _evict_over_limit(cursor, user_id, fts_available)
+
+        evicted = await self.store.run_write("store_memories_batch", _write)
+
+        for memory_id, importance in bumps.items():
+            self._index.set_importance(memory_id, importance, now)
+        for memory, blob, _metadata in new_memories:
+            self._index.add(memory, blob)
+        if evicted:
+            self._index.remove(evicted)
+            _LOGGER.info(
+                "Evicted %d memories for user %s (limit %d)",
+                len(evicted),
+                user_id[:8],
+                MAX_MEMORIES_PER_USER,
+            )
+
+        _LOGGER.debug(
+            "Stored %d/%d memories in one batch for user %s",
+            len(rows),
+            len(candidates),
+            user_id[:8],
+        )
+        return memory_ids
+
     async def search_memories(
         self,
         query_embedding: list[float],
@@ -307,7 +478,8 @@ class MemoryStore:
     ) -> list[Memory]:
         """Vector search for memories by cosine similarity.
 
-        Automatically filters out expired memories and runs lazy cleanup.
+        Served from the resident per-user index; expired memories are
+        dropped (and deleted) as their ``expires_at`` passes.
 
         Args:
             query_embedding: Query embedding vector.
@@ -319,60 +491,90 @@ class MemoryStore:
         Returns:
             List of Memory objects sorted by relevance (highest score first).
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return []
 
-        # Lazy cleanup: remove expired memories
-        await self._cleanup_expired(user_id)
+        await self._ensure_user_loaded(user_id)
+        await self._expire_due()
 
-        now = time.time()
-        cursor = conn.cursor()
+        return self._index.search(
+            query_embedding,
+            user_id,
+            limit=limit,
+            min_similarity=min_similarity,
+            category=category,
+        )
 
-        # Build query with optional category filter + exclude expired
-        if category:
-            cursor.execute(
-                "SELECT * FROM memories WHERE user_id = ? AND category = ? "
-                "AND (expires_at IS NULL OR expires_at > ?)",
-                (user_id, category, now),
-            )
-        else:
-            cursor.execute(
-                "SELECT * FROM memories WHERE user_id = ? "
-                "AND (expires_at IS NULL OR expires_at > ?)",
-                (user_id, now),
-            )
+    async def _ensure_user_loaded(self, user_id: str) -> None:
+        """Load a user's live memories into the index (once).
 
-        rows = cursor.fetchall()
-        if not rows:
-            return []
+        Expired rows are purged first.  The load runs as a writer job so it
+        is ordered with pending writes, which are mirrored into the index
+        after they commit.
+        """
+        if self._index.is_loaded(user_id):
+            return
+
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
 
-        # Compute cosine similarity for each row
-        results = []
-        for row in rows:
-            stored_embedding = self.store._read_embedding(row["embedding"])
-            similarity = _cosine_similarity(query_embedding, stored_embedding)
-
-            if similarity >= min_similarity:
-                results.append(
-                    Memory(
-                        id=row["id"],
-                        user_id=row["user_id"],
-                        text=row["text"],
-                        category=row["category"],
-                        importance=row["importance"],
-                        source=row["source"],
-                        session_id=row["session_id"],
-                        created_at=row["created_at"],
-                        updated_at=row["updated_at"],
-                        score=similarity,
-                        expires_at=row["expires_at"],
+        async with self._index_lock:
+            if self._index.is_loaded(user_id):
+                return
+
+            await self._cleanup_expired(user_id)
+
+            def _load(conn: sqlite3.Connection) -> list[tuple[Memory, Any]]:
+                rows = conn.execute(
+                    "SELECT id, user_id, text, embedding, category, importance, source, "
+                    "session_id, created_at, updated_at, expires_at "
+                    "FROM memories WHERE user_id = ?",
+                    (user_id,),
+                ).fetchall()
+                return [
+                    (
+                        Memory(
+                            id=row["id"],
+                            user_id=row["user_id"],
+                            text=row["text"],
+                            category=row["category"],
+                            importance=row["importance"],
+                            source=row["source"],
+                            session_id=row["session_id"],
+                            created_at=row["created_at"],
+                            updated_at=row["updated_at"],
+                            expires_at=row["expires_at"],
+                        ),
+                        row["embedding"],
                     )
-                )
+                    for row in rows
+                ]
+
+            rows = await self.store.run_write("memory_index_load", _load)
+            self._index.load(user_id, rows)
 
-        # Sort by score descending, then by importance
-        results.sort(key=lambda m: (m.score, m.importance), reverse=True)
-        return results[:limit]
+    async def _expire_due(self) -> None:
+        """Drop memories whose TTL has passed from the index and the table."""
+        expired = self._index.pop_expired(time.time())
+        if not expired:
+            return
+
+        fts_available = self._fts_available
+
+        def _purge(conn: sqlite3.Connection) -> None:
+            placeholders = ",".join("?" * len(expired))
+            if fts_available:
+                try:
+                    conn.execute(
+                        f"DELETE FROM memories_fts WHERE memory_id IN ({placeholders})",
+                        expired,
+                    )
+                except Exception:
+                    pass
+            conn.execute(f"DELETE FROM memories WHERE id IN ({placeholders})", expired)
+
+        await self.store.run_write("memory_expire", _purge)
+        _LOGGER.info("Expired %d memories", len(expired))
 
     async def keyword_search_memories(
         self,
@@ -394,11 +596,10 @@ class MemoryStore:
         if not self._fts_available or not fts_query:
             return []
 
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return []
 
-        try:
+        def _search(conn: sqlite3.Connection) -> list[Memory]:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -446,6 +647,8 @@ class MemoryStore:
 
             return results
 
+        try:
+            return await self.store.run_read("keyword_search_memories", _search)
         except Exception as e:
             _LOGGER.debug("Memory keyword search failed: %s", e)
             return []
@@ -459,25 +662,29 @@ class MemoryStore:
         Returns:
             True if deleted, False if not found.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return False
 
-        cursor = conn.cursor()
+        fts_available = self._fts_available
 
-        # Delete from FTS5 first
-        if self._fts_available:
-            try:
-                cursor.execute(
-                    "DELETE FROM memories_fts WHERE memory_id = ?", (memory_id,)
-                )
-            except Exception:
-                pass
+        def _delete(conn: sqlite3.Connection) -> bool:
+            cursor = conn.cursor()
 
-        # Delete from main table
-        cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
+            # Delete from FTS5 first
+            if fts_available:
+                try:
+                    cursor.execute(
+                        "DELETE FROM memories_fts WHERE memory_id = ?", (memory_id,)
+                    )
+                except Exception:
+                    pass
+
+            # Delete from main table
+            cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+            return cursor.rowcount > 0
+
+        deleted = await self.store.run_write("delete_memory", _delete)
+        self._index.remove([memory_id])
 
         if deleted:
             _LOGGER.debug("Deleted memory: %s", memory_id[:8])
@@ -492,36 +699,45 @@ class MemoryStore:
         Returns:
             Number of memories deleted.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return 0
 
-        cursor = conn.cursor()
+        fts_available = self._fts_available
 
-        # Delete from FTS5
-        if self._fts_available:
-            try:
-                cursor.execute("DELETE FROM memories_fts WHERE user_id = ?", (user_id,))
-            except Exception:
-                pass
+        def _delete(conn: sqlite3.Connection) -> int:
+            cursor = conn.cursor()
+
+            # Delete from FTS5
+            if fts_available:
+                try:
+                    cursor.execute(
+                        "DELETE FROM memories_fts WHERE user_id = ?", (user_id,)
+                    )
+                except Exception:
+                    pass
+
+            # Delete from main table
+            cursor.execute("DELETE FROM memories WHERE user_id = ?", (user_id,))
+            return cursor.rowcount
 
-        # Delete from main table
-        cursor.execute("DELETE FROM memories WHERE user_id = ?", (user_id,))
-        count = cursor.rowcount
-        conn.commit()
+        count = await self.store.run_write("delete_user_memories", _delete)
+        self._index.drop_user(user_id)
 
         _LOGGER.info("Deleted %d memories for user %s", count, user_id[:8])
         return count
 
     async def get_memory_count(self, user_id: str) -> int:
         """Get total memory count for a user."""
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return 0
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM memories WHERE user_id = ?", (user_id,))
-        return cursor.fetchone()[0]
+        def _count(conn: sqlite3.Connection) -> int:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM memories WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            return row[0]
+
+        return await self.store.run_read("get_memory_count", _count)
 
     async def get_stats(self, user_id: str | None = None) -> dict[str, Any]:
         """Get memory statistics.
@@ -532,80 +748,83 @@ class MemoryStore:
         Returns:
             Dict with total count, per-category counts, etc.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return {"total": 0}
 
-        cursor = conn.cursor()
+        def _stats(conn: sqlite3.Connection) -> dict[str, Any]:
+            cursor = conn.cursor()
 
-        if user_id:
-            cursor.execute(
-                "SELECT category, COUNT(*) as cnt FROM memories WHERE user_id = ? GROUP BY category",
-                (user_id,),
-            )
-        else:
-            cursor.execute(
-                "SELECT category, COUNT(*) as cnt FROM memories GROUP BY category"
-            )
+            if user_id:
+                cursor.execute(
+                    "SELECT category, COUNT(*) as cnt FROM memories WHERE user_id = ? GROUP BY category",
+                    (user_id,),
+                )
+            else:
+                cursor.execute(
+                    "SELECT category, COUNT(*) as cnt FROM memories GROUP BY category"
+                )
 
-        categories = {row["category"]: row["cnt"] for row in cursor.fetchall()}
-        total = sum(categories.values())
+            categories = {row["category"]: row["cnt"] for row in cursor.fetchall()}
+            total = sum(categories.values())
 
-        # Count unique users
-        cursor.execute("SELECT COUNT(DISTINCT user_id) FROM memories")
-        unique_users = cursor.fetchone()[0]
+            # Count unique users
+            cursor.execute("SELECT COUNT(DISTINCT user_id) FROM memories")
+            unique_users = cursor.fetchone()[0]
 
-        # Per-source breakdown
-        if user_id:
-            cursor.execute(
-                "SELECT source, COUNT(*) as cnt FROM memories WHERE user_id = ? GROUP BY source",
-                (user_id,),
-            )
-        else:
-            cursor.execute(
-                "SELECT source, COUNT(*) as cnt FROM memories GROUP BY source"
-            )
-        sources = {row["source"]: row["cnt"] for row in cursor.fetchall()}
+            # Per-source breakdown
+            if user_id:
+                cursor.execute(
+                    "SELECT source, COUNT(*) as cnt FROM memories WHERE user_id = ? GROUP BY source",
+                    (user_id,),
+                )
+            else:
+                cursor.execute(
+                    "SELECT source, COUNT(*) as cnt FROM memories GROUP BY source"
+                )
+            sources = {row["source"]: row["cnt"] for row in cursor.fetchall()}
 
-        # Expiring soon (within 3 days)
-        now = time.time()
-        three_days = now + 3 * 86400
-        if user_id:
-            cursor.execute(
-                "SELECT COUNT(*) FROM memories WHERE user_id = ? "
-                "AND expires_at IS NOT NULL AND expires_at > ? AND expires_at <= ?",
-                (user_id, now, three_days),
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) FROM memories "
-                "WHERE expires_at IS NOT NULL AND expires_at > ? AND expires_at <= ?",
-                (now, three_days),
-            )
-        expiring_soon = cursor.fetchone()[0]
+            # Expiring soon (within 3 days)
+            now = time.time()
+            three_days = now + 3 * 86400
+            if user_id:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM memories WHERE user_id = ? "
+                    "AND expires_at IS NOT NULL AND expires_at > ? AND expires_at <= ?",
+                    (user_id, now, three_days),
+                )
+            else:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM memories "
+                    "WHERE expires_at IS NOT NULL AND expires_at > ? AND expires_at <= ?",
+                    (now, three_days),
+                )
+            expiring_soon = cursor.fetchone()[0]
 
-        # Total with TTL (non-permanent)
-        if user_id:
-            cursor.execute(
-                "SELECT COUNT(*) FROM memories WHERE user_id = ? AND expires_at IS NOT NULL AND expires_at > ?",
-                (user_id, now),
-            )
-        else:
-            cursor.execute(
-                "SELECT COUNT(*) FROM memories WHERE expires_at IS NOT NULL AND expires_at > ?",
-                (now,),
-            )
-        total_with_ttl = cursor.fetchone()[0]
-
-        return {
-            "total": total,
-            "categories": categories,
-            "sources": sources,
-            "unique_users": unique_users,
-            "fts_available": self._fts_available,
-            "expiring_soon": expiring_soon,
-            "total_with_ttl": total_with_ttl,
-        }
+            # Total with TTL (non-permanent)
+            if user_id:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM memories WHERE user_id = ? AND expires_at IS NOT NULL AND expires_at > ?",
+                    (user_id, now),
+                )
+            else:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM memories WHERE expires_at IS NOT NULL AND expires_at > ?",
+                    (now,),
+                )
+            total_with_ttl = cursor.fetchone()[0]
+
+            return {
+                "total": total,
+                "categories": categories,
+                "sources": sources,
+                "unique_users": unique_users,
+                "expiring_soon": expiring_soon,
+                "total_with_ttl": total_with_ttl,
+            }
+
+        stats = await self.store.run_read("memory_stats", _stats)
+        stats["fts_available"] = self._fts_available
+        return stats
 
     async def list_memories(
         self,
@@ -628,60 +847,63 @@ class MemoryStore:
         Returns:
             List of Memory objects sorted by importance DESC, created_at DESC.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return []
 
         now = time.time()
-        cursor = conn.cursor()
-
         expire_filter = (
             "" if include_expired else "AND (expires_at IS NULL OR expires_at > ?)"
         )
 
-        if category:
-            params: list[Any] = [user_id, category]
-            if not include_expired:
-                params.append(now)
-            params.extend([limit, offset])
-            cursor.execute(
-                f"""SELECT * FROM memories WHERE user_id = ? AND category = ?
-                   {expire_filter}
-                   ORDER BY importance DESC, created_at DESC LIMIT ? OFFSET ?""",
-                params,
-            )
-        else:
-            params = [user_id]
-            if not include_expired:
-                params.append(now)
-            params.extend([limit, offset])
-            cursor.execute(
-                f"""SELECT * FROM memories WHERE user_id = ?
-                   {expire_filter}
-                   ORDER BY importance DESC, created_at DESC LIMIT ? OFFSET ?""",
-                params,
-            )
+        def _list(conn: sqlite3.Connection) -> list[Memory]:
+            cursor = conn.cursor()
 
-        return [
-            Memory(
-                id=row["id"],
-                user_id=row["user_id"],
-                text=row["text"],
-                category=row["category"],
-                importance=row["importance"],
-                source=row["source"],
-                session_id=row["session_id"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                expires_at=row["expires_at"],
-            )
-            for row in cursor.fetchall()
-        ]
+            if category:
+                params: list[Any] = [user_id, category]
+                if not include_expired:
+                    params.append(now)
+                params.extend([limit, offset])
+                cursor.execute(
+                    f"""SELECT * FROM memories WHERE user_id = ? AND category = ?
+                       {expire_filter}
+                       ORDER BY importance DESC, created_at DESC LIMIT ? OFFSET ?""",
+                    params,
+                )
+            else:
+                params = [user_id]
+                if not include_expired:
+                    params.append(now)
+                params.extend([limit, offset])
+                cursor.execute(
+                    f"""SELECT * FROM memories WHERE user_id = ?
+                       {expire_filter}
+                       ORDER BY importance DESC, created_at DESC LIMIT ? OFFSET ?""",
+                    params,
+                )
+
+            return [
+                Memory(
+                    id=row["id"],
+                    user_id=row["user_id"],
+                    text=row["text"],
+                    category=row["category"],
+                    importance=row["importance"],
+                    source=row["source"],
+                    session_id=row["session_id"],
+                    created_at=row["created_at"],
+                    updated_at=row["updated_at"],
+                    expires_at=row["expires_at"],
+                )
+                for row in cursor.fetchall()
+            ]
+
+        return await self.store.run_read("list_memories", _list)
 
     async def _cleanup_expired(self, user_id: str) -> int:
         """Delete expired memories for a user (lazy cleanup).
 
-        Called automatically during search/recall operations.
+        Called when a user's memories are loaded into the index; afterwards
+        expiry is handled by ``_expire_due``.
 
         Args:
             user_id: User whose expired memories to clean up.
@@ -689,98 +911,187 @@ class MemoryStore:
         Returns:
             Number of expired memories deleted.
         """
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return 0
 
         now = time.time()
-        cursor = conn.cursor()
+        fts_available = self._fts_available
 
-        # Find expired memory IDs
-        cursor.execute(
-            "SELECT id FROM memories WHERE user_id = ? AND expires_at IS NOT NULL AND expires_at <= ?",
-            (user_id, now),
-        )
-        expired_ids = [row["id"] for row in cursor.fetchall()]
+        def _cleanup(conn: sqlite3.Connection) -> int:
+            cursor = conn.cursor()
 
-        if not expired_ids:
-            return 0
+            # Find expired memory IDs
+            cursor.execute(
+                "SELECT id FROM memories WHERE user_id = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (user_id, now),
+            )
+            expired_ids = [row["id"] for row in cursor.fetchall()]
 
-        # Delete from FTS5
-        if self._fts_available:
-            for mid in expired_ids:
-                try:
-                    cursor.execute(
-                        "DELETE FROM memories_fts WHERE memory_id = ?", (mid,)
-                    )
-                except Exception:
-                    pass
+            if not expired_ids:
+                return 0
 
-        # Delete from main table
-        placeholders = ",".join("?" * len(expired_ids))
-        cursor.execute(
-            f"DELETE FROM memories WHERE id IN ({placeholders})", expired_ids
-        )
-        conn.commit()
+            # Delete from FTS5
+            if fts_available:
+                for mid in expired_ids:
+                    try:
+                        cursor.execute(
+                            "DELETE FROM memories_fts WHERE memory_id = ?", (mid,)
+                        )
+                    except Exception:
+                        pass
 
-        _LOGGER.info(
-            "Cleaned up %d expired memories for user %s", len(expired_ids), user_id[:8]
-        )
-        return len(expired_ids)
+            # Delete from main table
+            placeholders = ",".join("?" * len(expired_ids))
+            cursor.execute(
+                f"DELETE FROM memories WHERE id IN ({placeholders})", expired_ids
+            )
+            return len(expired_ids)
+
+        removed = await self.store.run_write("memory_cleanup_expired", _cleanup)
+        if removed:
+            _LOGGER.info(
+                "Cleaned up %d expired memories for user %s", removed, user_id[:8]
+            )
+        return removed
 
     async def _update_importance(self, memory_id: str, importance: float) -> None:
         """Update the importance score of an existing memory."""
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return
 
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE memories SET importance = ?, updated_at = ? WHERE id = ?",
-            (importance, time.time(), memory_id),
-        )
-        conn.commit()
+        now = time.time()
+
+        def _update(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "UPDATE memories SET importance = ?, updated_at = ? WHERE id = ?",
+                (importance, now, memory_id),
+            )
+
+        await self.store.run_write("memory_update_importance", _update)
+        self._index.set_importance(memory_id, importance, now)
 
     async def _enforce_user_limit(self, user_id: str) -> None:
         """Enforce maximum memories per user by evicting low-importance old entries."""
-        conn = self.store._conn
-        if conn is None:
+        if self.store._conn is None:
             return
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM memories WHERE user_id = ?", (user_id,))
-        count = cursor.fetchone()[0]
+        fts_available = self._fts_available
 
-        if count <= MAX_MEMORIES_PER_USER:
-            return
+        def _enforce(conn: sqlite3.Connection) -> list[str]:
+            return _evict_over_limit(conn.cursor(), user_id, fts_available)
 
-        # Delete oldest, least important memories over the limit
-        excess = count - MAX_MEMORIES_PER_USER
-        cursor.execute(
-            """
-            SELECT id FROM memories
-            WHERE user_id = ?
-            ORDER BY importance ASC, created_at ASC
-            LIMIT ?
-            """,
-            (user_id, excess),
-        )
-        ids_to_delete = [row["id"] for row in cursor.fetchall()]
+        evicted = await self.store.run_write("memory_enforce_limit", _enforce)
+        if evicted:
+            self._index.remove(evicted)
+            _LOGGER.info(
+                "Evicted %d memories for user %s (limit %d)",
+                len(evicted),
+                user_id[:8],
+                MAX_MEMORIES_PER_USER,
+            )
 
-        for mid in ids_to_delete:
-            if self._fts_available:
-                try:
-                    cursor.execute(
-                        "DELETE FROM memories_fts WHERE memory_id = ?", (mid,)
-                    )
-                except Exception:
-                    pass
-            cursor.execute("DELETE FROM memories WHERE id = ?", (mid,))
 
-        conn.commit()
-        _LOGGER.info(
-            "Evicted %d memories for user %s (limit %d)",
-            len(ids_to_delete),
-            user_id[:8],
-            MAX_MEMORIES_PER_USER,
-        )
+def _expires_at(category: str, ttl_days: int | None, now: float) -> float | None:
+    """Expiry time: explicit ttl_days > category default > None (permanent)."""
+    if ttl_days is not None:
+        return now + ttl_days * 86400
+    default_ttl = DEFAULT_TTL_DAYS.get(category)
+    return (now + default_ttl * 86400) if default_ttl else None
+
+
+def _insert_memory_rows(
+    cursor: sqlite3.Cursor, rows: list[tuple[Any, ...]], fts_available: bool
+) -> None:
+    """Insert full ``memories`` rows (column order of the INSERT) plus FTS entries."""
+    cursor.executemany(
+        """
+        INSERT INTO memories (id, user_id, text, embedding, category, importance,
+                              source, session_id, metadata, created_at, updated_at,
+                              expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+
+    # Sync FTS5
+    if fts_available:
+        try:
+            cursor.executemany(
+                "INSERT INTO memories_fts (text, memory_id, user_id, category) VALUES (?, ?, ?, ?)",
+                [(row[2], row[0], row[1], row[4]) for row in rows],
+            )
+        except Exception as fts_err:
+            _LOGGER.debug("Memory FTS5 sync failed: %s", fts_err)
+
+
+def _evict_over_limit(
+    cursor: sqlite3.Cursor, user_id: str, fts_available: bool
+) -> list[str]:
+    """Delete a user's least important, oldest memories over the limit.
+
+    Returns:
+        IDs of the evicted memories.
+    """
+    cursor.execute("SELECT COUNT(*) FROM memories WHERE user_id = ?", (user_id,))
+    count = cursor.fetchone()[0]
+
+    if count <= MAX_MEMORIES_PER_USER:
+        return []
+
+    # Delete oldest, least important memories over the limit
+    excess = count - MAX_MEMORIES_PER_USER
+    cursor.execute(
+        """
+        SELECT id FROM memories
+        WHERE user_id = ?
+        ORDER BY importance ASC, created_at ASC
+        LIMIT ?
+        """,
+        (user_id, excess),
+    )
+    ids_to_delete = [row["id"] for row in cursor.fetchall()]
+
+    for mid in ids_to_delete:
+        if fts_available:
+            try:
+                cursor.execute("DELETE FROM memories_fts WHERE memory_id = ?", (mid,))
+            except Exception:
+                pass
+        cursor.execute("DELETE FROM memories WHERE id = ?", (mid,))
+    return ids_to_delete
+
+
+def _batch_duplicates(embeddings: list[list[float]]) -> list[int | None]:
+    """Find candidates that duplicate an earlier candidate of the same batch.
+
+    Returns:
+        Per candidate, the index of the first earlier, non-duplicate
+        candidate it is at least ``DEDUP_SIMILARITY_THRESHOLD`` similar to,
+        or None.  All pairs are scored with one Gram matrix when NumPy is
+        available.
+    """
+    count = len(embeddings)
+    if np is not None and count > 1 and len({len(e) for e in embeddings}) == 1:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+        similar = (matrix @ matrix.T) >= DEDUP_SIMILARITY_THRESHOLD
+
+        def _is_similar(i: int, j: int) -> bool:
+            return bool(similar[i, j])
+
+    else:
+
+        def _is_similar(i: int, j: int) -> bool:
+            return (
+                _cosine_similarity(embeddings[i], embeddings[j])
+                >= DEDUP_SIMILARITY_THRESHOLD
+            )
+
+    duplicate_of: list[int | None] = [None] * count
+    kept: list[int] = []
+    for i in range(count):
+        duplicate_of[i] = next((j for j in kept if _is_similar(i, j)), None)
+        if duplicate_of[i] is None:
+            kept.append(i)
+    return duplicate_of
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from ..const import DOMAIN
+from ..rate_scheduler import Priority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -298,13 +299,14 @@ class HeartbeatService:
             prompt = self._build_heartbeat_prompt(snapshot)
 
             # 4. Call agent with read-only tools (denied_tools blocks all writes)
-            agent_result = await agent.process_query(
-                user_query=prompt,
-                model=model,
-                conversation_history=[],  # Clean history — no carry-over
-                denied_tools=HEARTBEAT_DENIED_TOOLS,
-                system_prompt=HEARTBEAT_SYSTEM_PROMPT,
-            )
+            with request_priority(Priority.BACKGROUND, "heartbeat"):
+                agent_result = await agent.process_query(
+                    user_query=prompt,
+                    model=model,
+                    conversation_history=[],  # Clean history — no carry-over
+                    denied_tools=HEARTBEAT_DENIED_TOOLS,
+                    system_prompt=HEARTBEAT_SYSTEM_PROMPT,
+                )
 
             # 5. Parse response
             response_text = agent_result.get("answer", "") or agent_result.get(
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
     from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from ..const import DOMAIN
+from ..rate_scheduler import Priority, request_priority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -465,14 +466,15 @@ class SchedulerService:
                 except Exception as e:
                     _LOGGER.warning("Failed to load system prompt for scheduler: %s", e)
 
-            result = await agent.process_query(
-                user_query=prompt,
-                model=model,
-                conversation_history=[],
-                user_id=user_id,
-                system_prompt=system_prompt,
-                max_iterations=SCHEDULER_MAX_ITERATIONS,
-            )
+            with request_priority(Priority.BACKGROUND, "scheduler"):
+                result = await agent.process_query(
+                    user_query=prompt,
+                    model=model,
+                    conversation_history=[],
+                    user_id=user_id,
+                    system_prompt=system_prompt,
+                    max_iterations=SCHEDULER_MAX_ITERATIONS,
+                )
 
             # HomeclawAgent.process_query returns "answer", not "response"
             response = result.get("answer", "") or result.get("response", "")
@@ -187,6 +187,24 @@ def convert_tools(
     )
 
 
+def convert_usage(usage: dict[str, Any]) -> dict[str, Any]:
+    """Convert Gemini ``usageMetadata`` to a canonical usage chunk.
+
+    ``cachedContentTokenCount`` counts prompt tokens served from Gemini's
+    (implicit or explicit) context cache.
+    """
+    chunk: dict[str, Any] = {"type": "usage"}
+    for source, target in (
+        ("promptTokenCount", "input_tokens"),
+        ("candidatesTokenCount", "output_tokens"),
+        ("cachedContentTokenCount", "cached_tokens"),
+    ):
+        value = usage.get(source)
+        if isinstance(value, int):
+            chunk[target] = value
+    return chunk
+
+
 def process_gemini_chunk(chunk: Any, label: str = "") -> list[dict[str, Any]]:
     """Process a parsed Gemini JSON chunk and extract text/tool_call results.
 
@@ -198,7 +216,7 @@ def process_gemini_chunk(chunk: Any, label: str = "") -> list[dict[str, Any]]:
         label: Optional prefix for log messages (e.g. "[Final flush]").
 
     Returns:
-        List of dicts with 'type' key ('text' or 'tool_call').
+        List of dicts with 'type' key ('text', 'tool_call' or 'usage').
     """
     results: list[dict[str, Any]] = []
 
@@ -217,6 +235,20 @@ def process_gemini_chunk(chunk: Any, label: str = "") -> list[dict[str, Any]]:
         if "response" in item:
             item = item["response"]
 
+        # Usage metadata (typically on last chunk, possibly without candidates)
+        usage = item.get("usageMetadata")
+        if usage:
+            _LOGGER.debug(
+                "%s📊 Gemini usage: promptTokens=%s, candidateTokens=%s, "
+                "cachedTokens=%s, totalTokens=%s",
+                log_prefix,
+                usage.get("promptTokenCount"),
+                usage.get("candidatesTokenCount"),
+                usage.get("cachedContentTokenCount"),
+                usage.get("totalTokenCount"),
+            )
+            results.append(convert_usage(usage))
+
         candidates = item.get("candidates", [])
         if not candidates:
             continue
@@ -227,17 +259,6 @@ def process_gemini_chunk(chunk: Any, label: str = "") -> list[dict[str, Any]]:
         if finish_reason:
             _LOGGER.info("%s📋 Gemini finishReason: %s", log_prefix, finish_reason)
 
-        # Log usage metadata (typically on last chunk)
-        usage = item.get("usageMetadata")
-        if usage:
-            _LOGGER.debug(
-                "%s📊 Gemini usage: promptTokens=%s, candidateTokens=%s, totalTokens=%s",
-                log_prefix,
-                usage.get("promptTokenCount"),
-                usage.get("candidatesTokenCount"),
-                usage.get("totalTokenCount"),
-            )
-
         content = candidate.get("content", {})
         parts = content.get("parts", [])
 
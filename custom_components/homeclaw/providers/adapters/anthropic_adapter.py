@@ -6,12 +6,20 @@ import json
 import logging
 from typing import Any
 
+from ...core.prompt_layout import split_system_content
+from ...core.token_estimator import estimate_tokens
 from ...core.tool_call_codec import extract_tool_calls_from_assistant_content
 from .base import ProviderAdapter
 from .stream_utils import ToolAccumulator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Anthropic does not cache prefixes shorter than this (1024 for Sonnet/Opus,
+# 2048 for Haiku); smaller prompts are sent without cache markers.
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+_CACHE_CONTROL = {"type": "ephemeral"}
+
 
 class AnthropicAdapter(ProviderAdapter):
     """Converts between canonical (OpenAI) message format and Anthropic API format.
@@ -180,6 +188,72 @@ class AnthropicAdapter(ProviderAdapter):
             return json.dumps(result)
         return parsed.get("content", "")
 
+    # ------------------------------------------------------------------
+    # apply_prompt_cache
+    # ------------------------------------------------------------------
+
+    def apply_prompt_cache(
+        self,
+        payload: dict[str, Any],
+        messages: list[dict[str, Any]],
+        tool_tokens: int | None = None,
+    ) -> None:
+        """Add ``cache_control`` breakpoints for the stable part of the request.
+
+        Anthropic caches the request prefix up to each breakpoint, in the
+        order tools -> system -> messages.  The tool schemas and the stable
+        system prefix (see ``core.prompt_layout``) get a breakpoint each; the
+        per-turn system suffix (current time, RAG context) is sent as a
+        separate, uncached block.  Mutates ``payload`` in place.
+
+        ``tool_tokens`` is the (precomputed) size of the tool schemas; it is
+        estimated from ``payload["tools"]`` when not given.
+        """
+        prefix_tokens = 0
+        tools = payload.get("tools")
+        if tools:
+            prefix_tokens = (
+                tool_tokens
+                if tool_tokens is not None
+                else estimate_tokens(json.dumps(tools))
+            )
+            if prefix_tokens >= PROMPT_CACHE_MIN_TOKENS:
+                tools[-1] = {**tools[-1], "cache_control": _CACHE_CONTROL}
+
+        system_message = None
+        for message in messages:
+            # Same selection as transform_messages (the last system message)
+            if message.get("role") == "system" and message.get("content"):
+                system_message = message
+        if system_message is None or not payload.get("system"):
+            return
+
+        stable, volatile = split_system_content(system_message)
+        prefix_tokens += estimate_tokens(stable)
+        if prefix_tokens < PROMPT_CACHE_MIN_TOKENS:
+            return
+        blocks: list[dict[str, Any]] = [
+            {"type": "text", "text": stable, "cache_control": _CACHE_CONTROL}
+        ]
+        if volatile:
+            blocks.append({"type": "text", "text": volatile})
+        payload["system"] = blocks
+
+    @staticmethod
+    def extract_usage(usage: dict[str, Any]) -> dict[str, Any]:
+        """Map an Anthropic ``usage`` object onto a canonical usage chunk."""
+        chunk: dict[str, Any] = {"type": "usage"}
+        for source, target in (
+            ("input_tokens", "input_tokens"),
+            ("output_tokens", "output_tokens"),
+            ("cache_read_input_tokens", "cached_tokens"),
+            ("cache_creation_input_tokens", "cache_write_tokens"),
+        ):
+            value = usage.get(source)
+            if isinstance(value, int):
+                chunk[target] = value
+        return chunk
+
     # ------------------------------------------------------------------
     # extract_response
     # ------------------------------------------------------------------
@@ -240,9 +314,14 @@ class AnthropicAdapter(ProviderAdapter):
             List of normalized chunks:
             - {"type": "text", "content": str}
             - {"type": "tool_call", "id": str, "name": str, "args": dict}
+            - {"type": "usage", ...} (see ``extract_usage``)
         """
         event_type = event_data.get("type", "")
 
+        if event_type == "message_start":
+            usage = event_data.get("message", {}).get("usage")
+            return [self.extract_usage(usage)] if usage else []
+
         if event_type == "content_block_start":
             block = event_data.get("content_block", {})
             if block.get("type") == "tool_use":
@@ -273,17 +352,20 @@ class AnthropicAdapter(ProviderAdapter):
             return []
 
         if event_type in {"message_delta", "message_stop"}:
-            if not tool_acc.has_pending:
-                return []
-            flushed = tool_acc.flush_all()
-            return [
-                {
-                    "type": "tool_call",
-                    "id": tc["id"],
-                    "name": tc["name"],
-                    "args": tc["args"],
-                }
-                for tc in flushed
-            ]
+            chunks: list[dict[str, Any]] = []
+            if tool_acc.has_pending:
+                chunks.extend(
+                    {
+                        "type": "tool_call",
+                        "id": tc["id"],
+                        "name": tc["name"],
+                        "args": tc["args"],
+                    }
+                    for tc in tool_acc.flush_all()
+                )
+            usage = event_data.get("usage")
+            if usage:
+                chunks.append(self.extract_usage(usage))
+            return chunks
 
         return []
@@ -62,4 +62,6 @@ class ProviderAdapter(ABC):
             List of normalized chunks:
             - {"type": "text", "content": str}
             - {"type": "tool_call", "id": str, "name": str, "args": dict}
+            - {"type": "usage", "input_tokens": int, "output_tokens": int,
+              "cached_tokens": int, "cache_write_tokens": int} (keys optional)
         """
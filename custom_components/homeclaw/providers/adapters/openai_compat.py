@@ -10,6 +10,7 @@ import json
 import logging
 from typing import Any
 
+from ...core.prompt_layout import CACHE_PREFIX_KEY
 from ...core.tool_call_codec import extract_tool_calls_from_assistant_content
 from .base import ProviderAdapter
 
@@ -24,6 +25,10 @@ class OpenAICompatAdapter(ProviderAdapter):
     - Converting user _images to multimodal content blocks.
     - Converting canonical assistant tool-call JSON to OpenAI tool_calls.
     - Parsing tool_calls from non-streaming and streaming responses.
+
+    Prompt caching on these APIs is automatic and prefix-based, so the only
+    requirement is that the stable part of the system prompt comes first;
+    ``core.prompt_layout`` already orders it that way.
     """
 
     # ------------------------------------------------------------------
@@ -45,7 +50,7 @@ class OpenAICompatAdapter(ProviderAdapter):
 
         - User messages with _images → multimodal content blocks.
         - Assistant messages with canonical tool-call JSON → tool_calls field.
-        - Strip _images from all messages.
+        - Strip _images and the prompt-layout boundary from all messages.
         - Return (converted, None) — OpenAI keeps system messages inline.
         """
         converted: list[dict[str, Any]] = []
@@ -55,8 +60,10 @@ class OpenAICompatAdapter(ProviderAdapter):
             content = msg.get("content", "")
             images: list[dict[str, Any]] = msg.get("_images", [])
 
-            # Build a clean copy without _images
-            new_msg: dict[str, Any] = {k: v for k, v in msg.items() if k != "_images"}
+            # Build a clean copy without private keys
+            new_msg: dict[str, Any] = {
+                k: v for k, v in msg.items() if k not in ("_images", CACHE_PREFIX_KEY)
+            }
 
             if role == "user" and images:
                 # Convert to multimodal content blocks
@@ -170,10 +177,12 @@ class OpenAICompatAdapter(ProviderAdapter):
         Returns:
             List of {"type": "text", "content": str}
             or {"type": "tool_call", "id": str, "name": str, "args": dict}
+            or {"type": "usage", ...} (final chunk, see ``extract_usage``)
         """
+        usage = event_data.get("usage")
         choices = event_data.get("choices", [])
         if not choices:
-            return []
+            return [self.extract_usage(usage)] if usage else []
 
         choice = choices[0]
         delta = choice.get("delta", {})
@@ -222,8 +231,32 @@ class OpenAICompatAdapter(ProviderAdapter):
                     }
                 )
 
+        # Some servers attach usage to the last chunk that still has choices
+        if usage:
+            chunks.append(self.extract_usage(usage))
+
         return chunks
 
+    @staticmethod
+    def extract_usage(usage: dict[str, Any]) -> dict[str, Any]:
+        """Map an OpenAI ``usage`` object onto a canonical usage chunk.
+
+        ``cached_tokens`` are the prompt tokens served from the provider's
+        prefix cache (``prompt_tokens_details.cached_tokens``).
+        """
+        chunk: dict[str, Any] = {"type": "usage"}
+        prompt_tokens = usage.get("prompt_tokens")
+        if isinstance(prompt_tokens, int):
+            chunk["input_tokens"] = prompt_tokens
+        completion_tokens = usage.get("completion_tokens")
+        if isinstance(completion_tokens, int):
+            chunk["output_tokens"] = completion_tokens
+        details = usage.get("prompt_tokens_details") or {}
+        cached = details.get("cached_tokens")
+        if isinstance(cached, int):
+            chunk["cached_tokens"] = cached
+        return chunk
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -10,48 +10,79 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class SSEParser:
-    """Parse Server-Sent Events from raw text chunks.
+    """Parse Server-Sent Events from raw byte (or text) chunks.
 
     Handles events split across chunks, multiple events in one chunk,
     multiline data fields, non-data lines, and the [DONE] sentinel.
+
+    Chunks are buffered as bytes and scanned for newlines from where the
+    previous scan stopped, so a long stream is parsed in linear time.  Only
+    complete lines are decoded; a newline byte never occurs inside a UTF-8
+    sequence, so multi-byte characters split across network chunks are
+    decoded intact.
     """
 
     def __init__(self) -> None:
-        self._buffer = ""
-
-    def feed(self, chunk: str) -> list[str]:
-        """Feed raw text and return a list of complete event data strings."""
-        self._buffer += chunk
+        self._buffer = bytearray()
+        self._scan_from = 0  # buffer offset not yet searched for a newline
+        self._block: list[bytes] = []  # lines of the current event
+
+    def feed(self, chunk: bytes | str) -> list[str]:
+        """Feed raw bytes (or text) and return a list of complete event data strings."""
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        buffer = self._buffer
+        buffer += chunk
         events: list[str] = []
 
-        while "\n\n" in self._buffer:
-            block, self._buffer = self._buffer.split("\n\n", 1)
-            data_parts: list[str] = []
-            for line in block.splitlines():
-                if line.startswith("data:"):
-                    data_parts.append(line[len("data:") :].lstrip(" "))
-            if data_parts:
-                events.append("\n".join(data_parts))
-
+        start = 0
+        while (end := buffer.find(b"\n", max(start, self._scan_from))) >= 0:
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            if line:
+                self._block.append(line)
+            elif self._block:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+
+        del buffer[:start]
+        self._scan_from = len(buffer)
         return events
 
     def flush(self) -> list[str]:
         """Flush remaining buffer content as events."""
-        remaining = self._buffer.strip()
-        self._buffer = ""
-        if not remaining:
+        tail = bytes(self._buffer).strip()
+        self._buffer.clear()
+        self._scan_from = 0
+        if tail:
+            self._block.append(tail)
+        if not self._block:
             return []
 
-        data_parts: list[str] = []
-        for line in remaining.splitlines():
-            if line.startswith("data:"):
-                data_parts.append(line[len("data:") :].lstrip(" "))
-
-        if data_parts:
-            return ["\n".join(data_parts)]
+        lines = self._block
+        event = self._dispatch()
+        if event is not None:
+            return [event]
 
         # No data: lines — treat raw remaining content as a single event
-        return [remaining]
+        remaining = "\n".join(_decode(line) for line in lines).strip()
+        return [remaining] if remaining else []
+
+    def _dispatch(self) -> str | None:
+        """Join the data lines of the current event and start a new one."""
+        data_parts = [
+            _decode(line[len(b"data:") :]).lstrip(" ")
+            for line in self._block
+            if line.startswith(b"data:")
+        ]
+        self._block = []
+        return "\n".join(data_parts) if data_parts else None
+
+
+def _decode(raw: bytes) -> str:
+    """Decode one complete SSE line."""
+    return raw.decode("utf-8", errors="replace")
 
 
 class ToolAccumulator:
@@ -6,6 +6,8 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from ..core.token_estimator import estimate_messages_tokens
+from ..core.tool_schema_cache import ToolSchemaCache, compile_tools
 from .adapters.anthropic_adapter import AnthropicAdapter
 from .adapters.stream_utils import SSEParser, ToolAccumulator
 from .base_client import BaseHTTPClient
@@ -106,10 +108,13 @@ class AnthropicProvider(BaseHTTPClient):
         # Convert and add tools if provided
         tools = kwargs.get("tools")
         if tools:
-            anthropic_tools = self.adapter.transform_tools(tools)
+            anthropic_tools = compile_tools(self.adapter, tools)
             if anthropic_tools:
                 payload["tools"] = anthropic_tools
 
+        self.adapter.apply_prompt_cache(
+            payload, messages, tool_tokens=ToolSchemaCache.estimate_tokens(tools)
+        )
         return payload
 
     def _extract_response(self, response_data: dict[str, Any]) -> str:
@@ -144,12 +149,15 @@ class AnthropicProvider(BaseHTTPClient):
         sse_parser = SSEParser()
         tool_acc = ToolAccumulator()
 
+        limiter = self.limiter_for(payload.get("model"))
         try:
+            await limiter.acquire(estimate_messages_tokens(messages))
             async with self.session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
             ) as response:
+                retry_after = self._observe_response(response, limiter)
                 if response.status != 200:
                     error_text = await response.text()
                     _LOGGER.error(
@@ -160,6 +168,8 @@ class AnthropicProvider(BaseHTTPClient):
                     yield {
                         "type": "error",
                         "message": f"Anthropic API error {response.status}: {error_text[:200]}",
+                        "status": response.status,
+                        "retry_after": retry_after,
                     }
                     return
 
@@ -167,9 +177,7 @@ class AnthropicProvider(BaseHTTPClient):
                     if not raw_chunk:
                         continue
 
-                    for data_text in sse_parser.feed(
-                        raw_chunk.decode("utf-8", errors="ignore")
-                    ):
+                    for data_text in sse_parser.feed(raw_chunk):
                         if data_text == "[DONE]":
                             break
 
@@ -12,8 +12,17 @@ from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from ...core.token_estimator import estimate_messages_tokens
+from ...core.tool_schema_cache import ToolSchemaCache, compile_tools
+from ...http_pool import get_pooled_session
+from ...rate_scheduler import (
+    DEFAULT_RATE_LIMIT_PAUSE,
+    AccountLimiter,
+    get_account_limiter,
+)
 from ..adapters.anthropic_adapter import AnthropicAdapter
 from ..adapters.stream_utils import SSEParser, ToolAccumulator
+from ..base_client import parse_retry_after
 from ..registry import AIProvider, ProviderRegistry
 from .auth import InflightRefreshGate, OAuthRefreshError, TokenSet
 from .transform import (
@@ -108,14 +117,15 @@ class AnthropicOAuthProvider(AIProvider):
         if access and time.time() < expires_at - 300:
             return access
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                tokens = await self._refresh_gate.refresh(session, self._read_refresh_token)
-            except OAuthRefreshError as err:
-                _LOGGER.error("Anthropic OAuth refresh failed: %s", err)
-                if err.is_permanent:
-                    self._trigger_reauth()
-                raise
+        try:
+            tokens = await self._refresh_gate.refresh(
+                get_pooled_session(self.hass), self._read_refresh_token
+            )
+        except OAuthRefreshError as err:
+            _LOGGER.error("Anthropic OAuth refresh failed: %s", err)
+            if err.is_permanent:
+                self._trigger_reauth()
+            raise
 
         self._persist_tokens(tokens)
         return tokens.access_token
@@ -140,15 +150,40 @@ class AnthropicOAuthProvider(AIProvider):
         if stream:
             payload["stream"] = True
         if tools:
-            anthropic_tools = self.adapter.transform_tools(tools)
+            anthropic_tools = compile_tools(self.adapter, tools)
             if anthropic_tools:
                 payload["tools"] = anthropic_tools
 
+        self.adapter.apply_prompt_cache(
+            payload, messages, tool_tokens=ToolSchemaCache.estimate_tokens(tools)
+        )
         return transform_request_payload(payload)
 
-    def _build_session(self) -> aiohttp.ClientSession:
-        connector = aiohttp.TCPConnector(ssl=False) if is_tls_insecure() else None
-        return aiohttp.ClientSession(connector=connector)
+    def _session(self) -> aiohttp.ClientSession:
+        return get_pooled_session(self.hass, verify_ssl=not is_tls_insecure())
+
+    def _limiter(self) -> AccountLimiter:
+        """Request scheduler of this OAuth account (keyed by config entry) and model."""
+        entry_id = self._config_entry.entry_id if self._config_entry else None
+        return get_account_limiter(
+            self.hass,
+            _BASE_API_URL,
+            entry_id,
+            model=self._model,
+            rpm=self.config.get("rate_limit_rpm"),
+            tpm=self.config.get("rate_limit_tpm"),
+        )
+
+    def _observe_response(self, resp: aiohttp.ClientResponse) -> float | None:
+        """Learn rate-limit headers; pause the account on a 429."""
+        limiter = self._limiter()
+        limiter.learn(resp.headers)
+        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+        if resp.status == 429:
+            limiter.pause(
+                retry_after if retry_after is not None else DEFAULT_RATE_LIMIT_PAUSE
+            )
+        return retry_after
 
     async def get_response(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
         access_token = await self._get_valid_access_token()
@@ -158,18 +193,20 @@ class AnthropicOAuthProvider(AIProvider):
 
         _LOGGER.debug("Anthropic OAuth POST %s", url)
 
-        async with self._build_session() as session:
-            async with session.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=300),
-            ) as resp:
-                response_text = await resp.text()
-                if resp.status != 200:
-                    _LOGGER.error("Anthropic OAuth API error %d: %s", resp.status, response_text[:500])
-                    raise RuntimeError(f"Anthropic OAuth API error {resp.status}: {response_text[:200]}")
-                data = json.loads(response_text)
+        await self._limiter().acquire(estimate_messages_tokens(messages))
+        session = self._session()
+        async with session.post(
+            url,
+            headers=headers,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=300),
+        ) as resp:
+            self._observe_response(resp)
+            response_text = await resp.text()
+            if resp.status != 200:
+                _LOGGER.error("Anthropic OAuth API error %d: %s", resp.status, response_text[:500])
+                raise RuntimeError(f"Anthropic OAuth API error {resp.status}: {response_text[:200]}")
+            data = json.loads(response_text)
 
         unprefix_tool_names_in_response(data)
         parsed = self.adapter.extract_response(data)
@@ -185,61 +222,65 @@ class AnthropicOAuthProvider(AIProvider):
         tool_acc = ToolAccumulator()
 
         try:
-            async with self._build_session() as session:
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=300),
-                ) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        _LOGGER.error(
-                            "Anthropic OAuth stream API error %d: %s",
-                            resp.status,
-                            error_text[:500],
-                        )
-                        yield {
-                            "type": "error",
-                            "message": f"Anthropic OAuth API error {resp.status}: {error_text[:200]}",
-                        }
-                        return
-
-                    async for raw_chunk in resp.content.iter_any():
-                        if not raw_chunk:
-                            continue
-                        for data_text in sse_parser.feed(raw_chunk.decode("utf-8", errors="ignore")):
-                            if data_text == "[DONE]":
-                                break
-                            try:
-                                event_data = json.loads(data_text)
-                            except (TypeError, ValueError, json.JSONDecodeError):
-                                _LOGGER.debug(
-                                    "Skipping unparsable Anthropic OAuth event: %s",
-                                    data_text[:200],
-                                )
-                                continue
-                            unprefix_tool_names_in_event(event_data)
-                            for out_chunk in self.adapter.extract_stream_events(event_data, tool_acc):
-                                yield out_chunk
-
-                    for data_text in sse_parser.flush():
+            await self._limiter().acquire(estimate_messages_tokens(messages))
+            session = self._session()
+            async with session.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=300),
+            ) as resp:
+                retry_after = self._observe_response(resp)
+                if resp.status != 200:
+                    error_text = await resp.text()
+                    _LOGGER.error(
+                        "Anthropic OAuth stream API error %d: %s",
+                        resp.status,
+                        error_text[:500],
+                    )
+                    yield {
+                        "type": "error",
+                        "message": f"Anthropic OAuth API error {resp.status}: {error_text[:200]}",
+                        "status": resp.status,
+                        "retry_after": retry_after,
+                    }
+                    return
+
+                async for raw_chunk in resp.content.iter_any():
+                    if not raw_chunk:
+                        continue
+                    for data_text in sse_parser.feed(raw_chunk):
+                        if data_text == "[DONE]":
+                            break
                         try:
                             event_data = json.loads(data_text)
                         except (TypeError, ValueError, json.JSONDecodeError):
+                            _LOGGER.debug(
+                                "Skipping unparsable Anthropic OAuth event: %s",
+                                data_text[:200],
+                            )
                             continue
                         unprefix_tool_names_in_event(event_data)
                         for out_chunk in self.adapter.extract_stream_events(event_data, tool_acc):
                             yield out_chunk
 
-                    if tool_acc.has_pending:
-                        for tc in tool_acc.flush_all():
-                            yield {
-                                "type": "tool_call",
-                                "id": tc["id"],
-                                "name": tc["name"],
-                                "args": tc["args"],
-                            }
+                for data_text in sse_parser.flush():
+                    try:
+                        event_data = json.loads(data_text)
+                    except (TypeError, ValueError, json.JSONDecodeError):
+                        continue
+                    unprefix_tool_names_in_event(event_data)
+                    for out_chunk in self.adapter.extract_stream_events(event_data, tool_acc):
+                        yield out_chunk
+
+                if tool_acc.has_pending:
+                    for tc in tool_acc.flush_all():
+                        yield {
+                            "type": "tool_call",
+                            "id": tc["id"],
+                            "name": tc["name"],
+                            "args": tc["args"],
+                        }
 
         except Exception as err:  # noqa: BLE001
             _LOGGER.error("Anthropic OAuth streaming exception: %s", err)
@@ -54,9 +54,10 @@ def prefix_tool_names_in_payload(payload: dict[str, Any]) -> None:
     """Mutate payload in-place: prefix all outgoing tool names."""
     tools = payload.get("tools")
     if isinstance(tools, list):
-        for tool in tools:
+        # Replace rather than mutate: tool dicts may be shared compiled schemas
+        for i, tool in enumerate(tools):
             if isinstance(tool, dict) and isinstance(tool.get("name"), str):
-                tool["name"] = prefix_tool_name(tool["name"])
+                tools[i] = {**tool, "name": prefix_tool_name(tool["name"])}
 
     messages = payload.get("messages")
     if not isinstance(messages, list):
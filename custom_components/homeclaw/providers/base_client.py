@@ -3,20 +3,62 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from abc import abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
+from ..core.token_estimator import estimate_messages_tokens
+from ..http_pool import get_pooled_session
+from ..rate_scheduler import DEFAULT_RATE_LIMIT_PAUSE, get_account_limiter
 from .registry import AIProvider
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from aiohttp import ClientResponse, ClientSession
     from homeassistant.core import HomeAssistant
 
+    from ..rate_scheduler import AccountLimiter
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delay seconds or HTTP date) to seconds."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if math.isnan(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+class ProviderHTTPError(Exception):
+    """A provider API request failed with an HTTP error status.
+
+    Attributes:
+        status: HTTP status code.
+        retry_after: Seconds from the ``Retry-After`` header, if sent.
+    """
+
+    def __init__(
+        self, message: str, *, status: int, retry_after: float | None = None
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
 class BaseHTTPClient(AIProvider):
     """Base class for HTTP-based AI providers.
 
@@ -38,15 +80,61 @@ class BaseHTTPClient(AIProvider):
         super().__init__(hass, config)
         self._max_retries = config.get("max_retries", self.DEFAULT_MAX_RETRIES)
         self._retry_delay = config.get("retry_delay", self.DEFAULT_RETRY_DELAY)
+        self._limiters: dict[str | None, AccountLimiter] = {}
 
     @property
     def session(self) -> ClientSession:
         """Get the aiohttp client session.
 
         Returns:
-            The aiohttp ClientSession for making HTTP requests.
+            The shared, pooled aiohttp ClientSession for making HTTP requests.
+        """
+        return get_pooled_session(self.hass)
+
+    def limiter_for(self, model: str | None) -> AccountLimiter:
+        """Get the request scheduler of this client's API credential and model.
+
+        Args:
+            model: The model the request is sent to.
+
+        Returns:
+            The AccountLimiter shared by every client using the same key
+            and model.
+        """
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limiter = self._limiters[model] = get_account_limiter(
+                self.hass,
+                self.api_url,
+                self.config.get("token"),
+                model=model,
+                rpm=self.config.get("rate_limit_rpm"),
+                tpm=self.config.get("rate_limit_tpm"),
+            )
+        return limiter
+
+    def _observe_response(
+        self, response: ClientResponse, limiter: AccountLimiter
+    ) -> float | None:
+        """Feed a response's rate-limit headers to the request's limiter.
+
+        A 429 pauses every request of the credential and model for the
+        server's ``Retry-After`` delay.
+
+        Args:
+            response: The API response.
+            limiter: The limiter the request was scheduled on.
+
+        Returns:
+            The ``Retry-After`` delay in seconds, if the response sent one.
         """
-        return async_get_clientsession(self.hass)
+        limiter.learn(response.headers)
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status == 429:
+            limiter.pause(
+                retry_after if retry_after is not None else DEFAULT_RATE_LIMIT_PAUSE
+            )
+        return retry_after
 
     @property
     @abstractmethod
@@ -94,7 +182,9 @@ class BaseHTTPClient(AIProvider):
         """Get a response from the AI provider.
 
         This is the template method that orchestrates the HTTP request
-        with retry logic.
+        with retry logic.  Every attempt waits for the credential's
+        request scheduler; a 429 is retried once the scheduler's pause
+        has elapsed instead of after the fixed retry delay.
 
         Args:
             messages: List of message dictionaries with role and content.
@@ -116,14 +206,19 @@ class BaseHTTPClient(AIProvider):
         )
 
         last_error: Exception | None = None
+        estimated_tokens = estimate_messages_tokens(messages)
+        limiter = self.limiter_for(payload.get("model"))
 
         for attempt in range(self._max_retries):
+            rate_limited = False
             try:
+                await limiter.acquire(estimated_tokens)
                 async with self.session.post(
                     self.api_url,
                     headers=headers,
                     json=payload,
                 ) as response:
+                    retry_after = self._observe_response(response, limiter)
                     if response.status == 200:
                         response_data = await response.json()
                         return self._extract_response(response_data)
@@ -137,8 +232,11 @@ class BaseHTTPClient(AIProvider):
                         response.status,
                         error_text,
                     )
-                    last_error = Exception(
-                        f"API request failed with status {response.status}: {error_text}"
+                    rate_limited = response.status == 429
+                    last_error = ProviderHTTPError(
+                        f"API request failed with status {response.status}: {error_text}",
+                        status=response.status,
+                        retry_after=retry_after,
                     )
 
             except Exception as e:
@@ -150,8 +248,9 @@ class BaseHTTPClient(AIProvider):
                 )
                 last_error = e
 
-            # Wait before retry (unless this is the last attempt)
-            if attempt < self._max_retries - 1:
+            # Wait before retry (unless this is the last attempt); after a
+            # 429 the limiter's pause does the waiting
+            if attempt < self._max_retries - 1 and not rate_limited:
                 await asyncio.sleep(self._retry_delay)
 
         # All retries exhausted
@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+from ..core.token_estimator import estimate_messages_tokens
+from ..core.tool_schema_cache import compile_tools
 from ..models import get_model_ids
 from .adapters.gemini_adapter import GeminiAdapter
-from .base_client import BaseHTTPClient
+from .base_client import BaseHTTPClient, ProviderHTTPError
 from .registry import ProviderRegistry
 
 if TYPE_CHECKING:
@@ -95,7 +97,7 @@ class GeminiProvider(BaseHTTPClient):
         # Convert and add tools if provided
         tools = kwargs.get("tools")
         if tools:
-            gemini_tools = self.adapter.transform_tools(tools)
+            gemini_tools = compile_tools(self.adapter, tools)
             if gemini_tools:
                 payload["tools"] = gemini_tools
                 _LOGGER.debug(
@@ -173,14 +175,19 @@ class GeminiProvider(BaseHTTPClient):
         payload = self._build_payload(messages, **kwargs)
 
         last_error: Exception | None = None
+        estimated_tokens = estimate_messages_tokens(messages)
+        limiter = self.limiter_for(model or self._model)
 
         for attempt in range(self._max_retries):
+            rate_limited = False
             try:
+                await limiter.acquire(estimated_tokens)
                 async with self.session.post(
                     api_url,
                     headers=headers,
                     json=payload,
                 ) as response:
+                    retry_after = self._observe_response(response, limiter)
                     if response.status == 200:
                         response_data = await response.json()
                         return self._extract_response(response_data)
@@ -193,8 +200,11 @@ class GeminiProvider(BaseHTTPClient):
                         response.status,
                         error_text[:500],
                     )
-                    last_error = Exception(
-                        f"Gemini API request failed with status {response.status}"
+                    rate_limited = response.status == 429
+                    last_error = ProviderHTTPError(
+                        f"Gemini API request failed with status {response.status}",
+                        status=response.status,
+                        retry_after=retry_after,
                     )
 
             except Exception as e:
@@ -206,7 +216,7 @@ class GeminiProvider(BaseHTTPClient):
                 )
                 last_error = e
 
-            if attempt < self._max_retries - 1:
+            if attempt < self._max_retries - 1 and not rate_limited:
                 await asyncio.sleep(self._retry_delay)
 
         raise last_error or Exception("Gemini API request failed after all retries")
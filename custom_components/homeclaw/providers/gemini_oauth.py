@@ -11,6 +11,9 @@ from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from ..core.token_estimator import estimate_messages_tokens
+from ..http_pool import get_pooled_session
+from ..rate_scheduler import get_account_limiter
 from ._gemini_constants import (
     DEFAULT_MODEL,
     GEMINI_AVAILABLE_MODELS,
@@ -30,6 +33,7 @@ from ._gemini_constants import (
 from ._gemini_convert import process_gemini_chunk
 from ._gemini_retry import classify_google_error, parse_retry_delay
 from .adapters.gemini_adapter import GeminiAdapter
+from .adapters.stream_utils import SSEParser
 from .registry import AIProvider, ProviderRegistry
 
 if TYPE_CHECKING:
@@ -89,32 +93,38 @@ class GeminiOAuthProvider(AIProvider):
         self._refresh_lock = asyncio.Lock()
         self._project_lock = asyncio.Lock()
         self._model_cooldowns: dict[str, float] = {}
-        self._session: aiohttp.ClientSession | None = None
 
         # Load OAuth data from config entry
         if self._config_entry:
             self._oauth_data = dict(self._config_entry.data.get("gemini_oauth", {}))
 
     def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create a reusable aiohttp session with connection pooling.
+        """Get the shared aiohttp session with connection pooling.
 
         Returns:
-            Shared aiohttp.ClientSession with keep-alive and connection limits.
+            Pooled aiohttp.ClientSession with keep-alive and connection limits.
         """
-        if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(
-                limit=10,
-                keepalive_timeout=30,
-                enable_cleanup_closed=True,
-            )
-            self._session = aiohttp.ClientSession(connector=connector)
-        return self._session
+        return get_pooled_session(self.hass)
+
+    async def _acquire_slot(self, messages: list[dict[str, Any]], model: str) -> None:
+        """Wait for the OAuth account's request scheduler of ``model``.
+
+        Rate-limit responses are handled by the per-model cooldowns, so the
+        scheduler only orders and paces requests here.
+        """
+        entry_id = self._config_entry.entry_id if self._config_entry else None
+        limiter = get_account_limiter(
+            self.hass,
+            GEMINI_CODE_ASSIST_ENDPOINT,
+            entry_id,
+            model=model,
+            rpm=self.config.get("rate_limit_rpm"),
+            tpm=self.config.get("rate_limit_tpm"),
+        )
+        await limiter.acquire(estimate_messages_tokens(messages))
 
     async def async_close(self) -> None:
-        """Close the shared HTTP session. Call on shutdown or entry removal."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Release provider resources (the pooled session is closed on shutdown)."""
 
     @property
     def supports_tools(self) -> bool:
@@ -402,10 +412,14 @@ class GeminiOAuthProvider(AIProvider):
         # Add tools for function calling if provided
         tools = kwargs.get("tools")
         if tools:
+            from ..core.tool_schema_cache import ToolSchemaCache
             from .gemini_schema_sanitizer import clean_tools_for_gemini
 
-            cleaned_tools = clean_tools_for_gemini(tools)
-            gemini_tools = self.adapter.transform_tools(cleaned_tools)
+            gemini_tools = ToolSchemaCache.compile(
+                "GeminiAdapter:sanitized",
+                tools,
+                lambda raw: self.adapter.transform_tools(clean_tools_for_gemini(raw)),
+            )
             if gemini_tools:
                 request_payload["tools"] = gemini_tools
 
@@ -773,6 +787,7 @@ class GeminiOAuthProvider(AIProvider):
                 model,
             )
 
+            await self._acquire_slot(messages, model)
             return await self._do_request(session, url, headers, wrapped_payload)
 
         return await self._retry_with_backoff(_perform_request)
@@ -823,6 +838,8 @@ class GeminiOAuthProvider(AIProvider):
                     "type": "error",
                     "message": f"Quota exhausted: {e}. "
                     "Please wait for quota reset or upgrade your plan.",
+                    "status": 429,
+                    "retry_after": getattr(e, "retry_delay_seconds", None),
                 }
                 return
 
@@ -836,6 +853,8 @@ class GeminiOAuthProvider(AIProvider):
                         "type": "error",
                         "message": "Rate limit exceeded after multiple retries. "
                         "Please wait and try again, or consider using Provisioned Throughput.",
+                        "status": 429,
+                        "retry_after": getattr(e, "retry_delay_seconds", None),
                     }
                     return
 
@@ -915,6 +934,7 @@ class GeminiOAuthProvider(AIProvider):
 
         _LOGGER.info("Gemini OAuth SSE STREAMING request to: %s", url)
 
+        await self._acquire_slot(messages, model)
         try:
             async with session.post(
                 url,
@@ -967,35 +987,26 @@ class GeminiOAuthProvider(AIProvider):
                     yield {
                         "type": "error",
                         "message": f"API error {resp.status}: {error_text[:200]}",
+                        "status": resp.status,
                     }
                     return
 
                 # Parse SSE stream: lines prefixed with "data: ", empty line = yield
                 _LOGGER.info("Gemini streaming (SSE): starting to read chunks")
                 chunk_count = 0
-                buffered_lines: list[str] = []
+                sse_parser = SSEParser()
 
-                async for raw_line in resp.content:
-                    if not raw_line:
+                async for raw_chunk in resp.content:
+                    if not raw_chunk:
                         continue
 
-                    line = raw_line.decode("utf-8").rstrip("\r\n")
-
-                    if line.startswith("data:"):
-                        # SSE spec: "data: payload" or "data:payload"
-                        payload = line[5:].lstrip(" ") if len(line) > 5 else ""
-                        buffered_lines.append(payload.strip())
-                    elif line == "" and buffered_lines:
-                        # Empty line = end of SSE event → parse buffered data
-                        joined = "\n".join(buffered_lines)
-                        buffered_lines = []
-
+                    for data_text in sse_parser.feed(raw_chunk):
                         try:
-                            chunk = json.loads(joined)
+                            chunk = json.loads(data_text)
                         except json.JSONDecodeError:
                             _LOGGER.debug(
                                 "Gemini SSE: malformed JSON chunk (%d bytes)",
-                                len(joined),
+                                len(data_text),
                             )
                             continue
 
@@ -1013,10 +1024,9 @@ class GeminiOAuthProvider(AIProvider):
                     # Ignore comment lines, id: fields, other SSE metadata
 
                 # Flush remaining buffered data (stream ended without trailing blank line)
-                if buffered_lines:
-                    joined = "\n".join(buffered_lines)
+                for data_text in sse_parser.flush():
                     try:
-                        chunk = json.loads(joined)
+                        chunk = json.loads(data_text)
                         if isinstance(chunk, dict):
                             chunk_count += 1
                             for result in process_gemini_chunk(
@@ -1025,7 +1035,8 @@ class GeminiOAuthProvider(AIProvider):
                                 yield result
                     except json.JSONDecodeError:
                         _LOGGER.debug(
-                            "Gemini SSE flush: unparseable data (%d bytes)", len(joined)
+                            "Gemini SSE flush: unparseable data (%d bytes)",
+                            len(data_text),
                         )
 
                 _LOGGER.info(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..core.prompt_layout import CACHE_PREFIX_KEY
 from .base_client import BaseHTTPClient
 from .registry import ProviderRegistry
 
@@ -92,7 +93,10 @@ class LocalProvider(BaseHTTPClient):
         """
         return {
             "model": self._model,
-            "messages": messages,
+            "messages": [
+                {k: v for k, v in msg.items() if k != CACHE_PREFIX_KEY}
+                for msg in messages
+            ],
             "stream": False,
         }
 
@@ -7,6 +7,7 @@ import logging
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
 
+from ..core.token_estimator import estimate_messages_tokens
 from .adapters.openai_compat import OpenAICompatAdapter
 from .adapters.stream_utils import SSEParser, ToolAccumulator
 from .base_client import BaseHTTPClient
@@ -15,6 +16,7 @@ from .registry import ProviderRegistry
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+
 def _is_openai_reasoning_model(model: str) -> bool:
     """True for OpenAI models that accept the ``reasoning_effort`` parameter.
 
@@ -53,6 +55,8 @@ class OpenAIProvider(BaseHTTPClient):
 
     API_URL = "https://api.openai.com/v1/chat/completions"
     DEFAULT_MODEL = "gpt-4o"
+    # Ask for a final usage chunk (incl. cached prompt tokens) when streaming
+    STREAM_INCLUDE_USAGE = True
 
     def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
         """Initialize the OpenAI provider.
@@ -161,11 +165,13 @@ class OpenAIProvider(BaseHTTPClient):
         Yields normalized chunks consumed by stream_loop:
         - {"type": "text", "content": "..."}
         - {"type": "tool_call", "name": str, "args": dict, "id": str}
-        - {"type": "error", "message": str}
+        - {"type": "error", "message": str, "status"?: int, "retry_after"?: float}
         """
         headers = self._build_headers()
         payload = self._build_payload(messages, **kwargs)
         payload["stream"] = True
+        if self.STREAM_INCLUDE_USAGE:
+            payload["stream_options"] = {"include_usage": True}
 
         sse_parser = SSEParser()
         tool_acc = ToolAccumulator()
@@ -178,12 +184,15 @@ class OpenAIProvider(BaseHTTPClient):
             payload.get("model"),
         )
 
+        limiter = self.limiter_for(payload.get("model"))
         try:
+            await limiter.acquire(estimate_messages_tokens(messages))
             async with self.session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
             ) as response:
+                retry_after = self._observe_response(response, limiter)
                 if response.status != 200:
                     error_text = await response.text()
                     log.error(
@@ -195,6 +204,8 @@ class OpenAIProvider(BaseHTTPClient):
                     yield {
                         "type": "error",
                         "message": f"{provider_name} API error {response.status}: {error_text[:200]}",
+                        "status": response.status,
+                        "retry_after": retry_after,
                     }
                     return
 
@@ -205,8 +216,7 @@ class OpenAIProvider(BaseHTTPClient):
                     if not raw_chunk:
                         continue
 
-                    text = raw_chunk.decode("utf-8", errors="ignore")
-                    for event_text in sse_parser.feed(text):
+                    for event_text in sse_parser.feed(raw_chunk):
                         if event_text == "[DONE]":
                             done = True
                             break
@@ -0,0 +1,522 @@
+"""Cross-provider failover router.
+
+``FailoverRouter`` stands in for the provider of one config entry.  Each
+request goes to the first usable provider of a user-defined chain: the
+entry's own provider, then the ``fallback_providers`` (other configured
+entries) in order.
+
+- A provider that answered 429/5xx (or could not be reached) is skipped
+  while it cools down, for as long as its ``Retry-After`` header asks.
+- A provider whose rolling error rate, or p95 first-token latency, is too
+  high is demoted behind the healthy ones.
+- Streams fail over only until the first content chunk; after that the
+  response is committed to one provider.
+- With a hedge delay, a slow first token starts the next provider in
+  parallel and whichever answers first wins.
+
+Latency and error statistics are kept per provider/model in one
+``ProviderHealth`` per Home Assistant instance, shared by every router.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .base_client import ProviderHTTPError
+from .registry import AIProvider
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROVIDER_HEALTH = "homeclaw_provider_health"
+
+# Rolling health window per provider/model
+HEALTH_WINDOW = 50  # most recent requests
+HEALTH_MAX_AGE = 300.0  # seconds; older samples are ignored
+HEALTH_MIN_SAMPLES = 5  # before error rate / latency can demote a provider
+MAX_ERROR_RATE = 0.5
+
+# Cooldown after a retryable failure without Retry-After, and its cap
+DEFAULT_COOLDOWN = 15.0  # seconds
+MAX_COOLDOWN = 300.0  # seconds
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504, 529})
+
+# Stream chunks that commit a response to the provider that sent them
+_CONTENT_CHUNKS = frozenset({"text", "reasoning", "reasoning_details", "tool_call"})
+
+
+@dataclass
+class _RouteStats:
+    """Rolling samples for one provider/model."""
+
+    # (monotonic time, seconds to first token / response)
+    latencies: deque[tuple[float, float]] = field(
+        default_factory=lambda: deque(maxlen=HEALTH_WINDOW)
+    )
+    # (monotonic time, succeeded)
+    outcomes: deque[tuple[float, bool]] = field(
+        default_factory=lambda: deque(maxlen=HEALTH_WINDOW)
+    )
+    cooldown_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+    def prune(self, now: float) -> None:
+        """Drop samples older than ``HEALTH_MAX_AGE``."""
+        for samples in (self.latencies, self.outcomes):
+            while samples and now - samples[0][0] > HEALTH_MAX_AGE:
+                samples.popleft()
+
+    def percentile(self, pct: float) -> float | None:
+        """Nearest-rank percentile of the latency window."""
+        if not self.latencies:
+            return None
+        ordered = sorted(latency for _, latency in self.latencies)
+        index = math.ceil(pct / 100 * len(ordered)) - 1
+        return ordered[min(len(ordered) - 1, max(0, index))]
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for _, ok in self.outcomes if not ok) / len(self.outcomes)
+
+
+@dataclass
+class ProviderHealth:
+    """Rolling latency, error rate and cooldowns per provider/model route.
+
+    Routes are ``"<provider>/<model>"`` strings (see ``FailoverRouter``).
+    """
+
+    default_cooldown: float = DEFAULT_COOLDOWN
+    _routes: dict[str, _RouteStats] = field(default_factory=dict, repr=False)
+
+    def record_success(self, route: str, latency: float) -> None:
+        """Record a request that produced its first token after ``latency`` s."""
+        stats = self._stats(route)
+        now = time.monotonic()
+        stats.requests += 1
+        stats.outcomes.append((now, True))
+        stats.latencies.append((now, latency))
+
+    def record_latency(self, route: str, latency: float) -> None:
+        """Record a latency sample without an outcome (e.g. a lost hedge race)."""
+        self._stats(route).latencies.append((time.monotonic(), latency))
+
+    def record_failure(
+        self,
+        route: str,
+        status: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Record a failed request and start a cooldown if it is retryable.
+
+        Args:
+            route: Provider/model route.
+            status: HTTP status, or None for connection errors and timeouts.
+            retry_after: Seconds from the ``Retry-After`` header, if any.
+        """
+        stats = self._stats(route)
+        now = time.monotonic()
+        stats.requests += 1
+        stats.failures += 1
+        stats.outcomes.append((now, False))
+
+        if retry_after is not None:
+            cooldown = retry_after
+        elif status is None or status in RETRYABLE_STATUSES:
+            cooldown = self.default_cooldown
+        else:
+            return
+        stats.cooldown_until = max(
+            stats.cooldown_until, now + min(cooldown, MAX_COOLDOWN)
+        )
+
+    def cooldown_remaining(self, route: str) -> float:
+        """Seconds until ``route`` may be used again (0 when available)."""
+        stats = self._routes.get(route)
+        if stats is None:
+            return 0.0
+        return max(0.0, stats.cooldown_until - time.monotonic())
+
+    def is_degraded(self, route: str, latency_budget: float | None = None) -> bool:
+        """True when the route's error rate or p95 latency is too high."""
+        stats = self._routes.get(route)
+        if stats is None:
+            return False
+        stats.prune(time.monotonic())
+        if len(stats.outcomes) >= HEALTH_MIN_SAMPLES and (
+            stats.error_rate > MAX_ERROR_RATE
+        ):
+            return True
+        if latency_budget is None or len(stats.latencies) < HEALTH_MIN_SAMPLES:
+            return False
+        p95 = stats.percentile(95)
+        return p95 is not None and p95 > latency_budget
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-route request counts, error rates and p50/p95 latencies."""
+        now = time.monotonic()
+        result: dict[str, dict[str, Any]] = {}
+        for route, stats in self._routes.items():
+            stats.prune(now)
+            p50 = stats.percentile(50)
+            p95 = stats.percentile(95)
+            result[route] = {
+                "requests": stats.requests,
+                "failures": stats.failures,
+                "error_rate_pct": round(stats.error_rate * 100, 1),
+                "p50_ms": round(p50 * 1000) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000) if p95 is not None else None,
+                "cooldown_s": round(max(0.0, stats.cooldown_until - now), 1),
+            }
+        return result
+
+    def _stats(self, route: str) -> _RouteStats:
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = _RouteStats()
+        return stats
+
+
+def get_provider_health(hass: HomeAssistant) -> ProviderHealth:
+    """Return the Home Assistant instance's health tracker, creating it on first use."""
+    health = hass.data.get(DATA_PROVIDER_HEALTH)
+    if health is None:
+        health = hass.data[DATA_PROVIDER_HEALTH] = ProviderHealth()
+    return health
+
+
+@dataclass
+class _Candidate:
+    """One provider of the chain, ready to be called."""
+
+    name: str
+    provider: AIProvider
+    route: str
+    kwargs: dict[str, Any]
+
+
+@dataclass
+class _Attempt:
+    """A candidate's stream, read up to its first content chunk."""
+
+    candidate: _Candidate
+    stream: AsyncGenerator[dict[str, Any], None]
+    started: float = field(default_factory=time.monotonic)
+    buffered: list[dict[str, Any]] = field(default_factory=list)
+    error: dict[str, Any] | None = None
+
+    async def prime(self) -> bool:
+        """Read until the first content chunk; False if the stream failed first.
+
+        Non-content chunks (usage, status) are buffered so a failed attempt
+        leaves nothing behind.  A stream that ends without content is an
+        empty answer, not a failure.
+        """
+        try:
+            async for chunk in self.stream:
+                if chunk.get("type") == "error":
+                    self.error = chunk
+                    return False
+                self.buffered.append(chunk)
+                if chunk.get("type") in _CONTENT_CHUNKS:
+                    return True
+        except Exception as err:  # noqa: BLE001 - any failure means fail over
+            self.error = {
+                "type": "error",
+                "message": f"{self.candidate.name} streaming error: {err}",
+            }
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Close the underlying stream (and its HTTP response)."""
+        try:
+            await self.stream.aclose()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Error closing %s stream", self.candidate.name, exc_info=True)
+
+
+class FailoverRouter(AIProvider):
+    """Routes requests across a chain of providers with failover and hedging.
+
+    Fallback providers are looked up by name on every request (through
+    ``resolve``), so entries set up after this one join the chain as soon
+    as they are loaded.  When failing over, the primary's ``model``
+    argument is dropped and the fallback uses its own configured model.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        primary_name: str,
+        primary: AIProvider,
+        fallbacks: list[str],
+        resolve: Callable[[str], AIProvider | None],
+        *,
+        hedge_delay: float | None = None,
+        latency_budget: float | None = None,
+        health: ProviderHealth | None = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            hass: Home Assistant instance.
+            primary_name: Provider name of this config entry.
+            primary: This entry's provider (always first in the chain).
+            fallbacks: Provider names to fail over to, in order.
+            resolve: Returns the provider configured under a name, or None.
+            hedge_delay: Seconds to wait for a first token before starting
+                the next provider in parallel (None disables hedging).
+            latency_budget: p95 first-token latency (seconds) above which a
+                provider is demoted (None disables latency demotion).
+            health: Shared health tracker (defaults to the one for ``hass``).
+        """
+        super().__init__(hass, primary.config)
+        self.primary_name = primary_name
+        self.primary = primary
+        self.fallbacks = [name for name in fallbacks if name != primary_name]
+        self._resolve = resolve
+        self.hedge_delay = hedge_delay or None
+        self.latency_budget = latency_budget or None
+        self.health = health if health is not None else get_provider_health(hass)
+        self._failovers = 0
+        self._hedges = 0
+
+    @property
+    def supports_tools(self) -> bool:
+        return self.primary.supports_tools
+
+    @property
+    def lightweight_model(self) -> str | None:
+        return self.primary.lightweight_model
+
+    async def async_close(self) -> None:
+        """Close the primary provider (fallbacks belong to their own entries)."""
+        if hasattr(self.primary, "async_close"):
+            await self.primary.async_close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get failover/hedge counters and the per-route health statistics."""
+        return {
+            "failovers": self._failovers,
+            "hedges": self._hedges,
+            "routes": self.health.get_stats(),
+        }
+
+    # -- candidate selection -------------------------------------------
+
+    def _candidates(self, kwargs: dict[str, Any]) -> list[_Candidate]:
+        """Order the chain: healthy first, degraded after, cooling down skipped."""
+        chain: list[tuple[str, AIProvider]] = [(self.primary_name, self.primary)]
+        for name in self.fallbacks:
+            provider = self._resolve(name)
+            if isinstance(provider, FailoverRouter):
+                provider = provider.primary
+            if provider is None:
+                continue
+            if kwargs.get("tools") and not provider.supports_tools:
+                continue
+            chain.append((name, provider))
+
+        healthy: list[_Candidate] = []
+        degraded: list[_Candidate] = []
+        for name, provider in chain:
+            if provider is self.primary:
+                call_kwargs = kwargs
+                model = kwargs.get("model") or provider.config.get("model")
+            else:
+                # The requested model belongs to the primary provider
+                call_kwargs = {k: v for k, v in kwargs.items() if k != "model"}
+                model = provider.config.get("model")
+            route = f"{name}/{model}" if model else name
+
+            if self.health.cooldown_remaining(route) > 0:
+                _LOGGER.debug("Skipping %s (cooling down)", route)
+                continue
+            target = (
+                degraded
+                if self.health.is_degraded(route, self.latency_budget)
+                else healthy
+            )
+            target.append(_Candidate(name, provider, route, call_kwargs))
+        return healthy + degraded
+
+    def _unavailable(self) -> ProviderHTTPError:
+        """Error for a request when every provider is cooling down."""
+        routes = self.health.get_stats()
+        wait = min(
+            (stats["cooldown_s"] for stats in routes.values() if stats["cooldown_s"]),
+            default=0.0,
+        )
+        return ProviderHTTPError(
+            f"All providers are rate limited or unavailable; retry in {wait:.0f}s",
+            status=429,
+            retry_after=wait,
+        )
+
+    def _record_failure(
+        self, candidate: _Candidate, status: Any, retry_after: Any
+    ) -> None:
+        self.health.record_failure(
+            candidate.route,
+            status if isinstance(status, int) else None,
+            retry_after if isinstance(retry_after, (int, float)) else None,
+        )
+
+    # -- requests --------------------------------------------------------
+
+    async def get_response(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        """Get a response from the first provider of the chain that succeeds."""
+        candidates = self._candidates(kwargs)
+        if not candidates:
+            raise self._unavailable()
+
+        last_error: Exception | None = None
+        for candidate in candidates:
+            if last_error is not None:
+                self._failovers += 1
+                _LOGGER.warning(
+                    "Failing over to %s after error: %s", candidate.route, last_error
+                )
+            started = time.monotonic()
+            try:
+                response = await candidate.provider.get_response(
+                    messages, **candidate.kwargs
+                )
+            except Exception as err:
+                self._record_failure(
+                    candidate,
+                    getattr(err, "status", None),
+                    getattr(err, "retry_after", None),
+                )
+                last_error = err
+                continue
+            self.health.record_success(candidate.route, time.monotonic() - started)
+            return response
+
+        raise last_error or self._unavailable()
+
+    async def get_response_stream(
+        self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream from the first provider of the chain to produce content.
+
+        Errors after the first content chunk are passed through unchanged.
+        """
+        candidates = self._candidates(kwargs)
+        if not candidates:
+            yield {"type": "error", "message": str(self._unavailable())}
+            return
+
+        winner, last_error = await self._first_responder(candidates, messages)
+        if winner is None:
+            yield last_error or {"type": "error", "message": "All providers failed"}
+            return
+
+        try:
+            for chunk in winner.buffered:
+                yield chunk
+            async for chunk in winner.stream:
+                if chunk.get("type") == "error":
+                    self._record_failure(
+                        winner.candidate, chunk.get("status"), chunk.get("retry_after")
+                    )
+                yield chunk
+        finally:
+            await winner.close()
+
+    async def _first_responder(
+        self, candidates: list[_Candidate], messages: list[dict[str, Any]]
+    ) -> tuple[_Attempt | None, dict[str, Any] | None]:
+        """Start candidates until one produces content.
+
+        Without hedging, candidates are tried one after another.  With
+        hedging, the next candidate also starts whenever no first token
+        arrived within ``hedge_delay``; the first to produce content wins
+        and the others are cancelled.
+
+        Returns:
+            The winning attempt (or None) and the last error chunk seen.
+        """
+        queue = list(candidates)
+        running: dict[asyncio.Future[bool], _Attempt] = {}
+        last_error: dict[str, Any] | None = None
+        winner: _Attempt | None = None
+
+        def _launch() -> None:
+            candidate = queue.pop(0)
+            attempt = _Attempt(
+                candidate,
+                candidate.provider.get_response_stream(messages, **candidate.kwargs),
+            )
+            running[asyncio.ensure_future(attempt.prime())] = attempt
+
+        _launch()
+        try:
+            while running and winner is None:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self.hedge_delay if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self._hedges += 1
+                    _LOGGER.info(
+                        "No first token within %.1fs, hedging with %s",
+                        self.hedge_delay,
+                        queue[0].route,
+                    )
+                    _launch()
+                    continue
+
+                for task in done:
+                    attempt = running.pop(task)
+                    elapsed = time.monotonic() - attempt.started
+                    if task.result() and winner is None:
+                        winner = attempt
+                        self.health.record_success(attempt.candidate.route, elapsed)
+                        continue
+                    if attempt.error is not None:
+                        last_error = attempt.error
+                        self._record_failure(
+                            attempt.candidate,
+                            attempt.error.get("status"),
+                            attempt.error.get("retry_after"),
+                        )
+                        _LOGGER.warning(
+                            "%s failed before its first token: %s",
+                            attempt.candidate.route,
+                            attempt.error.get("message"),
+                        )
+                    await attempt.close()
+
+                if winner is None and not running and queue:
+                    self._failovers += 1
+                    _LOGGER.warning("Failing over to %s", queue[0].route)
+                    _launch()
+        finally:
+            # Cancel the hedge losers (or everything, if we were cancelled)
+            for task, attempt in running.items():
+                task.cancel()
+                self.health.record_latency(
+                    attempt.candidate.route, time.monotonic() - attempt.started
+                )
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for attempt in running.values():
+                await attempt.close()
+
+        return winner, last_error
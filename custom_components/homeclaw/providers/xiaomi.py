@@ -22,6 +22,8 @@ class XiaomiProvider(OpenAIProvider):
 
     API_URL = "https://api.xiaomimimo.com/v1/chat/completions"
     DEFAULT_MODEL = "mimo-v2-flash"
+    # stream_options is not documented for this API
+    STREAM_INCLUDE_USAGE = False
 
     @property
     def api_url(self) -> str:
@@ -31,6 +31,8 @@ class ZaiProvider(OpenAIProvider):
     """
 
     DEFAULT_MODEL = "glm-4-flash"
+    # stream_options is not documented for this API
+    STREAM_INCLUDE_USAGE = False
 
     def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
         """Initialize the z.ai provider.
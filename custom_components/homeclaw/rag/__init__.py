@@ -21,6 +21,8 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .entity_indexer import ProgressCallback
+
 _LOGGER = logging.getLogger(__name__)
 
 # Re-export for external use
@@ -89,6 +91,7 @@ class RAGManager:
             indexer=self._lifecycle.indexer,
             session_indexer=self._lifecycle.session_indexer,
             memory_manager=self._lifecycle.memory_manager,
+            context_cache=self._lifecycle.context_cache,
         )
 
     def _ensure_initialized(self) -> None:
@@ -120,6 +123,8 @@ class RAGManager:
         user_id: str | None = None,
         provider: Any | None = None,
         model: str | None = None,
+        *,
+        timings_out: dict[str, Any] | None = None,
     ) -> str:
         """Get relevant entity context for a user query.
 
@@ -129,13 +134,14 @@ class RAGManager:
             user_id: Optional user ID for memory recall.
             provider: Optional AI provider for query expansion.
             model: Optional model name for query expansion.
+            timings_out: Optional dict filled with this call's stage timings.
 
         Returns:
             JSON-formatted context string for the LLM, or empty string if no results.
         """
         self._ensure_initialized()
         return await self._retriever.get_relevant_context(
-            query, top_k, user_id, provider, model
+            query, top_k, user_id, provider, model, timings_out=timings_out
         )
 
     # ------------------------------------------------------------------
@@ -181,7 +187,7 @@ class RAGManager:
         ]
 
         try:
-            return await session_indexer.index_session(
+            indexed = await session_indexer.index_session(
                 session_id=session_id,
                 rounds=rounds,
                 force=force,
@@ -189,6 +195,9 @@ class RAGManager:
         except Exception as e:
             _LOGGER.warning("Session indexing failed for %s: %s", session_id, e)
             return 0
+        if indexed:
+            self._clear_context_cache()
+        return indexed
 
     async def sanitize_and_index_session(
         self,
@@ -229,11 +238,14 @@ class RAGManager:
                 _LOGGER.debug("Sanitization returned empty result for %s", session_id)
                 return 0
 
-            return await session_indexer.index_session(
+            indexed = await session_indexer.index_session(
                 session_id=session_id,
                 rounds=sanitized,
                 force=True,
             )
+            if indexed:
+                self._clear_context_cache()
+            return indexed
         except Exception as e:
             _LOGGER.warning(
                 "Sanitize-and-index failed for session %s: %s", session_id, e
@@ -263,12 +275,15 @@ class RAGManager:
         try:
             from .session_archiver import archive_old_sessions
 
-            return await archive_old_sessions(
+            result = await archive_old_sessions(
                 store=self._lifecycle.store,
                 embedding_provider=self._lifecycle.embedding_provider,
                 provider=provider,
                 model=model,
             )
+            if result:
+                self._clear_context_cache()
+            return result
         except Exception as e:
             _LOGGER.warning("Session archival failed: %s", e)
             return {}
@@ -285,6 +300,7 @@ class RAGManager:
         if session_indexer:
             try:
                 await session_indexer.remove_session(session_id)
+                self._clear_context_cache()
             except Exception as e:
                 _LOGGER.warning(
                     "Failed to remove session index for %s: %s", session_id, e
@@ -371,10 +387,34 @@ class RAGManager:
         self._ensure_initialized()
         await self._lifecycle.indexer.remove_entity(entity_id)
 
-    async def full_reindex(self) -> None:
-        """Perform a full reindex of all entities."""
+    async def full_reindex(
+        self,
+        progress_callback: ProgressCallback | None = None,
+    ) -> bool:
+        """Perform a full reindex of all entities.
+
+        Args:
+            progress_callback: Optional async callback receiving progress events.
+
+        Returns:
+            True if the new index was swapped in, False if it was left
+            incomplete to be resumed.
+        """
         self._ensure_initialized()
-        await self._lifecycle.indexer.full_reindex()
+        try:
+            return await self._lifecycle.indexer.full_reindex(progress_callback)
+        finally:
+            self._clear_context_cache()
+
+    def _clear_context_cache(self) -> None:
+        """Drop all cached RAG contexts (session index or full entity index changed)."""
+        if self._lifecycle and self._lifecycle.context_cache is not None:
+            self._lifecycle.context_cache.clear()
+
+    @property
+    def reindex_running(self) -> bool:
+        """Whether a full entity reindex is in progress."""
+        return bool(self._lifecycle.indexer and self._lifecycle.indexer.reindex_running)
 
     # ------------------------------------------------------------------
     # Statistics
@@ -401,6 +441,29 @@ class RAGManager:
             stats["embedding_cache"] = lc.embedding_provider.get_cache_stats()
             stats["embedding_cache_db"] = await lc.store.get_cache_stats()
 
+        # Incremental entity indexing counters
+        if lc.indexer and hasattr(lc.indexer, "get_stats"):
+            stats["entity_indexer"] = lc.indexer.get_stats()
+
+        # Context result cache hit ratio
+        if lc.context_cache is not None:
+            stats["context_cache"] = lc.context_cache.get_stats()
+
+        # Shared HTTP pool utilization / connection reuse
+        from ..http_pool import get_http_pool
+
+        stats["http_pool"] = get_http_pool(self.hass).get_metrics()
+
+        # Token counter and per-provider calibration
+        from ..core.token_estimator import get_token_accounting_stats
+
+        stats["token_accounting"] = get_token_accounting_stats()
+
+        # SQLite worker queue depth / latency
+        db_metrics = lc.store.get_db_metrics()
+        if isinstance(db_metrics, dict) and db_metrics:
+            stats["db_worker"] = db_metrics
+
         # Session indexing stats
         if lc.session_indexer:
             try:
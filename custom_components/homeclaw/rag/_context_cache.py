@@ -0,0 +1,168 @@
+"""Result cache for RAG context retrieval.
+
+Users repeat near-identical questions ("what's the temperature in the
+bedroom") many times a day.  ``ContextCache`` keeps the context strings
+built by ``RAGContextRetriever`` in a small LRU keyed by the normalized
+query, user and ``top_k``; entries expire after a TTL and are dropped
+early when an entity they mention is reindexed or the user's memories
+change.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Cache sizing
+CONTEXT_CACHE_MAX_ENTRIES = 256
+# Session context and entity states age even without an invalidation event
+CONTEXT_CACHE_TTL = 300.0  # seconds
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s?!.,;:]+$")
+
+_CacheKey = tuple[str, str, int]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookup (case, whitespace, trailing punctuation)."""
+    normalized = _WHITESPACE_RE.sub(" ", query.casefold()).strip()
+    return _TRAILING_PUNCT_RE.sub("", normalized)
+
+
+@dataclass
+class _CacheEntry:
+    """One cached context string and what it depends on."""
+
+    context: str
+    user_id: str | None
+    entity_ids: frozenset[str]
+    expires_at: float
+
+
+@dataclass
+class ContextCache:
+    """LRU/TTL cache of retrieved RAG context strings.
+
+    Invalidation is selective: ``invalidate_entities`` drops only entries
+    whose context includes one of the entities, ``invalidate_user`` only
+    entries built for that user.
+    """
+
+    max_entries: int = CONTEXT_CACHE_MAX_ENTRIES
+    ttl: float = CONTEXT_CACHE_TTL
+    _entries: OrderedDict[_CacheKey, _CacheEntry] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    # entity_id -> keys of entries whose context mentions it
+    _by_entity: dict[str, set[_CacheKey]] = field(default_factory=dict, repr=False)
+    _hits: int = field(default=0, repr=False)
+    _misses: int = field(default=0, repr=False)
+    _invalidations: int = field(default=0, repr=False)
+
+    @staticmethod
+    def make_key(query: str, user_id: str | None, top_k: int) -> _CacheKey:
+        """Build the cache key for a retrieval call."""
+        return (normalize_query(query), user_id or "", top_k)
+
+    def get(self, key: _CacheKey) -> str | None:
+        """Return the cached context for ``key``, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.context
+
+    def put(
+        self,
+        key: _CacheKey,
+        context: str,
+        user_id: str | None,
+        entity_ids: Iterable[str],
+    ) -> None:
+        """Store a context string with the entity IDs it was built from."""
+        if key in self._entries:
+            self._remove(key)
+        entry = _CacheEntry(
+            context=context,
+            user_id=user_id,
+            entity_ids=frozenset(entity_ids),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries[key] = entry
+        for entity_id in entry.entity_ids:
+            self._by_entity.setdefault(entity_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_entities(self, entity_ids: Iterable[str]) -> int:
+        """Drop entries whose context mentions any of ``entity_ids``.
+
+        Returns:
+            Number of entries dropped.
+        """
+        keys: set[_CacheKey] = set()
+        for entity_id in entity_ids:
+            keys.update(self._by_entity.get(entity_id, ()))
+        return self._invalidate(keys)
+
+    def invalidate_user(self, user_id: str | None) -> int:
+        """Drop entries built for ``user_id`` (all entries when None).
+
+        Returns:
+            Number of entries dropped.
+        """
+        if user_id is None:
+            return self.clear()
+        keys = {key for key, entry in self._entries.items() if entry.user_id == user_id}
+        return self._invalidate(keys)
+
+    def clear(self) -> int:
+        """Drop every entry.
+
+        Returns:
+            Number of entries dropped.
+        """
+        return self._invalidate(set(self._entries))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        total = self._hits + self._misses
+        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "total": total,
+            "hit_rate_pct": round(hit_rate, 1),
+            "invalidations": self._invalidations,
+        }
+
+    def _invalidate(self, keys: set[_CacheKey]) -> int:
+        """Remove ``keys`` and count them as invalidations."""
+        for key in keys:
+            self._remove(key)
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def _remove(self, key: _CacheKey) -> None:
+        """Remove one entry and its entity back-references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for entity_id in entry.entity_ids:
+            keys = self._by_entity.get(entity_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_entity[entity_id]
@@ -0,0 +1,356 @@
+"""Off-loop SQLite execution for the RAG vector store.
+
+Every SQLite statement of the RAG store (and of the memory / identity stores
+sharing its database) goes through a ``DbWorker`` so the Home Assistant
+event loop never blocks on disk I/O:
+
+- Writes run on the single writer connection, serialized by a lock, so there
+  is exactly one writer at a time.  Each write job is one transaction: it is
+  committed when the job returns and rolled back if it raises.
+- Reads check out a connection from a small pool of read-only connections.
+  The database runs in WAL mode, so readers never wait for the writer and
+  always see the last committed state.
+
+Jobs are plain sync callables receiving a ``sqlite3.Connection``; they are
+executed in the event loop's default executor (Home Assistant's executor
+pool), so thread lifecycle stays owned by Home Assistant.
+
+Per-operation latency, queue wait time and queue depth are tracked and
+exposed through ``get_metrics()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Read-only connections kept open for concurrent readers
+DEFAULT_READ_POOL_SIZE = 3
+
+# How long a connection waits on a locked database before raising
+BUSY_TIMEOUT_MS = 5000
+
+# Number of recent samples per operation used for percentile estimates
+_LATENCY_WINDOW = 128
+
+
+@dataclass
+class _OpStats:
+    """Rolling latency statistics for one labelled operation."""
+
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    wait_ms: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def record(self, run_ms: float, wait_ms: float, error: bool) -> None:
+        """Add one sample."""
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += run_ms
+        self.wait_ms += wait_ms
+        self.max_ms = max(self.max_ms, run_ms)
+        self.recent.append(run_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the stats websocket."""
+        ordered = sorted(self.recent)
+        p50 = ordered[len(ordered) // 2] if ordered else 0.0
+        p95 = (
+            ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        )
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(p50, 3),
+            "p95_ms": round(p95, 3),
+            "max_ms": round(self.max_ms, 3),
+            "avg_wait_ms": round(self.wait_ms / self.count, 3) if self.count else 0.0,
+        }
+
+
+class DbWorker:
+    """Single-writer / pooled-reader SQLite executor.
+
+    Args:
+        db_path: Path of the SQLite database file.
+        read_pool_size: Maximum number of read-only connections.
+    """
+
+    def __init__(
+        self, db_path: str, read_pool_size: int = DEFAULT_READ_POOL_SIZE
+    ) -> None:
+        """Initialize the worker (connections are opened by ``open``)."""
+        self._db_path = db_path
+        self._read_pool_size = max(1, read_pool_size)
+        self._writer: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        self._idle_readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._journal_mode = "unknown"
+        self._closed = False
+
+        # Queue depth is only touched on the event loop thread
+        self._pending_writes = 0
+        self._pending_reads = 0
+        self._peak_pending_writes = 0
+        self._peak_pending_reads = 0
+
+        # Latency stats are recorded from executor threads
+        self._stats: dict[str, _OpStats] = {}
+        self._stats_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def writer(self) -> sqlite3.Connection | None:
+        """The writer connection (None until opened / after close)."""
+        return self._writer
+
+    def open(self) -> sqlite3.Connection:
+        """Open the writer connection and switch the database to WAL mode.
+
+        Blocking -- call from an executor (see ``async_open``).
+
+        Returns:
+            The writer connection.
+        """
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        try:
+            row = conn.execute("PRAGMA journal_mode = WAL").fetchone()
+            self._journal_mode = str(row[0]).lower() if row else "unknown"
+            if self._journal_mode == "wal":
+                conn.execute("PRAGMA synchronous = NORMAL")
+            else:
+                _LOGGER.warning(
+                    "SQLite WAL mode unavailable (journal_mode=%s); readers may wait on writes",
+                    self._journal_mode,
+                )
+        except sqlite3.DatabaseError as err:
+            _LOGGER.warning("Failed to enable SQLite WAL mode: %s", err)
+
+        self._writer = conn
+        self._closed = False
+        return conn
+
+    async def async_open(self) -> sqlite3.Connection:
+        """Open the writer connection without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.open)
+
+    def close(self) -> None:
+        """Close every connection, waiting for an in-flight write to finish."""
+        self._closed = True
+        with self._write_lock:
+            # Idle readers are closed now; busy ones are closed on check-in
+            with self._pool_lock:
+                while True:
+                    try:
+                        conn = self._idle_readers.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._readers.remove(conn)
+                    try:
+                        conn.close()
+                    except sqlite3.Error as err:
+                        _LOGGER.debug("Error closing SQLite read connection: %s", err)
+
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except sqlite3.Error as err:
+                    _LOGGER.debug("Error closing SQLite writer connection: %s", err)
+                self._writer = None
+
+    async def async_close(self) -> None:
+        """Close every connection without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    # ------------------------------------------------------------------
+    # Job execution
+    # ------------------------------------------------------------------
+
+    async def write(self, label: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Run ``func(conn, *args)`` as one transaction on the writer.
+
+        Args:
+            label: Operation name used for metrics.
+            func: Sync callable receiving the writer connection.
+            *args: Extra positional arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        loop = asyncio.get_running_loop()
+        self._pending_writes += 1
+        self._peak_pending_writes = max(self._peak_pending_writes, self._pending_writes)
+        try:
+            return await loop.run_in_executor(
+                None, self._execute_write, label, func, args, time.perf_counter()
+            )
+        finally:
+            self._pending_writes -= 1
+
+    async def read(self, label: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Run ``func(conn, *args)`` on a pooled read-only connection.
+
+        Args:
+            label: Operation name used for metrics.
+            func: Sync callable receiving a read connection.
+            *args: Extra positional arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        loop = asyncio.get_running_loop()
+        self._pending_reads += 1
+        self._peak_pending_reads = max(self._peak_pending_reads, self._pending_reads)
+        try:
+            return await loop.run_in_executor(
+                None, self._execute_read, label, func, args, time.perf_counter()
+            )
+        finally:
+            self._pending_reads -= 1
+
+    def write_blocking(self, label: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a write job on the calling thread (legacy sync callers only)."""
+        return self._execute_write(label, func, args, time.perf_counter())
+
+    def _execute_write(
+        self,
+        label: str,
+        func: Callable[..., _T],
+        args: tuple[Any, ...],
+        enqueued: float,
+    ) -> _T:
+        """Executor side of ``write``."""
+        with self._write_lock:
+            conn = self._writer
+            if conn is None:
+                raise RuntimeError("SQLite worker is closed")
+            started = time.perf_counter()
+            try:
+                result = func(conn, *args)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                self._record(label, enqueued, started, error=True)
+                raise
+            self._record(label, enqueued, started, error=False)
+            return result
+
+    def _execute_read(
+        self,
+        label: str,
+        func: Callable[..., _T],
+        args: tuple[Any, ...],
+        enqueued: float,
+    ) -> _T:
+        """Executor side of ``read``."""
+        conn = self._checkout()
+        started = time.perf_counter()
+        error = False
+        try:
+            return func(conn, *args)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self._record(label, enqueued, started, error=error)
+            self._checkin(conn)
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle read connection, opening one if the pool has room."""
+        if self._closed:
+            raise RuntimeError("SQLite worker is closed")
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if len(self._readers) < self._read_pool_size:
+                conn = sqlite3.connect(self._db_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+                conn.execute("PRAGMA query_only = ON")
+                self._readers.append(conn)
+                return conn
+
+        # Pool exhausted: wait for a reader to be returned
+        while True:
+            try:
+                return self._idle_readers.get(timeout=0.5)
+            except queue.Empty:
+                if self._closed:
+                    raise RuntimeError("SQLite worker is closed") from None
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        """Return a read connection to the pool."""
+        if conn.in_transaction:
+            conn.rollback()
+        if self._closed:
+            with self._pool_lock:
+                if conn in self._readers:
+                    self._readers.remove(conn)
+            conn.close()
+            return
+        self._idle_readers.put(conn)
+
+    def _record(
+        self, label: str, enqueued: float, started: float, *, error: bool
+    ) -> None:
+        """Store one latency sample for ``label``."""
+        finished = time.perf_counter()
+        with self._stats_lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = _OpStats()
+            stats.record(
+                (finished - started) * 1000, (started - enqueued) * 1000, error
+            )
+        if error:
+            _LOGGER.debug("SQLite operation %s failed", label)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return queue depth and per-operation latency statistics."""
+        with self._stats_lock:
+            operations = {
+                label: s.as_dict() for label, s in sorted(self._stats.items())
+            }
+        with self._pool_lock:
+            open_readers = len(self._readers)
+        return {
+            "journal_mode": self._journal_mode,
+            "pending_writes": self._pending_writes,
+            "pending_reads": self._pending_reads,
+            "peak_pending_writes": self._peak_pending_writes,
+            "peak_pending_reads": self._peak_pending_reads,
+            "read_pool_size": self._read_pool_size,
+            "read_connections_open": open_readers,
+            "operations": operations,
+        }
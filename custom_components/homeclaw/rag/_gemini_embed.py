@@ -0,0 +1,279 @@
+"""Batched, rate-aware transport for the Gemini embedding providers.
+
+Both Gemini providers embed through ``batchEmbedContents`` (up to
+``GEMINI_BATCH_SIZE`` texts per request).  If the endpoint is unavailable
+for the model / credential, they fall back to ``embedContent`` per text,
+run by a bounded pool of concurrent workers.  Every request takes a token
+from the provider's ``TokenBucket``; a 429 pauses the bucket for the
+server-provided ``retryDelay`` and the request is retried.
+
+Requests go through the integration's shared ``HttpPool`` session when the
+provider was given one, otherwise through one long-lived session owned by
+the provider, never a new session per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from ..providers._gemini_retry import classify_google_error, parse_retry_delay
+from ._rate_limit import TokenBucket
+
+if TYPE_CHECKING:
+    from ..http_pool import HttpPool
+
+_LOGGER = logging.getLogger(__name__)
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta/models/{model}"
+
+# Texts per batchEmbedContents request (API maximum is 100)
+GEMINI_BATCH_SIZE = 100
+
+# Concurrent in-flight requests per provider
+GEMINI_MAX_CONCURRENCY = 4
+
+# Steady request rate / burst for the token bucket
+GEMINI_REQUESTS_PER_SECOND = 5.0
+GEMINI_REQUEST_BURST = 10.0
+
+# 429 handling: retries honouring retryDelay, and the delay used without one
+GEMINI_MAX_RATE_LIMIT_RETRIES = 3
+GEMINI_DEFAULT_RETRY_DELAY = 2.0
+GEMINI_MAX_RETRY_DELAY = 60.0
+
+# Status codes meaning "batchEmbedContents not available here"
+_BATCH_UNSUPPORTED_STATUS = (404, 501)
+
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+
+def _embedding_error(message: str) -> Exception:
+    """Build an ``EmbeddingError`` (imported lazily: embeddings imports us)."""
+    from .embeddings import EmbeddingError
+
+    return EmbeddingError(message)
+
+
+def new_gemini_limiter() -> TokenBucket:
+    """Create the default per-provider token bucket."""
+    return TokenBucket(GEMINI_REQUESTS_PER_SECOND, GEMINI_REQUEST_BURST)
+
+
+def _retry_delay(body: str, headers: Mapping[str, str], attempt: int) -> float:
+    """Seconds to wait after a 429, as requested by the server if it says so.
+
+    Uses the structured ``RetryInfo`` detail, then the "retry in Xs" message
+    text, then the ``Retry-After`` header, then exponential backoff.
+    """
+    error = classify_google_error(429, body)
+    delay = getattr(error, "retry_delay_seconds", None)
+    if delay is None:
+        retry_after = headers.get("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after else None
+        except ValueError:
+            delay = None
+    if delay is None:
+        delay = parse_retry_delay(body, GEMINI_DEFAULT_RETRY_DELAY * (2**attempt))
+    return min(max(delay, 0.0), GEMINI_MAX_RETRY_DELAY)
+
+
+class GeminiBatchMixin(ABC):
+    """Batched embedding transport shared by the Gemini providers.
+
+    Expects the host class to provide:
+    - ``self.model``: embedding model name
+    - ``self._session`` / ``self._limiter`` / ``self._batch_supported`` fields
+    - ``self.http_pool``: shared connection pool (None = own session)
+    - ``self._auth_headers()``: coroutine returning request auth headers
+    - ``self._error_label``: prefix for error messages
+    """
+
+    model: str
+    http_pool: HttpPool | None
+    _session: aiohttp.ClientSession | None
+    _limiter: TokenBucket
+    _batch_supported: bool
+    _error_label: str
+
+    @abstractmethod
+    async def _auth_headers(self) -> dict[str, str]:
+        """Return the authentication headers for the next requests."""
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared pool's session, or the provider's own long-lived one."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        if self.http_pool is not None:
+            return self.http_pool.session()
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=GEMINI_MAX_CONCURRENCY * 2),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the provider's own HTTP session (the shared pool stays open)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _embed_texts(
+        self, texts: list[str], task_type: str
+    ) -> list[list[float]]:
+        """Embed ``texts`` (order preserved) via batches or the worker pool."""
+        headers = {**await self._auth_headers(), "Content-Type": "application/json"}
+        semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+
+        async def _bounded(coro_fn: Any, *args: Any) -> Any:
+            async with semaphore:
+                return await coro_fn(*args)
+
+        if not self._batch_supported:
+            return list(
+                await asyncio.gather(
+                    *(_bounded(self._embed_one, t, task_type, headers) for t in texts)
+                )
+            )
+
+        chunks = [
+            texts[i : i + GEMINI_BATCH_SIZE]
+            for i in range(0, len(texts), GEMINI_BATCH_SIZE)
+        ]
+        results = list(
+            await asyncio.gather(
+                *(
+                    _bounded(self._embed_batch, chunk, task_type, headers)
+                    for chunk in chunks
+                )
+            )
+        )
+
+        # Re-embed only the chunks the batch endpoint did not serve
+        failed = [i for i, result in enumerate(results) if result is None]
+        if failed:
+            singles = await asyncio.gather(
+                *(
+                    _bounded(self._embed_one, text, task_type, headers)
+                    for i in failed
+                    for text in chunks[i]
+                )
+            )
+            pos = 0
+            for i in failed:
+                results[i] = list(singles[pos : pos + len(chunks[i])])
+                pos += len(chunks[i])
+
+        return [embedding for chunk in results for embedding in chunk]
+
+    async def _embed_batch(
+        self, texts: list[str], task_type: str, headers: dict[str, str]
+    ) -> list[list[float]] | None:
+        """Embed one chunk with batchEmbedContents.
+
+        Returns None when the chunk must be re-embedded with single requests:
+        the endpoint is unsupported or the response does not match the chunk.
+        """
+        model_path = f"models/{self.model}"
+        payload = {
+            "requests": [
+                {
+                    "model": model_path,
+                    "content": {"parts": [{"text": text}]},
+                    "taskType": task_type,
+                }
+                for text in texts
+            ]
+        }
+        data = await self._post("batchEmbedContents", payload, headers)
+        if data is None:
+            return None
+
+        embeddings = [e.get("values", []) for e in data.get("embeddings", [])]
+        if len(embeddings) != len(texts) or not all(embeddings):
+            _LOGGER.warning(
+                "%s returned %d embeddings for %d texts, re-embedding the chunk "
+                "with single requests",
+                self._error_label,
+                len(embeddings),
+                len(texts),
+            )
+            return None
+        return embeddings
+
+    async def _embed_one(
+        self, text: str, task_type: str, headers: dict[str, str]
+    ) -> list[float]:
+        """Embed a single text with embedContent."""
+        payload = {"content": {"parts": [{"text": text}]}, "taskType": task_type}
+        data = await self._post("embedContent", payload, headers)
+        embedding = (data or {}).get("embedding", {}).get("values", [])
+        if not embedding:
+            raise _embedding_error("No embedding in Gemini response")
+        return embedding
+
+    async def _post(
+        self, method: str, payload: dict[str, Any], headers: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """POST to ``models/{model}:{method}`` under the rate limiter.
+
+        Returns:
+            Parsed JSON body, or None if ``batchEmbedContents`` is not
+            available (the caller then falls back to per-text requests).
+
+        Raises:
+            EmbeddingError: On any other non-200 response.
+        """
+        url = f"{GEMINI_API_BASE.format(model=self.model)}:{method}"
+        session = self._get_session()
+
+        for attempt in range(GEMINI_MAX_RATE_LIMIT_RETRIES + 1):
+            await self._limiter.acquire()
+            async with session.post(
+                url, headers=headers, json=payload, timeout=_REQUEST_TIMEOUT
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+
+                error_text = await resp.text()
+
+                if resp.status == 429 and attempt < GEMINI_MAX_RATE_LIMIT_RETRIES:
+                    delay = _retry_delay(error_text, resp.headers, attempt)
+                    _LOGGER.warning(
+                        "%s rate limited (429), pausing %.1fs (attempt %d/%d)",
+                        self._error_label,
+                        delay,
+                        attempt + 1,
+                        GEMINI_MAX_RATE_LIMIT_RETRIES,
+                    )
+                    self._limiter.pause(delay)
+                    continue
+
+                if (
+                    method == "batchEmbedContents"
+                    and resp.status in _BATCH_UNSUPPORTED_STATUS
+                ):
+                    _LOGGER.info(
+                        "%s: batchEmbedContents unavailable (%s), "
+                        "falling back to concurrent single requests",
+                        self._error_label,
+                        resp.status,
+                    )
+                    self._batch_supported = False
+                    return None
+
+                _LOGGER.error(
+                    "%s failed: %s - %s", self._error_label, resp.status, error_text
+                )
+                raise _embedding_error(
+                    f"{self._error_label} failed: {resp.status} - {error_text[:200]}"
+                )
+
+        # Unreachable: the last attempt either returns or raises
+        raise _embedding_error(f"{self._error_label} failed: rate limited")
@@ -0,0 +1,294 @@
+"""On-box embedding providers for offline RAG.
+
+Two flavours, both plain ``EmbeddingProvider`` implementations:
+
+- ``LocalModelEmbeddings`` runs a small sentence-embedding model on the CPU
+  via `fastembed <https://github.com/qdrant/fastembed>`_ (ONNX Runtime, no
+  PyTorch).  Inference is batched and runs on a dedicated worker thread so
+  the event loop never blocks.  fastembed is an optional dependency; the
+  provider is only offered when it is importable.
+- ``LocalEndpointEmbeddings`` talks to an OpenAI-compatible ``/v1/embeddings``
+  endpoint on the LAN (Ollama, LM Studio, llama.cpp server, LocalAI ...),
+  e.g. the same server the ``local`` chat provider uses.
+
+Neither needs internet access once the model is available locally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from .embeddings import EmbeddingError, EmbeddingProvider
+
+if TYPE_CHECKING:
+    from ..http_pool import HttpPool
+
+_LOGGER = logging.getLogger(__name__)
+
+# Multilingual (50+ languages incl. Polish), 384-dim, ~220 MB ONNX
+DEFAULT_LOCAL_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+# Default embedding model for OpenAI-compatible local servers (Ollama naming)
+DEFAULT_LOCAL_ENDPOINT_MODEL = "nomic-embed-text"
+
+# Known output dimensions (avoids loading a model just to read its size)
+LOCAL_MODEL_DIMENSIONS = {
+    "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2": 384,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+    "intfloat/multilingual-e5-large": 1024,
+    "nomic-embed-text": 768,
+    "mxbai-embed-large": 1024,
+    "all-minilm": 384,
+    "bge-m3": 1024,
+    "snowflake-arctic-embed": 1024,
+}
+
+# Texts per inference / HTTP batch
+LOCAL_BATCH_SIZE = 32
+LOCAL_ENDPOINT_BATCH_SIZE = 64
+
+_ENDPOINT_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+
+def fastembed_available() -> bool:
+    """Whether the optional fastembed package is installed.
+
+    Only looks the package up; importing it (slow, pulls in ONNX Runtime)
+    happens on the inference thread when the model is loaded.
+    """
+    return importlib.util.find_spec("fastembed") is not None
+
+
+def normalize_embeddings_url(url: str) -> str:
+    """Turn a local server URL into its OpenAI-compatible embeddings URL.
+
+    Accepts a bare base URL (``http://host:11434``), an OpenAI-style base
+    (``.../v1``), a full ``.../v1/embeddings`` URL, or the Ollama chat /
+    generate URL configured for the ``local`` chat provider.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    if path.endswith("/embeddings"):
+        return urlunsplit(parts._replace(path=path))
+    if path.endswith("/v1"):
+        return urlunsplit(parts._replace(path=f"{path}/embeddings"))
+    # Ollama native paths (/api/chat, /api/generate) or no path at all
+    return urlunsplit(parts._replace(path="/v1/embeddings", query="", fragment=""))
+
+
+@dataclass
+class LocalModelEmbeddings(EmbeddingProvider):
+    """Embeddings computed on the local CPU with fastembed.
+
+    The model is loaded lazily (first call or ``async_setup``) and
+    downloaded into ``cache_dir`` on first use; afterwards no network access
+    is needed.
+    """
+
+    model: str = DEFAULT_LOCAL_MODEL
+    cache_dir: str | None = None
+    threads: int | None = None
+    batch_size: int = LOCAL_BATCH_SIZE
+    _encoder: Any = field(default=None, repr=False)
+    _dimension: int = field(default=0, repr=False)
+    _executor: ThreadPoolExecutor | None = field(default=None, repr=False)
+    _load_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the dimension of well-known models without loading them."""
+        self._dimension = LOCAL_MODEL_DIMENSIONS.get(self.model, 0)
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def provider_name(self) -> str:
+        return "local_model"
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Single inference thread: ONNX Runtime parallelizes internally."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="homeclaw_embed"
+            )
+        return self._executor
+
+    def _load_encoder(self) -> Any:
+        """Load the fastembed model (blocking, runs on the inference thread)."""
+        try:
+            from fastembed import TextEmbedding
+        except ImportError as err:
+            raise EmbeddingError(
+                "Local embeddings need the 'fastembed' package (pip install fastembed)"
+            ) from err
+        return TextEmbedding(
+            model_name=self.model, cache_dir=self.cache_dir, threads=self.threads
+        )
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
+        """Run batched inference (blocking, runs on the inference thread)."""
+        return [
+            [float(v) for v in vector]
+            for vector in self._encoder.embed(texts, batch_size=self.batch_size)
+        ]
+
+    async def _ensure_loaded(self) -> None:
+        """Load the model once, off the event loop."""
+        if self._encoder is not None:
+            return
+        async with self._load_lock:
+            if self._encoder is not None:
+                return
+            loop = asyncio.get_running_loop()
+            self._encoder = await loop.run_in_executor(
+                self._get_executor(), self._load_encoder
+            )
+            _LOGGER.info("Loaded local embedding model %s", self.model)
+
+    async def async_setup(self) -> None:
+        """Load the model and learn its dimension if it is not a known one."""
+        await self._ensure_loaded()
+        if not self._dimension:
+            probe = await self.get_embeddings(["dimension probe"])
+            self._dimension = len(probe[0])
+
+    async def get_embeddings(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed ``texts`` on the local CPU (extra kwargs such as task_type are ignored)."""
+        if not texts:
+            return []
+
+        try:
+            await self._ensure_loaded()
+            loop = asyncio.get_running_loop()
+            embeddings = await loop.run_in_executor(
+                self._get_executor(), self._encode, list(texts)
+            )
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Local model embedding error: %s", e)
+            raise EmbeddingError(f"Local model embedding failed: {e}") from e
+
+        if embeddings and not self._dimension:
+            self._dimension = len(embeddings[0])
+        _LOGGER.debug("Generated %d embeddings with local model", len(embeddings))
+        return embeddings
+
+    async def async_close(self) -> None:
+        """Stop the inference thread and drop the model."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, executor.shutdown, True
+            )
+        self._encoder = None
+
+
+@dataclass
+class LocalEndpointEmbeddings(EmbeddingProvider):
+    """Embeddings from an OpenAI-compatible server on the local network."""
+
+    url: str
+    model: str = DEFAULT_LOCAL_ENDPOINT_MODEL
+    api_key: str | None = None
+    dimension_hint: int | None = None
+    batch_size: int = LOCAL_ENDPOINT_BATCH_SIZE
+    http_pool: HttpPool | None = field(default=None, repr=False)
+    _dimension: int = field(default=0, repr=False)
+    _session: aiohttp.ClientSession | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the URL and resolve a known dimension."""
+        self.url = normalize_embeddings_url(self.url)
+        self._dimension = self.dimension_hint or LOCAL_MODEL_DIMENSIONS.get(
+            self.model.split(":", 1)[0], 0
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension or self.dimension_hint or 0
+
+    @property
+    def provider_name(self) -> str:
+        return "local_endpoint"
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared pool's session, or the provider's own long-lived one."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        if self.http_pool is not None:
+            return self.http_pool.session()
+        self._session = aiohttp.ClientSession(timeout=_ENDPOINT_TIMEOUT)
+        return self._session
+
+    async def async_setup(self) -> None:
+        """Probe the endpoint once to learn the embedding dimension."""
+        if not self._dimension:
+            probe = await self.get_embeddings(["dimension probe"])
+            self._dimension = len(probe[0])
+
+    async def get_embeddings(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        """Embed ``texts`` via the local server in batches."""
+        if not texts:
+            return []
+
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        try:
+            embeddings: list[list[float]] = []
+            session = self._get_session()
+            for i in range(0, len(texts), self.batch_size):
+                batch = texts[i : i + self.batch_size]
+                payload = {"model": self.model, "input": batch}
+                async with session.post(
+                    self.url, headers=headers, json=payload, timeout=_ENDPOINT_TIMEOUT
+                ) as resp:
+                    if resp.status != 200:
+                        error_text = await resp.text()
+                        _LOGGER.error(
+                            "Local embedding endpoint failed: %s - %s",
+                            resp.status,
+                            error_text,
+                        )
+                        raise EmbeddingError(
+                            f"Local embedding endpoint failed: {resp.status} - {error_text[:200]}"
+                        )
+                    data = await resp.json()
+
+                items = sorted(data.get("data", []), key=lambda x: x.get("index", 0))
+                if len(items) != len(batch):
+                    raise EmbeddingError(
+                        f"Local embedding endpoint returned {len(items)} embeddings "
+                        f"for {len(batch)} texts"
+                    )
+                embeddings.extend(item["embedding"] for item in items)
+
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Local endpoint embedding error: %s", e)
+            raise EmbeddingError(f"Local endpoint embedding failed: {e}") from e
+
+        if embeddings and not self._dimension:
+            self._dimension = len(embeddings[0])
+        _LOGGER.debug("Generated %d embeddings with local endpoint", len(embeddings))
+        return embeddings
+
+    async def async_close(self) -> None:
+        """Close the provider's own HTTP session (the shared pool stays open)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
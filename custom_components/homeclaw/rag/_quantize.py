@@ -0,0 +1,103 @@
+"""Compact embedding blob formats: float16 and per-vector scaled int8.
+
+Embeddings are stored as raw little-endian float32 blobs by default.  The
+store can instead be configured to write:
+
+- ``float16``: ``FLOAT16_MAGIC`` + one half-precision float per component
+  (2x smaller, practically lossless for cosine ranking);
+- ``int8``: ``INT8_MAGIC`` + a float32 scale + one signed byte per component,
+  where ``component ~= code * scale`` and ``scale = max(|v|) / 127``
+  (~4x smaller).
+
+Both headers, read as a little-endian float32, are NaNs -- a value no real
+embedding starts with -- so every blob identifies its own format and
+legacy float32 blobs keep decoding unchanged.  This is what lets a format
+migration run in batches and resume after an interruption.
+
+With a quantized format the in-memory indexes hold int8 codes as well
+(see ``VectorIndex``).  Under float16 they re-rank their hits against the
+stored vectors; int8 blobs carry the same codes, so their hits are final.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant core
+    np = None
+
+EMBEDDING_FORMAT_FLOAT32 = "float32"
+EMBEDDING_FORMAT_FLOAT16 = "float16"
+EMBEDDING_FORMAT_INT8 = "int8"
+EMBEDDING_FORMATS = (
+    EMBEDDING_FORMAT_FLOAT32,
+    EMBEDDING_FORMAT_FLOAT16,
+    EMBEDDING_FORMAT_INT8,
+)
+
+FLOAT16_MAGIC = b"f6\xc0\x7f"
+INT8_MAGIC = b"q8\xc0\x7f"
+_HEADER_SIZE = 4
+_INT8_SCALE = struct.Struct("<f")
+
+
+def blob_format(blob: bytes) -> str:
+    """Return the storage format of an embedding blob."""
+    header = blob[:_HEADER_SIZE]
+    if header == INT8_MAGIC:
+        return EMBEDDING_FORMAT_INT8
+    if header == FLOAT16_MAGIC:
+        return EMBEDDING_FORMAT_FLOAT16
+    return EMBEDDING_FORMAT_FLOAT32
+
+
+def quantize_int8(vector: Sequence[float]) -> tuple[float, list[int]]:
+    """Return ``(scale, codes)`` with ``vector[i] ~= codes[i] * scale``."""
+    peak = max((abs(v) for v in vector), default=0.0)
+    if not peak or not math.isfinite(peak):
+        return 0.0, [0] * len(vector)
+    scale = peak / 127.0
+    return scale, [max(-127, min(127, round(v / scale))) for v in vector]
+
+
+def encode_embedding(embedding: Sequence[float], fmt: str) -> bytes:
+    """Serialize an embedding in ``fmt`` (one of ``EMBEDDING_FORMATS``)."""
+    count = len(embedding)
+    if fmt == EMBEDDING_FORMAT_INT8:
+        scale, codes = quantize_int8(embedding)
+        return INT8_MAGIC + _INT8_SCALE.pack(scale) + struct.pack(f"<{count}b", *codes)
+    if fmt == EMBEDDING_FORMAT_FLOAT16:
+        return FLOAT16_MAGIC + struct.pack(f"<{count}e", *embedding)
+    return struct.pack(f"<{count}f", *embedding)
+
+
+def decode_embedding(blob: bytes) -> list[float]:
+    """Deserialize a blob written by ``encode_embedding`` (any format)."""
+    fmt = blob_format(blob)
+    if fmt == EMBEDDING_FORMAT_INT8:
+        scale = _INT8_SCALE.unpack_from(blob, _HEADER_SIZE)[0]
+        codes = blob[_HEADER_SIZE + _INT8_SCALE.size :]
+        return [c * scale for c in struct.unpack(f"<{len(codes)}b", codes)]
+    if fmt == EMBEDDING_FORMAT_FLOAT16:
+        count = (len(blob) - _HEADER_SIZE) // 2
+        return list(struct.unpack_from(f"<{count}e", blob, _HEADER_SIZE))
+    count = len(blob) // 4  # 4 bytes per float32
+    return list(struct.unpack(f"<{count}f", blob))
+
+
+def decode_embedding_array(blob: bytes) -> Any:
+    """NumPy variant of ``decode_embedding`` returning a float32 array."""
+    fmt = blob_format(blob)
+    if fmt == EMBEDDING_FORMAT_INT8:
+        scale = _INT8_SCALE.unpack_from(blob, _HEADER_SIZE)[0]
+        codes = np.frombuffer(
+            blob, dtype=np.int8, offset=_HEADER_SIZE + _INT8_SCALE.size
+        )
+        return codes.astype(np.float32) * np.float32(scale)
+    if fmt == EMBEDDING_FORMAT_FLOAT16:
+        return np.frombuffer(blob, dtype="<f2", offset=_HEADER_SIZE).astype(np.float32)
+    return np.frombuffer(blob, dtype="<f4", count=len(blob) // 4)
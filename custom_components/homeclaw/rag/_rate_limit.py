@@ -0,0 +1,85 @@
+"""Async token-bucket rate limiting for embedding API calls.
+
+A ``TokenBucket`` refills at a steady rate up to a burst capacity; callers
+``await acquire()`` before each request.  When the API answers 429 with a
+server-provided retry delay, ``pause()`` blocks every caller of the bucket
+until that delay has elapsed, so concurrent workers back off together
+instead of each hammering the endpoint on its own schedule.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+
+class TokenBucket:
+    """Token bucket shared by all requests of one API credential.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens (burst size).
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._waited = 0.0
+        self._pauses = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until ``tokens`` are available and take them.
+
+        Waiters are served in FIFO order.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+        waited = time.monotonic() - started
+        self._waited += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` and drain the bucket.
+
+        Used when the server asks us to retry later (HTTP 429).
+        """
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+        self._updated = self._blocked_until
+        self._pauses += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return limiter statistics."""
+        return {
+            "rate_per_s": self.rate,
+            "capacity": self.capacity,
+            "pauses": self._pauses,
+            "total_wait_s": round(self._waited, 3),
+        }
@@ -0,0 +1,142 @@
+"""Helpers for RAG context retrieval.
+
+``RAGContextRetriever`` runs its entity, session and memory branches
+concurrently; each branch gets its own deadline so one slow subsystem
+(e.g. an LLM time-range expansion for session search) is dropped instead
+of delaying the LLM call.  The deadline runner and the entity-search
+pre-filters live here to keep context_retriever.py under the 300-line
+project limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Per-stage deadlines (seconds)
+QUERY_EMBEDDING_TIMEOUT = 5.0
+ENTITY_BRANCH_TIMEOUT = 5.0
+# Session search may call the LLM to resolve a time range ("last week")
+SESSION_BRANCH_TIMEOUT = 6.0
+MEMORY_BRANCH_TIMEOUT = 3.0
+
+
+@dataclass
+class RetrievalTimings:
+    """Per-stage wall-clock timings of one context retrieval."""
+
+    stages: dict[str, float] = field(default_factory=dict)
+    dropped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    total_ms: float = 0.0
+    cached: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for logging / websocket responses."""
+        return {
+            "stages_ms": {k: round(v, 2) for k, v in self.stages.items()},
+            "dropped": list(self.dropped),
+            "failed": list(self.failed),
+            "total_ms": round(self.total_ms, 2),
+            "cached": self.cached,
+        }
+
+
+async def run_stage(
+    name: str,
+    awaitable: Awaitable[_T],
+    timeout: float,
+    timings: RetrievalTimings,
+    default: _T,
+) -> _T:
+    """Await one retrieval stage under a deadline, recording its duration.
+
+    A stage that exceeds ``timeout`` is cancelled and reported in
+    ``timings.dropped``; a stage that raises is reported in
+    ``timings.failed``.  Either way ``default`` is returned so the remaining
+    stages still contribute to the context.
+
+    Args:
+        name: Stage name used in timings and logs.
+        awaitable: The stage coroutine.
+        timeout: Deadline in seconds.
+        timings: Timings collector for the current retrieval.
+        default: Value returned when the stage is dropped or fails.
+
+    Returns:
+        The stage result, or ``default``.
+    """
+    started = time.perf_counter()
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        timings.dropped.append(name)
+        _LOGGER.debug("RAG stage '%s' exceeded %.1fs deadline, dropped", name, timeout)
+        return default
+    except Exception as err:
+        timings.failed.append(name)
+        _LOGGER.debug("RAG stage '%s' failed: %s", name, err)
+        return default
+    finally:
+        timings.stages[name] = (time.perf_counter() - started) * 1000
+
+
+def looks_ha_related(query: str) -> bool:
+    """Cheap keyword check for Home Assistant relevance."""
+    query_lower = query.lower()
+    ha_keywords = [
+        "light",
+        "turn",
+        "switch",
+        "temperature",
+        "sensor",
+        "automation",
+        "scene",
+        "device",
+        "home",
+        "room",
+        "cover",
+        "blind",
+        "lock",
+        "fan",
+        "climate",
+        "thermostat",
+        "światło",
+        "światła",
+        "włącz",
+        "wyłącz",
+        "temperatura",
+        "czujnik",
+        "urządzenie",
+        "dom",
+        "pokój",
+        "roleta",
+    ]
+    return any(kw in query_lower for kw in ha_keywords)
+
+
+def build_intent_filter(intent: dict[str, Any] | None) -> dict[str, Any]:
+    """Convert detected intent into a where-filter dict."""
+    if not intent:
+        return {}
+
+    where: dict[str, Any] = {}
+    domain = intent.get("domain")
+    if domain:
+        where["domain"] = domain
+    else:
+        device_class = intent.get("device_class")
+        if device_class:
+            where["device_class"] = device_class
+    area = intent.get("area")
+    if area:
+        where["area_name"] = area
+    return where
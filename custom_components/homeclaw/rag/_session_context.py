@@ -7,6 +7,7 @@ to keep files under the 300-line project limit.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -24,6 +25,7 @@ async def get_session_context(
     top_k: int = 3,
     provider: Any | None = None,
     model: str | None = None,
+    query_embedding: list[float] | None = None,
 ) -> list[dict[str, Any]]:
     """Search session chunks for relevant conversational context.
 
@@ -35,16 +37,27 @@ async def get_session_context(
         top_k: Maximum number of session chunks to include.
         provider: Optional AI provider for LLM time-range expansion.
         model: Optional model name for time-range expansion.
+        query_embedding: Pre-computed query embedding (embedded here if None).
 
     Returns:
         List of dictionaries containing session chunks, or empty list.
     """
     start_date, end_date = await _resolve_time_range(query, provider, model)
 
-    vector_results = await _search_vector(
-        query, embedding_provider, store, top_k, min_similarity, start_date, end_date
+    # Vector and keyword searches are independent DB reads -- run them together
+    vector_results, keyword_results = await asyncio.gather(
+        _search_vector(
+            query,
+            embedding_provider,
+            store,
+            top_k,
+            min_similarity,
+            start_date,
+            end_date,
+            query_embedding,
+        ),
+        _search_keyword(query, store, top_k, start_date, end_date),
     )
-    keyword_results = await _search_keyword(query, store, top_k, start_date, end_date)
 
     results = _merge_and_filter(vector_results, keyword_results, min_similarity, top_k)
     if not results:
@@ -93,11 +106,13 @@ async def _search_vector(
     min_similarity: float,
     start_date: str | None,
     end_date: str | None,
+    query_embedding: list[float] | None = None,
 ) -> list[Any]:
     """Run vector similarity search on session chunks."""
     from .embeddings import get_embedding_for_query
 
-    query_embedding = await get_embedding_for_query(embedding_provider, query)
+    if query_embedding is None:
+        query_embedding = await get_embedding_for_query(embedding_provider, query)
     return await store.search_session_chunks(
         query_embedding=query_embedding,
         n_results=top_k * 4,
@@ -0,0 +1,251 @@
+"""Month-partitioned in-memory vector index for session chunks.
+
+Session chunks accumulate for as long as the integration runs, and most
+temporal queries ("last week", "in March") only care about a small slice of
+them.  ``SessionChunkIndex`` groups chunk embeddings by the calendar month
+of their ``timestamp`` column (``YYYY-MM``); each month is its own
+``VectorIndex`` with a cached float32 matrix.  A date-bounded search only
+scores the partitions overlapping the range, and per-partition winners are
+merged with a bounded heap.
+
+Only IDs, session IDs and timestamps are kept in memory.  Chunk text and
+metadata stay in SQLite and are fetched for the final hits only.  As with
+the entity index, SQLite remains the source of truth and the store mirrors
+every add / delete into the index.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from typing import Any, NamedTuple, Sequence
+
+from ._vector_index import VectorIndex, numpy_available
+
+# Partition for chunks whose timestamp is empty or not ISO-formatted
+UNDATED_PARTITION = ""
+
+_MONTH_RE = re.compile(r"^\d{4}-\d{2}")
+
+
+class ChunkHit(NamedTuple):
+    """A session chunk selected by the index (text/metadata not loaded)."""
+
+    id: str
+    session_id: str
+    distance: float
+
+
+def partition_key(timestamp: str | None) -> str:
+    """Return the ``YYYY-MM`` partition for an ISO timestamp."""
+    if timestamp and _MONTH_RE.match(timestamp):
+        return timestamp[:7]
+    return UNDATED_PARTITION
+
+
+class SessionChunkIndex:
+    """Session chunk embeddings partitioned by month.
+
+    Date filters keep the semantics of ``build_date_filter_clauses``: rows
+    with an empty timestamp never match, ``start_date`` is compared against
+    the raw timestamp and ``end_date`` is inclusive of the whole day.  Only
+    the boundary months (and the undated partition, which may hold
+    non-ISO timestamps) need the per-row comparison.
+    """
+
+    def __init__(self, quantized: bool = False) -> None:
+        """Initialize an empty index.
+
+        Args:
+            quantized: Hold partition rows as int8 codes (see ``VectorIndex``).
+        """
+        self._quantized = quantized
+        self._partitions: dict[str, VectorIndex] = {}
+        # chunk id -> (partition key, session id)
+        self._locations: dict[str, tuple[str, str]] = {}
+        # session id -> chunk ids
+        self._sessions: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed chunks."""
+        return len(self._locations)
+
+    @property
+    def quantized(self) -> bool:
+        """Whether hits are approximate and need ``rescore``."""
+        return self._quantized and numpy_available()
+
+    @property
+    def partition_keys(self) -> list[str]:
+        """Non-empty partitions, oldest first."""
+        return sorted(self._partitions)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the vector data."""
+        return sum(index.nbytes for index in self._partitions.values())
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        session_ids: Sequence[str],
+        timestamps: Sequence[str],
+        embeddings: Sequence[Any],
+    ) -> None:
+        """Insert or replace chunks.
+
+        Args:
+            ids: Chunk IDs.
+            session_ids: Owning session of each chunk.
+            timestamps: Raw ``timestamp`` column values.
+            embeddings: Lists of floats, float32 blobs or legacy JSON strings.
+        """
+        for i, chunk_id in enumerate(ids):
+            session_id = session_ids[i] if i < len(session_ids) else ""
+            timestamp = (timestamps[i] if i < len(timestamps) else "") or ""
+            key = partition_key(timestamp)
+
+            previous = self._locations.get(chunk_id)
+            if previous is not None:
+                if previous[0] != key:
+                    self._remove_from_partition(previous[0], [chunk_id])
+                if previous[1] != session_id:
+                    self._discard_session_member(previous[1], chunk_id)
+
+            partition = self._partitions.get(key)
+            if partition is None:
+                partition = self._partitions[key] = VectorIndex(quantized=self._quantized)
+            partition.upsert(
+                [chunk_id],
+                [""],
+                [embeddings[i] if i < len(embeddings) else []],
+                [{"session_id": session_id, "timestamp": timestamp}],
+            )
+            self._locations[chunk_id] = (key, session_id)
+            self._sessions.setdefault(session_id, set()).add(chunk_id)
+
+    def remove(self, chunk_ids: Sequence[str]) -> None:
+        """Drop chunks by ID (unknown IDs are ignored)."""
+        by_partition: dict[str, list[str]] = {}
+        for chunk_id in chunk_ids:
+            location = self._locations.pop(chunk_id, None)
+            if location is None:
+                continue
+            by_partition.setdefault(location[0], []).append(chunk_id)
+            self._discard_session_member(location[1], chunk_id)
+        for key, members in by_partition.items():
+            self._remove_from_partition(key, members)
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop every chunk of ``session_id``."""
+        chunk_ids = self._sessions.pop(session_id, set())
+        by_partition: dict[str, list[str]] = {}
+        for chunk_id in chunk_ids:
+            location = self._locations.pop(chunk_id, None)
+            if location is not None:
+                by_partition.setdefault(location[0], []).append(chunk_id)
+        for key, members in by_partition.items():
+            self._remove_from_partition(key, members)
+
+    def clear(self) -> None:
+        """Drop all chunks."""
+        self._partitions.clear()
+        self._locations.clear()
+        self._sessions.clear()
+
+    def _remove_from_partition(self, key: str, chunk_ids: list[str]) -> None:
+        """Remove chunks from one partition, dropping it once empty."""
+        partition = self._partitions.get(key)
+        if partition is None:
+            return
+        partition.remove(chunk_ids)
+        if not len(partition):
+            del self._partitions[key]
+
+    def _discard_session_member(self, session_id: str, chunk_id: str) -> None:
+        """Unlink ``chunk_id`` from ``session_id``."""
+        members = self._sessions.get(session_id)
+        if members is None:
+            return
+        members.discard(chunk_id)
+        if not members:
+            del self._sessions[session_id]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def partitions_for(
+        self, start_date: str | None, end_date: str | None
+    ) -> list[tuple[str, bool]]:
+        """Return the partitions overlapping a date range.
+
+        Returns:
+            ``(key, needs_row_filter)`` pairs; the flag is False for months
+            lying entirely inside the range.
+        """
+        if not start_date and not end_date:
+            return [(key, False) for key in self.partition_keys]
+
+        first = start_date[:7] if start_date else None
+        last = end_date[:7] if end_date else None
+        selected: list[tuple[str, bool]] = []
+        for key in self.partition_keys:
+            if key == UNDATED_PARTITION:
+                selected.append((key, True))
+                continue
+            if (first and key < first) or (last and key > last):
+                continue
+            selected.append((key, key == first or key == last))
+        return selected
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        n_results: int = 5,
+        min_similarity: float | None = None,
+        session_id: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> list[ChunkHit]:
+        """Return the closest chunks, lowest cosine distance first.
+
+        Args:
+            query_embedding: Query vector (need not be normalized).
+            n_results: Maximum number of hits.
+            min_similarity: Optional minimum cosine similarity.
+            session_id: Optional session restriction.
+            start_date: Validated YYYY-MM-DD start date (or None).
+            end_date: Validated YYYY-MM-DD end date (or None).
+        """
+        if n_results <= 0:
+            return []
+
+        end_bound = f"{end_date}T23:59:59Z" if end_date else None
+
+        def _in_range(metadata: dict[str, Any]) -> bool:
+            timestamp = metadata["timestamp"]
+            return bool(timestamp) and (
+                (not start_date or timestamp >= start_date)
+                and (end_bound is None or timestamp <= end_bound)
+            )
+
+        where = {"session_id": session_id} if session_id else None
+        candidates: list[ChunkHit] = []
+        for key, needs_row_filter in self.partitions_for(start_date, end_date):
+            for result in self._partitions[key].search(
+                query_embedding,
+                n_results=n_results,
+                where=where,
+                min_similarity=min_similarity,
+                predicate=_in_range if needs_row_filter else None,
+            ):
+                candidates.append(
+                    ChunkHit(result.id, result.metadata["session_id"], result.distance)
+                )
+
+        return heapq.nsmallest(n_results, candidates, key=lambda hit: hit.distance)
@@ -2,11 +2,16 @@
 
 Provides content-addressable caching of computed embeddings
 keyed by (provider, model, SHA-256 hash) to avoid redundant API calls.
+
+The ``async_*`` methods run on the store's DB worker and are what the
+embedding pipeline uses; the sync variants are kept for callers outside
+the event loop and run on the calling thread under the writer lock.
 """
 
 from __future__ import annotations
 
 import logging
+import sqlite3
 import time
 from typing import Any
 
@@ -19,8 +24,10 @@ class EmbeddingCacheMixin:
     """Mixin providing embedding cache operations on the ``embedding_cache`` table.
 
     Expects the host class to provide:
-    - ``self._conn``: sqlite3.Connection
+    - ``self._db``: DbWorker
+    - ``self.run_read()`` / ``self.run_write()``: off-loop execution helpers
     - ``self._ensure_initialized()``: guard method
+    - ``self.embedding_format``: blob format for cached embeddings
     """
 
     def cache_lookup(
@@ -29,7 +36,7 @@ class EmbeddingCacheMixin:
         model: str,
         hashes: list[str],
     ) -> dict[str, list[float]]:
-        """Bulk lookup cached embeddings by content hashes.
+        """Bulk lookup cached embeddings by content hashes (blocking).
 
         Args:
             provider: Embedding provider name (e.g., "openai", "gemini").
@@ -45,26 +52,38 @@ class EmbeddingCacheMixin:
             return {}
 
         try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            result: dict[str, list[float]] = {}
-
-            # Query in batches of 400 to avoid SQL parameter limits
-            batch_size = 400
-            for start in range(0, len(hashes), batch_size):
-                batch = hashes[start : start + batch_size]
-                placeholders = ",".join("?" * len(batch))
-                cursor.execute(
-                    f"""
-                    SELECT hash, embedding FROM embedding_cache
-                    WHERE provider = ? AND model = ? AND hash IN ({placeholders})
-                    """,
-                    [provider, model, *batch],
-                )
-                for row in cursor.fetchall():
-                    result[row["hash"]] = blob_to_embedding(row["embedding"])
-
-            return result
+            return self._db.write_blocking(  # type: ignore[union-attr]
+                "cache_lookup", _cache_lookup, provider, model, hashes
+            )
+        except Exception as e:
+            _LOGGER.error("Embedding cache lookup failed: %s", e)
+            return {}
+
+    async def async_cache_lookup(
+        self,
+        provider: str,
+        model: str,
+        hashes: list[str],
+    ) -> dict[str, list[float]]:
+        """Bulk lookup cached embeddings by content hashes.
+
+        Args:
+            provider: Embedding provider name (e.g., "openai", "gemini").
+            model: Embedding model name (e.g., "text-embedding-3-small").
+            hashes: List of SHA-256 content hashes to look up.
+
+        Returns:
+            Dict mapping hash -> embedding for cache hits.
+        """
+        self._ensure_initialized()
+
+        if not hashes:
+            return {}
 
+        try:
+            return await self.run_read(  # type: ignore[attr-defined]
+                "cache_lookup", _cache_lookup, provider, model, hashes
+            )
         except Exception as e:
             _LOGGER.error("Embedding cache lookup failed: %s", e)
             return {}
@@ -75,7 +94,7 @@ class EmbeddingCacheMixin:
         model: str,
         entries: list[tuple[str, list[float]]],
     ) -> None:
-        """Store newly computed embeddings in the cache.
+        """Store newly computed embeddings in the cache (blocking).
 
         Args:
             provider: Embedding provider name.
@@ -88,30 +107,55 @@ class EmbeddingCacheMixin:
             return
 
         try:
-            now = time.time()
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-
-            for content_hash, embedding in entries:
-                blob = embedding_to_blob(embedding)
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO embedding_cache
-                        (provider, model, hash, embedding, dims, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (provider, model, content_hash, blob, len(embedding), now),
-                )
-
-            self._conn.commit()  # type: ignore[union-attr]
+            self._db.write_blocking(  # type: ignore[union-attr]
+                "cache_upsert",
+                _cache_upsert,
+                provider,
+                model,
+                entries,
+                self.embedding_format,  # type: ignore[attr-defined]
+            )
             _LOGGER.debug(
                 "Cached %d embeddings for %s/%s", len(entries), provider, model
             )
+        except Exception as e:
+            _LOGGER.error("Embedding cache upsert failed: %s", e)
 
+    async def async_cache_upsert(
+        self,
+        provider: str,
+        model: str,
+        entries: list[tuple[str, list[float]]],
+    ) -> None:
+        """Store newly computed embeddings in the cache.
+
+        Args:
+            provider: Embedding provider name.
+            model: Embedding model name.
+            entries: List of (hash, embedding) tuples to cache.
+        """
+        self._ensure_initialized()
+
+        if not entries:
+            return
+
+        try:
+            await self.run_write(  # type: ignore[attr-defined]
+                "cache_upsert",
+                _cache_upsert,
+                provider,
+                model,
+                entries,
+                self.embedding_format,  # type: ignore[attr-defined]
+            )
+            _LOGGER.debug(
+                "Cached %d embeddings for %s/%s", len(entries), provider, model
+            )
         except Exception as e:
             _LOGGER.error("Embedding cache upsert failed: %s", e)
 
     def cache_prune(self, max_entries: int = 10000) -> None:
-        """Prune oldest cache entries if cache exceeds max size (LRU).
+        """Prune oldest cache entries if cache exceeds max size (LRU, blocking).
 
         Args:
             max_entries: Maximum number of cache entries to keep.
@@ -119,32 +163,26 @@ class EmbeddingCacheMixin:
         self._ensure_initialized()
 
         try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute("SELECT COUNT(*) FROM embedding_cache")
-            count = cursor.fetchone()[0]
-
-            if count <= max_entries:
-                return
-
-            excess = count - max_entries
-            cursor.execute(
-                """
-                DELETE FROM embedding_cache
-                WHERE rowid IN (
-                    SELECT rowid FROM embedding_cache
-                    ORDER BY updated_at ASC
-                    LIMIT ?
-                )
-                """,
-                (excess,),
-            )
-            self._conn.commit()  # type: ignore[union-attr]
-            _LOGGER.info(
-                "Pruned %d oldest embedding cache entries (kept %d)",
-                excess,
-                max_entries,
+            excess = self._db.write_blocking(  # type: ignore[union-attr]
+                "cache_prune", _cache_prune, max_entries
             )
+            _log_prune(excess, max_entries)
+        except Exception as e:
+            _LOGGER.error("Embedding cache prune failed: %s", e)
+
+    async def async_cache_prune(self, max_entries: int = 10000) -> None:
+        """Prune oldest cache entries if cache exceeds max size (LRU).
 
+        Args:
+            max_entries: Maximum number of cache entries to keep.
+        """
+        self._ensure_initialized()
+
+        try:
+            excess = await self.run_write(  # type: ignore[attr-defined]
+                "cache_prune", _cache_prune, max_entries
+            )
+            _log_prune(excess, max_entries)
         except Exception as e:
             _LOGGER.error("Embedding cache prune failed: %s", e)
 
@@ -156,12 +194,13 @@ class EmbeddingCacheMixin:
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute(
+        def _stats(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
                 "SELECT COUNT(*), SUM(LENGTH(embedding)) FROM embedding_cache"
-            )
-            row = cursor.fetchone()
+            ).fetchone()
+
+        try:
+            row = await self.run_read("get_cache_stats", _stats)  # type: ignore[attr-defined]
             count = row[0] if row else 0
             total_bytes = row[1] if row and row[1] else 0
 
@@ -173,3 +212,89 @@ class EmbeddingCacheMixin:
         except Exception as e:
             _LOGGER.error("Failed to get cache stats: %s", e)
             return {"entries": 0, "total_bytes": 0, "total_mb": 0}
+
+
+# ----------------------------------------------------------------------
+# DB jobs (run on the DbWorker, receive a sqlite3.Connection)
+# ----------------------------------------------------------------------
+
+
+def _cache_lookup(
+    conn: sqlite3.Connection,
+    provider: str,
+    model: str,
+    hashes: list[str],
+) -> dict[str, list[float]]:
+    """Fetch cached embeddings for ``hashes``."""
+    cursor = conn.cursor()
+    result: dict[str, list[float]] = {}
+
+    # Query in batches of 400 to avoid SQL parameter limits
+    batch_size = 400
+    for start in range(0, len(hashes), batch_size):
+        batch = hashes[start : start + batch_size]
+        placeholders = ",".join("?" * len(batch))
+        cursor.execute(
+            f"""
+            SELECT hash, embedding FROM embedding_cache
+            WHERE provider = ? AND model = ? AND hash IN ({placeholders})
+            """,
+            [provider, model, *batch],
+        )
+        for row in cursor.fetchall():
+            result[row["hash"]] = blob_to_embedding(row["embedding"])
+
+    return result
+
+
+def _cache_upsert(
+    conn: sqlite3.Connection,
+    provider: str,
+    model: str,
+    entries: list[tuple[str, list[float]]],
+    fmt: str,
+) -> None:
+    """Insert or refresh cache entries."""
+    now = time.time()
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO embedding_cache
+            (provider, model, hash, embedding, dims, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (provider, model, content_hash, embedding_to_blob(embedding, fmt), len(embedding), now)
+            for content_hash, embedding in entries
+        ],
+    )
+
+
+def _cache_prune(conn: sqlite3.Connection, max_entries: int) -> int:
+    """Delete the oldest entries above ``max_entries``; return how many."""
+    count = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+    if count <= max_entries:
+        return 0
+
+    excess = count - max_entries
+    conn.execute(
+        """
+        DELETE FROM embedding_cache
+        WHERE rowid IN (
+            SELECT rowid FROM embedding_cache
+            ORDER BY updated_at ASC
+            LIMIT ?
+        )
+        """,
+        (excess,),
+    )
+    return excess
+
+
+def _log_prune(excess: int, max_entries: int) -> None:
+    """Log a prune result (no-op when nothing was removed)."""
+    if excess:
+        _LOGGER.info(
+            "Pruned %d oldest embedding cache entries (kept %d)",
+            excess,
+            max_entries,
+        )
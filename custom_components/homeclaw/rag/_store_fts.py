@@ -25,7 +25,7 @@ class FtsIndexMixin:
     """Mixin providing FTS5 keyword search for entities and session chunks.
 
     Expects the host class to provide:
-    - ``self._conn``: sqlite3.Connection
+    - ``self.run_read()``: off-loop read helper
     - ``self._fts_available``: bool
     - ``self._ensure_initialized()``: guard method
     - ``self.table_name``: str (entity table name)
@@ -114,50 +114,41 @@ class FtsIndexMixin:
         if not self._fts_available or not fts_query:
             return []
 
-        try:
-            fts_table = self.table_name + self._FTS_TABLE_SUFFIX
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        fts_table = self.table_name + self._FTS_TABLE_SUFFIX
 
-            cursor.execute(
+        def _search(conn: sqlite3.Connection) -> list[SearchResult]:
+            # Metadata is joined in the same query instead of one lookup per
+            # hit -- after ranking, so only the top hits are joined.  FTS5
+            # does not support aliases for bm25()/MATCH.
+            rows = conn.execute(
                 f"""
-                SELECT entity_id, text, domain, area_name,
-                       bm25({fts_table}) AS rank
-                FROM {fts_table}
-                WHERE {fts_table} MATCH ?
-                ORDER BY rank ASC
-                LIMIT ?
+                SELECT hits.entity_id, hits.text, hits.rank, e.metadata
+                FROM (
+                    SELECT entity_id, text, bm25({fts_table}) AS rank
+                    FROM {fts_table}
+                    WHERE {fts_table} MATCH ?
+                    ORDER BY rank ASC
+                    LIMIT ?
+                ) AS hits
+                LEFT JOIN {self.table_name} e ON e.id = hits.entity_id
+                ORDER BY hits.rank ASC
                 """,
                 (fts_query, n_results),
-            )
-            rows = cursor.fetchall()
-
-            results = []
-            for row in rows:
-                entity_id = row["entity_id"]
-                bm25_score = bm25_rank_to_score(row["rank"])
-
-                # Fetch full metadata from main table
-                cursor.execute(
-                    f"SELECT metadata FROM {self.table_name} WHERE id = ?",
-                    (entity_id,),
-                )
-                meta_row = cursor.fetchone()
-                metadata = (
-                    json.loads(meta_row["metadata"])
-                    if meta_row and meta_row["metadata"]
-                    else {}
-                )
-
-                # Store BM25 score as distance (1 - score so lower = better match)
-                results.append(
-                    SearchResult(
-                        id=entity_id,
-                        text=row["text"],
-                        metadata=metadata,
-                        distance=1.0 - bm25_score,
-                    )
+            ).fetchall()
+
+            # Store BM25 score as distance (1 - score so lower = better match)
+            return [
+                SearchResult(
+                    id=row["entity_id"],
+                    text=row["text"],
+                    metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+                    distance=1.0 - bm25_rank_to_score(row["rank"]),
                 )
+                for row in rows
+            ]
 
+        try:
+            results = await self.run_read("keyword_search", _search)  # type: ignore[attr-defined]
             _LOGGER.debug(
                 "FTS5 keyword search returned %d results for query: %s",
                 len(results),
@@ -197,24 +188,22 @@ class FtsIndexMixin:
         start_date = validate_date_param(start_date, "start_date")
         end_date = validate_date_param(end_date, "end_date")
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-
-            # FTS5 does NOT support table aliases for bm25()/MATCH — use full table name
+        def _search(conn: sqlite3.Connection) -> list[SearchResult]:
+            # FTS5 does NOT support table aliases for bm25()/MATCH — use full table name.
+            # Chunk metadata is joined in the same query (no per-hit lookup);
+            # the date filter needs the chunk row, otherwise the top hits are
+            # ranked first and only they are joined.
+            query_parts = [
+                "SELECT session_chunks_fts.chunk_id, session_chunks_fts.session_id,"
+                " session_chunks_fts.text, bm25(session_chunks_fts) AS rank",
+                "FROM session_chunks_fts",
+            ]
             if start_date or end_date:
-                query_parts = [
-                    "SELECT session_chunks_fts.chunk_id, session_chunks_fts.session_id,"
-                    " session_chunks_fts.text, bm25(session_chunks_fts) AS rank",
-                    "FROM session_chunks_fts"
-                    " JOIN session_chunks c ON session_chunks_fts.chunk_id = c.id",
-                    "WHERE session_chunks_fts MATCH ?",
-                ]
-            else:
-                query_parts = [
-                    "SELECT chunk_id, session_id, text, bm25(session_chunks_fts) AS rank",
-                    "FROM session_chunks_fts",
-                    "WHERE session_chunks_fts MATCH ?",
-                ]
+                query_parts[0] += ", c.metadata"
+                query_parts.append(
+                    "JOIN session_chunks c ON session_chunks_fts.chunk_id = c.id"
+                )
+            query_parts.append("WHERE session_chunks_fts MATCH ?")
             params: list[Any] = [fts_query]
 
             date_clauses, date_params = build_date_filter_clauses(
@@ -226,35 +215,34 @@ class FtsIndexMixin:
             query_parts.append("ORDER BY rank ASC LIMIT ?")
             params.append(n_results)
 
-            cursor.execute(" ".join(query_parts), tuple(params))
-            rows = cursor.fetchall()
+            if not (start_date or end_date):
+                query_parts = [
+                    "SELECT hits.*, c.metadata FROM (",
+                    *query_parts,
+                    ") AS hits LEFT JOIN session_chunks c ON c.id = hits.chunk_id",
+                    "ORDER BY hits.rank ASC",
+                ]
+
+            rows = conn.execute(" ".join(query_parts), tuple(params)).fetchall()
 
             results = []
             for row in rows:
-                bm25_score = bm25_rank_to_score(row["rank"])
-
-                # Fetch full metadata from session_chunks table
-                cursor.execute(
-                    "SELECT metadata FROM session_chunks WHERE id = ?",
-                    (row["chunk_id"],),
-                )
-                meta_row = cursor.fetchone()
-                metadata = (
-                    json.loads(meta_row["metadata"])
-                    if meta_row and meta_row["metadata"]
-                    else {}
-                )
+                metadata = json.loads(row["metadata"]) if row["metadata"] else {}
                 metadata["session_id"] = row["session_id"]
-
                 results.append(
                     SearchResult(
                         id=row["chunk_id"],
                         text=row["text"],
                         metadata=metadata,
-                        distance=1.0 - bm25_score,
+                        distance=1.0 - bm25_rank_to_score(row["rank"]),
                     )
                 )
+            return results
 
+        try:
+            results = await self.run_read(  # type: ignore[attr-defined]
+                "keyword_search_sessions", _search
+            )
             _LOGGER.debug(
                 "Session FTS5 search returned %d results for query: %s",
                 len(results),
@@ -0,0 +1,261 @@
+"""Shadow-table full reindex mixin for the SQLite vector store.
+
+A full entity reindex used to clear the entity table first, leaving RAG
+empty until every entity was embedded again -- and partially empty for
+good if the reindex failed halfway.  Instead, the reindex now writes into a
+shadow table (``<table>_shadow``) while the live table keeps serving
+searches, then swaps it in with a single transaction.
+
+Progress is checkpointed in ``rag_metadata`` (``REINDEX_CHECKPOINT_KEY``)
+in the same transaction as every batch written to the shadow table.  A
+checkpoint left behind by an interrupted run is resumed as long as it was
+made for the same embedding signature (provider and dimension): rows
+already in the shadow table with a matching ``embed_hash`` are not embedded
+again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any
+
+from ._store_utils import filter_metadata
+
+if TYPE_CHECKING:
+    from ._vector_index import VectorIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+# rag_metadata key holding the checkpoint of an unfinished full reindex
+REINDEX_CHECKPOINT_KEY = "entity_reindex_checkpoint"
+
+
+class ShadowReindexMixin:
+    """Mixin providing the shadow table used by ``EntityIndexer.full_reindex``.
+
+    Expects the host class to provide:
+    - ``self.run_read()`` / ``self.run_write()``: off-loop execution helpers
+    - ``self._ensure_initialized()``: guard method
+    - ``self.encode_embedding()``: blob encoder
+    - ``self.table_name``: str (entity table name)
+    - ``self._fts_available`` / ``self._FTS_TABLE_SUFFIX``: entity FTS5 index
+    - ``self._vector_index`` / ``self._index_lock``: resident entity index
+      (initially None)
+    """
+
+    _vector_index: VectorIndex | None
+    _index_lock: asyncio.Lock | None
+
+    # Shadow table name suffix (appended to self.table_name)
+    _SHADOW_TABLE_SUFFIX = "_shadow"
+
+    @property
+    def _shadow_table(self) -> str:
+        """Name of the shadow entity table."""
+        return self.table_name + self._SHADOW_TABLE_SUFFIX
+
+    async def get_reindex_checkpoint(self) -> dict[str, Any] | None:
+        """Return the checkpoint of an unfinished full reindex, if any."""
+        self._ensure_initialized()
+
+        def _get(conn: sqlite3.Connection) -> dict[str, Any] | None:
+            row = conn.execute(
+                "SELECT value FROM rag_metadata WHERE key = ?",
+                (REINDEX_CHECKPOINT_KEY,),
+            ).fetchone()
+            return _parse_checkpoint(row["value"]) if row else None
+
+        return await self.run_read("get_reindex_checkpoint", _get)
+
+    async def begin_shadow_reindex(self, signature: str) -> dict[str, str]:
+        """Prepare the shadow table, resuming a matching checkpoint.
+
+        Args:
+            signature: Identifies the embeddings being produced (provider
+                and dimension); a checkpoint made for another signature is
+                discarded along with its shadow rows.
+
+        Returns:
+            Mapping of entity ID to ``embed_hash`` for rows already written
+            by the resumed run (empty when starting over).
+        """
+        self._ensure_initialized()
+        shadow = self._shadow_table
+
+        def _begin(conn: sqlite3.Connection) -> dict[str, str]:
+            row = conn.execute(
+                "SELECT value FROM rag_metadata WHERE key = ?",
+                (REINDEX_CHECKPOINT_KEY,),
+            ).fetchone()
+            checkpoint = _parse_checkpoint(row["value"]) if row else None
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (shadow,),
+            ).fetchone()
+
+            if checkpoint and exists and checkpoint.get("signature") == signature:
+                rows = conn.execute(
+                    f"SELECT id, embed_hash FROM {shadow} WHERE embed_hash IS NOT NULL"
+                ).fetchall()
+                return {r["id"]: r["embed_hash"] for r in rows}
+
+            conn.execute(f"DROP TABLE IF EXISTS {shadow}")
+            conn.execute(f"""
+                CREATE TABLE {shadow} (
+                    id TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    embedding TEXT NOT NULL,
+                    metadata TEXT,
+                    embed_hash TEXT
+                )
+            """)
+            _write_checkpoint(
+                conn,
+                {"signature": signature, "started_at": time.time(), "written": 0},
+            )
+            return {}
+
+        return await self.run_write("begin_shadow_reindex", _begin)
+
+    async def write_shadow_documents(
+        self,
+        ids: list[str],
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]],
+        embed_hashes: list[str],
+    ) -> int:
+        """Write a batch into the shadow table and advance the checkpoint.
+
+        Args:
+            ids: Entity IDs.
+            texts: Document texts.
+            embeddings: Embeddings (aligned with ``ids``).
+            metadatas: Metadata dictionaries.
+            embed_hashes: Hash of the text each embedding was computed from.
+
+        Returns:
+            Number of rows the checkpoint records as written so far.
+        """
+        self._ensure_initialized()
+        shadow = self._shadow_table
+        rows = [
+            (
+                doc_id,
+                texts[i],
+                self.encode_embedding(embeddings[i]),
+                json.dumps(filter_metadata(metadatas[i])),
+                embed_hashes[i],
+            )
+            for i, doc_id in enumerate(ids)
+        ]
+
+        def _write(conn: sqlite3.Connection) -> int:
+            conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO {shadow} (id, text, embedding, metadata, embed_hash)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            row = conn.execute(
+                "SELECT value FROM rag_metadata WHERE key = ?",
+                (REINDEX_CHECKPOINT_KEY,),
+            ).fetchone()
+            checkpoint = (_parse_checkpoint(row["value"]) if row else None) or {}
+            checkpoint["written"] = int(checkpoint.get("written", 0)) + len(rows)
+            _write_checkpoint(conn, checkpoint)
+            return checkpoint["written"]
+
+        return await self.run_write("write_shadow_documents", _write)
+
+    async def swap_shadow_table(self, live_ids: list[str]) -> int:
+        """Atomically replace the entity table with the shadow table.
+
+        Rows for entities no longer in ``live_ids`` are dropped.  Live
+        entities missing from the shadow table (e.g. registered while the
+        reindex ran) keep their current row, without an ``embed_hash`` so
+        the next update embeds them again.  The FTS index is rebuilt and the
+        checkpoint removed in the same transaction; the resident vector
+        index is rebuilt on the next search.
+
+        Args:
+            live_ids: Entity IDs currently in the registry.
+
+        Returns:
+            Number of documents in the new entity table.
+        """
+        self._ensure_initialized()
+        table = self.table_name
+        shadow = self._shadow_table
+        fts_table = table + self._FTS_TABLE_SUFFIX
+        live = json.dumps(live_ids)
+
+        def _swap(conn: sqlite3.Connection) -> int:
+            # DML first so the implicit transaction also covers the DDL below
+            conn.execute(
+                f"DELETE FROM {shadow} WHERE id NOT IN (SELECT value FROM json_each(?))",
+                (live,),
+            )
+            conn.execute(
+                f"""
+                INSERT INTO {shadow} (id, text, embedding, metadata, embed_hash)
+                SELECT id, text, embedding, metadata, NULL FROM {table}
+                WHERE id IN (SELECT value FROM json_each(?))
+                  AND id NOT IN (SELECT id FROM {shadow})
+                """,
+                (live,),
+            )
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"ALTER TABLE {shadow} RENAME TO {table}")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_id ON {table}(id)")
+
+            if self._fts_available:
+                conn.execute(f"DELETE FROM {fts_table}")
+                conn.execute(f"""
+                    INSERT INTO {fts_table} (text, entity_id, domain, area_name)
+                    SELECT text, id,
+                           COALESCE(json_extract(metadata, '$.domain'), ''),
+                           COALESCE(json_extract(metadata, '$.area_name'), '')
+                    FROM {table}
+                """)
+
+            conn.execute(
+                "DELETE FROM rag_metadata WHERE key = ?", (REINDEX_CHECKPOINT_KEY,)
+            )
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        # Hold the index lock so a concurrent index build cannot install a
+        # snapshot of the old table after the swap
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+        async with self._index_lock:
+            count = await self.run_write("swap_shadow_table", _swap)
+            self._vector_index = None
+
+        _LOGGER.info("Swapped in reindexed entity table (%d documents)", count)
+        return count
+
+
+def _parse_checkpoint(value: str) -> dict[str, Any] | None:
+    """Decode a stored checkpoint (None when unreadable)."""
+    try:
+        checkpoint = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    return checkpoint if isinstance(checkpoint, dict) else None
+
+
+def _write_checkpoint(conn: sqlite3.Connection, checkpoint: dict[str, Any]) -> None:
+    """Store the reindex checkpoint (inside the caller's transaction)."""
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO rag_metadata (key, value, updated_at)
+        VALUES (?, ?, ?)
+        """,
+        (REINDEX_CHECKPOINT_KEY, json.dumps(checkpoint), time.time()),
+    )
@@ -2,35 +2,53 @@
 
 Provides conversation indexing: storing, searching, listing, and managing
 session conversation chunks with embeddings for RAG retrieval.
+
+Vector search is served from a month-partitioned ``SessionChunkIndex``
+(see ``_session_index``) built from the table on first use and kept in sync
+by ``add_session_chunks`` / ``delete_session_chunks``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import sqlite3
 import time
 from typing import Any
 
-from ._store_utils import (
-    SearchResult,
-    build_date_filter_clauses,
-    cosine_distance,
-    embedding_to_blob,
-    read_embedding,
-    validate_date_param,
-)
+from ._quantize import EMBEDDING_FORMAT_FLOAT32
+from ._session_index import SessionChunkIndex
+from ._store_utils import SearchResult, validate_date_param
+from ._vector_index import first_pass_limits, rescore
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _chunk_timestamps(
+    ids: list[str], metadatas: list[dict[str, Any]] | None
+) -> list[str]:
+    """Timestamps of chunks aligned with ``ids`` (missing metadata -> "")."""
+    return [
+        (metadatas[i] if metadatas and i < len(metadatas) else {}).get("timestamp", "")
+        for i in range(len(ids))
+    ]
+
+
 class SessionChunkMixin:
     """Mixin providing session chunk operations on ``session_chunks`` and related tables.
 
     Expects the host class to provide:
-    - ``self._conn``: sqlite3.Connection
+    - ``self.run_read()`` / ``self.run_write()``: off-loop execution helpers
     - ``self._ensure_initialized()``: guard method
+    - ``self.encode_embedding()`` / ``self.embedding_format``: blob format
+    - ``self._session_index`` / ``self._session_index_lock``: index slots
+      (initially None)
     """
 
+    _session_index: SessionChunkIndex | None
+    _session_index_lock: asyncio.Lock | None
+
     async def add_session_chunks(
         self,
         ids: list[str],
@@ -55,48 +73,12 @@ class SessionChunkMixin:
         if not ids:
             return
 
-        try:
+        def _store(conn: sqlite3.Connection) -> None:
             now = time.time()
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-
-            for i, chunk_id in enumerate(ids):
-                text = texts[i] if i < len(texts) else ""
-                embedding = embeddings[i] if i < len(embeddings) else []
-                metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
-
-                # Extract timestamp for denormalized column (avoids json_extract in queries)
-                ts = metadata.get("timestamp", "")
-
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO session_chunks
-                        (id, session_id, text, embedding, metadata, start_msg, end_msg, updated_at, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        chunk_id,
-                        session_id,
-                        text,
-                        embedding_to_blob(embedding),
-                        json.dumps(metadata),
-                        metadata.get("start_msg", 0),
-                        metadata.get("end_msg", 0),
-                        now,
-                        ts,
-                    ),
-                )
-
-                # Sync to session FTS5 (if available)
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO session_chunks_fts (text, chunk_id, session_id)
-                        VALUES (?, ?, ?)
-                        """,
-                        (text, chunk_id, session_id),
-                    )
-                except Exception:
-                    pass  # FTS5 not available -- silently skip
+            cursor = conn.cursor()
+            self._insert_session_chunk_rows(
+                cursor, ids, texts, embeddings, metadatas, session_id, now
+            )
 
             # Store session content hash for delta detection
             if session_id and content_hash:
@@ -109,7 +91,15 @@ class SessionChunkMixin:
                     (session_id, content_hash, len(ids), now),
                 )
 
-            self._conn.commit()  # type: ignore[union-attr]
+        try:
+            await self.run_write("add_session_chunks", _store)  # type: ignore[attr-defined]
+            if self._session_index is not None:
+                self._session_index.upsert(
+                    ids,
+                    [session_id] * len(ids),
+                    _chunk_timestamps(ids, metadatas),
+                    embeddings,
+                )
             _LOGGER.debug(
                 "Stored %d session chunks for session %s", len(ids), session_id
             )
@@ -118,6 +108,152 @@ class SessionChunkMixin:
             _LOGGER.error("Failed to store session chunks: %s", e)
             raise
 
+    def _insert_session_chunk_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        ids: list[str],
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]] | None,
+        session_id: str,
+        now: float,
+    ) -> None:
+        """Write chunk rows and their FTS entries (runs on the DB worker)."""
+        for i, chunk_id in enumerate(ids):
+            text = texts[i] if i < len(texts) else ""
+            embedding = embeddings[i] if i < len(embeddings) else []
+            metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
+
+            # Extract timestamp for denormalized column (avoids json_extract in queries)
+            ts = metadata.get("timestamp", "")
+
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO session_chunks
+                    (id, session_id, text, embedding, metadata, start_msg, end_msg, updated_at, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    chunk_id,
+                    session_id,
+                    text,
+                    self.encode_embedding(embedding),  # type: ignore[attr-defined]
+                    json.dumps(metadata),
+                    metadata.get("start_msg", 0),
+                    metadata.get("end_msg", 0),
+                    now,
+                    ts,
+                ),
+            )
+
+            # Sync to session FTS5 (if available)
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO session_chunks_fts (text, chunk_id, session_id)
+                    VALUES (?, ?, ?)
+                    """,
+                    (text, chunk_id, session_id),
+                )
+            except Exception:
+                pass  # FTS5 not available -- silently skip
+
+    async def sync_session_chunks(
+        self,
+        session_id: str,
+        ids: list[str],
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]],
+        live_ids: list[str],
+        content_hash: str,
+        round_hashes: list[str],
+    ) -> int:
+        """Apply a delta to a session's chunks in one transaction.
+
+        Upserts the given (new or changed) chunks, deletes every chunk of
+        the session that is not in ``live_ids`` and records the session and
+        per-round hashes for the next delta.
+
+        Args:
+            session_id: Session being indexed.
+            ids: Chunk IDs to write (a subset of ``live_ids``).
+            texts: Chunk text contents.
+            embeddings: Pre-computed embeddings for ``ids``.
+            metadatas: Metadata dicts for ``ids``.
+            live_ids: IDs of all chunks the session should end up with.
+            content_hash: SHA-256 hash of full session content.
+            round_hashes: Per-round content hashes, in round order.
+
+        Returns:
+            Number of stale chunks deleted.
+        """
+        self._ensure_initialized()
+
+        def _sync(conn: sqlite3.Connection) -> list[str]:
+            now = time.time()
+            cursor = conn.cursor()
+            live = set(live_ids)
+            existing = {
+                row["id"]
+                for row in cursor.execute(
+                    "SELECT id FROM session_chunks WHERE session_id = ?",
+                    (session_id,),
+                ).fetchall()
+            }
+            stale = sorted(existing - live)
+            # Rewritten chunks get fresh FTS rows
+            dropped = stale + [chunk_id for chunk_id in ids if chunk_id in existing]
+
+            if dropped:
+                placeholders = ",".join("?" * len(dropped))
+                try:
+                    cursor.execute(
+                        f"DELETE FROM session_chunks_fts WHERE chunk_id IN ({placeholders})",
+                        dropped,
+                    )
+                except Exception:
+                    pass  # FTS5 not available
+                cursor.execute(
+                    f"DELETE FROM session_chunks WHERE id IN ({placeholders})", dropped
+                )
+
+            self._insert_session_chunk_rows(
+                cursor, ids, texts, embeddings, metadatas, session_id, now
+            )
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO session_hashes
+                    (session_id, content_hash, chunk_count, updated_at, round_hashes)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    session_id,
+                    content_hash,
+                    len(live_ids),
+                    now,
+                    json.dumps(round_hashes),
+                ),
+            )
+            return stale
+
+        stale = await self.run_write("sync_session_chunks", _sync)  # type: ignore[attr-defined]
+        if self._session_index is not None:
+            self._session_index.remove(stale)
+            self._session_index.upsert(
+                ids,
+                [session_id] * len(ids),
+                _chunk_timestamps(ids, metadatas),
+                embeddings,
+            )
+        _LOGGER.debug(
+            "Synced session %s: %d chunks written, %d removed",
+            session_id,
+            len(ids),
+            len(stale),
+        )
+        return len(stale)
+
     async def delete_session_chunks(self, session_id: str) -> None:
         """Delete all chunks for a given session.
 
@@ -126,8 +262,8 @@ class SessionChunkMixin:
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        def _delete(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
 
             # Delete from FTS5 first (if available)
             try:
@@ -150,7 +286,10 @@ class SessionChunkMixin:
                 (session_id,),
             )
 
-            self._conn.commit()  # type: ignore[union-attr]
+        try:
+            await self.run_write("delete_session_chunks", _delete)  # type: ignore[attr-defined]
+            if self._session_index is not None:
+                self._session_index.remove_session(session_id)
             _LOGGER.debug("Deleted session chunks for session %s", session_id)
 
         except Exception as e:
@@ -167,19 +306,56 @@ class SessionChunkMixin:
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute(
+        def _get(conn: sqlite3.Connection) -> str | None:
+            row = conn.execute(
                 "SELECT content_hash FROM session_hashes WHERE session_id = ?",
                 (session_id,),
-            )
-            row = cursor.fetchone()
+            ).fetchone()
             return row["content_hash"] if row else None
 
+        try:
+            return await self.run_read("get_session_hash", _get)  # type: ignore[attr-defined]
         except Exception as e:
             _LOGGER.error("Failed to get session hash for %s: %s", session_id, e)
             return None
 
+    async def get_session_index_state(self, session_id: str) -> dict[str, Any] | None:
+        """Get the persisted delta-indexing state of a session.
+
+        Args:
+            session_id: Session to look up.
+
+        Returns:
+            Dict with ``content_hash``, ``round_count`` and ``round_hashes``
+            (empty when written without per-round hashes), or None if the
+            session was never indexed.
+        """
+        self._ensure_initialized()
+
+        def _get(conn: sqlite3.Connection) -> dict[str, Any] | None:
+            row = conn.execute(
+                """
+                SELECT content_hash, chunk_count, round_hashes
+                FROM session_hashes WHERE session_id = ?
+                """,
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return {
+                "content_hash": row["content_hash"],
+                "round_count": row["chunk_count"],
+                "round_hashes": json.loads(row["round_hashes"])
+                if row["round_hashes"]
+                else [],
+            }
+
+        try:
+            return await self.run_read("get_session_index_state", _get)  # type: ignore[attr-defined]
+        except Exception as e:
+            _LOGGER.error("Failed to get session state for %s: %s", session_id, e)
+            return None
+
     async def search_session_chunks(
         self,
         query_embedding: list[float],
@@ -208,54 +384,113 @@ class SessionChunkMixin:
         end_date = validate_date_param(end_date, "end_date")
 
         try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+            index = await self._get_session_index()
+            quantized = (
+                index.quantized and self._rescores_from_storage  # type: ignore[attr-defined]
+            )
+            limit, threshold = (
+                first_pass_limits(n_results, min_similarity)
+                if quantized
+                else (n_results, min_similarity)
+            )
+            hits = index.search(
+                query_embedding,
+                n_results=limit,
+                min_similarity=threshold,
+                session_id=session_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if not hits:
+                return []
 
-            query_parts = [
-                "SELECT id, session_id, text, embedding, metadata FROM session_chunks WHERE 1=1"
-            ]
-            params: list[Any] = []
+            # Text and metadata are only loaded for the final hits
+            columns = "id, text, metadata, embedding" if quantized else "id, text, metadata"
 
-            if session_id:
-                query_parts.append("AND session_id = ?")
-                params.append(session_id)
+            def _hydrate(conn: sqlite3.Connection) -> dict[str, sqlite3.Row]:
+                placeholders = ",".join("?" * len(hits))
+                rows = conn.execute(
+                    f"SELECT {columns} FROM session_chunks WHERE id IN ({placeholders})",
+                    [hit.id for hit in hits],
+                ).fetchall()
+                return {row["id"]: row for row in rows}
 
-            date_clauses, date_params = build_date_filter_clauses(start_date, end_date)
-            query_parts.extend(date_clauses)
-            params.extend(date_params)
+            rows = await self.run_read("search_session_chunks", _hydrate)  # type: ignore[attr-defined]
+        except Exception as e:
+            _LOGGER.error("Session chunk search failed: %s", e)
+            return []
 
-            cursor.execute(" ".join(query_parts), tuple(params))
-            rows = cursor.fetchall()
+        if quantized:
+            hits = [
+                hit._replace(distance=distance)
+                for hit, distance in rescore(
+                    query_embedding,
+                    hits,
+                    {chunk_id: row["embedding"] for chunk_id, row in rows.items()},
+                    n_results,
+                    min_similarity,
+                )
+            ]
 
-            if not rows:
-                return []
+        results = []
+        for hit in hits:
+            row = rows.get(hit.id)
+            if row is None:  # deleted since the index lookup
+                continue
+            metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+            metadata["session_id"] = hit.session_id
+            results.append(
+                SearchResult(
+                    id=hit.id,
+                    text=row["text"],
+                    metadata=metadata,
+                    distance=hit.distance,
+                )
+            )
+        return results
 
-            results = []
-            for row in rows:
-                embedding = read_embedding(row["embedding"])
-                distance = cosine_distance(query_embedding, embedding)
-                similarity = 1.0 - distance
+    async def _get_session_index(self) -> SessionChunkIndex:
+        """Return the session chunk index, building it from the table once.
 
-                if min_similarity is not None and similarity < min_similarity:
-                    continue
+        Like the entity index, the build runs as a writer job so it is
+        ordered with pending writes.
+        """
+        if self._session_index is not None:
+            return self._session_index
 
-                metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                metadata["session_id"] = row["session_id"]
+        if self._session_index_lock is None:
+            self._session_index_lock = asyncio.Lock()
 
-                results.append(
-                    SearchResult(
-                        id=row["id"],
-                        text=row["text"],
-                        metadata=metadata,
-                        distance=distance,
-                    )
+        async with self._session_index_lock:
+            if self._session_index is None:
+                self._session_index = await self.run_write(  # type: ignore[attr-defined]
+                    "build_session_index", self._build_session_index
                 )
-
-            results.sort(key=lambda x: x.distance)
-            return results[:n_results]
-
-        except Exception as e:
-            _LOGGER.error("Session chunk search failed: %s", e)
-            return []
+        return self._session_index
+
+    def _build_session_index(self, conn: sqlite3.Connection) -> SessionChunkIndex:
+        """Load every session chunk embedding into a new index (writer job)."""
+        start = time.perf_counter()
+        rows = conn.execute(
+            "SELECT id, session_id, embedding, timestamp FROM session_chunks"
+        ).fetchall()
+
+        index = SessionChunkIndex(
+            quantized=self.embedding_format != EMBEDDING_FORMAT_FLOAT32  # type: ignore[attr-defined]
+        )
+        index.upsert(
+            [row["id"] for row in rows],
+            [row["session_id"] for row in rows],
+            [row["timestamp"] for row in rows],
+            [row["embedding"] for row in rows],
+        )
+        _LOGGER.debug(
+            "Built session chunk index: %d chunks in %d partitions in %.1f ms",
+            len(index),
+            len(index.partition_keys),
+            (time.perf_counter() - start) * 1000,
+        )
+        return index
 
     async def list_session_chunks(
         self,
@@ -275,8 +510,9 @@ class SessionChunkMixin:
             List of dicts with id, session_id, text (first 500 chars), start_msg, end_msg.
         """
         self._ensure_initialized()
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+
+        def _list(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+            cursor = conn.cursor()
             if session_id:
                 cursor.execute(
                     """SELECT id, session_id, text, metadata, start_msg, end_msg
@@ -304,6 +540,9 @@ class SessionChunkMixin:
                     }
                 )
             return results
+
+        try:
+            return await self.run_read("list_session_chunks", _list)  # type: ignore[attr-defined]
         except Exception as e:
             _LOGGER.error("Failed to list session chunks: %s", e)
             return []
@@ -316,8 +555,8 @@ class SessionChunkMixin:
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        def _stats(conn: sqlite3.Connection) -> dict[str, Any]:
+            cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM session_chunks")
             total_chunks = cursor.fetchone()[0]
@@ -336,6 +575,8 @@ class SessionChunkMixin:
                 "total_mb": round(total_bytes / (1024 * 1024), 2),
             }
 
+        try:
+            return await self.run_read("get_session_chunk_stats", _stats)  # type: ignore[attr-defined]
         except Exception as e:
             _LOGGER.error("Failed to get session chunk stats: %s", e)
             return {
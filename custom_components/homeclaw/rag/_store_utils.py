@@ -11,10 +11,11 @@ import json
 import logging
 import math
 import re
-import struct
 from dataclasses import dataclass
 from typing import Any
 
+from ._quantize import EMBEDDING_FORMAT_FLOAT32, decode_embedding, encode_embedding
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -85,29 +86,32 @@ def cosine_distance(vec1: list[float], vec2: list[float]) -> float:
     return 1.0 - cosine_similarity(vec1, vec2)
 
 
-def embedding_to_blob(embedding: list[float]) -> bytes:
-    """Convert embedding list to compact binary blob (float32).
+def embedding_to_blob(
+    embedding: list[float], fmt: str = EMBEDDING_FORMAT_FLOAT32
+) -> bytes:
+    """Convert embedding list to compact binary blob.
 
     Args:
         embedding: List of float values.
+        fmt: Storage format (see ``_quantize``): float32, float16 or int8.
 
     Returns:
-        Binary blob (~3KB for 768-dim instead of ~6KB JSON).
+        Binary blob (~3KB for 768-dim float32 instead of ~6KB JSON;
+        ~1.5KB as float16, ~0.8KB as int8).
     """
-    return struct.pack(f"<{len(embedding)}f", *embedding)
+    return encode_embedding(embedding, fmt)
 
 
 def blob_to_embedding(blob: bytes) -> list[float]:
     """Convert binary blob back to embedding list.
 
     Args:
-        blob: Binary blob of float32 values.
+        blob: Binary blob in any storage format (detected from its header).
 
     Returns:
         List of float values.
     """
-    count = len(blob) // 4  # 4 bytes per float32
-    return list(struct.unpack(f"<{count}f", blob))
+    return decode_embedding(blob)
 
 
 def read_embedding(raw: Any) -> list[float]:
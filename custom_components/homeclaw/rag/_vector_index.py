@@ -0,0 +1,531 @@
+"""Resident in-memory vector index for the SQLite vector store.
+
+Keeps every entity embedding as a pre-normalized row of a contiguous
+float32 matrix so a query is answered with one matrix-vector product plus
+``argpartition`` instead of decoding every blob and computing cosine in
+Python.  The index is a cache: SQLite remains the source of truth, and the
+store keeps the index in sync on every add / upsert / delete / clear.
+
+When NumPy is not importable the same API is served by a pure-Python path
+(pre-normalized lists + dot products), which is still cheaper than the old
+per-query blob decoding.
+
+A ``quantized`` index (used when the store writes float16 / int8 blobs, see
+``_quantize``) keeps each unit row as int8 codes plus a float32 factor --
+about a quarter of the memory -- and scores the matrix block by block.
+When the stored vectors are more precise than the codes (float16), callers
+over-fetch with ``first_pass_limits`` and re-rank the candidates against
+them with ``rescore``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from typing import Any, Callable, Sequence, TypeVar
+
+from ._quantize import decode_embedding_array
+from ._store_utils import SearchResult, cosine_similarity, read_embedding
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant core
+    np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Initial row capacity of the matrix; grows geometrically on demand
+_INITIAL_CAPACITY = 256
+
+# Rows of a quantized matrix converted to float32 at a time while scoring
+_QUANTIZED_BLOCK_ROWS = 4096
+
+# Candidates taken from a quantized first pass per requested result
+RESCORE_FACTOR = 4
+
+# Similarity slack for the first pass, so borderline hits survive until rescoring
+RESCORE_SIMILARITY_SLACK = 0.03
+
+_T = TypeVar("_T")
+
+
+def numpy_available() -> bool:
+    """Whether the vectorized (NumPy) search path is available."""
+    return np is not None
+
+
+def _normalize(vector: Sequence[float]) -> list[float]:
+    """Return a unit-length copy of ``vector`` (zero vectors stay zero)."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return [0.0] * len(vector)
+    return [v / norm for v in vector]
+
+
+def _matches_where(metadata: dict[str, Any], where: dict[str, Any]) -> bool:
+    """Simple equality filter, same semantics as ``SqliteStore.search``."""
+    for key, value in where.items():
+        if metadata.get(key) != value:
+            return False
+    return True
+
+
+class VectorIndex:
+    """In-memory cosine index over (id, text, metadata, embedding) rows.
+
+    Rows are stored densely: deleting a row moves the last row into its slot,
+    so the live region of the matrix is always ``[0, len(self))``.
+
+    Embeddings whose dimensionality differs from the index dimension (e.g.
+    leftovers from a previous embedding provider) are kept aside and scored
+    individually, mirroring ``cosine_similarity`` which returns 0 for vectors
+    of different length.
+    """
+
+    def __init__(self, quantized: bool = False) -> None:
+        """Initialize an empty index.
+
+        Args:
+            quantized: Hold rows as int8 codes (NumPy path only).
+        """
+        self._quantized = quantized and np is not None
+        self._ids: list[str] = []
+        self._texts: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._rows: dict[str, int] = {}
+        self._dim: int | None = None
+        # NumPy path: capacity x dim float32 matrix of unit rows
+        # (int8 codes when quantized, rescaled to unit length by _row_scales)
+        self._matrix: Any = None
+        self._row_scales: Any = None
+        # Pure-Python path: unit vectors aligned with ``_ids``
+        self._vectors: list[list[float]] = []
+        # NumPy path: unit vectors whose dim != self._dim, keyed by doc id
+        self._foreign: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._ids)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Whether ``doc_id`` is indexed."""
+        return doc_id in self._rows
+
+    @property
+    def dim(self) -> int | None:
+        """Embedding dimensionality of the matrix (None while empty)."""
+        return self._dim
+
+    @property
+    def quantized(self) -> bool:
+        """Whether rows are held as int8 codes (results need ``rescore``)."""
+        return self._quantized
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the vector data."""
+        if np is not None and self._matrix is not None:
+            if self._row_scales is not None:
+                return int(self._matrix.nbytes + self._row_scales.nbytes)
+            return int(self._matrix.nbytes)
+        return sum(len(v) for v in self._vectors) * 8
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        embeddings: Sequence[Any],
+        metadatas: Sequence[dict[str, Any]],
+    ) -> None:
+        """Insert or replace documents.
+
+        Args:
+            ids: Document IDs.
+            texts: Document texts (aligned with ``ids``).
+            embeddings: Raw embeddings -- lists of floats, float32 blobs or
+                legacy JSON strings.
+            metadatas: Already-filtered metadata dicts (aligned with ``ids``).
+        """
+        for i, doc_id in enumerate(ids):
+            vector = self._coerce(embeddings[i] if i < len(embeddings) else [])
+            text = texts[i] if i < len(texts) else ""
+            metadata = metadatas[i] if i < len(metadatas) else {}
+
+            row = self._rows.get(doc_id)
+            if row is None:
+                row = len(self._ids)
+                self._rows[doc_id] = row
+                self._ids.append(doc_id)
+                self._texts.append(text)
+                self._metadatas.append(metadata)
+                if np is None:
+                    self._vectors.append([])
+            else:
+                self._texts[row] = text
+                self._metadatas[row] = metadata
+
+            self._set_vector(row, doc_id, vector)
+
+    def update_documents(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        metadatas: Sequence[dict[str, Any]],
+    ) -> None:
+        """Replace the text and metadata of indexed documents, keeping vectors.
+
+        Unknown IDs are ignored.
+        """
+        for doc_id, text, metadata in zip(ids, texts, metadatas):
+            row = self._rows.get(doc_id)
+            if row is None:
+                continue
+            self._texts[row] = text
+            self._metadatas[row] = metadata
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """Remove documents by ID (unknown IDs are ignored)."""
+        for doc_id in ids:
+            row = self._rows.pop(doc_id, None)
+            if row is None:
+                continue
+            self._foreign.pop(doc_id, None)
+
+            last = len(self._ids) - 1
+            if row != last:
+                moved_id = self._ids[last]
+                self._ids[row] = moved_id
+                self._texts[row] = self._texts[last]
+                self._metadatas[row] = self._metadatas[last]
+                self._rows[moved_id] = row
+                if np is None:
+                    self._vectors[row] = self._vectors[last]
+                elif self._matrix is not None:
+                    self._matrix[row] = self._matrix[last]
+                    if self._row_scales is not None:
+                        self._row_scales[row] = self._row_scales[last]
+
+            self._ids.pop()
+            self._texts.pop()
+            self._metadatas.pop()
+            if np is None:
+                self._vectors.pop()
+
+        if not self._ids:
+            self.clear()
+
+    def clear(self) -> None:
+        """Drop all documents and reset the dimension."""
+        self._ids.clear()
+        self._texts.clear()
+        self._metadatas.clear()
+        self._rows.clear()
+        self._vectors.clear()
+        self._foreign.clear()
+        self._matrix = None
+        self._row_scales = None
+        self._dim = None
+
+    def _coerce(self, raw: Any) -> Any:
+        """Turn a raw embedding into a float vector for the active backend."""
+        if np is not None:
+            if isinstance(raw, bytes):
+                return decode_embedding_array(raw)
+            if isinstance(raw, str):
+                raw = read_embedding(raw)
+            return np.asarray(raw, dtype=np.float32).reshape(-1)
+        if isinstance(raw, (bytes, str)):
+            return read_embedding(raw)
+        return list(raw)
+
+    def _set_vector(self, row: int, doc_id: str, vector: Any) -> None:
+        """Store the normalized vector for ``row``."""
+        if np is None:
+            self._vectors[row] = _normalize(vector)
+            return
+
+        size = int(vector.shape[0])
+        dtype = np.int8 if self._quantized else np.float32
+        if self._dim is None and size:
+            self._dim = size
+            self._matrix = np.zeros((_INITIAL_CAPACITY, size), dtype=dtype)
+            if self._quantized:
+                self._row_scales = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+
+        if self._matrix is not None and row >= self._matrix.shape[0]:
+            capacity = max(row + 1, self._matrix.shape[0] * 2)
+            grown = np.zeros((capacity, self._dim), dtype=dtype)
+            grown[: self._matrix.shape[0]] = self._matrix
+            self._matrix = grown
+            if self._row_scales is not None:
+                scales = np.zeros(capacity, dtype=np.float32)
+                scales[: self._row_scales.shape[0]] = self._row_scales
+                self._row_scales = scales
+
+        norm = float(np.linalg.norm(vector)) if size else 0.0
+        if size == self._dim:
+            self._foreign.pop(doc_id, None)
+            if self._quantized:
+                self._set_quantized_row(row, vector, norm)
+            else:
+                self._matrix[row] = vector / norm if norm else 0.0
+        else:
+            # Dimension mismatch: keep a zero row, score it separately
+            if self._matrix is not None:
+                self._matrix[row] = 0
+                if self._row_scales is not None:
+                    self._row_scales[row] = 0.0
+            self._foreign[doc_id] = (
+                [float(v) / norm for v in vector] if norm else [0.0] * size
+            )
+
+    def _set_quantized_row(self, row: int, vector: Any, norm: float) -> None:
+        """Store ``vector`` as int8 codes plus a factor restoring unit length."""
+        peak = float(np.abs(vector).max()) if norm else 0.0
+        if not peak:
+            self._matrix[row] = 0
+            self._row_scales[row] = 0.0
+            return
+        codes = np.clip(np.rint(vector * (127.0 / peak)), -127, 127).astype(np.int8)
+        code_norm = float(np.linalg.norm(codes.astype(np.float32)))
+        self._matrix[row] = codes
+        self._row_scales[row] = 1.0 / code_norm if code_norm else 0.0
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        min_similarity: float | None = None,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[SearchResult]:
+        """Return the top ``n_results`` documents by cosine similarity.
+
+        Args:
+            query_embedding: Query vector (need not be normalized).
+            n_results: Maximum number of results.
+            where: Optional metadata equality filter.
+            min_similarity: Optional minimum cosine similarity.
+            predicate: Optional extra metadata filter, applied with ``where``.
+
+        Returns:
+            SearchResults sorted by ascending cosine distance.  Metadata dicts
+            are shallow copies, so callers may mutate them freely.
+        """
+        if not self._ids or n_results <= 0:
+            return []
+
+        if where or predicate is not None:
+            candidates = [
+                row
+                for row, metadata in enumerate(self._metadatas)
+                if (not where or _matches_where(metadata, where))
+                and (predicate is None or predicate(metadata))
+            ]
+            if not candidates:
+                return []
+        else:
+            candidates = None
+
+        if np is None:
+            top = self._top_k_python(
+                query_embedding, n_results, candidates, min_similarity
+            )
+        else:
+            top = self._top_k_numpy(
+                query_embedding, n_results, candidates, min_similarity
+            )
+
+        return [
+            SearchResult(
+                id=self._ids[row],
+                text=self._texts[row],
+                metadata=dict(self._metadatas[row]),
+                distance=1.0 - similarity,
+            )
+            for row, similarity in top
+        ]
+
+    def nearest(
+        self, queries: Sequence[Sequence[float]]
+    ) -> list[tuple[str, float] | None]:
+        """Return the most similar document for each of several queries.
+
+        On the NumPy path a plain (non-quantized) index answers the whole
+        batch with one matrix-matrix product; otherwise each query goes
+        through ``search``.
+
+        Returns:
+            ``(doc id, cosine similarity)`` per query, or None for every
+            query while the index is empty.
+        """
+        if not self._ids:
+            return [None] * len(queries)
+
+        if np is None or self._quantized or self._foreign:
+            results: list[tuple[str, float] | None] = []
+            for query in queries:
+                hits = self.search(query, n_results=1)
+                results.append((hits[0].id, 1.0 - hits[0].distance) if hits else None)
+            return results
+
+        count = len(self._ids)
+        unit_queries = np.zeros((len(queries), self._dim), dtype=np.float32)
+        for i, query in enumerate(queries):
+            vector = np.asarray(query, dtype=np.float32).reshape(-1)
+            norm = float(np.linalg.norm(vector)) if vector.shape[0] else 0.0
+            if norm and vector.shape[0] == self._dim:
+                unit_queries[i] = vector / norm
+
+        sims = np.clip(unit_queries @ self._matrix[:count].T, -1.0, 1.0)
+        best = sims.argmax(axis=1)
+        return [
+            (self._ids[int(row)], float(sims[i, row])) for i, row in enumerate(best)
+        ]
+
+    def _top_k_numpy(
+        self,
+        query_embedding: Sequence[float],
+        n_results: int,
+        candidates: list[int] | None,
+        min_similarity: float | None,
+    ) -> list[tuple[int, float]]:
+        """Vectorized top-k: one mat-vec product, then argpartition."""
+        count = len(self._ids)
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        q_norm = float(np.linalg.norm(query)) if query.shape[0] else 0.0
+
+        if q_norm and query.shape[0] == self._dim:
+            unit_query = query / q_norm
+            sims = self._scores(unit_query, count)
+        else:
+            unit_query = query / q_norm if q_norm else None
+            sims = np.zeros(count, dtype=np.float32)
+
+        if self._foreign:
+            for doc_id, vector in self._foreign.items():
+                if unit_query is not None and len(vector) == query.shape[0]:
+                    sims[self._rows[doc_id]] = float(np.dot(vector, unit_query))
+
+        rows = np.arange(count) if candidates is None else np.asarray(candidates)
+        sims = np.clip(sims[rows], -1.0, 1.0)
+
+        if min_similarity is not None:
+            keep = sims >= min_similarity
+            rows, sims = rows[keep], sims[keep]
+            _LOGGER.debug(
+                "RAG similarity filter: %d/%d results above threshold %.2f",
+                int(rows.shape[0]),
+                int(keep.shape[0]),
+                min_similarity,
+            )
+
+        if rows.shape[0] > n_results:
+            part = np.argpartition(-sims, n_results - 1)[:n_results]
+            rows, sims = rows[part], sims[part]
+
+        # Highest similarity first; row order breaks ties deterministically
+        order = np.lexsort((rows, -sims))
+        return [(int(rows[i]), float(sims[i])) for i in order]
+
+    def _scores(self, unit_query: Any, count: int) -> Any:
+        """Cosine similarity of the first ``count`` rows to a unit query."""
+        if not self._quantized:
+            return self._matrix[:count] @ unit_query
+        sims = np.empty(count, dtype=np.float32)
+        for start in range(0, count, _QUANTIZED_BLOCK_ROWS):
+            stop = min(start + _QUANTIZED_BLOCK_ROWS, count)
+            sims[start:stop] = self._matrix[start:stop].astype(np.float32) @ unit_query
+        return sims * self._row_scales[:count]
+
+    def _top_k_python(
+        self,
+        query_embedding: Sequence[float],
+        n_results: int,
+        candidates: list[int] | None,
+        min_similarity: float | None,
+    ) -> list[tuple[int, float]]:
+        """Pure-Python top-k against pre-normalized vectors."""
+        query = _normalize(query_embedding)
+        rows = range(len(self._ids)) if candidates is None else candidates
+
+        scored: list[tuple[int, float]] = []
+        for row in rows:
+            vector = self._vectors[row]
+            if len(vector) != len(query):
+                similarity = 0.0
+            else:
+                similarity = sum(a * b for a, b in zip(vector, query))
+            if min_similarity is not None and similarity < min_similarity:
+                continue
+            scored.append((row, similarity))
+
+        return heapq.nsmallest(n_results, scored, key=lambda item: (-item[1], item[0]))
+
+
+def first_pass_limits(
+    n_results: int, min_similarity: float | None
+) -> tuple[int, float | None]:
+    """Return the (n_results, min_similarity) for a quantized first pass."""
+    if min_similarity is not None:
+        min_similarity -= RESCORE_SIMILARITY_SLACK
+    return n_results * RESCORE_FACTOR, min_similarity
+
+
+def rescore(
+    query_embedding: Sequence[float],
+    candidates: Sequence[_T],
+    stored: dict[str, Any],
+    n_results: int,
+    min_similarity: float | None = None,
+) -> list[tuple[_T, float]]:
+    """Re-rank first-pass candidates by exact cosine distance.
+
+    Args:
+        query_embedding: The query vector.
+        candidates: First-pass hits; each must have an ``id`` attribute.
+        stored: Stored embedding (blob or legacy JSON) per candidate ID.
+            Candidates missing from it (deleted meanwhile) are dropped.
+        n_results: Maximum number of results.
+        min_similarity: Optional minimum cosine similarity.
+
+    Returns:
+        ``(candidate, distance)`` pairs, lowest distance first.
+    """
+    if np is not None:
+        query = np.asarray(query_embedding, dtype=np.float64).reshape(-1)
+        q_norm = float(np.linalg.norm(query))
+
+    scored: list[tuple[float, int, _T]] = []
+    for position, candidate in enumerate(candidates):
+        raw = stored.get(candidate.id)  # type: ignore[attr-defined]
+        if raw is None:
+            continue
+        if np is None:
+            similarity = cosine_similarity(list(query_embedding), read_embedding(raw))
+        else:
+            vector = (
+                decode_embedding_array(raw)
+                if isinstance(raw, bytes)
+                else np.asarray(read_embedding(raw))
+            ).astype(np.float64)
+            norm = float(np.linalg.norm(vector))
+            if vector.shape != query.shape or not norm or not q_norm:
+                similarity = 0.0
+            else:
+                similarity = float(vector @ query) / (norm * q_norm)
+        if min_similarity is not None and similarity < min_similarity:
+            continue
+        scored.append((1.0 - similarity, position, candidate))
+
+    scored.sort(key=lambda item: (item[0], item[1]))
+    return [(candidate, distance) for distance, _, candidate in scored[:n_results]]
@@ -6,12 +6,26 @@ combining them into a single context string for the LLM.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
+from ._context_cache import ContextCache
+from ._retrieval import (
+    ENTITY_BRANCH_TIMEOUT,
+    MEMORY_BRANCH_TIMEOUT,
+    QUERY_EMBEDDING_TIMEOUT,
+    SESSION_BRANCH_TIMEOUT,
+    RetrievalTimings,
+    build_intent_filter,
+    looks_ha_related,
+    run_stage,
+)
 from ._session_context import get_session_context
 from ._temporal import has_temporal_hint
+from .embeddings import get_embedding_for_query
 
 # Backward-compatible alias — tests import _has_temporal_hint from here.
 _has_temporal_hint = has_temporal_hint
@@ -44,6 +58,7 @@ class RAGContextRetriever:
         indexer: Any,
         session_indexer: Any | None = None,
         memory_manager: Any | None = None,
+        context_cache: ContextCache | None = None,
     ) -> None:
         """Initialize the context retriever.
 
@@ -56,6 +71,7 @@ class RAGContextRetriever:
             indexer: EntityIndexer for stale-entity removal.
             session_indexer: Optional SessionIndexer.
             memory_manager: Optional MemoryManager for long-term recall.
+            context_cache: Optional cache of context strings by query/user.
         """
         self._hass = hass
         self._query_engine = query_engine
@@ -65,6 +81,7 @@ class RAGContextRetriever:
         self._indexer = indexer
         self._session_indexer = session_indexer
         self._memory_manager = memory_manager
+        self._context_cache = context_cache
 
     async def get_relevant_context(
         self,
@@ -73,12 +90,25 @@ class RAGContextRetriever:
         user_id: str | None = None,
         provider: Any | None = None,
         model: str | None = None,
+        *,
+        timings_out: dict[str, Any] | None = None,
     ) -> str:
         """Get relevant entity context for a user query.
 
         Uses semantic search to find entities related to the query
         and returns a structured JSON context string suitable for LLM.
 
+        The query is embedded once and the vector is shared by intent
+        detection, entity search, session search and memory recall.  The
+        entity, session and memory branches run concurrently, each under its
+        own deadline; a branch that misses its deadline is dropped.  Stage
+        timings are logged and, when ``timings_out`` is given, stored in it
+        (per call, so concurrent retrievals do not mix them up).
+
+        With a context cache, a repeated query from the same user is served
+        from the cache; only retrievals where no branch was dropped or failed
+        are cached.
+
         Includes self-healing: removes stale entities from the index
         if they no longer exist in Home Assistant.
 
@@ -91,12 +121,74 @@ class RAGContextRetriever:
             user_id: Optional user ID for memory recall.
             provider: Optional AI provider for query expansion.
             model: Optional model name for query expansion.
+            timings_out: Optional dict filled with this call's timings
+                (``RetrievalTimings.as_dict``).
 
         Returns:
             JSON-formatted context string for the LLM, or empty string if no results.
         """
+        timings = RetrievalTimings()
+        started = time.perf_counter()
+        cache_key = None
         try:
-            results = await self._search_entities(query, top_k)
+            if self._context_cache is not None:
+                cache_key = self._context_cache.make_key(query, user_id, top_k)
+                cached = self._context_cache.get(cache_key)
+                if cached is not None:
+                    timings.cached = True
+                    _LOGGER.debug("RAG context cache hit for query: %s...", query[:50])
+                    return cached
+
+            # Embed once; on failure each stage falls back to its own embedding
+            query_embedding = await run_stage(
+                "embedding",
+                get_embedding_for_query(self._embedding_provider, query),
+                QUERY_EMBEDDING_TIMEOUT,
+                timings,
+                None,
+            )
+
+            branches = [
+                run_stage(
+                    "entities",
+                    self._search_entities(query, top_k, query_embedding, timings),
+                    ENTITY_BRANCH_TIMEOUT,
+                    timings,
+                    [],
+                ),
+                run_stage(
+                    "sessions",
+                    get_session_context(
+                        query,
+                        self._embedding_provider,
+                        self._store,
+                        RAG_MIN_SIMILARITY,
+                        top_k=3,
+                        provider=provider,
+                        model=model,
+                        query_embedding=query_embedding,
+                    ),
+                    SESSION_BRANCH_TIMEOUT,
+                    timings,
+                    [],
+                ),
+            ]
+            if user_id and self._memory_manager:
+                branches.append(
+                    run_stage(
+                        "memories",
+                        self._memory_manager.recall_for_query(
+                            query, user_id, query_embedding=query_embedding
+                        ),
+                        MEMORY_BRANCH_TIMEOUT,
+                        timings,
+                        [],
+                    )
+                )
+
+            results, session_ctx, *rest = await asyncio.gather(*branches)
+            memory_context = rest[0] if rest else []
+
             valid_results = await self._validate_and_heal(results)
 
             context_data: dict[str, Any] = {}
@@ -109,33 +201,13 @@ class RAGContextRetriever:
                 if entity_context:
                     context_data["relevant_entities"] = entity_context
 
-            # Search session chunks for conversational context
-            try:
-                session_ctx = await get_session_context(
-                    query,
-                    self._embedding_provider,
-                    self._store,
-                    RAG_MIN_SIMILARITY,
-                    top_k=3,
-                    provider=provider,
-                    model=model,
-                )
-                if session_ctx:
-                    context_data["previous_conversations"] = session_ctx
-            except Exception as sess_err:
-                _LOGGER.debug("Session context retrieval failed: %s", sess_err)
+            if session_ctx:
+                context_data["previous_conversations"] = session_ctx
 
-            # Recall long-term memories (if user_id provided)
-            if user_id and self._memory_manager:
-                try:
-                    memory_context = await self._memory_manager.recall_for_query(
-                        query, user_id
-                    )
-                    if memory_context:
-                        context_data["long_term_memories"] = memory_context
-                except Exception as mem_err:
-                    _LOGGER.debug("Memory recall failed: %s", mem_err)
+            if memory_context:
+                context_data["long_term_memories"] = memory_context
 
+            context_str = ""
             if context_data:
                 context_str = json.dumps(
                     context_data, ensure_ascii=False, separators=(",", ":")
@@ -145,14 +217,23 @@ class RAGContextRetriever:
                     len(context_str),
                     query[:50],
                 )
-                return context_str
 
-            return ""
+            if cache_key is not None and not (timings.dropped or timings.failed):
+                self._context_cache.put(
+                    cache_key, context_str, user_id, [r.id for r in valid_results]
+                )
+            return context_str
 
         except Exception as e:
             _LOGGER.warning("RAG context retrieval failed: %s", e)
             return ""
 
+        finally:
+            timings.total_ms = (time.perf_counter() - started) * 1000
+            if timings_out is not None:
+                timings_out.update(timings.as_dict())
+            _LOGGER.debug("RAG retrieval timings: %s", timings.as_dict())
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -161,27 +242,36 @@ class RAGContextRetriever:
         self,
         query: str,
         top_k: int,
+        query_embedding: list[float] | None = None,
+        timings: RetrievalTimings | None = None,
     ) -> list[Any]:
         """Run hybrid entity search with intent-based filtering and fallback.
 
         Args:
             query: The user's query text.
             top_k: Maximum number of entities to return.
+            query_embedding: Shared query embedding (None = embed per stage).
+            timings: Optional collector for the intent sub-stage timing.
 
         Returns:
             List of SearchResult objects (may be empty).
         """
-        intent = await self._intent_detector.detect_intent(query)
+        intent_started = time.perf_counter()
+        intent = await self._intent_detector.detect_intent(
+            query, query_embedding=query_embedding
+        )
+        if timings is not None:
+            timings.stages["intent"] = (time.perf_counter() - intent_started) * 1000
 
         # Pre-filter: Skip RAG if query clearly not HA-related
-        if not intent and not self._looks_ha_related(query):
+        if not intent and not looks_ha_related(query):
             _LOGGER.debug(
                 "RAG pre-filter: Query doesn't appear HA-related, skipping search: %s",
                 query[:100],
             )
             return []
 
-        where_filter = self._build_intent_filter(intent)
+        where_filter = build_intent_filter(intent)
         if where_filter:
             _LOGGER.debug(
                 "RAG using hybrid search with intent filters: %s (raw: %s)",
@@ -194,6 +284,7 @@ class RAGContextRetriever:
             top_k=top_k,
             where=where_filter if where_filter else None,
             min_similarity=RAG_MIN_SIMILARITY,
+            query_embedding=query_embedding,
         )
 
         # Fallback: if no results with filters, retry without
@@ -202,7 +293,10 @@ class RAGContextRetriever:
                 "RAG hybrid search with filters returned 0 results, falling back without filters"
             )
             results = await self._query_engine.hybrid_search(
-                query=query, top_k=top_k, min_similarity=RAG_MIN_SIMILARITY
+                query=query,
+                top_k=top_k,
+                min_similarity=RAG_MIN_SIMILARITY,
+                query_embedding=query_embedding,
             )
 
         if not results:
@@ -246,56 +340,3 @@ class RAGContextRetriever:
                     _LOGGER.error("Failed to remove stale entity %s: %s", entity_id, e)
 
         return valid
-
-    @staticmethod
-    def _looks_ha_related(query: str) -> bool:
-        """Cheap keyword check for Home Assistant relevance."""
-        query_lower = query.lower()
-        ha_keywords = [
-            "light",
-            "turn",
-            "switch",
-            "temperature",
-            "sensor",
-            "automation",
-            "scene",
-            "device",
-            "home",
-            "room",
-            "cover",
-            "blind",
-            "lock",
-            "fan",
-            "climate",
-            "thermostat",
-            "światło",
-            "światła",
-            "włącz",
-            "wyłącz",
-            "temperatura",
-            "czujnik",
-            "urządzenie",
-            "dom",
-            "pokój",
-            "roleta",
-        ]
-        return any(kw in query_lower for kw in ha_keywords)
-
-    @staticmethod
-    def _build_intent_filter(intent: dict[str, Any] | None) -> dict[str, Any]:
-        """Convert detected intent into a where-filter dict."""
-        if not intent:
-            return {}
-
-        where: dict[str, Any] = {}
-        domain = intent.get("domain")
-        if domain:
-            where["domain"] = domain
-        else:
-            device_class = intent.get("device_class")
-            if device_class:
-                where["device_class"] = device_class
-        area = intent.get("area")
-        if area:
-            where["area_name"] = area
-        return where
@@ -1,7 +1,8 @@
 """Embedding providers for RAG system.
 
 This module provides embedding generation using available AI providers.
-Supports Gemini OAuth (preferred), OpenAI, and Gemini API key as fallbacks.
+Supports OpenAI, Gemini API key and on-box local providers (a local
+OpenAI-compatible server or a CPU model, see ``_local_embed``).
 
 Includes SHA-256 content-addressable caching and batch embedding with retry.
 """
@@ -18,9 +19,23 @@ from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from ..const import (
+    CONF_EMBEDDING_PROVIDER,
+    CONF_LOCAL_EMBEDDING_MODEL,
+    CONF_LOCAL_EMBEDDING_URL,
+)
+from ..core.token_estimator import estimate_tokens
+from ..http_pool import borrowed_session, get_http_pool
+from ..rate_scheduler import Priority, get_account_limiter, request_priority
+from ._gemini_embed import GeminiBatchMixin, new_gemini_limiter
+from ._rate_limit import TokenBucket
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+
+    from ..http_pool import HttpPool
+    from ..rate_scheduler import AccountLimiter
     from .sqlite_store import SqliteStore
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,15 +45,14 @@ EMBEDDING_RETRY_MAX_ATTEMPTS = 3
 EMBEDDING_RETRY_BASE_DELAY = 0.5  # seconds
 EMBEDDING_RETRY_MAX_DELAY = 8.0  # seconds
 
-# Batch configuration for Gemini (which doesn't support native batch)
-GEMINI_BATCH_DELAY = 0.05  # 50ms between individual Gemini calls to avoid rate limits
-
 # Embedding dimensions for different providers
 EMBEDDING_DIMENSIONS = {
     "gemini": 3072,  # gemini-embedding-001
     "openai": 1536,  # text-embedding-3-small
 }
 
+_OPENAI_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
 
 class EmbeddingError(Exception):
     """Raised when embedding generation fails."""
@@ -72,9 +86,18 @@ class EmbeddingProvider(ABC):
     def provider_name(self) -> str:
         """Return the name of the embedding provider."""
 
+    async def async_setup(self) -> None:
+        """Prepare the provider before first use (no-op by default).
+
+        Local providers load their model or probe their dimension here.
+        """
+
+    async def async_close(self) -> None:
+        """Release network resources held by the provider (no-op by default)."""
+
 
 @dataclass
-class GeminiOAuthEmbeddings(EmbeddingProvider):
+class GeminiOAuthEmbeddings(GeminiBatchMixin, EmbeddingProvider):
     """Gemini embeddings using existing OAuth token from Gemini CLI.
 
     Uses the same OAuth authentication as the main GeminiOAuthClient.
@@ -83,11 +106,12 @@ class GeminiOAuthEmbeddings(EmbeddingProvider):
     hass: HomeAssistant
     config_entry: ConfigEntry
     model: str = "gemini-embedding-001"
+    http_pool: HttpPool | None = field(default=None, repr=False)
     _session: aiohttp.ClientSession | None = field(default=None, repr=False)
+    _limiter: TokenBucket = field(default_factory=new_gemini_limiter, repr=False)
+    _batch_supported: bool = field(default=True, repr=False)
 
-    ENDPOINT = (
-        "https://generativelanguage.googleapis.com/v1beta/models/{model}:embedContent"
-    )
+    _error_label = "Gemini embedding"
 
     @property
     def dimension(self) -> int:
@@ -113,8 +137,7 @@ class GeminiOAuthEmbeddings(EmbeddingProvider):
             if not refresh:
                 raise EmbeddingError("No refresh token available for Gemini OAuth")
 
-            async with aiohttp.ClientSession() as session:
-                new_tokens = await refresh_token(session, refresh)
+            new_tokens = await refresh_token(self._get_session(), refresh)
 
             # Update oauth_data and persist to config entry
             oauth_data.update(new_tokens)
@@ -126,13 +149,18 @@ class GeminiOAuthEmbeddings(EmbeddingProvider):
 
         return oauth_data["access_token"]
 
+    async def _auth_headers(self) -> dict[str, str]:
+        """Bearer token header (refreshed if expiring)."""
+        return {"Authorization": f"Bearer {await self._get_valid_token()}"}
+
     async def get_embeddings(
         self, texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT"
     ) -> list[list[float]]:
         """Generate embeddings using Gemini OAuth.
 
-        Sends requests sequentially (Gemini doesn't support batch embedding).
-        Rate limiting and retry are handled by the CachedEmbeddingProvider wrapper.
+        Sends ``batchEmbedContents`` requests (falling back to concurrent
+        single requests) under the provider's rate limiter.  Transient
+        failures are retried by the CachedEmbeddingProvider wrapper.
 
         Args:
             texts: List of texts to embed.
@@ -143,43 +171,7 @@ class GeminiOAuthEmbeddings(EmbeddingProvider):
             return []
 
         try:
-            token = await self._get_valid_token()
-            embeddings = []
-
-            async with aiohttp.ClientSession() as session:
-                for i, text in enumerate(texts):
-                    url = self.ENDPOINT.format(model=self.model)
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "Content-Type": "application/json",
-                    }
-                    payload = {
-                        "content": {"parts": [{"text": text}]},
-                        "taskType": task_type,
-                    }
-
-                    async with session.post(url, headers=headers, json=payload) as resp:
-                        if resp.status != 200:
-                            error_text = await resp.text()
-                            _LOGGER.error(
-                                "Gemini embedding failed: %s - %s",
-                                resp.status,
-                                error_text,
-                            )
-                            raise EmbeddingError(
-                                f"Gemini embedding failed: {resp.status} - {error_text[:200]}"
-                            )
-
-                        data = await resp.json()
-                        embedding = data.get("embedding", {}).get("values", [])
-                        if not embedding:
-                            raise EmbeddingError("No embedding in Gemini response")
-                        embeddings.append(embedding)
-
-                    # Small delay between requests to avoid rate limits
-                    if i < len(texts) - 1:
-                        await asyncio.sleep(GEMINI_BATCH_DELAY)
-
+            embeddings = await self._embed_texts(texts, task_type)
             _LOGGER.debug("Generated %d embeddings with Gemini OAuth", len(embeddings))
             return embeddings
 
@@ -191,15 +183,17 @@ class GeminiOAuthEmbeddings(EmbeddingProvider):
 
 
 @dataclass
-class GeminiApiKeyEmbeddings(EmbeddingProvider):
+class GeminiApiKeyEmbeddings(GeminiBatchMixin, EmbeddingProvider):
     """Gemini embeddings using API key."""
 
     api_key: str
     model: str = "gemini-embedding-001"
+    http_pool: HttpPool | None = field(default=None, repr=False)
+    _session: aiohttp.ClientSession | None = field(default=None, repr=False)
+    _limiter: TokenBucket = field(default_factory=new_gemini_limiter, repr=False)
+    _batch_supported: bool = field(default=True, repr=False)
 
-    ENDPOINT = (
-        "https://generativelanguage.googleapis.com/v1beta/models/{model}:embedContent"
-    )
+    _error_label = "Gemini API embedding"
 
     @property
     def dimension(self) -> int:
@@ -209,13 +203,18 @@ class GeminiApiKeyEmbeddings(EmbeddingProvider):
     def provider_name(self) -> str:
         return "gemini"
 
+    async def _auth_headers(self) -> dict[str, str]:
+        """API key header (keeps the key out of request URLs and logs)."""
+        return {"x-goog-api-key": self.api_key}
+
     async def get_embeddings(
         self, texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT"
     ) -> list[list[float]]:
         """Generate embeddings using Gemini API key.
 
-        Sends requests sequentially (Gemini doesn't support batch embedding).
-        Rate limiting and retry are handled by the CachedEmbeddingProvider wrapper.
+        Sends ``batchEmbedContents`` requests (falling back to concurrent
+        single requests) under the provider's rate limiter.  Transient
+        failures are retried by the CachedEmbeddingProvider wrapper.
 
         Args:
             texts: List of texts to embed.
@@ -226,39 +225,7 @@ class GeminiApiKeyEmbeddings(EmbeddingProvider):
             return []
 
         try:
-            embeddings = []
-
-            async with aiohttp.ClientSession() as session:
-                for i, text in enumerate(texts):
-                    url = f"{self.ENDPOINT.format(model=self.model)}?key={self.api_key}"
-                    headers = {"Content-Type": "application/json"}
-                    payload = {
-                        "content": {"parts": [{"text": text}]},
-                        "taskType": task_type,
-                    }
-
-                    async with session.post(url, headers=headers, json=payload) as resp:
-                        if resp.status != 200:
-                            error_text = await resp.text()
-                            _LOGGER.error(
-                                "Gemini API embedding failed: %s - %s",
-                                resp.status,
-                                error_text,
-                            )
-                            raise EmbeddingError(
-                                f"Gemini API embedding failed: {resp.status} - {error_text[:200]}"
-                            )
-
-                        data = await resp.json()
-                        embedding = data.get("embedding", {}).get("values", [])
-                        if not embedding:
-                            raise EmbeddingError("No embedding in Gemini response")
-                        embeddings.append(embedding)
-
-                    # Small delay between requests to avoid rate limits
-                    if i < len(texts) - 1:
-                        await asyncio.sleep(GEMINI_BATCH_DELAY)
-
+            embeddings = await self._embed_texts(texts, task_type)
             _LOGGER.debug(
                 "Generated %d embeddings with Gemini API key", len(embeddings)
             )
@@ -273,10 +240,17 @@ class GeminiApiKeyEmbeddings(EmbeddingProvider):
 
 @dataclass
 class OpenAIEmbeddings(EmbeddingProvider):
-    """OpenAI embeddings using text-embedding-3-small."""
+    """OpenAI embeddings using text-embedding-3-small.
+
+    With a ``limiter`` the requests go through the request scheduler of
+    this key and embedding model; multi-text batches (indexing) are queued
+    as bulk work behind single queries.
+    """
 
     api_key: str
     model: str = "text-embedding-3-small"
+    http_pool: HttpPool | None = field(default=None, repr=False)
+    limiter: AccountLimiter | None = field(default=None, repr=False)
 
     ENDPOINT = "https://api.openai.com/v1/embeddings"
 
@@ -293,8 +267,16 @@ class OpenAIEmbeddings(EmbeddingProvider):
         if not texts:
             return []
 
+        if self.limiter is not None:
+            tokens = sum(estimate_tokens(text) for text in texts)
+            if len(texts) > 1:
+                with request_priority(Priority.BULK, "embeddings"):
+                    await self.limiter.acquire(tokens)
+            else:
+                await self.limiter.acquire(tokens)
+
         try:
-            async with aiohttp.ClientSession() as session:
+            async with borrowed_session(self.http_pool) as session:
                 headers = {
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
@@ -305,8 +287,13 @@ class OpenAIEmbeddings(EmbeddingProvider):
                 }
 
                 async with session.post(
-                    self.ENDPOINT, headers=headers, json=payload
+                    self.ENDPOINT,
+                    headers=headers,
+                    json=payload,
+                    timeout=_OPENAI_TIMEOUT,
                 ) as resp:
+                    if self.limiter is not None:
+                        self.limiter.learn(resp.headers)
                     if resp.status != 200:
                         error_text = await resp.text()
                         _LOGGER.error(
@@ -343,8 +330,12 @@ def create_embedding_provider(
     """Create an embedding provider based on available configuration.
 
     Fallback chain:
-    1. OpenAI (if configured) - text-embedding-3-small (most reliable)
-    2. Gemini API key (if configured) - gemini-embedding-001
+    1. Local embedding endpoint (if ``local_embedding_url`` is configured)
+    2. Local CPU model (if ``embedding_provider`` is ``"local"``)
+    3. OpenAI (if configured) - text-embedding-3-small (most reliable)
+    4. Gemini API key (if configured) - gemini-embedding-001
+    5. The local chat server (``local_url``) via its /v1/embeddings endpoint
+    6. Local CPU model (if the optional ``fastembed`` package is installed)
 
     Note: Gemini OAuth tokens from Code Assist do NOT have scopes for
     the embeddings API (generativelanguage.googleapis.com), so we skip it.
@@ -360,24 +351,136 @@ def create_embedding_provider(
     Raises:
         EmbeddingError: If no embedding provider could be configured.
     """
-    # 1. Try OpenAI API key (most reliable for embeddings)
+    from ._local_embed import (
+        DEFAULT_LOCAL_ENDPOINT_MODEL,
+        DEFAULT_LOCAL_MODEL,
+        LocalEndpointEmbeddings,
+        LocalModelEmbeddings,
+        fastembed_available,
+    )
+
+    http_pool = get_http_pool(hass)
+
+    def _local_model() -> LocalModelEmbeddings:
+        return LocalModelEmbeddings(
+            model=config.get(CONF_LOCAL_EMBEDDING_MODEL) or DEFAULT_LOCAL_MODEL,
+            cache_dir=hass.config.path("homeclaw", "models"),
+        )
+
+    # 1. Explicit local embedding endpoint (Ollama, LM Studio, llama.cpp ...)
+    local_embedding_url = config.get(CONF_LOCAL_EMBEDDING_URL)
+    if local_embedding_url:
+        _LOGGER.info("Using local endpoint %s for embeddings", local_embedding_url)
+        return LocalEndpointEmbeddings(
+            url=local_embedding_url,
+            model=config.get(CONF_LOCAL_EMBEDDING_MODEL)
+            or DEFAULT_LOCAL_ENDPOINT_MODEL,
+            http_pool=http_pool,
+        )
+
+    # 2. Explicitly requested on-box model
+    if config.get(CONF_EMBEDDING_PROVIDER) == "local":
+        if not fastembed_available():
+            raise EmbeddingError(
+                "Local embeddings selected but the 'fastembed' package is not installed"
+            )
+        _LOGGER.info("Using local CPU model for embeddings")
+        return _local_model()
+
+    # 3. Try OpenAI API key (most reliable for embeddings)
     openai_token = config.get("openai_token")
     if openai_token and openai_token.startswith("sk-"):
         _LOGGER.info("Using OpenAI for embeddings")
-        return OpenAIEmbeddings(api_key=openai_token)
+        openai_embeddings = OpenAIEmbeddings(api_key=openai_token, http_pool=http_pool)
+        openai_embeddings.limiter = get_account_limiter(
+            hass,
+            openai_embeddings.ENDPOINT,
+            openai_token,
+            model=openai_embeddings.model,
+        )
+        return openai_embeddings
 
-    # 2. Try Gemini API key
+    # 4. Try Gemini API key
     gemini_token = config.get("gemini_token")
     if gemini_token:
         _LOGGER.info("Using Gemini API key for embeddings")
-        return GeminiApiKeyEmbeddings(api_key=gemini_token)
+        return GeminiApiKeyEmbeddings(api_key=gemini_token, http_pool=http_pool)
+
+    # 5. The local chat server usually serves embeddings too
+    local_url = config.get("local_url")
+    if local_url:
+        _LOGGER.info("Using local chat server %s for embeddings", local_url)
+        return LocalEndpointEmbeddings(
+            url=local_url,
+            model=config.get(CONF_LOCAL_EMBEDDING_MODEL)
+            or DEFAULT_LOCAL_ENDPOINT_MODEL,
+            http_pool=http_pool,
+        )
+
+    # 6. Offline fallback when the optional dependency is present
+    if fastembed_available():
+        _LOGGER.info("Using local CPU model for embeddings")
+        return _local_model()
 
     raise EmbeddingError(
-        "No embedding provider available. Configure OpenAI API key or Gemini API key. "
+        "No embedding provider available. Configure OpenAI API key, Gemini API key "
+        "or a local embedding endpoint. "
         "Note: Gemini OAuth (Code Assist) tokens don't support embeddings API."
     )
 
 
+async def async_create_embedding_provider(
+    hass: HomeAssistant,
+    config: dict[str, Any],
+    config_entry: ConfigEntry | None = None,
+    *,
+    stored_dimension: int | None = None,
+) -> EmbeddingProvider:
+    """Create the embedding provider and run its ``async_setup``.
+
+    A local embedding server that is down at startup does not fail RAG
+    initialization: with ``stored_dimension`` (the dimension of an index
+    built from a local endpoint) the dimension probe is deferred to the
+    first embed call, otherwise the next provider of the chain is used.
+
+    Raises:
+        EmbeddingError: If no embedding provider could be set up.
+    """
+    from ._local_embed import LocalEndpointEmbeddings
+
+    config = dict(config)
+    while True:
+        provider = create_embedding_provider(hass, config, config_entry)
+        try:
+            await provider.async_setup()
+            return provider
+        except EmbeddingError as err:
+            if not isinstance(provider, LocalEndpointEmbeddings):
+                raise
+            if stored_dimension:
+                _LOGGER.warning(
+                    "Local embedding endpoint %s unavailable (%s), assuming the "
+                    "indexed dimension %d until it answers",
+                    provider.url,
+                    err,
+                    stored_dimension,
+                )
+                provider.dimension_hint = stored_dimension
+                return provider
+            _LOGGER.warning(
+                "Local embedding endpoint %s unavailable (%s), trying the next "
+                "embedding provider",
+                provider.url,
+                err,
+            )
+            await provider.async_close()
+            # Drop the endpoint that failed (the explicit one is tried first)
+            if config.get(CONF_LOCAL_EMBEDDING_URL):
+                config[CONF_LOCAL_EMBEDDING_URL] = None
+            else:
+                config["local_url"] = None
+
+
 async def get_embedding_for_query(
     provider: EmbeddingProvider,
     query: str,
@@ -394,6 +497,27 @@ async def get_embedding_for_query(
     Returns:
         The embedding vector for the query.
     """
+    return (await get_embeddings_for_queries(provider, [query]))[0]
+
+
+async def get_embeddings_for_queries(
+    provider: EmbeddingProvider,
+    queries: list[str],
+) -> list[list[float]]:
+    """Embed several query texts with a single provider call.
+
+    Same task type handling as ``get_embedding_for_query``.
+
+    Args:
+        provider: The embedding provider to use.
+        queries: The query texts to embed.
+
+    Returns:
+        One embedding vector per query, in order.
+
+    Raises:
+        EmbeddingError: If the provider did not return one vector per query.
+    """
     # Use RETRIEVAL_QUERY task type if provider supports it (Gemini)
     kwargs: dict[str, Any] = {}
     if isinstance(provider, CachedEmbeddingProvider):
@@ -404,10 +528,10 @@ async def get_embedding_for_query(
     elif isinstance(provider, (GeminiOAuthEmbeddings, GeminiApiKeyEmbeddings)):
         kwargs["task_type"] = "RETRIEVAL_QUERY"
 
-    embeddings = await provider.get_embeddings([query], **kwargs)
-    if not embeddings:
+    embeddings = await provider.get_embeddings(queries, **kwargs)
+    if not embeddings or len(embeddings) < len(queries):
         raise EmbeddingError("Failed to generate query embedding")
-    return embeddings[0]
+    return embeddings
 
 
 def _hash_text(text: str) -> str:
@@ -507,7 +631,7 @@ class CachedEmbeddingProvider(EmbeddingProvider):
 
     Also adds:
     - Retry with exponential backoff on retryable errors (429, 5xx)
-    - Batch support for Gemini (sends texts sequentially with small delay)
+    - Batch support for Gemini (batchEmbedContents under a token bucket)
     - LRU cache pruning to prevent unbounded growth
     """
 
@@ -544,7 +668,7 @@ class CachedEmbeddingProvider(EmbeddingProvider):
         hashes = [_hash_text(t) for t in texts]
 
         # 2. Bulk cache lookup
-        cached = self.store.cache_lookup(provider, model, hashes)
+        cached = await self.store.async_cache_lookup(provider, model, hashes)
 
         # 3. Separate hits from misses
         embeddings: list[list[float] | None] = [None] * len(texts)
@@ -598,10 +722,10 @@ class CachedEmbeddingProvider(EmbeddingProvider):
                 embeddings[idx] = new_embeddings[j]
                 to_cache.append((content_hash, new_embeddings[j]))
 
-        # 6. Store new embeddings in cache (fire-and-forget, non-blocking)
+        # 6. Store new embeddings in cache (runs on the DB worker, off the loop)
         if to_cache:
             try:
-                self.store.cache_upsert(provider, model, to_cache)
+                await self.store.async_cache_upsert(provider, model, to_cache)
             except Exception as e:
                 _LOGGER.warning("Failed to update embedding cache: %s", e)
 
@@ -609,13 +733,21 @@ class CachedEmbeddingProvider(EmbeddingProvider):
         total_ops = self._cache_hits + self._cache_misses
         if total_ops > 0 and total_ops % 500 == 0:
             try:
-                self.store.cache_prune(max_entries=10000)
+                await self.store.async_cache_prune(max_entries=10000)
             except Exception as e:
                 _LOGGER.warning("Cache prune failed: %s", e)
 
         # Filter out any None entries (shouldn't happen but safety)
         return [e for e in embeddings if e is not None]
 
+    async def async_setup(self) -> None:
+        """Set up the wrapped provider."""
+        await self.inner.async_setup()
+
+    async def async_close(self) -> None:
+        """Close the wrapped provider."""
+        await self.inner.async_close()
+
     def _get_model_name(self) -> str:
         """Get the model name from the inner provider."""
         model = getattr(self.inner, "model", None)
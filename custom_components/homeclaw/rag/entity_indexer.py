@@ -6,7 +6,11 @@ for the vector database.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -22,6 +26,15 @@ _LOGGER = logging.getLogger(__name__)
 # Batch size for embedding generation to avoid rate limits
 EMBEDDING_BATCH_SIZE = 50
 
+# Embedding batches in flight at once during a full reindex
+REINDEX_EMBED_CONCURRENCY = 3
+
+# Batches buffered between reindex pipeline stages (bounds memory use)
+REINDEX_QUEUE_SIZE = 4
+
+# Type alias for progress callback
+ProgressCallback = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+
 
 @dataclass
 class EntityDocument:
@@ -30,19 +43,37 @@ class EntityDocument:
     id: str  # entity_id
     text: str  # searchable text
     metadata: dict[str, Any]  # domain, area, state, learned_category, etc.
+    embed_text: str = ""  # stable part of ``text`` that gets embedded
+
+    @property
+    def embed_hash(self) -> str:
+        """Hash of the embedded text, compared to skip re-embedding."""
+        return hashlib.sha256((self.embed_text or self.text).encode("utf-8")).hexdigest()
 
 
 @dataclass
 class EntityIndexer:
     """Indexes Home Assistant entities into the vector database.
 
-    Converts entities to searchable documents with embeddings.
+    Converts entities to searchable documents with embeddings.  The embedding
+    is computed from the stable description of the entity (name, domain,
+    device class, area, learned category) while the stored text and FTS row
+    also carry the volatile state, so a state change only re-embeds an
+    entity when its stable description changed too.
     """
 
     hass: HomeAssistant
     store: SqliteStore
     embedding_provider: EmbeddingProvider
     _learned_categories: dict[str, str] = field(default_factory=dict)
+    _embeddings_generated: int = field(default=0, repr=False)
+    _embeddings_avoided: int = field(default=0, repr=False)
+    _reindex_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def reindex_running(self) -> bool:
+        """Whether a full reindex is in progress."""
+        return self._reindex_lock.locked()
 
     def set_learned_categories(self, categories: dict[str, str]) -> None:
         """Set learned categories from semantic learner.
@@ -263,6 +294,15 @@ class EntityIndexer:
             state=state_value,
         )
 
+        embed_text = self._build_document_text(
+            entity_id=entity_id,
+            friendly_name=friendly_name,
+            domain=domain,
+            device_class=device_class,
+            area_name=area_name,
+            state=None,
+        )
+
         metadata = self._build_metadata(
             entity_id=entity_id,
             domain=domain,
@@ -273,7 +313,9 @@ class EntityIndexer:
             friendly_name=friendly_name,
         )
 
-        return EntityDocument(id=entity_id, text=text, metadata=metadata)
+        return EntityDocument(
+            id=entity_id, text=text, metadata=metadata, embed_text=embed_text
+        )
 
     async def index_entity(self, entity_id: str) -> None:
         """Index or reindex a single entity.
@@ -287,24 +329,69 @@ class EntityIndexer:
             return
 
         try:
-            # Generate embedding
-            embeddings = await self.embedding_provider.get_embeddings([doc.text])
-            if not embeddings:
-                _LOGGER.warning("Failed to generate embedding for %s", entity_id)
-                return
-
-            # Upsert to store
-            await self.store.upsert_documents(
-                ids=[doc.id],
-                texts=[doc.text],
-                embeddings=embeddings,
-                metadatas=[doc.metadata],
-            )
+            await self._index_documents([doc])
             _LOGGER.debug("Indexed entity: %s", entity_id)
 
         except Exception as e:
             _LOGGER.error("Failed to index entity %s: %s", entity_id, e)
 
+    async def _index_documents(self, docs: list[EntityDocument]) -> None:
+        """Write documents, embedding only those whose stable text changed.
+
+        Documents whose embedded-text hash matches the stored one keep their
+        vector and only get their text and metadata refreshed.
+
+        Args:
+            docs: Documents to write.
+        """
+        try:
+            stored = await self.store.get_embed_hashes([doc.id for doc in docs])
+        except Exception as e:
+            _LOGGER.debug("Embedding hashes unavailable, re-embedding: %s", e)
+            stored = {}
+
+        unchanged = [doc for doc in docs if stored.get(doc.id) == doc.embed_hash]
+        changed = [doc for doc in docs if stored.get(doc.id) != doc.embed_hash]
+
+        if unchanged:
+            await self.store.update_documents_text(
+                ids=[doc.id for doc in unchanged],
+                texts=[doc.text for doc in unchanged],
+                metadatas=[doc.metadata for doc in unchanged],
+            )
+            self._embeddings_avoided += len(unchanged)
+
+        if not changed:
+            return
+
+        embeddings = await self.embedding_provider.get_embeddings(
+            [doc.embed_text or doc.text for doc in changed]
+        )
+        if not embeddings:
+            _LOGGER.warning("Failed to generate embeddings for %d entities", len(changed))
+            return
+        self._embeddings_generated += len(changed)
+
+        await self.store.upsert_documents(
+            ids=[doc.id for doc in changed],
+            texts=[doc.text for doc in changed],
+            embeddings=embeddings,
+            metadatas=[doc.metadata for doc in changed],
+            embed_hashes=[doc.embed_hash for doc in changed],
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Get incremental indexing counters.
+
+        Returns:
+            Embeddings generated and embeddings avoided because only the
+            entity state changed.
+        """
+        return {
+            "embeddings_generated": self._embeddings_generated,
+            "embeddings_avoided": self._embeddings_avoided,
+        }
+
     async def remove_entity(self, entity_id: str) -> None:
         """Remove an entity from the index.
 
@@ -317,64 +404,154 @@ class EntityIndexer:
         except Exception as e:
             _LOGGER.error("Failed to remove entity %s: %s", entity_id, e)
 
-    async def full_reindex(self) -> None:
+    async def full_reindex(
+        self, progress_callback: ProgressCallback | None = None
+    ) -> bool:
         """Perform a full reindex of all entities.
 
-        Clears the existing index and reindexes all entities
-        from the Home Assistant entity registry.
-        """
-        _LOGGER.info("Starting full entity reindex...")
-
-        try:
-            # Clear existing documents
-            await self.store.clear_collection()
+        Rebuilds the index from the Home Assistant entity registry into the
+        store's shadow table and swaps it in once complete, so the live
+        index keeps serving searches meanwhile.  Documents flow through a
+        bounded pipeline: building, embedding (``REINDEX_EMBED_CONCURRENCY``
+        batches at once) and writing, each written batch advancing the
+        reindex checkpoint.
 
-            # Get all entities from registry
-            registry = self._get_entity_registry()
-            entities = list(registry.entities.values())
+        An interrupted run, or one with failed embedding batches, leaves its
+        checkpoint behind; the next call resumes it and only embeds what is
+        missing.
 
-            _LOGGER.info("Indexing %d entities...", len(entities))
-
-            # Process in batches to avoid rate limits
-            all_docs: list[EntityDocument] = []
+        Args:
+            progress_callback: Optional async callback receiving progress
+                events (``start``, ``progress``, ``complete``, ``incomplete``).
 
-            for entry in entities:
-                doc = await self._get_entity_data(entry.entity_id)
-                if doc:
-                    all_docs.append(doc)
+        Returns:
+            True if the new index was swapped in, False if it was left
+            incomplete to be resumed.
+        """
+        async with self._reindex_lock:
+            try:
+                return await self._full_reindex(progress_callback)
+            except Exception as e:
+                _LOGGER.exception("Full reindex failed: %s", e)
+                raise
+
+    async def _full_reindex(self, progress_callback: ProgressCallback | None) -> bool:
+        """Run ``full_reindex`` (caller holds the reindex lock)."""
+        started = time.monotonic()
+        signature = (
+            f"{self.embedding_provider.provider_name}:{self.embedding_provider.dimension}"
+        )
+        resumed = await self.store.begin_shadow_reindex(signature)
 
-            # Generate embeddings in batches
-            for i in range(0, len(all_docs), EMBEDDING_BATCH_SIZE):
-                batch = all_docs[i : i + EMBEDDING_BATCH_SIZE]
-                texts = [doc.text for doc in batch]
+        registry = self._get_entity_registry()
+        entity_ids = [entry.entity_id for entry in registry.entities.values()]
+        total = len(entity_ids)
+        _LOGGER.info(
+            "Starting full entity reindex of %d entities (%d already done)...",
+            total,
+            len(resumed),
+        )
+        await _send_progress(
+            progress_callback, "start", total=total, resumed=len(resumed)
+        )
 
+        embed_queue: asyncio.Queue[list[EntityDocument] | None] = asyncio.Queue(
+            REINDEX_QUEUE_SIZE
+        )
+        write_queue: asyncio.Queue[
+            tuple[list[EntityDocument], list[list[float]]] | None
+        ] = asyncio.Queue(REINDEX_QUEUE_SIZE)
+        embedders_left = REINDEX_EMBED_CONCURRENCY
+        failed = 0
+        indexed = 0
+
+        async def build() -> None:
+            nonlocal indexed
+            batch: list[EntityDocument] = []
+            for entity_id in entity_ids:
+                doc = await self._get_entity_data(entity_id)
+                if doc is None:
+                    continue
+                if resumed.get(doc.id) == doc.embed_hash:
+                    indexed += 1
+                    self._embeddings_avoided += 1
+                    continue
+                batch.append(doc)
+                if len(batch) == EMBEDDING_BATCH_SIZE:
+                    await embed_queue.put(batch)
+                    batch = []
+            if batch:
+                await embed_queue.put(batch)
+            for _ in range(REINDEX_EMBED_CONCURRENCY):
+                await embed_queue.put(None)
+
+        async def embed() -> None:
+            nonlocal embedders_left, failed
+            while (batch := await embed_queue.get()) is not None:
                 try:
-                    embeddings = await self.embedding_provider.get_embeddings(texts)
-
-                    await self.store.add_documents(
-                        ids=[doc.id for doc in batch],
-                        texts=texts,
-                        embeddings=embeddings,
-                        metadatas=[doc.metadata for doc in batch],
+                    embeddings = await self.embedding_provider.get_embeddings(
+                        [doc.embed_text or doc.text for doc in batch]
                     )
-
-                    _LOGGER.debug(
-                        "Indexed batch %d-%d of %d",
-                        i + 1,
-                        min(i + EMBEDDING_BATCH_SIZE, len(all_docs)),
-                        len(all_docs),
-                    )
-
+                    if len(embeddings) != len(batch):
+                        raise ValueError(
+                            f"got {len(embeddings)} embeddings for {len(batch)} texts"
+                        )
                 except Exception as e:
-                    _LOGGER.error("Failed to index batch: %s", e)
-                    # Continue with next batch
+                    _LOGGER.error("Failed to embed reindex batch: %s", e)
+                    failed += len(batch)
+                    continue
+                self._embeddings_generated += len(batch)
+                await write_queue.put((batch, embeddings))
+            embedders_left -= 1
+            if not embedders_left:
+                await write_queue.put(None)
+
+        async def write() -> None:
+            nonlocal indexed
+            while (item := await write_queue.get()) is not None:
+                batch, embeddings = item
+                await self.store.write_shadow_documents(
+                    ids=[doc.id for doc in batch],
+                    texts=[doc.text for doc in batch],
+                    embeddings=embeddings,
+                    metadatas=[doc.metadata for doc in batch],
+                    embed_hashes=[doc.embed_hash for doc in batch],
+                )
+                indexed += len(batch)
+                _LOGGER.debug("Reindexed %d of %d entities", indexed, total)
+                await _send_progress(
+                    progress_callback, "progress", indexed=indexed, total=total
+                )
+
+        await _run_pipeline(
+            [build(), *(embed() for _ in range(REINDEX_EMBED_CONCURRENCY)), write()]
+        )
 
-            final_count = await self.store.get_document_count()
-            _LOGGER.info("Full reindex complete. Indexed %d entities.", final_count)
+        if failed:
+            _LOGGER.warning(
+                "Full reindex incomplete: %d entities failed to embed; "
+                "the live index is unchanged and the reindex will resume",
+                failed,
+            )
+            await _send_progress(
+                progress_callback, "incomplete", indexed=indexed, failed=failed, total=total
+            )
+            return False
 
-        except Exception as e:
-            _LOGGER.exception("Full reindex failed: %s", e)
-            raise
+        live_ids = [entry.entity_id for entry in registry.entities.values()]
+        final_count = await self.store.swap_shadow_table(live_ids)
+        duration = time.monotonic() - started
+        _LOGGER.info(
+            "Full reindex complete. Indexed %d entities in %.1fs.", final_count, duration
+        )
+        await _send_progress(
+            progress_callback,
+            "complete",
+            indexed=final_count,
+            total=total,
+            duration_seconds=round(duration, 1),
+        )
+        return True
 
     async def index_entities_batch(self, entity_ids: list[str]) -> None:
         """Index multiple entities in a batch.
@@ -395,16 +572,71 @@ class EntityIndexer:
             return
 
         try:
-            texts = [doc.text for doc in docs]
-            embeddings = await self.embedding_provider.get_embeddings(texts)
-
-            await self.store.upsert_documents(
-                ids=[doc.id for doc in docs],
-                texts=texts,
-                embeddings=embeddings,
-                metadatas=[doc.metadata for doc in docs],
-            )
+            await self._index_documents(docs)
             _LOGGER.debug("Batch indexed %d entities", len(docs))
 
         except Exception as e:
             _LOGGER.error("Failed to batch index entities: %s", e)
+
+    async def reembed_unhashed(self) -> int:
+        """Re-embed documents stored without an embedded-text hash.
+
+        Rows written before hashes were recorded were embedded from the
+        full text (including the state); without this they would keep
+        that vector until the entity itself changes.  Rows of entities no
+        longer in the registry are dropped instead, so they are not
+        retried on every start.
+
+        Returns:
+            Number of documents considered.
+        """
+        entity_ids = await self.store.get_unhashed_ids()
+        if not entity_ids:
+            return 0
+
+        registry = self._get_entity_registry()
+        known: list[str] = []
+        orphans: list[str] = []
+        for entity_id in entity_ids:
+            (known if registry.async_get(entity_id) else orphans).append(entity_id)
+        if orphans:
+            _LOGGER.info(
+                "Dropping %d unhashed entities no longer in the registry",
+                len(orphans),
+            )
+            await self.store.delete_documents(orphans)
+
+        if known:
+            _LOGGER.info(
+                "Re-embedding %d entities stored without an embedding hash",
+                len(known),
+            )
+        for i in range(0, len(known), EMBEDDING_BATCH_SIZE):
+            await self.index_entities_batch(known[i : i + EMBEDDING_BATCH_SIZE])
+        return len(entity_ids)
+
+
+async def _run_pipeline(stages: list[Coroutine[Any, Any, None]]) -> None:
+    """Run pipeline stages concurrently; the first failure cancels the rest."""
+    tasks = [asyncio.create_task(stage) for stage in stages]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def _send_progress(
+    callback: ProgressCallback | None, event_type: str, **kwargs: Any
+) -> None:
+    """Send a reindex progress event via the callback (if any)."""
+    if callback is None:
+        return
+    try:
+        await callback({"type": event_type, **kwargs})
+    except Exception:
+        pass  # Progress reporting is non-critical
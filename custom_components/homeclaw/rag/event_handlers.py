@@ -9,12 +9,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from homeassistant.core import Event, HomeAssistant
 
+    from ._context_cache import ContextCache
+
 from .entity_indexer import EntityIndexer
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,11 +35,14 @@ class EntityRegistryEventHandler:
     """Handles entity registry events for RAG reindexing.
 
     Listens to entity added/removed/updated events and triggers
-    appropriate reindexing operations.
+    appropriate reindexing operations.  Cached RAG contexts that mention a
+    removed or reindexed entity are invalidated; a new entity may match any
+    query, so creation clears the whole context cache.
     """
 
     hass: HomeAssistant
     indexer: EntityIndexer
+    context_cache: ContextCache | None = None
     _unsub_listener: Callable[[], None] | None = field(default=None, repr=False)
     _started: bool = field(default=False, repr=False)
 
@@ -116,6 +122,8 @@ class EntityRegistryEventHandler:
             await self.indexer.index_entity(entity_id)
         except Exception as e:
             _LOGGER.error("Failed to index new entity %s: %s", entity_id, e)
+        if self.context_cache is not None:
+            self.context_cache.clear()
 
     async def _on_entity_removed(self, entity_id: str) -> None:
         """Handle entity removed event.
@@ -128,6 +136,8 @@ class EntityRegistryEventHandler:
             await self.indexer.remove_entity(entity_id)
         except Exception as e:
             _LOGGER.error("Failed to remove entity %s from index: %s", entity_id, e)
+        if self.context_cache is not None:
+            self.context_cache.invalidate_entities([entity_id])
 
     async def _on_entity_updated(
         self,
@@ -167,6 +177,8 @@ class EntityRegistryEventHandler:
                     _LOGGER.error(
                         "Failed to remove old entity %s: %s", old_entity_id, e
                     )
+                if self.context_cache is not None:
+                    self.context_cache.invalidate_entities([old_entity_id])
 
         if changes and not relevant_changes.intersection(changes.keys()):
             _LOGGER.debug(
@@ -180,6 +192,8 @@ class EntityRegistryEventHandler:
             await self.indexer.index_entity(entity_id)
         except Exception as e:
             _LOGGER.error("Failed to reindex updated entity %s: %s", entity_id, e)
+        if self.context_cache is not None:
+            self.context_cache.invalidate_entities([entity_id])
 
 
 @dataclass
@@ -188,11 +202,17 @@ class StateChangeHandler:
 
     Now enabled by default because state is included in searchable text.
     Uses debouncing to prevent API explosion from frequent sensor updates.
+    State is kept out of the embedded text (see ``EntityIndexer``), so a
+    plain state flip only refreshes the stored text and FTS row; the
+    embedding is regenerated only when name, area, device class or learned
+    category changed.  Cached RAG contexts that mention a reindexed entity
+    are invalidated once its new state is in the index.
     """
 
     hass: HomeAssistant
     indexer: EntityIndexer
     enabled: bool = True  # Enabled by default now
+    context_cache: ContextCache | None = None
     _unsub_listener: Callable[[], None] | None = field(default=None, repr=False)
     _pending_updates: dict[str, float] = field(default_factory=dict, repr=False)
     _update_task: asyncio.Task | None = field(default=None, repr=False)
@@ -237,6 +257,7 @@ class StateChangeHandler:
                     await self.indexer.index_entity(entity_id)
                 except Exception as e:
                     _LOGGER.error("Failed to reindex %s: %s", entity_id, e)
+            self._invalidate_cached(self._pending_updates)
 
         _LOGGER.info("RAG state change handler stopped")
 
@@ -346,6 +367,13 @@ class StateChangeHandler:
                                     e2,
                                 )
 
+                    self._invalidate_cached(batch)
+
                     # Small delay between batches to avoid rate limits
                     if i + BATCH_SIZE < len(entities_to_update):
                         await asyncio.sleep(0.5)
+
+    def _invalidate_cached(self, entity_ids: Iterable[str]) -> None:
+        """Drop cached RAG contexts that mention any of ``entity_ids``."""
+        if self.context_cache is not None:
+            self.context_cache.invalidate_entities(entity_ids)
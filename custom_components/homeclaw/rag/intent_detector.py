@@ -3,16 +3,34 @@
 This module detects user intent (domain, device_class, area) from queries
 using semantic similarity with prototype queries, eliminating the need
 for hardcoded keyword lists.
+
+Prototype embeddings are computed with a single batch call and persisted in
+the SQLite store under a hash of ``INTENT_PROTOTYPES`` and the embedding
+model, so the embedding API is only hit when either changes.  At query time
+the prototypes are scored as one stacked matrix and the best prototype per
+intent type is picked with a single masked argmax.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from dataclasses import dataclass, field
 from typing import Any
 
 from ._store_utils import cosine_similarity
-from .embeddings import EmbeddingProvider, get_embedding_for_query
+from .embeddings import (
+    CachedEmbeddingProvider,
+    EmbeddingProvider,
+    get_embedding_for_query,
+    get_embeddings_for_queries,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with Home Assistant core
+    np = None
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -205,49 +223,171 @@ INTENT_PROTOTYPES: dict[str, list[str]] = {
 }
 
 
+def prototype_table_hash(provider: EmbeddingProvider) -> str:
+    """Hash of ``INTENT_PROTOTYPES`` and the model that embeds them."""
+    if isinstance(provider, CachedEmbeddingProvider):
+        provider = provider.inner
+    model = getattr(provider, "model", None)
+    signature = json.dumps(
+        {
+            "prototypes": INTENT_PROTOTYPES,
+            "provider": provider.provider_name,
+            "model": model if isinstance(model, str) else "",
+            "dimension": provider.dimension,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+
+class _PrototypeMatrix:
+    """Prototype embeddings stacked for one-shot, per-intent-type matching."""
+
+    def __init__(self, prototypes: dict[str, list[float]]) -> None:
+        """Build from ``"intent_type:value:query" -> embedding`` entries."""
+        self.intent_types: list[str] = []
+        self._values: list[str] = []
+        self._type_of_row: list[int] = []
+        self._vectors: list[list[float]] = []
+
+        for cache_key, embedding in prototypes.items():
+            parts = cache_key.split(":", 2)
+            if len(parts) < 3:
+                continue
+            intent_type, intent_value = parts[0], parts[1]
+            if intent_type not in self.intent_types:
+                self.intent_types.append(intent_type)
+            self._type_of_row.append(self.intent_types.index(intent_type))
+            self._values.append(intent_value)
+            self._vectors.append(list(embedding))
+
+        self._matrix: Any = None
+        self._mask: Any = None
+        dims = {len(v) for v in self._vectors}
+        if np is not None and len(dims) == 1 and 0 not in dims:
+            matrix = np.asarray(self._vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._matrix = np.divide(
+                matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+            )
+            # intent type x prototype row membership
+            self._mask = np.arange(len(self.intent_types))[:, None] == np.asarray(
+                self._type_of_row
+            )
+
+    def __len__(self) -> int:
+        """Number of prototypes."""
+        return len(self._values)
+
+    def best_matches(self, query_embedding: list[float]) -> dict[str, tuple[str, float]]:
+        """Return ``intent_type -> (value, score)`` of the best prototype per type."""
+        if not self._values:
+            return {}
+        if self._matrix is None:
+            return self._best_matches_python(query_embedding)
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(query)) if query.shape[0] else 0.0
+        if not norm or query.shape[0] != self._matrix.shape[1]:
+            return {}
+
+        sims = self._matrix @ (query / norm)
+        per_type = np.where(self._mask, sims, -np.inf)
+        best_rows = per_type.argmax(axis=1)
+        return {
+            intent_type: (self._values[row], float(sims[row]))
+            for intent_type, row in zip(self.intent_types, best_rows.tolist())
+        }
+
+    def _best_matches_python(
+        self, query_embedding: list[float]
+    ) -> dict[str, tuple[str, float]]:
+        """Pure-Python fallback of ``best_matches``."""
+        best: dict[str, tuple[str, float]] = {}
+        for row, vector in enumerate(self._vectors):
+            intent_type = self.intent_types[self._type_of_row[row]]
+            score = cosine_similarity(query_embedding, vector)
+            current = best.get(intent_type)
+            if current is None or score > current[1]:
+                best[intent_type] = (self._values[row], score)
+        return best
+
+
 @dataclass
 class IntentDetector:
-    """Detects user intent using semantic similarity with cached prototypes."""
+    """Detects user intent using semantic similarity with cached prototypes.
+
+    Args:
+        embedding_provider: Provider used to embed prototypes and queries.
+        store: Optional SqliteStore persisting the prototype embeddings.
+    """
 
     embedding_provider: EmbeddingProvider
+    store: Any | None = None  # SqliteStore
     _prototype_cache: dict[str, list[float]] = field(default_factory=dict)
     _initialized: bool = field(default=False)
+    _matrix: _PrototypeMatrix | None = field(default=None, repr=False)
 
     async def async_initialize(self) -> None:
-        """Pre-compute and cache embeddings for all prototype queries."""
+        """Load or compute embeddings for all prototype queries."""
         if self._initialized:
             return
 
         _LOGGER.info("Initializing semantic intent detector...")
-        total_prototypes = sum(len(protos) for protos in INTENT_PROTOTYPES.values())
-        cached = 0
+        keys = [
+            f"{intent_key}:{proto_query}"
+            for intent_key, prototypes in INTENT_PROTOTYPES.items()
+            for proto_query in prototypes
+        ]
+        table_hash = prototype_table_hash(self.embedding_provider)
 
-        for intent_key, prototypes in INTENT_PROTOTYPES.items():
-            for proto_query in prototypes:
+        stored = None
+        if self.store is not None:
+            stored = await self.store.load_intent_prototypes(table_hash)
+
+        if stored is not None and set(stored) == set(keys):
+            self._prototype_cache = {key: stored[key] for key in keys}
+            source = "store"
+        else:
+            try:
+                embeddings = await get_embeddings_for_queries(
+                    self.embedding_provider,
+                    [key.split(":", 2)[2] for key in keys],
+                )
+                self._prototype_cache = dict(zip(keys, embeddings))
+                source = "embedding API"
+            except Exception as e:
+                _LOGGER.warning("Failed to embed intent prototypes: %s", e)
+                self._prototype_cache = {}
+                source = "nowhere"
+
+            if self._prototype_cache and self.store is not None:
                 try:
-                    embedding = await get_embedding_for_query(
-                        self.embedding_provider, proto_query
+                    await self.store.save_intent_prototypes(
+                        table_hash, self._prototype_cache
                     )
-                    cache_key = f"{intent_key}:{proto_query}"
-                    self._prototype_cache[cache_key] = embedding
-                    cached += 1
                 except Exception as e:
-                    _LOGGER.warning(
-                        "Failed to cache embedding for '%s': %s", proto_query, e
-                    )
+                    _LOGGER.warning("Failed to persist intent prototypes: %s", e)
 
+        self._matrix = None
         self._initialized = True
         _LOGGER.info(
-            "Intent detector initialized: %d/%d prototypes cached",
-            cached,
-            total_prototypes,
+            "Intent detector initialized: %d/%d prototypes loaded from %s",
+            len(self._prototype_cache),
+            len(keys),
+            source,
         )
 
-    async def detect_intent(self, query: str) -> dict[str, Any]:
+    async def detect_intent(
+        self, query: str, query_embedding: list[float] | None = None
+    ) -> dict[str, Any]:
         """Detect intent from query using semantic similarity.
 
         Args:
             query: The user's query text.
+            query_embedding: Pre-computed query embedding (skips embedding
+                the query again when the caller already has it).
 
         Returns:
             Dictionary with detected intent filters:
@@ -259,34 +399,27 @@ class IntentDetector:
             _LOGGER.warning("Intent detector not initialized, returning empty intent")
             return {}
 
-        try:
-            # Get embedding for the query
-            query_embedding = await get_embedding_for_query(
-                self.embedding_provider, query
-            )
-        except Exception as e:
-            _LOGGER.warning("Failed to get query embedding for intent: %s", e)
-            return {}
+        if query_embedding is None:
+            try:
+                # Get embedding for the query
+                query_embedding = await get_embedding_for_query(
+                    self.embedding_provider, query
+                )
+            except Exception as e:
+                _LOGGER.warning("Failed to get query embedding for intent: %s", e)
+                return {}
 
-        # Find best matching intents for each type
+        # Best prototype per intent type, from one pass over the matrix
+        if self._matrix is None:
+            self._matrix = _PrototypeMatrix(self._prototype_cache)
         intent: dict[str, Any] = {}
-        best_scores: dict[str, tuple[str, float]] = {}  # type -> (value, score)
-
-        for cache_key, proto_embedding in self._prototype_cache.items():
-            # Parse cache key: "intent_type:value:proto_query"
-            parts = cache_key.split(":", 2)
-            if len(parts) < 3:
-                continue
-
-            intent_type = parts[0]  # "domain", "device_class", "area"
-            intent_value = parts[1]  # e.g., "temperature", "light", "bedroom"
-
-            score = cosine_similarity(query_embedding, proto_embedding)
-
-            if score >= INTENT_THRESHOLD:
-                current_best = best_scores.get(intent_type)
-                if current_best is None or score > current_best[1]:
-                    best_scores[intent_type] = (intent_value, score)
+        best_scores = {
+            intent_type: match
+            for intent_type, match in self._matrix.best_matches(
+                query_embedding
+            ).items()
+            if match[1] >= INTENT_THRESHOLD
+        }
 
         # Build result from best matches
         for intent_type, (value, score) in best_scores.items():
@@ -7,9 +7,18 @@ to isolate complex setup/teardown logic.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from typing import TYPE_CHECKING, Any
 
+from ..const import (
+    CONF_EMBEDDING_PROVIDER,
+    CONF_RAG_EMBEDDING_FORMAT,
+    CONF_RAG_HYBRID_FUSION,
+    DEFAULT_EMBEDDING_PROVIDER,
+)
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -53,8 +62,10 @@ class RAGLifecycleManager:
         self.state_handler: Any | None = None
         self.memory_manager: Any | None = None
         self.identity_manager: Any | None = None
+        self.context_cache: Any | None = None
 
         self._initialized: bool = False
+        self._reembed_task: asyncio.Task[None] | None = None
 
     @property
     def is_initialized(self) -> bool:
@@ -74,7 +85,7 @@ class RAGLifecycleManager:
         3. Entity indexer
         4. Query engine
         5. Intent detector
-        6. Session indexer + memory/identity managers
+        6. Session indexer + memory/identity managers + context cache
         7. Semantic learner
         8. Event handlers
         9. Metadata checks / auto-reindex
@@ -90,22 +101,37 @@ class RAGLifecycleManager:
             from .sqlite_store import SqliteStore
 
             persist_dir = self._get_persist_directory()
-            self.store = SqliteStore(persist_directory=persist_dir)
+            self.store = SqliteStore(
+                persist_directory=persist_dir,
+                embedding_format=self.config.get(CONF_RAG_EMBEDDING_FORMAT)
+                or "float32",
+            )
             await self.store.async_initialize()
 
             # 2. Embedding provider (with caching wrapper)
-            from .embeddings import CachedEmbeddingProvider, create_embedding_provider
+            from .embeddings import (
+                CachedEmbeddingProvider,
+                async_create_embedding_provider,
+            )
 
-            raw_provider = create_embedding_provider(
-                self.hass, self.config, self.config_entry
+            stored_dimension = None
+            if await self.store.get_metadata("embedding_provider") == "local_endpoint":
+                stored = await self.store.get_metadata("embedding_dimension")
+                stored_dimension = int(stored) if stored and stored.isdigit() else None
+            raw_provider = await async_create_embedding_provider(
+                self.hass,
+                self.config,
+                self.config_entry,
+                stored_dimension=stored_dimension,
             )
             self.embedding_provider = CachedEmbeddingProvider(
                 inner=raw_provider,
                 store=self.store,
             )
             _LOGGER.info(
-                "RAG using embedding provider: %s (with cache)",
+                "RAG using embedding provider: %s (with cache, configured: %s)",
                 self.embedding_provider.provider_name,
+                self.config.get(CONF_EMBEDDING_PROVIDER) or DEFAULT_EMBEDDING_PROVIDER,
             )
 
             # 3. Entity indexer
@@ -123,6 +149,7 @@ class RAGLifecycleManager:
             self.query_engine = QueryEngine(
                 store=self.store,
                 embedding_provider=self.embedding_provider,
+                fusion=self.config.get(CONF_RAG_HYBRID_FUSION) or "weighted",
             )
 
             # 5. Intent detector
@@ -130,6 +157,7 @@ class RAGLifecycleManager:
 
             self.intent_detector = IntentDetector(
                 embedding_provider=self.embedding_provider,
+                store=self.store,
             )
             await self.intent_detector.async_initialize()
 
@@ -142,13 +170,24 @@ class RAGLifecycleManager:
             )
             _LOGGER.debug("Session indexer initialized")
 
+            # 6a. Context result cache (invalidated by memory and entity changes)
+            from ._context_cache import ContextCache
+
+            self.context_cache = ContextCache()
+
             # 6b. Long-term memory manager
             try:
                 from ..memory.manager import MemoryManager
 
+                context_cache = self.context_cache
+
+                def _invalidate_user_context(user_id: str | None) -> None:
+                    context_cache.invalidate_user(user_id)
+
                 self.memory_manager = MemoryManager(
                     store=self.store,
                     embedding_provider=self.embedding_provider,
+                    on_memories_changed=_invalidate_user_context,
                 )
                 await self.memory_manager.async_initialize()
                 _LOGGER.info("Long-term memory manager initialized")
@@ -186,27 +225,41 @@ class RAGLifecycleManager:
             self.event_handlers = EntityRegistryEventHandler(
                 hass=self.hass,
                 indexer=self.indexer,
+                context_cache=self.context_cache,
             )
             await self.event_handlers.async_start()
 
             self.state_handler = StateChangeHandler(
                 hass=self.hass,
                 indexer=self.indexer,
+                context_cache=self.context_cache,
             )
             await self.state_handler.async_start()
 
             # 9. Metadata checks / auto-reindex
-            await self._check_and_reindex()
+            reembed = await self._check_and_reindex()
 
             self._initialized = True
             _LOGGER.info("RAG system initialized successfully")
 
+            # 10. Upgrade rows stored without an embedding hash, off the
+            # startup path
+            if reembed:
+                self._reembed_task = self.hass.async_create_background_task(
+                    self._async_reembed_unhashed(), "homeclaw_rag_reembed_unhashed"
+                )
+
         except Exception as e:
             _LOGGER.exception("Failed to initialize RAG system: %s", e)
             raise
 
-    async def _check_and_reindex(self) -> None:
-        """Check metadata (provider, dimension, task type) and reindex if needed."""
+    async def _check_and_reindex(self) -> bool:
+        """Check metadata (provider, dimension, task type) and reindex if needed.
+
+        Returns:
+            True when the existing index is kept, so rows stored without an
+            embedding hash still need re-embedding.
+        """
         provider_name = self.embedding_provider.provider_name
         stored_provider = await self.store.get_metadata("embedding_provider")
 
@@ -254,31 +307,51 @@ class RAGLifecycleManager:
                 )
                 _LOGGER.info("Stored Gemini task type version: %s", task_type_version)
 
-        # Perform reindex if needed
+        # Perform reindex if needed.  The old index keeps serving (keyword)
+        # searches until the reindex swaps the new one in; an incomplete
+        # reindex leaves the stored configuration untouched so it is
+        # resumed on the next start.
         doc_count = await self.store.get_document_count()
         if reindex_needed:
             _LOGGER.info("Reindexing all entities due to configuration change...")
-            await self.store.clear_collection()
-            self.store.cache_prune(max_entries=0)
-            _LOGGER.info("Cleared old embeddings and cache")
-            await self.indexer.full_reindex()
-            await self.store.set_metadata("embedding_provider", provider_name)
-            await self.store.set_metadata("embedding_dimension", current_dimension)
-            if provider_name == "gemini":
-                await self.store.set_metadata(
-                    "gemini_task_type_version", "v2_query_document_split"
-                )
+            await self.store.async_cache_prune(max_entries=0)
+            _LOGGER.info("Cleared embedding cache")
+            if await self.indexer.full_reindex():
+                await self.store.set_metadata("embedding_provider", provider_name)
+                await self.store.set_metadata("embedding_dimension", current_dimension)
+                if provider_name == "gemini":
+                    await self.store.set_metadata(
+                        "gemini_task_type_version", "v2_query_document_split"
+                    )
         elif doc_count == 0:
             _LOGGER.info("No indexed entities found, performing full reindex...")
             await self.indexer.full_reindex()
+        elif await self.store.get_reindex_checkpoint():
+            _LOGGER.info("Resuming interrupted full reindex...")
+            await self.indexer.full_reindex()
         else:
             _LOGGER.info("RAG system has %d indexed entities", doc_count)
+            return True
+        return False
+
+    async def _async_reembed_unhashed(self) -> None:
+        """Re-embed unhashed rows in the background; failures are only logged."""
+        try:
+            await self.indexer.reembed_unhashed()
+        except Exception:
+            _LOGGER.exception("Failed to re-embed entities without an embedding hash")
 
     async def async_shutdown(self) -> None:
         """Shutdown all RAG components gracefully."""
         _LOGGER.info("Shutting down RAG system...")
 
         try:
+            if self._reembed_task is not None:
+                self._reembed_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._reembed_task
+                self._reembed_task = None
+
             if self.state_handler:
                 await self.state_handler.async_stop()
                 self.state_handler = None
@@ -295,11 +368,18 @@ class RAGLifecycleManager:
                 await self.store.async_shutdown()
                 self.store = None
 
+            if self.embedding_provider:
+                try:
+                    await self.embedding_provider.async_close()
+                except Exception as close_err:
+                    _LOGGER.debug("Error closing embedding provider: %s", close_err)
+
             self.indexer = None
             self.query_engine = None
             self.session_indexer = None
             self.memory_manager = None
             self.identity_manager = None
+            self.context_cache = None
             self.embedding_provider = None
             self.intent_detector = None
             self._initialized = False
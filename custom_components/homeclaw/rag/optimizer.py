@@ -13,12 +13,15 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import sqlite3
 import time
 from collections import defaultdict
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from ..rate_scheduler import Priority, request_priority
+
 _LOGGER = logging.getLogger(__name__)
 
 # --- Constants ---
@@ -565,15 +568,16 @@ class RAGOptimizer:
         Returns:
             Dict mapping session_id to chunk count.
         """
-        try:
-            conn = self.store._conn
-            if not conn:
-                return {}
+
+        def _groups(conn: sqlite3.Connection) -> dict[str, int]:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT session_id, COUNT(*) as cnt FROM session_chunks GROUP BY session_id"
             )
             return {row["session_id"]: row["cnt"] for row in cursor.fetchall()}
+
+        try:
+            return await self.store.run_read("optimizer_chunk_groups", _groups)
         except Exception as e:
             _LOGGER.error("Failed to get session chunk groups: %s", e)
             return {}
@@ -587,10 +591,8 @@ class RAGOptimizer:
         Returns:
             List of chunk dicts with id, text, metadata, start_msg, end_msg.
         """
-        try:
-            conn = self.store._conn
-            if not conn:
-                return []
+
+        def _chunks(conn: sqlite3.Connection) -> list[Any]:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, session_id, text, metadata, start_msg, end_msg
@@ -598,8 +600,12 @@ class RAGOptimizer:
                    ORDER BY start_msg ASC""",
                 (session_id,),
             )
+            return cursor.fetchall()
+
+        try:
+            rows = await self.store.run_read("optimizer_session_chunks", _chunks)
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 import json
 
                 metadata = json.loads(row["metadata"]) if row["metadata"] else {}
@@ -665,7 +671,8 @@ class RAGOptimizer:
             if model:
                 kwargs["model"] = model
 
-            response = await provider.get_response(messages, **kwargs)
+            with request_priority(Priority.BULK, "rag_optimizer"):
+                response = await provider.get_response(messages, **kwargs)
             if not response or not response.strip():
                 raise ValueError("Empty response from AI provider")
 
@@ -843,7 +850,8 @@ class RAGOptimizer:
         if model:
             kwargs["model"] = model
 
-        response = await provider.get_response(messages, **kwargs)
+        with request_priority(Priority.BULK, "rag_optimizer"):
+            response = await provider.get_response(messages, **kwargs)
         if not response or not response.strip():
             raise ValueError("Empty response from AI provider")
 
@@ -6,6 +6,7 @@ and context compression for providing relevant entity information to the LLM.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -27,6 +28,13 @@ HYBRID_TEXT_WEIGHT = 0.3
 # Candidate multiplier: fetch N * multiplier from each subsystem, then merge to N
 HYBRID_CANDIDATE_MULTIPLIER = 4
 
+# Hybrid fusion methods: weighted score sum, or reciprocal rank fusion
+HYBRID_FUSION_WEIGHTED = "weighted"
+HYBRID_FUSION_RRF = "rrf"
+
+# Reciprocal rank fusion damping constant (Cormack et al. use 60)
+RRF_K = 60
+
 
 def build_fts_query(raw: str) -> str | None:
     """Build an FTS5 MATCH query from a raw user query string.
@@ -61,20 +69,29 @@ def merge_hybrid_results(
     keyword_results: list[SearchResult],
     vector_weight: float = HYBRID_VECTOR_WEIGHT,
     text_weight: float = HYBRID_TEXT_WEIGHT,
+    fusion: str = HYBRID_FUSION_WEIGHTED,
+    rrf_k: int = RRF_K,
 ) -> list[SearchResult]:
-    """Merge vector search and keyword search results with weighted scoring.
+    """Merge vector search and keyword search results.
 
-    For each unique result, computes:
+    With ``fusion="weighted"`` (default), each unique result gets:
         final_score = vector_weight * vector_similarity + text_weight * text_score
 
     Where vector_similarity = 1 - distance and text_score = 1 - distance.
     Results appearing in only one set get 0 for the missing component.
 
+    With ``fusion="rrf"`` (reciprocal rank fusion) only the ranks count:
+        final_score = (rrf_k + 1) * sum(weight / (rrf_k + rank))
+    scaled so a result ranked first by both searches scores 1.0.  RRF is
+    insensitive to how the two score scales compare.
+
     Args:
-        vector_results: Results from vector (embedding) search.
-        keyword_results: Results from FTS5 keyword search.
+        vector_results: Results from vector (embedding) search, best first.
+        keyword_results: Results from FTS5 keyword search, best first.
         vector_weight: Weight for vector similarity (default 0.7).
         text_weight: Weight for keyword/BM25 score (default 0.3).
+        fusion: ``HYBRID_FUSION_WEIGHTED`` or ``HYBRID_FUSION_RRF``.
+        rrf_k: RRF damping constant.
 
     Returns:
         Merged, deduplicated results sorted by final score descending (best first).
@@ -86,50 +103,44 @@ def merge_hybrid_results(
         vector_weight = vector_weight / total
         text_weight = text_weight / total
 
-    # Build lookup by ID
-    by_id: dict[str, dict[str, Any]] = {}
-
-    # Add vector results
-    for r in vector_results:
-        vector_score = max(0.0, 1.0 - r.distance)
-        by_id[r.id] = {
-            "id": r.id,
-            "text": r.text,
-            "metadata": r.metadata,
-            "vector_score": vector_score,
-            "text_score": 0.0,
-        }
-
-    # Merge keyword results
-    for r in keyword_results:
-        text_score = max(0.0, 1.0 - r.distance)
-        if r.id in by_id:
-            by_id[r.id]["text_score"] = text_score
-        else:
-            by_id[r.id] = {
-                "id": r.id,
-                "text": r.text,
-                "metadata": r.metadata,
-                "vector_score": 0.0,
-                "text_score": text_score,
-            }
-
-    # Compute final scores and build SearchResult objects
-    merged = []
-    for entry in by_id.values():
-        final_score = (
-            vector_weight * entry["vector_score"] + text_weight * entry["text_score"]
-        )
-        merged.append(
-            SearchResult(
-                id=entry["id"],
-                text=entry["text"],
-                metadata=entry["metadata"],
-                distance=1.0 - final_score,  # Lower distance = better
-            )
+    # Per-result score of each search, pre-weighted
+    if fusion == HYBRID_FUSION_RRF:
+        scale = rrf_k + 1
+        vector_scores = [
+            scale * vector_weight / (rrf_k + rank)
+            for rank in range(1, len(vector_results) + 1)
+        ]
+        text_scores = [
+            scale * text_weight / (rrf_k + rank)
+            for rank in range(1, len(keyword_results) + 1)
+        ]
+    else:
+        vector_scores = [
+            vector_weight * max(0.0, 1.0 - r.distance) for r in vector_results
+        ]
+        text_scores = [text_weight * max(0.0, 1.0 - r.distance) for r in keyword_results]
+
+    # Sum the scores by ID; the vector result wins for text/metadata
+    docs: dict[str, SearchResult] = {}
+    scores: dict[str, float] = {}
+    for results, weighted in (
+        (vector_results, vector_scores),
+        (keyword_results, text_scores),
+    ):
+        for r, score in zip(results, weighted):
+            docs.setdefault(r.id, r)
+            scores[r.id] = scores.get(r.id, 0.0) + score
+
+    # Lower distance = better; sort by distance ascending (best first)
+    merged = [
+        SearchResult(
+            id=doc.id,
+            text=doc.text,
+            metadata=doc.metadata,
+            distance=1.0 - scores[doc_id],
         )
-
-    # Sort by distance ascending (best first)
+        for doc_id, doc in docs.items()
+    ]
     merged.sort(key=lambda x: x.distance)
     return merged
 
@@ -144,6 +155,7 @@ class QueryEngine:
 
     store: SqliteStore
     embedding_provider: EmbeddingProvider
+    fusion: str = HYBRID_FUSION_WEIGHTED  # default hybrid merge method
 
     async def search_entities(
         self,
@@ -367,11 +379,15 @@ class QueryEngine:
         top_k: int = 10,
         where: dict[str, Any] | None = None,
         min_similarity: float | None = None,
+        query_embedding: list[float] | None = None,
+        fusion: str | None = None,
     ) -> list[SearchResult]:
         """Perform hybrid search combining vector similarity and FTS5 keyword search.
 
-        Runs both searches in parallel, merges results with weighted scoring
-        (0.7 vector + 0.3 keyword by default), deduplicates, and returns top_k.
+        Runs both searches concurrently (the keyword search does not wait for
+        the query embedding), merges results with weighted scoring (0.7
+        vector + 0.3 keyword by default) or reciprocal rank fusion,
+        deduplicates, and returns top_k.
 
         Falls back to vector-only search if FTS5 is not available or keyword
         search fails.
@@ -380,7 +396,12 @@ class QueryEngine:
             query: The user's query text.
             top_k: Maximum number of results to return.
             where: Optional metadata filter for vector search (simple equality).
-            min_similarity: Minimum final score (0-1) for results.
+            min_similarity: Minimum score (0-1) for results: the merged score
+                with weighted fusion, the vector similarity with RRF (keyword
+                hits are then kept regardless).
+            query_embedding: Pre-computed query embedding (embedded here if None).
+            fusion: Merge method (``HYBRID_FUSION_WEIGHTED`` or
+                ``HYBRID_FUSION_RRF``); defaults to ``self.fusion``.
 
         Returns:
             Merged, ranked list of SearchResult objects.
@@ -389,34 +410,46 @@ class QueryEngine:
             # Fetch more candidates than needed, then merge and trim
             candidates = min(200, max(1, top_k * HYBRID_CANDIDATE_MULTIPLIER))
 
-            # 1. Vector search
-            query_embedding = await get_embedding_for_query(
-                self.embedding_provider, query
-            )
-            vector_results = await self.store.search(
-                query_embedding=query_embedding,
-                n_results=candidates,
-                where=where,
+            async def _vector_search() -> list[SearchResult]:
+                embedding = query_embedding
+                if embedding is None:
+                    embedding = await get_embedding_for_query(
+                        self.embedding_provider, query
+                    )
+                return await self.store.search(
+                    query_embedding=embedding,
+                    n_results=candidates,
+                    where=where,
+                )
+
+            async def _keyword_search() -> list[SearchResult]:
+                # Graceful fallback: keyword_search returns [] on failure
+                fts_query = build_fts_query(query) if self.store.fts_available else None
+                if not fts_query:
+                    return []
+                return await self.store.keyword_search(
+                    fts_query=fts_query,
+                    n_results=candidates,
+                )
+
+            # 1 + 2. Vector and keyword (FTS5) searches run together
+            vector_results, keyword_results = await asyncio.gather(
+                _vector_search(), _keyword_search()
             )
 
-            # 2. Keyword search (FTS5) — graceful fallback on failure
-            keyword_results: list[SearchResult] = []
-            if self.store.fts_available:
-                fts_query = build_fts_query(query)
-                if fts_query:
-                    keyword_results = await self.store.keyword_search(
-                        fts_query=fts_query,
-                        n_results=candidates,
-                    )
+            fusion = fusion or self.fusion
+
+            # 3. RRF scores are rank-based, not similarities: the threshold
+            # applies to the raw vector similarity before fusing
+            if min_similarity is not None and (
+                not keyword_results or fusion == HYBRID_FUSION_RRF
+            ):
+                vector_results = [
+                    r for r in vector_results if (1.0 - r.distance) >= min_similarity
+                ]
 
-            # 3. If no keyword results, return vector-only (apply min_similarity)
+            # 4. If no keyword results, return vector-only
             if not keyword_results:
-                if min_similarity is not None:
-                    vector_results = [
-                        r
-                        for r in vector_results
-                        if (1.0 - r.distance) >= min_similarity
-                    ]
                 _LOGGER.debug(
                     "Hybrid search (vector-only fallback): %d results for '%s'",
                     len(vector_results[:top_k]),
@@ -424,11 +457,11 @@ class QueryEngine:
                 )
                 return vector_results[:top_k]
 
-            # 4. Merge results
-            merged = merge_hybrid_results(vector_results, keyword_results)
+            # 5. Merge results
+            merged = merge_hybrid_results(vector_results, keyword_results, fusion=fusion)
 
-            # 5. Apply min_similarity threshold on merged scores
-            if min_similarity is not None:
+            # 6. Weighted scores share the similarity scale: threshold them
+            if min_similarity is not None and fusion != HYBRID_FUSION_RRF:
                 merged = [r for r in merged if (1.0 - r.distance) >= min_similarity]
 
             result = merged[:top_k]
@@ -12,9 +12,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import sqlite3
 import time
 from typing import TYPE_CHECKING, Any
 
+from ..rate_scheduler import Priority, request_priority
+
 if TYPE_CHECKING:
     from .embeddings import EmbeddingProvider
     from .sqlite_store import SqliteStore
@@ -206,10 +209,8 @@ async def _find_old_sessions(
         Dict mapping session_id -> chunk_count for old sessions.
         Excludes the archive session itself.
     """
-    try:
-        conn = store._conn
-        if not conn:
-            return {}
+
+    def _find(conn: sqlite3.Connection) -> dict[str, int]:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -222,6 +223,9 @@ async def _find_old_sessions(
             (ARCHIVE_SESSION_ID, cutoff_time),
         )
         return {row["session_id"]: row["cnt"] for row in cursor.fetchall()}
+
+    try:
+        return await store.run_read("archiver_old_sessions", _find)
     except Exception as e:
         _LOGGER.error("Failed to find old sessions: %s", e)
         return {}
@@ -240,11 +244,8 @@ async def _collect_chunks(
     Returns:
         List of chunk text strings, ordered by session and position.
     """
-    try:
-        conn = store._conn
-        if not conn:
-            return []
 
+    def _collect(conn: sqlite3.Connection) -> list[str]:
         all_texts: list[str] = []
         cursor = conn.cursor()
 
@@ -262,6 +263,9 @@ async def _collect_chunks(
                     all_texts.append(row["text"])
 
         return all_texts
+
+    try:
+        return await store.run_read("archiver_collect_chunks", _collect)
     except Exception as e:
         _LOGGER.error("Failed to collect chunks for archival: %s", e)
         return []
@@ -311,7 +315,8 @@ async def _summarize_chunks(
         kwargs["model"] = model
 
     try:
-        response = await provider.get_response(messages, **kwargs)
+        with request_priority(Priority.BULK, "session_archiver"):
+            response = await provider.get_response(messages, **kwargs)
         if response and response.strip():
             return response.strip()
         return None
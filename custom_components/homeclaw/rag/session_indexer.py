@@ -4,8 +4,11 @@ Indexes conversation history as an additional RAG source.
 Uses round-level granularity (User + Assistant) with Key Expansion
 (Original text + Extracted User Facts) for better retrieval.
 
-Delta-based reindex and SHA-256 hash-based change detection is maintained
-from the previous chunk-based approach.
+Delta-based reindex with SHA-256 change detection: each round is hashed
+individually and only new or changed rounds are embedded and upserted,
+while rounds that disappeared are deleted.  The per-round hashes and round
+count live in the ``session_hashes`` table, so the delta state survives
+restarts.
 """
 
 from __future__ import annotations
@@ -39,12 +42,14 @@ class SessionIndexer:
     """Indexes conversation sessions into the RAG SQLite store.
 
     Tracks per-session round counts to enable delta-based reindexing.
-    Only re-embeds sessions that have enough new rounds since the last index.
+    Only re-indexes sessions that have enough new rounds since the last index,
+    and then only embeds the rounds whose content changed.
 
     Attributes:
         store: The SQLite vector store for persistence.
         embedding_provider: Provider for generating text embeddings.
-        _delta_tracker: Maps session_id -> last indexed round count.
+        _delta_tracker: Maps session_id -> last indexed round count
+            (seeded from ``session_hashes`` on first sight of a session).
     """
 
     store: SqliteStore
@@ -65,10 +70,11 @@ class SessionIndexer:
         Args:
             session_id: Unique session identifier.
             rounds: List of dicts with 'user_message', 'assistant_message', 'user_facts', 'timestamp'.
-            force: If True, skip delta check and always reindex.
+            force: If True, skip the delta and whole-session hash checks
+                (unchanged rounds are still not re-embedded).
 
         Returns:
-            Number of rounds indexed (0 if skipped).
+            Number of rounds embedded (0 if skipped or nothing changed).
         """
         # Ensure we have valid rounds
         valid_rounds = [
@@ -84,6 +90,8 @@ class SessionIndexer:
             return 0
 
         # Delta check: skip if not enough new rounds
+        tracked = session_id in self._delta_tracker
+        state = None if tracked else await self._load_state(session_id)
         last_count = self._delta_tracker.get(session_id, 0)
         new_rounds_count = len(valid_rounds) - last_count
 
@@ -103,7 +111,9 @@ class SessionIndexer:
             for r in valid_rounds
         )
         content_hash = _hash_text(full_text)
-        stored_hash = await self.store.get_session_hash(session_id)
+        if tracked:
+            state = await self.store.get_session_index_state(session_id)
+        stored_hash = state["content_hash"] if state else None
 
         if not force and stored_hash == content_hash:
             _LOGGER.debug(
@@ -112,16 +122,12 @@ class SessionIndexer:
             self._delta_tracker[session_id] = len(valid_rounds)
             return 0
 
-        _LOGGER.info(
-            "Indexing session %s: %d rounds",
-            session_id,
-            len(valid_rounds),
-        )
-
-        # Generate embeddings for all rounds.
         # KEY EXPANSION: The embedding key is a combination of the conversation text AND the extracted facts.
         # Truncate to MAX_ROUND_CHARS to prevent embedding API failures on oversized messages.
-        keys_for_embedding = []
+        # What we retrieve as VALUE is the original text (without facts polluting it)
+        # with a timestamp.
+        keys: list[str] = []
+        values: list[str] = []
         for r in valid_rounds:
             key = f"User: {r['user_message']}\nAssistant: {r['assistant_message']}"
             facts = r.get("user_facts", "").strip()
@@ -129,62 +135,85 @@ class SessionIndexer:
                 key += f"\nUser Facts: {facts}"
             if len(key) > MAX_ROUND_CHARS:
                 key = key[:MAX_ROUND_CHARS]
-            keys_for_embedding.append(key)
-
-        try:
-            embeddings = await self.embedding_provider.get_embeddings(
-                keys_for_embedding
+            keys.append(key)
+            values.append(
+                f"[{r.get('timestamp', '')}] User: {r['user_message']}\nAssistant: {r['assistant_message']}"
             )
-        except Exception as e:
-            _LOGGER.error("Failed to embed session %s rounds: %s", session_id, e)
-            return 0
 
-        # Build chunk IDs and metadata
-        chunk_ids: list[str] = []
-        chunk_texts: list[str] = []
-        chunk_metadatas: list[dict[str, Any]] = []
+        # Deterministic ID per round; a round is rewritten when its ID or
+        # its stored value changed since the last pass.
+        chunk_ids = [
+            _hash_text(f"session:{session_id}:round:{i}:{_hash_text(key)}")
+            for i, key in enumerate(keys)
+        ]
+        round_hashes = [
+            _hash_text(f"{chunk_id}\n{value}")
+            for chunk_id, value in zip(chunk_ids, values)
+        ]
+        previous = state["round_hashes"] if state else []
+        changed = [
+            i
+            for i, round_hash in enumerate(round_hashes)
+            if i >= len(previous) or previous[i] != round_hash
+        ]
 
-        for i, (r, key_text) in enumerate(zip(valid_rounds, keys_for_embedding)):
-            # Deterministic ID for the round
-            round_id = _hash_text(
-                f"session:{session_id}:round:{i}:{_hash_text(key_text)}"
-            )
+        _LOGGER.info(
+            "Indexing session %s: %d/%d rounds new or changed",
+            session_id,
+            len(changed),
+            len(valid_rounds),
+        )
 
-            chunk_ids.append(round_id)
-            # What we retrieve as VALUE is the original text (without facts polluting it)
-            # so we store the same combined text with a timestamp
-            value_text = f"[{r.get('timestamp', '')}] User: {r['user_message']}\nAssistant: {r['assistant_message']}"
-            chunk_texts.append(value_text)
-
-            chunk_metadatas.append(
-                {
-                    "session_id": session_id,
-                    "round_index": i,
-                    "start_msg": i * 2,
-                    "end_msg": i * 2 + 1,
-                    "timestamp": r.get("timestamp", ""),
-                    "source": "session_round",
-                }
-            )
+        embeddings: list[list[float]] = []
+        if changed:
+            try:
+                embeddings = await self.embedding_provider.get_embeddings(
+                    [keys[i] for i in changed]
+                )
+            except Exception as e:
+                _LOGGER.error("Failed to embed session %s rounds: %s", session_id, e)
+                return 0
+
+        chunk_metadatas: list[dict[str, Any]] = [
+            {
+                "session_id": session_id,
+                "round_index": i,
+                "start_msg": i * 2,
+                "end_msg": i * 2 + 1,
+                "timestamp": valid_rounds[i].get("timestamp", ""),
+                "source": "session_round",
+            }
+            for i in changed
+        ]
 
-        # Delete old chunks for this session, then insert new ones
-        await self.store.delete_session_chunks(session_id)
-        await self.store.add_session_chunks(
-            ids=chunk_ids,
-            texts=chunk_texts,
+        await self.store.sync_session_chunks(
+            session_id,
+            ids=[chunk_ids[i] for i in changed],
+            texts=[values[i] for i in changed],
             embeddings=embeddings,
             metadatas=chunk_metadatas,
-            session_id=session_id,
+            live_ids=chunk_ids,
             content_hash=content_hash,
+            round_hashes=round_hashes,
         )
 
         # Update delta tracker
         self._delta_tracker[session_id] = len(valid_rounds)
 
         _LOGGER.info(
-            "Indexed session %s: %d rounds stored", session_id, len(valid_rounds)
+            "Indexed session %s: %d rounds embedded, %d total",
+            session_id,
+            len(changed),
+            len(valid_rounds),
         )
-        return len(valid_rounds)
+        return len(changed)
+
+    async def _load_state(self, session_id: str) -> dict[str, Any] | None:
+        """Load the persisted indexing state, seeding the delta tracker."""
+        state = await self.store.get_session_index_state(session_id)
+        if state is not None:
+            self._delta_tracker.setdefault(session_id, state["round_count"])
+        return state
 
     async def remove_session(self, session_id: str) -> None:
         """Remove all indexed chunks for a session."""
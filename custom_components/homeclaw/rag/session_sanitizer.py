@@ -10,6 +10,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from ..rate_scheduler import Priority, request_priority
+
 _LOGGER = logging.getLogger(__name__)
 
 SESSION_SANITIZE_PROMPT = """\
@@ -143,7 +145,8 @@ async def sanitize_session_messages(
         if model:
             kwargs["model"] = model
 
-        response = await provider.get_response(llm_messages, **kwargs)
+        with request_priority(Priority.BULK, "session_sanitizer"):
+            response = await provider.get_response(llm_messages, **kwargs)
 
         if not response or not response.strip():
             _LOGGER.warning("Empty response from sanitization LLM")
@@ -7,6 +7,17 @@ The ``SqliteStore`` class composes functionality from domain-specific mixins:
 - ``FtsIndexMixin``:        FTS5 keyword search for entities and sessions
 - ``EmbeddingCacheMixin``:  Content-addressable embedding cache
 - ``SessionChunkMixin``:    Session conversation chunk storage and search
+- ``ShadowReindexMixin``:   Shadow table for resumable full reindexes
+
+Entity vector search is served from a resident ``VectorIndex`` (see
+``_vector_index``) that is built from the table on first use and kept in
+sync by the CRUD methods; session chunks get a month-partitioned
+``SessionChunkIndex`` (see ``_session_index``) maintained the same way.
+
+All SQLite statements run through a ``DbWorker`` (see ``_db_worker``): one
+serialized writer connection plus a pool of WAL read connections, executed
+in the default executor so the Home Assistant event loop never blocks on
+database I/O.
 
 Pure utility functions (cosine math, blob serialization, etc.) live in
 ``_store_utils`` and are re-exported here for backward compatibility.
@@ -14,17 +25,29 @@ Pure utility functions (cosine math, blob serialization, etc.) live in
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import os
 import re
 import sqlite3
 import time
-from dataclasses import dataclass, field
-from typing import Any
-
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, TypeVar
+
+from ._db_worker import DbWorker
+from ._quantize import (
+    EMBEDDING_FORMAT_FLOAT32,
+    EMBEDDING_FORMAT_INT8,
+    EMBEDDING_FORMATS,
+    FLOAT16_MAGIC,
+    INT8_MAGIC,
+)
+from ._session_index import SessionChunkIndex
 from ._store_cache import EmbeddingCacheMixin
 from ._store_fts import FtsIndexMixin
+from ._store_reindex import ShadowReindexMixin
 from ._store_sessions import SessionChunkMixin
 from ._store_utils import (
     SearchResult,
@@ -34,9 +57,12 @@ from ._store_utils import (
     filter_metadata,
     read_embedding,
 )
+from ._vector_index import VectorIndex, first_pass_limits, rescore
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Default table name for entity embeddings
 DEFAULT_TABLE_NAME = "ha_entities"
 
@@ -46,27 +72,61 @@ FTS_TABLE_SUFFIX = "_fts"
 # Regex for safe SQL table names (letters/underscores, max 64 chars)
 _SAFE_TABLE_NAME = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]{0,63}$")
 
+# rag_metadata key recording the format of the stored embedding blobs
+EMBEDDING_FORMAT_KEY = "embedding_format"
+
+# rag_metadata key recording which prototype table the stored intent
+# prototype embeddings were computed from
+INTENT_PROTOTYPES_HASH_KEY = "intent_prototypes_hash"
+
+# Tables with an ``embedding`` blob column besides the entity table
+_EMBEDDING_TABLES = (
+    "session_chunks",
+    "embedding_cache",
+    "memories",
+    "intent_prototypes",
+)
+
 
 @dataclass
-class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
+class SqliteStore(
+    ShadowReindexMixin, SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin
+):
     """SQLite-based vector store for entity embeddings.
 
     Provides async-compatible methods for storing and searching embeddings.
-    Uses SQLite with binary blob storage for embeddings and pure Python for
-    cosine similarity computation.
+    Uses SQLite with binary blob storage for embeddings and a resident
+    in-memory ``VectorIndex`` (float32 matrix, NumPy when available) for
+    cosine similarity search.
 
     Composed from mixins:
     - ``FtsIndexMixin``:        FTS5 keyword search
     - ``EmbeddingCacheMixin``:  Embedding cache
     - ``SessionChunkMixin``:    Session chunk storage
+    - ``ShadowReindexMixin``:   Resumable full reindex
+
+    ``embedding_format`` selects how embeddings are written (float32,
+    float16 or int8, see ``_quantize``).  Existing blobs are converted at
+    initialization and the format is recorded in ``rag_metadata``.  With a
+    quantized format the in-memory indexes hold int8 codes; with float16
+    storage searches rescore their top candidates against the stored vectors.
+
+    ``_conn`` is the writer connection.  Code outside the store should use
+    ``run_read`` / ``run_write`` instead of touching it directly.
     """
 
     persist_directory: str
     table_name: str = DEFAULT_TABLE_NAME
+    embedding_format: str = EMBEDDING_FORMAT_FLOAT32
     _db_path: str = field(default="", repr=False)
     _conn: sqlite3.Connection | None = field(default=None, repr=False)
     _initialized: bool = field(default=False, repr=False)
     _fts_available: bool = field(default=False, repr=False)
+    _db: DbWorker | None = field(default=None, repr=False)
+    _vector_index: VectorIndex | None = field(default=None, repr=False)
+    _index_lock: asyncio.Lock | None = field(default=None, repr=False)
+    _session_index: SessionChunkIndex | None = field(default=None, repr=False)
+    _session_index_lock: asyncio.Lock | None = field(default=None, repr=False)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -85,24 +145,27 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         # Validate table name to prevent SQL injection via f-string queries
         if not _SAFE_TABLE_NAME.match(self.table_name):
             raise ValueError(f"Invalid table name: {self.table_name!r}")
+        if self.embedding_format not in EMBEDDING_FORMATS:
+            raise ValueError(f"Invalid embedding format: {self.embedding_format!r}")
 
         try:
             # Ensure persist directory exists
-            os.makedirs(self.persist_directory, exist_ok=True)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                functools.partial(os.makedirs, self.persist_directory, exist_ok=True),
+            )
             _LOGGER.debug("SQLite persist directory: %s", self.persist_directory)
 
             # Set up database path
             self._db_path = os.path.join(self.persist_directory, "vectors.db")
 
-            # Initialize SQLite connection
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
+            # Open the writer connection (WAL mode) off the event loop
+            self._db = DbWorker(self._db_path)
+            self._conn = await self._db.async_open()
 
-            # Create tables
-            self._create_tables()
-
-            # Migrate legacy JSON embeddings to binary blob
-            self._migrate_embeddings_to_blob()
+            # Create tables and migrate legacy JSON embeddings to binary blob
+            await self._db.write("initialize_schema", self._initialize_schema)
 
             self._initialized = True
             count = await self.get_document_count()
@@ -112,6 +175,12 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             _LOGGER.error("Failed to initialize SQLite store: %s", e)
             raise
 
+    def _initialize_schema(self, conn: sqlite3.Connection) -> None:
+        """Create tables and run migrations (writer job)."""
+        self._create_tables()
+        self._migrate_embeddings_to_blob()
+        self._migrate_embedding_format()
+
     def _create_tables(self) -> None:
         """Create the required database tables."""
         if self._conn is None:
@@ -125,7 +194,8 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
                 id TEXT PRIMARY KEY,
                 text TEXT NOT NULL,
                 embedding TEXT NOT NULL,
-                metadata TEXT
+                metadata TEXT,
+                embed_hash TEXT
             )
         """)
 
@@ -135,6 +205,18 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             ON {self.table_name}(id)
         """)
 
+        # Migration: hash of the text each embedding was computed from, so
+        # state-only updates can skip re-embedding (NULL = unknown)
+        cols = {
+            row[1]
+            for row in cursor.execute(
+                f"PRAGMA table_info({self.table_name})"
+            ).fetchall()
+        }
+        if "embed_hash" not in cols:
+            _LOGGER.info("Migrating %s: adding embed_hash column", self.table_name)
+            cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN embed_hash TEXT")
+
         # Metadata table for tracking configuration (embedding provider, versions, etc.)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS rag_metadata (
@@ -144,6 +226,14 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             )
         """)
 
+        # Intent detector prototype embeddings ("type:value:query" -> vector)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS intent_prototypes (
+                key TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL
+            )
+        """)
+
         # Embedding cache table (content-addressable by SHA-256 hash)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS embedding_cache (
@@ -207,9 +297,18 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
                 session_id TEXT PRIMARY KEY,
                 content_hash TEXT NOT NULL,
                 chunk_count INTEGER NOT NULL DEFAULT 0,
-                updated_at REAL NOT NULL
+                updated_at REAL NOT NULL,
+                round_hashes TEXT
             )
         """)
+        # Migration: per-round hashes for delta session indexing
+        cols = {
+            row[1]
+            for row in cursor.execute("PRAGMA table_info(session_hashes)").fetchall()
+        }
+        if "round_hashes" not in cols:
+            _LOGGER.info("Migrating session_hashes: adding round_hashes column")
+            cursor.execute("ALTER TABLE session_hashes ADD COLUMN round_hashes TEXT")
 
         # FTS5 virtual table for keyword search (graceful fallback if unavailable)
         fts_table = self.table_name + FTS_TABLE_SUFFIX
@@ -293,7 +392,7 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             for row in rows:
                 try:
                     embedding = json.loads(row["embedding"])
-                    blob = embedding_to_blob(embedding)
+                    blob = self.encode_embedding(embedding)
                     cursor.execute(
                         f"UPDATE {self.table_name} SET embedding = ? WHERE id = ?",
                         (blob, row["id"]),
@@ -311,6 +410,111 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             "Embedding migration complete: %d migrated, %d failed", migrated, failed
         )
 
+    def _migrate_embedding_format(self) -> None:
+        """Re-encode stored embedding blobs into ``self.embedding_format``.
+
+        Covers the entity table, session chunks, the embedding cache,
+        memories and intent prototypes.  Every blob carries its own format header, so rows already
+        in the target format are skipped and an interrupted migration simply
+        resumes on the next start.  The format is recorded in
+        ``rag_metadata`` once all tables are converted.
+        """
+        if self._conn is None:
+            return
+
+        cursor = self._conn.cursor()
+        row = cursor.execute(
+            "SELECT value FROM rag_metadata WHERE key = ?", (EMBEDDING_FORMAT_KEY,)
+        ).fetchone()
+        # Stores without a marker predate quantization: everything is float32
+        stored_format = row["value"] if row else EMBEDDING_FORMAT_FLOAT32
+
+        if stored_format != self.embedding_format:
+            existing = {
+                r["name"]
+                for r in cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ).fetchall()
+            }
+            for table in (self.table_name, *_EMBEDDING_TABLES):
+                if table in existing:
+                    self._migrate_table_embedding_format(table)
+
+        if not row or stored_format != self.embedding_format:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO rag_metadata (key, value, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                (EMBEDDING_FORMAT_KEY, self.embedding_format, time.time()),
+            )
+            self._conn.commit()
+
+    def _migrate_table_embedding_format(self, table: str) -> None:
+        """Re-encode the blobs of one table that are not in the target format."""
+        cursor = self._conn.cursor()  # type: ignore[union-attr]
+        target = self.embedding_format
+        batch_size = 200
+        last_rowid = 0
+        migrated = 0
+        failed = 0
+
+        # Select rows by their 4-byte format header
+        if target == EMBEDDING_FORMAT_FLOAT32:
+            header_clause = "substr(embedding, 1, 4) IN (?, ?)"
+            header_params: tuple[bytes, ...] = (INT8_MAGIC, FLOAT16_MAGIC)
+        else:
+            header_clause = "substr(embedding, 1, 4) != ?"
+            header_params = (
+                INT8_MAGIC if target == EMBEDDING_FORMAT_INT8 else FLOAT16_MAGIC,
+            )
+
+        while True:
+            cursor.execute(
+                f"""
+                SELECT rowid, embedding FROM {table}
+                WHERE rowid > ? AND typeof(embedding) = 'blob' AND {header_clause}
+                ORDER BY rowid
+                LIMIT ?
+                """,
+                (last_rowid, *header_params, batch_size),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            for row in rows:
+                last_rowid = row["rowid"]
+                try:
+                    cursor.execute(
+                        f"UPDATE {table} SET embedding = ? WHERE rowid = ?",
+                        (
+                            self.encode_embedding(blob_to_embedding(row["embedding"])),
+                            last_rowid,
+                        ),
+                    )
+                    migrated += 1
+                except Exception as e:
+                    _LOGGER.warning(
+                        "Failed to convert embedding %s/%s to %s: %s",
+                        table,
+                        last_rowid,
+                        target,
+                        e,
+                    )
+                    failed += 1
+
+            self._conn.commit()  # type: ignore[union-attr]
+
+        if migrated or failed:
+            _LOGGER.info(
+                "Converted %d %s embeddings to %s (%d failed)",
+                migrated,
+                table,
+                target,
+                failed,
+            )
+
     # ------------------------------------------------------------------
     # Properties / guards
     # ------------------------------------------------------------------
@@ -320,6 +524,19 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """Whether FTS5 keyword search is available."""
         return self._fts_available
 
+    @property
+    def _rescores_from_storage(self) -> bool:
+        """Whether quantized index hits are re-ranked against the stored blobs.
+
+        Only float16 blobs are more precise than the index's int8 codes.
+        int8 blobs hold the same codes (one scale per vector), so reading
+        them back would cost a query without changing the ranking.
+        """
+        return self.embedding_format not in (
+            EMBEDDING_FORMAT_FLOAT32,
+            EMBEDDING_FORMAT_INT8,
+        )
+
     def _ensure_initialized(self) -> None:
         """Ensure the store is initialized before operations."""
         if not self._initialized or self._conn is None:
@@ -327,6 +544,53 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
                 "SqliteStore not initialized. Call async_initialize() first."
             )
 
+    # ------------------------------------------------------------------
+    # Off-loop execution
+    # ------------------------------------------------------------------
+
+    async def run_read(
+        self, label: str, func: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run ``func(conn, *args)`` on a pooled read connection.
+
+        Args:
+            label: Operation name used for latency metrics.
+            func: Sync callable receiving a ``sqlite3.Connection``.
+            *args: Extra positional arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        return await self._db.read(label, func, *args)  # type: ignore[union-attr]
+
+    async def run_write(
+        self, label: str, func: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run ``func(conn, *args)`` as one transaction on the writer connection.
+
+        The transaction is committed when ``func`` returns and rolled back
+        if it raises.
+
+        Args:
+            label: Operation name used for latency metrics.
+            func: Sync callable receiving a ``sqlite3.Connection``.
+            *args: Extra positional arguments for ``func``.
+
+        Returns:
+            Whatever ``func`` returns.
+        """
+        return await self._db.write(label, func, *args)  # type: ignore[union-attr]
+
+    def get_db_metrics(self) -> dict[str, Any]:
+        """Return DB worker queue depth and per-statement latency metrics."""
+        if self._db is None:
+            return {}
+        return self._db.get_metrics()
+
+    def encode_embedding(self, embedding: list[float]) -> bytes:
+        """Serialize an embedding in the store's configured format."""
+        return embedding_to_blob(embedding, self.embedding_format)
+
     # ------------------------------------------------------------------
     # Entity document CRUD
     # ------------------------------------------------------------------
@@ -337,6 +601,7 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         texts: list[str],
         embeddings: list[list[float]],
         metadatas: list[dict[str, Any]] | None = None,
+        embed_hashes: list[str] | None = None,
     ) -> None:
         """Add documents with their embeddings to the store.
 
@@ -345,6 +610,8 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             texts: Text content of each document.
             embeddings: Pre-computed embeddings for each document.
             metadatas: Optional metadata dictionaries for each document.
+            embed_hashes: Optional hash of the text each embedding was
+                computed from (see ``get_embed_hashes``).
         """
         self._ensure_initialized()
 
@@ -352,9 +619,8 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             _LOGGER.debug("No documents to add")
             return
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-
+        def _insert(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
             for i, doc_id in enumerate(ids):
                 text = texts[i] if i < len(texts) else ""
                 embedding = embeddings[i] if i < len(embeddings) else []
@@ -363,27 +629,32 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
 
                 cursor.execute(
                     f"""
-                    INSERT INTO {self.table_name} (id, text, embedding, metadata)
-                    VALUES (?, ?, ?, ?)
+                    INSERT INTO {self.table_name} (id, text, embedding, metadata, embed_hash)
+                    VALUES (?, ?, ?, ?, ?)
                     """,
                     (
                         doc_id,
                         text,
-                        embedding_to_blob(embedding),
+                        self.encode_embedding(embedding),
                         json.dumps(filtered_meta),
+                        embed_hashes[i] if embed_hashes and i < len(embed_hashes) else None,
                     ),
                 )
 
                 # Sync to FTS5 index
                 self._fts_sync_insert(cursor, doc_id, text, filtered_meta)
 
-            self._conn.commit()  # type: ignore[union-attr]
+        try:
+            await self.run_write("add_documents", _insert)
+            self._index_sync_upsert(ids, texts, embeddings, metadatas)
             _LOGGER.debug("Added %d documents to SQLite store", len(ids))
 
         except sqlite3.IntegrityError:
             # Document already exists, use upsert instead
             _LOGGER.debug("Some documents already exist, using upsert")
-            await self.upsert_documents(ids, texts, embeddings, metadatas)
+            await self.upsert_documents(
+                ids, texts, embeddings, metadatas, embed_hashes
+            )
         except Exception as e:
             _LOGGER.error("Failed to add documents: %s", e)
             raise
@@ -394,6 +665,7 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         texts: list[str],
         embeddings: list[list[float]],
         metadatas: list[dict[str, Any]] | None = None,
+        embed_hashes: list[str] | None = None,
     ) -> None:
         """Upsert documents (add or update) in the store.
 
@@ -402,6 +674,8 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             texts: Text content of each document.
             embeddings: Pre-computed embeddings for each document.
             metadatas: Optional metadata dictionaries for each document.
+            embed_hashes: Optional hash of the text each embedding was
+                computed from (see ``get_embed_hashes``).
         """
         self._ensure_initialized()
 
@@ -409,8 +683,8 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             _LOGGER.debug("No documents to upsert")
             return
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        def _upsert(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
 
             # Delete old FTS5 entries for all upserted IDs (then re-insert below)
             self._fts_sync_delete(cursor, ids)
@@ -423,27 +697,132 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
 
                 cursor.execute(
                     f"""
-                    INSERT OR REPLACE INTO {self.table_name} (id, text, embedding, metadata)
-                    VALUES (?, ?, ?, ?)
+                    INSERT OR REPLACE INTO {self.table_name} (id, text, embedding, metadata, embed_hash)
+                    VALUES (?, ?, ?, ?, ?)
                     """,
                     (
                         doc_id,
                         text,
-                        embedding_to_blob(embedding),
+                        self.encode_embedding(embedding),
                         json.dumps(filtered_meta),
+                        embed_hashes[i] if embed_hashes and i < len(embed_hashes) else None,
                     ),
                 )
 
                 # Sync to FTS5 index
                 self._fts_sync_insert(cursor, doc_id, text, filtered_meta)
 
-            self._conn.commit()  # type: ignore[union-attr]
+        try:
+            await self.run_write("upsert_documents", _upsert)
+            self._index_sync_upsert(ids, texts, embeddings, metadatas)
             _LOGGER.debug("Upserted %d documents to SQLite store", len(ids))
 
         except Exception as e:
             _LOGGER.error("Failed to upsert documents: %s", e)
             raise
 
+    async def update_documents_text(
+        self,
+        ids: list[str],
+        texts: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> int:
+        """Update the text and metadata of existing documents, keeping embeddings.
+
+        Used for changes that do not affect the embedded text (e.g. entity
+        state): the FTS row and the in-memory index follow, the vector does
+        not change.  Unknown IDs are ignored.
+
+        Args:
+            ids: Document identifiers.
+            texts: New text content of each document.
+            metadatas: New metadata dictionaries for each document.
+
+        Returns:
+            Number of documents updated.
+        """
+        self._ensure_initialized()
+
+        if not ids:
+            return 0
+
+        filtered = [filter_metadata(metadata) for metadata in metadatas]
+
+        def _update(conn: sqlite3.Connection) -> list[int]:
+            cursor = conn.cursor()
+            updated: list[int] = []
+            for i, doc_id in enumerate(ids):
+                cursor.execute(
+                    f"UPDATE {self.table_name} SET text = ?, metadata = ? WHERE id = ?",
+                    (texts[i], json.dumps(filtered[i]), doc_id),
+                )
+                if cursor.rowcount:
+                    updated.append(i)
+
+            # Re-insert the FTS5 rows of the updated documents
+            self._fts_sync_delete(cursor, [ids[i] for i in updated])
+            for i in updated:
+                self._fts_sync_insert(cursor, ids[i], texts[i], filtered[i])
+            return updated
+
+        try:
+            updated = await self.run_write("update_documents_text", _update)
+        except Exception as e:
+            _LOGGER.error("Failed to update documents: %s", e)
+            raise
+
+        if self._vector_index is not None:
+            self._vector_index.update_documents(
+                [ids[i] for i in updated],
+                [texts[i] for i in updated],
+                [filtered[i] for i in updated],
+            )
+        return len(updated)
+
+    async def get_embed_hashes(self, ids: list[str]) -> dict[str, str]:
+        """Get the embedded-text hashes recorded for documents.
+
+        Args:
+            ids: Document identifiers.
+
+        Returns:
+            Mapping of document ID to hash; documents that are missing or
+            were stored without a hash are left out.
+        """
+        self._ensure_initialized()
+
+        if not ids:
+            return {}
+
+        def _get(conn: sqlite3.Connection) -> dict[str, str]:
+            placeholders = ",".join("?" * len(ids))
+            rows = conn.execute(
+                f"""
+                SELECT id, embed_hash FROM {self.table_name}
+                WHERE id IN ({placeholders}) AND embed_hash IS NOT NULL
+                """,
+                ids,
+            ).fetchall()
+            return {row["id"]: row["embed_hash"] for row in rows}
+
+        return await self.run_read("get_embed_hashes", _get)
+
+    async def get_unhashed_ids(self) -> list[str]:
+        """Get the IDs of documents stored without an embedded-text hash.
+
+        Their embedding may predate the current embedded text (rows written
+        before hashes were recorded, or kept over by a shadow reindex).
+        """
+        self._ensure_initialized()
+
+        def _get(conn: sqlite3.Connection) -> list[str]:
+            rows = conn.execute(
+                f"SELECT id FROM {self.table_name} WHERE embed_hash IS NULL"
+            ).fetchall()
+            return [row["id"] for row in rows]
+
+        return await self.run_read("get_unhashed_ids", _get)
+
     async def search(
         self,
         query_embedding: list[float],
@@ -465,63 +844,18 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         self._ensure_initialized()
 
         try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-
-            # Fetch all documents (for small datasets this is fine)
-            cursor.execute(
-                f"SELECT id, text, embedding, metadata FROM {self.table_name}"
-            )
-            rows = cursor.fetchall()
-
-            # Compute similarities
-            results_with_distance = []
-            for row in rows:
-                doc_id = row["id"]
-                text = row["text"]
-                embedding = read_embedding(row["embedding"])
-                metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-
-                # Apply where filter if provided
-                if where:
-                    match = True
-                    for key, value in where.items():
-                        if metadata.get(key) != value:
-                            match = False
-                            break
-                    if not match:
-                        continue
-
-                # Compute cosine distance
-                distance = cosine_distance(query_embedding, embedding)
-                results_with_distance.append(
-                    SearchResult(
-                        id=doc_id,
-                        text=text,
-                        metadata=metadata,
-                        distance=distance,
-                    )
-                )
-
-            # Apply similarity threshold filter if specified
-            filtered_results = []
-            if min_similarity is not None:
-                for result in results_with_distance:
-                    similarity = 1.0 - result.distance
-                    if similarity >= min_similarity:
-                        filtered_results.append(result)
-
-                _LOGGER.debug(
-                    "RAG similarity filter: %d/%d results above threshold %.2f",
-                    len(filtered_results),
-                    len(results_with_distance),
-                    min_similarity,
+            index = await self._get_vector_index()
+            if index.quantized and self._rescores_from_storage:
+                search_results = await self._search_quantized(
+                    index, query_embedding, n_results, where, min_similarity
                 )
             else:
-                filtered_results = results_with_distance
-
-            # Sort by distance (ascending) and limit results
-            filtered_results.sort(key=lambda x: x.distance)
-            search_results = filtered_results[:n_results]
+                search_results = index.search(
+                    query_embedding,
+                    n_results=n_results,
+                    where=where,
+                    min_similarity=min_similarity,
+                )
 
             _LOGGER.debug("Search returned %d results", len(search_results))
             return search_results
@@ -530,6 +864,38 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             _LOGGER.error("Failed to search: %s", e)
             raise
 
+    async def _search_quantized(
+        self,
+        index: VectorIndex,
+        query_embedding: list[float],
+        n_results: int,
+        where: dict[str, Any] | None,
+        min_similarity: float | None,
+    ) -> list[SearchResult]:
+        """Int8 first pass over the index, then exact rescoring from SQLite."""
+        first_n, first_min = first_pass_limits(n_results, min_similarity)
+        candidates = index.search(
+            query_embedding, n_results=first_n, where=where, min_similarity=first_min
+        )
+        if not candidates:
+            return []
+
+        def _fetch(conn: sqlite3.Connection) -> dict[str, Any]:
+            placeholders = ",".join("?" * len(candidates))
+            rows = conn.execute(
+                f"SELECT id, embedding FROM {self.table_name} WHERE id IN ({placeholders})",
+                [c.id for c in candidates],
+            ).fetchall()
+            return {row["id"]: row["embedding"] for row in rows}
+
+        stored = await self.run_read("search_rescore", _fetch)
+        return [
+            replace(result, distance=distance)
+            for result, distance in rescore(
+                query_embedding, candidates, stored, n_results, min_similarity
+            )
+        ]
+
     async def delete_documents(self, ids: list[str]) -> None:
         """Delete documents from the store by their IDs.
 
@@ -542,19 +908,24 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
             _LOGGER.debug("No documents to delete")
             return
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        def _delete(conn: sqlite3.Connection) -> int:
+            cursor = conn.cursor()
             placeholders = ",".join("?" * len(ids))
             cursor.execute(
                 f"DELETE FROM {self.table_name} WHERE id IN ({placeholders})",
                 ids,
             )
+            deleted = cursor.rowcount
 
             # Sync FTS5
             self._fts_sync_delete(cursor, ids)
+            return deleted
 
-            self._conn.commit()  # type: ignore[union-attr]
-            _LOGGER.debug("Deleted %d documents from SQLite store", cursor.rowcount)
+        try:
+            deleted = await self.run_write("delete_documents", _delete)
+            if self._vector_index is not None:
+                self._vector_index.remove(ids)
+            _LOGGER.debug("Deleted %d documents from SQLite store", deleted)
 
         except Exception as e:
             _LOGGER.error("Failed to delete documents: %s", e)
@@ -568,11 +939,12 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
-            result = cursor.fetchone()
+        def _count(conn: sqlite3.Connection) -> int:
+            result = conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()
             return result[0] if result else 0
+
+        try:
+            return await self.run_read("get_document_count", _count)
         except Exception as e:
             _LOGGER.error("Failed to get document count: %s", e)
             raise
@@ -588,13 +960,14 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute(
+        def _get(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
                 f"SELECT id, text, metadata FROM {self.table_name} WHERE id = ?",
                 (doc_id,),
-            )
-            row = cursor.fetchone()
+            ).fetchone()
+
+        try:
+            row = await self.run_read("get_document", _get)
 
             if row:
                 return SearchResult(
@@ -613,20 +986,91 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """Clear all documents from the store."""
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
+        def _clear(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
             cursor.execute(f"DELETE FROM {self.table_name}")
 
             # Sync FTS5
             self._fts_sync_clear(cursor)
 
-            self._conn.commit()  # type: ignore[union-attr]
+        try:
+            await self.run_write("clear_collection", _clear)
+            if self._vector_index is not None:
+                self._vector_index.clear()
             _LOGGER.info("Cleared all documents from SQLite store")
 
         except Exception as e:
             _LOGGER.error("Failed to clear collection: %s", e)
             raise
 
+    # ------------------------------------------------------------------
+    # Resident vector index
+    # ------------------------------------------------------------------
+
+    async def _get_vector_index(self) -> VectorIndex:
+        """Return the resident vector index, building it from the table once.
+
+        The build runs as a writer job so it is ordered with pending writes:
+        every write that completes after the build is mirrored into the new
+        index by ``_index_sync_upsert`` / ``delete_documents``.
+        """
+        if self._vector_index is not None:
+            return self._vector_index
+
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+
+        async with self._index_lock:
+            if self._vector_index is None:
+                self._vector_index = await self.run_write(
+                    "build_vector_index", self._build_vector_index
+                )
+        return self._vector_index
+
+    def _build_vector_index(self, conn: sqlite3.Connection) -> VectorIndex:
+        """Load every entity row into a new ``VectorIndex`` (writer job)."""
+        start = time.perf_counter()
+        rows = conn.execute(
+            f"SELECT id, text, embedding, metadata FROM {self.table_name}"
+        ).fetchall()
+
+        index = VectorIndex(
+            quantized=self.embedding_format != EMBEDDING_FORMAT_FLOAT32
+        )
+        index.upsert(
+            [row["id"] for row in rows],
+            [row["text"] for row in rows],
+            [row["embedding"] for row in rows],
+            [json.loads(row["metadata"]) if row["metadata"] else {} for row in rows],
+        )
+        _LOGGER.debug(
+            "Built vector index: %d documents, dim=%s in %.1f ms",
+            len(index),
+            index.dim,
+            (time.perf_counter() - start) * 1000,
+        )
+        return index
+
+    def _index_sync_upsert(
+        self,
+        ids: list[str],
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]] | None,
+    ) -> None:
+        """Mirror committed writes into the vector index (if already built)."""
+        if self._vector_index is None:
+            return
+        self._vector_index.upsert(
+            ids,
+            texts,
+            embeddings,
+            [
+                filter_metadata(metadatas[i] if metadatas and i < len(metadatas) else {})
+                for i in range(len(ids))
+            ],
+        )
+
     # ------------------------------------------------------------------
     # RAG metadata key-value store
     # ------------------------------------------------------------------
@@ -642,11 +1086,14 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute("SELECT value FROM rag_metadata WHERE key = ?", (key,))
-            row = cursor.fetchone()
+        def _get(conn: sqlite3.Connection) -> str | None:
+            row = conn.execute(
+                "SELECT value FROM rag_metadata WHERE key = ?", (key,)
+            ).fetchone()
             return row["value"] if row else None
+
+        try:
+            return await self.run_read("get_metadata", _get)
         except Exception as e:
             _LOGGER.error("Failed to get metadata for key %s: %s", key, e)
             return None
@@ -660,21 +1107,84 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """
         self._ensure_initialized()
 
-        try:
-            cursor = self._conn.cursor()  # type: ignore[union-attr]
-            cursor.execute(
+        def _set(conn: sqlite3.Connection) -> None:
+            conn.execute(
                 """
                 INSERT OR REPLACE INTO rag_metadata (key, value, updated_at)
                 VALUES (?, ?, ?)
                 """,
                 (key, value, time.time()),
             )
-            self._conn.commit()  # type: ignore[union-attr]
+
+        try:
+            await self.run_write("set_metadata", _set)
             _LOGGER.debug("Set metadata: %s = %s", key, value)
         except Exception as e:
             _LOGGER.error("Failed to set metadata %s: %s", key, e)
             raise
 
+    # ------------------------------------------------------------------
+    # Intent prototypes
+    # ------------------------------------------------------------------
+
+    async def load_intent_prototypes(
+        self, table_hash: str
+    ) -> dict[str, list[float]] | None:
+        """Load persisted intent prototype embeddings.
+
+        Args:
+            table_hash: Hash of the prototype table (and embedding model)
+                the caller expects.
+
+        Returns:
+            Prototype key -> embedding, or None when nothing was stored for
+            ``table_hash``.
+        """
+        self._ensure_initialized()
+
+        def _load(conn: sqlite3.Connection) -> dict[str, list[float]] | None:
+            row = conn.execute(
+                "SELECT value FROM rag_metadata WHERE key = ?",
+                (INTENT_PROTOTYPES_HASH_KEY,),
+            ).fetchone()
+            if row is None or row["value"] != table_hash:
+                return None
+            rows = conn.execute("SELECT key, embedding FROM intent_prototypes")
+            return {r["key"]: read_embedding(r["embedding"]) for r in rows} or None
+
+        try:
+            return await self.run_read("load_intent_prototypes", _load)
+        except Exception as e:
+            _LOGGER.error("Failed to load intent prototypes: %s", e)
+            return None
+
+    async def save_intent_prototypes(
+        self, table_hash: str, prototypes: dict[str, list[float]]
+    ) -> None:
+        """Replace the persisted intent prototype embeddings.
+
+        Args:
+            table_hash: Hash identifying the prototype table.
+            prototypes: Prototype key -> embedding.
+        """
+        self._ensure_initialized()
+        rows = [(key, self.encode_embedding(emb)) for key, emb in prototypes.items()]
+
+        def _save(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM intent_prototypes")
+            conn.executemany(
+                "INSERT INTO intent_prototypes (key, embedding) VALUES (?, ?)", rows
+            )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO rag_metadata (key, value, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                (INTENT_PROTOTYPES_HASH_KEY, table_hash, time.time()),
+            )
+
+        await self.run_write("save_intent_prototypes", _save)
+
     # ------------------------------------------------------------------
     # Shutdown
     # ------------------------------------------------------------------
@@ -683,8 +1193,14 @@ class SqliteStore(SessionChunkMixin, EmbeddingCacheMixin, FtsIndexMixin):
         """Shutdown the SQLite connection gracefully."""
         if self._conn:
             _LOGGER.debug("Shutting down SQLite store")
-            self._conn.close()
+            if self._db is not None:
+                await self._db.async_close()
+                self._db = None
+            else:
+                self._conn.close()
             self._conn = None
+            self._vector_index = None
+            self._session_index = None
             self._initialized = False
 
     # ------------------------------------------------------------------
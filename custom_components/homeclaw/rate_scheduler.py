@@ -0,0 +1,395 @@
+"""Per-credential request scheduling for provider APIs.
+
+Live chat, the heartbeat, scheduled jobs, subagents and RAG maintenance
+often call the same API key at the same time.  Every provider request
+therefore passes through the ``AccountLimiter`` of its credential and
+model (providers budget each model separately), which keeps:
+
+- two per-minute budgets (requests and tokens), refilled continuously;
+- a pause shared by all callers after a 429, for the server's retry delay;
+- one queue per priority class, with round-robin between request sources
+  inside a class, so live chat goes first and no background job can
+  monopolize the key.
+
+Limits start unknown (unlimited) and are learned from the rate-limit
+response headers OpenAI-compatible and Anthropic APIs send, unless they
+are configured explicitly.
+
+Callers pick their class with ``request_priority``; requests made outside
+it are interactive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RATE_SCHEDULER = "homeclaw_rate_scheduler"
+
+# Pause after a 429 that carries no retry hint
+DEFAULT_RATE_LIMIT_PAUSE = 5.0  # seconds
+
+# (budget, limit header, remaining header, reset header)
+_LIMIT_HEADERS = (
+    # OpenAI, Groq, DeepSeek, OpenRouter, ... (reset: "1s", "6m0s", "20ms")
+    (
+        "requests",
+        "x-ratelimit-limit-requests",
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-reset-requests",
+    ),
+    (
+        "tokens",
+        "x-ratelimit-limit-tokens",
+        "x-ratelimit-remaining-tokens",
+        "x-ratelimit-reset-tokens",
+    ),
+    # Anthropic (reset: RFC 3339 timestamp)
+    (
+        "requests",
+        "anthropic-ratelimit-requests-limit",
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-requests-reset",
+    ),
+    (
+        "tokens",
+        "anthropic-ratelimit-tokens-limit",
+        "anthropic-ratelimit-tokens-remaining",
+        "anthropic-ratelimit-tokens-reset",
+    ),
+)
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class Priority(IntEnum):
+    """Request classes, served in this order."""
+
+    INTERACTIVE = 0  # live chat and voice
+    BACKGROUND = 1  # heartbeat, scheduled jobs, subagents, memory flush
+    BULK = 2  # RAG maintenance (optimizer, archiving, indexing)
+
+
+_request_class: ContextVar[tuple[Priority, str]] = ContextVar(
+    "homeclaw_request_class", default=(Priority.INTERACTIVE, "chat")
+)
+
+
+@contextmanager
+def request_priority(priority: Priority, source: str) -> Iterator[None]:
+    """Run the enclosed provider calls at ``priority`` on behalf of ``source``.
+
+    Tasks created inside the block inherit the class.
+    """
+    token = _request_class.set((priority, source))
+    try:
+        yield
+    finally:
+        _request_class.reset(token)
+
+
+def parse_reset(value: Any) -> float | None:
+    """Parse a rate-limit reset header to seconds from now.
+
+    Accepts OpenAI-style durations (``"1m30.5s"``, ``"20ms"``) and
+    RFC 3339 timestamps (Anthropic).
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    parts = _DURATION_PART_RE.findall(value)
+    if parts and "".join(num + unit for num, unit in parts) == value:
+        scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+        return sum(float(num) * scale[unit] for num, unit in parts)
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _to_number(value: Any) -> float | None:
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _Budget:
+    """Continuously refilled per-minute budget (requests or tokens)."""
+
+    def __init__(self, per_minute: float | None) -> None:
+        self.limit = per_minute
+        self.configured = per_minute is not None
+        self.available = per_minute or 0.0
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.limit and now > self._updated:
+            self.available = min(
+                self.limit, self.available + (now - self._updated) * self.limit / 60
+            )
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 = now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if not self.limit:
+            return 0.0
+        self._refill(now)
+        # A request larger than the whole budget waits for a full bucket
+        needed = min(amount, self.limit)
+        if self.available >= needed:
+            return 0.0
+        return (needed - self.available) * 60 / self.limit
+
+    def take(self, amount: float, now: float) -> None:
+        if self.limit:
+            self._refill(now)
+            self.available -= amount
+
+    def learn(
+        self, limit: float | None, remaining: float | None, reset: float | None
+    ) -> None:
+        """Adopt the server's view of this budget."""
+        now = time.monotonic()
+        self._refill(now)
+        if limit and not self.configured:
+            self.limit = limit
+        if remaining is not None and self.limit:
+            self.available = min(self.limit, remaining)
+            if remaining <= 0 and reset:
+                self.blocked_until = max(self.blocked_until, now + reset)
+
+
+@dataclass
+class _Waiter:
+    """A queued request."""
+
+    tokens: float
+    future: asyncio.Future[None]
+
+
+class AccountLimiter:
+    """Request scheduler for one API credential.
+
+    Args:
+        name: Account key (host, credential digest and model), used in logs.
+        rpm: Configured requests per minute (None = learn from headers).
+        tpm: Configured tokens per minute (None = learn from headers).
+    """
+
+    def __init__(
+        self, name: str, *, rpm: float | None = None, tpm: float | None = None
+    ) -> None:
+        """Initialize with empty queues."""
+        self.name = name
+        self._requests = _Budget(rpm)
+        self._tokens = _Budget(tpm)
+        self._paused_until = 0.0
+        # priority -> source -> waiters (sources are served round-robin)
+        self._queues: dict[Priority, OrderedDict[str, deque[_Waiter]]] = {
+            priority: OrderedDict() for priority in Priority
+        }
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+        self._granted = {priority: 0 for priority in Priority}
+        self._waited = 0.0
+        self._pauses = 0
+
+    async def acquire(self, tokens: float = 0.0) -> float:
+        """Wait for a request slot and ``tokens`` of the token budget.
+
+        The caller's class comes from ``request_priority``.
+
+        Args:
+            tokens: Estimated tokens the request will consume.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        priority, source = _request_class.get()
+        now = time.monotonic()
+        if not self._has_waiters() and self._wait_time(tokens, now) == 0:
+            self._grant(priority, tokens, now)
+            return 0.0
+
+        waiter = _Waiter(tokens, asyncio.get_running_loop().create_future())
+        self._queues[priority].setdefault(source, deque()).append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        self._wakeup.set()
+
+        await waiter.future
+        waited = time.monotonic() - now
+        self._waited += waited
+        if waited > 1:
+            _LOGGER.debug(
+                "%s request from %s waited %.1fs for %s",
+                priority.name.lower(),
+                source,
+                waited,
+                self.name,
+            )
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for ``seconds`` (the server asked us to back off)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._pauses += 1
+        self._wakeup.set()
+
+    def learn(self, headers: Mapping[str, Any] | None) -> None:
+        """Update the budgets from a response's rate-limit headers."""
+        if not headers or not hasattr(headers, "get"):
+            return
+        for budget_name, limit_key, remaining_key, reset_key in _LIMIT_HEADERS:
+            limit = _to_number(headers.get(limit_key))
+            remaining = _to_number(headers.get(remaining_key))
+            if limit is None and remaining is None:
+                continue
+            budget = self._requests if budget_name == "requests" else self._tokens
+            budget.learn(limit, remaining, parse_reset(headers.get(reset_key)))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get learned limits, queue depth and wait statistics."""
+        return {
+            "rpm": self._requests.limit,
+            "tpm": self._tokens.limit,
+            "queued": {
+                priority.name.lower(): sum(len(q) for q in queues.values())
+                for priority, queues in self._queues.items()
+            },
+            "granted": {
+                priority.name.lower(): count
+                for priority, count in self._granted.items()
+            },
+            "pauses": self._pauses,
+            "total_wait_s": round(self._waited, 3),
+        }
+
+    def _has_waiters(self) -> bool:
+        return any(self._queues[priority] for priority in Priority)
+
+    def _wait_time(self, tokens: float, now: float) -> float:
+        return max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._tokens.wait_time(tokens, now),
+            0.0,
+        )
+
+    def _grant(self, priority: Priority, tokens: float, now: float) -> None:
+        self._requests.take(1, now)
+        self._tokens.take(tokens, now)
+        self._granted[priority] += 1
+
+    def _next_waiter(self) -> tuple[Priority, str, _Waiter] | None:
+        """Return the waiter to serve next, dropping cancelled ones."""
+        for priority in Priority:
+            queues = self._queues[priority]
+            while queues:
+                source, waiters = next(iter(queues.items()))
+                while waiters and waiters[0].future.done():
+                    waiters.popleft()
+                if waiters:
+                    return priority, source, waiters[0]
+                del queues[source]
+        return None
+
+    async def _dispatch(self) -> None:
+        """Grant queued requests in priority order as budget becomes available."""
+        while (entry := self._next_waiter()) is not None:
+            priority, source, waiter = entry
+            delay = self._wait_time(waiter.tokens, time.monotonic())
+            if delay > 0:
+                # Woken early by a pause, or a waiter of a higher class
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            queues = self._queues[priority]
+            queues[source].popleft()
+            if queues[source]:
+                queues.move_to_end(source)
+            else:
+                del queues[source]
+            self._grant(priority, waiter.tokens, time.monotonic())
+            waiter.future.set_result(None)
+
+
+@dataclass
+class RateScheduler:
+    """The ``AccountLimiter`` of every credential in use."""
+
+    _limiters: dict[str, AccountLimiter] = field(default_factory=dict, repr=False)
+
+    def limiter(
+        self, account: str, *, rpm: float | None = None, tpm: float | None = None
+    ) -> AccountLimiter:
+        """Return the limiter for ``account``, creating it on first use."""
+        limiter = self._limiters.get(account)
+        if limiter is None:
+            limiter = self._limiters[account] = AccountLimiter(
+                account, rpm=rpm, tpm=tpm
+            )
+        return limiter
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of every limiter."""
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
+
+
+def get_rate_scheduler(hass: HomeAssistant) -> RateScheduler:
+    """Return the Home Assistant instance's scheduler, creating it on first use."""
+    scheduler = hass.data.get(DATA_RATE_SCHEDULER)
+    if not isinstance(scheduler, RateScheduler):
+        scheduler = hass.data[DATA_RATE_SCHEDULER] = RateScheduler()
+    return scheduler
+
+
+def get_account_limiter(
+    hass: HomeAssistant,
+    url: str,
+    credential: str | None,
+    *,
+    model: str | None = None,
+    rpm: float | None = None,
+    tpm: float | None = None,
+) -> AccountLimiter:
+    """Return the limiter for ``credential`` and ``model`` on the host of ``url``.
+
+    Rate limits are per model, so every model of a key gets its own
+    budgets and 429 pause; clients calling the same model with the same key
+    share one limiter.  The key itself is only kept as a digest.
+    """
+    host = urlsplit(url).hostname or url
+    digest = hashlib.sha256(str(credential or "").encode()).hexdigest()[:12]
+    account = f"{host}:{digest}" if model is None else f"{host}:{digest}:{model}"
+    return get_rate_scheduler(hass).limiter(account, rpm=rpm, tpm=tpm)
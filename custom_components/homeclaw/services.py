@@ -207,7 +207,8 @@ async def _handle_rag_reindex(
             return {"error": "RAG system not initialized"}
 
         _LOGGER.info("Starting RAG full reindex via service call...")
-        await rag_manager.full_reindex()
+        if not await rag_manager.full_reindex():
+            return {"error": "Reindex incomplete, it will resume on the next run"}
         stats = await rag_manager.get_stats()
         _LOGGER.info(
             "RAG reindex completed: %d entities indexed",
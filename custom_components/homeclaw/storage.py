@@ -2,6 +2,12 @@
 
 This module provides persistent storage for chat sessions and messages
 using Home Assistant's Store helpers. Each user has isolated storage.
+
+Layout (data v4): a small per-user index document holds the session list
+and preferences, and the messages of every session live in their own
+Store file.  Adding or editing a message only rewrites that session's
+file, and writes are coalesced with ``Store.async_delay_save`` so a burst
+of updates during one streamed turn ends up as a single flush.
 """
 
 from __future__ import annotations
@@ -24,10 +30,17 @@ _LOGGER = logging.getLogger(__name__)
 # implementing Store._async_migrate_func which is complex.  We keep it at 1
 # and handle our own data-level versioning via data["version"] inside _load().
 STORAGE_VERSION = 1
-DATA_VERSION = (
-    3  # Internal data schema version (v3 adds content_blocks + tool_call_id to Message)
-)
+# Internal data schema version (v3 adds content_blocks + tool_call_id to Message,
+# v4 moves messages out of the index into one Store per session)
+DATA_VERSION = 4
 STORAGE_KEY = "homeclaw_user_data"
+MESSAGES_STORAGE_KEY = "homeclaw_sessions"
+
+# Seconds to coalesce writes before flushing to disk
+SAVE_DELAY = 2
+
+# hass.data key of the shared Store registry (see _shared_store)
+_STORES_DATA_KEY = "homeclaw_session_stores"
 
 # Limits
 MAX_SESSIONS = 100
@@ -36,6 +49,22 @@ MAX_MESSAGE_LENGTH = 50000
 SESSION_RETENTION_DAYS = 90
 
 
+def _shared_store(hass: HomeAssistant, key: str) -> Store[dict[str, Any]]:
+    """Return the one Store object used for ``key`` in this HA instance.
+
+    Writes are debounced, so every SessionStorage touching a file must go
+    through the same Store: its ``async_load`` returns a pending write
+    instead of the stale file contents.
+    """
+    stores: dict[str, Store[dict[str, Any]]] = hass.data.setdefault(
+        _STORES_DATA_KEY, {}
+    )
+    store = stores.get(key)
+    if store is None:
+        store = stores[key] = Store(hass, STORAGE_VERSION, key)
+    return store
+
+
 @dataclass
 class Message:
     """Represents a chat message."""
@@ -107,34 +136,81 @@ class SessionStorage:
         """
         self.hass = hass
         self.user_id = user_id
-        self._store: Store[dict[str, Any]] = Store(
-            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{user_id}"
-        )
+        self._store = _shared_store(hass, f"{STORAGE_KEY}_{user_id}")
         self._data: dict[str, Any] | None = None
+        # Per-session message lists, loaded on first access
+        self._messages: dict[str, list[dict[str, Any]]] = {}
+        # message_id -> message dict, per loaded session
+        self._message_index: dict[str, dict[str, dict[str, Any]]] = {}
 
     async def _load(self) -> dict[str, Any]:
-        """Load data from store, with migration support.
+        """Load the session index from store, with migration support.
 
         Returns:
-            Dictionary containing sessions and messages data
+            Dictionary containing the sessions index and preferences
         """
         if self._data is None:
             loaded = await self._store.async_load()
             self._data = loaded or {
                 "version": DATA_VERSION,
                 "sessions": [],
-                "messages": {},
             }
             await self._migrate_v1_to_v2()
             await self._migrate_v2_to_v3()
+            await self._migrate_v3_to_v4()
             await self._migrate_legacy_data()
             await self._cleanup_old_sessions()
         return self._data
 
     async def _save(self) -> None:
-        """Save data to store."""
+        """Schedule a (coalesced) write of the session index."""
         if self._data:
-            await self._store.async_save(self._data)
+            self._store.async_delay_save(self._index_data, SAVE_DELAY)
+
+    def _index_data(self) -> dict[str, Any]:
+        """Return the index document to write."""
+        return self._data or {"version": DATA_VERSION, "sessions": []}
+
+    def _message_store(self, session_id: str) -> Store[dict[str, Any]]:
+        """Return the Store holding the messages of ``session_id``."""
+        return _shared_store(
+            self.hass, f"{MESSAGES_STORAGE_KEY}/{self.user_id}/{session_id}"
+        )
+
+    def _set_messages(self, session_id: str, messages: list[dict[str, Any]]) -> None:
+        """Cache the message list of a session and rebuild its id index."""
+        self._messages[session_id] = messages
+        self._message_index[session_id] = {m["message_id"]: m for m in messages}
+
+    async def _load_messages(self, session_id: str) -> list[dict[str, Any]]:
+        """Return the (cached) message list of a session."""
+        if session_id not in self._messages:
+            loaded = await self._message_store(session_id).async_load()
+            self._set_messages(session_id, (loaded or {}).get("messages", []))
+        return self._messages[session_id]
+
+    def _save_messages(self, session_id: str) -> None:
+        """Schedule a (coalesced) write of one session's messages."""
+        self._message_store(session_id).async_delay_save(
+            lambda: {"messages": self._messages.get(session_id, [])}, SAVE_DELAY
+        )
+
+    async def _remove_messages(self, session_id: str) -> None:
+        """Drop a session's messages from memory and disk."""
+        self._messages.pop(session_id, None)
+        self._message_index.pop(session_id, None)
+        store = self._message_store(session_id)
+        self.hass.data[_STORES_DATA_KEY].pop(store.key, None)
+        await store.async_remove()
+
+    def _find_session(self, session_id: str) -> dict[str, Any] | None:
+        """Return the index entry of a session, or None."""
+        if self._data is None:
+            return None
+        for session in self._data["sessions"]:
+            if session["session_id"] == session_id:
+                return session
+        return None
 
     async def _migrate_v1_to_v2(self) -> None:
         """Migrate storage from v1 to v2: add metadata field to sessions.
@@ -187,7 +263,7 @@ class SessionStorage:
                 if "tool_call_id" not in msg:
                     msg["tool_call_id"] = ""
 
-        self._data["version"] = DATA_VERSION
+        self._data["version"] = 3  # Let v3→v4 run next
 
         if migrated_count:
             _LOGGER.info(
@@ -197,6 +273,35 @@ class SessionStorage:
             )
             await self._save()
 
+    async def _migrate_v3_to_v4(self) -> None:
+        """Migrate storage from v3 to v4: one message Store per session.
+
+        Messages are written to their per-session stores first and the index
+        is rewritten without them afterwards, so an interrupted migration
+        simply runs again on the next load.
+        """
+        if self._data is None:
+            return
+
+        legacy_messages = self._data.get("messages")
+        if legacy_messages is None:
+            self._data["version"] = max(self._data.get("version", 1), DATA_VERSION)
+            return
+
+        for session_id, messages in legacy_messages.items():
+            self._set_messages(session_id, messages)
+            await self._message_store(session_id).async_save({"messages": messages})
+
+        del self._data["messages"]
+        self._data["version"] = DATA_VERSION
+        await self._store.async_save(self._data)
+
+        _LOGGER.info(
+            "Migrated %d sessions to per-session message storage for user %s",
+            len(legacy_messages),
+            self.user_id,
+        )
+
     async def _migrate_legacy_data(self) -> None:
         """Migrate from legacy prompt history if exists.
 
@@ -232,18 +337,24 @@ class SessionStorage:
                 provider="unknown",
             )
             self._data["sessions"].append(asdict(session))
-            self._data["messages"][session.session_id] = []
 
             # Convert prompts to messages
-            for prompt in legacy_data["prompts"]:
-                message = Message(
-                    message_id=str(uuid.uuid4()),
-                    session_id=session.session_id,
-                    role="user",
-                    content=prompt,
-                    timestamp=now,
-                )
-                self._data["messages"][session.session_id].append(asdict(message))
+            self._set_messages(
+                session.session_id,
+                [
+                    asdict(
+                        Message(
+                            message_id=str(uuid.uuid4()),
+                            session_id=session.session_id,
+                            role="user",
+                            content=prompt,
+                            timestamp=now,
+                        )
+                    )
+                    for prompt in legacy_data["prompts"]
+                ],
+            )
+            self._save_messages(session.session_id)
 
             # Update session message count
             for s in self._data["sessions"]:
@@ -283,11 +394,12 @@ class SessionStorage:
                 self.user_id,
             )
 
+            removed = set(sessions_to_remove)
+            self._data["sessions"] = [
+                s for s in self._data["sessions"] if s["session_id"] not in removed
+            ]
             for session_id in sessions_to_remove:
-                self._data["sessions"] = [
-                    s for s in self._data["sessions"] if s["session_id"] != session_id
-                ]
-                self._data["messages"].pop(session_id, None)
+                await self._remove_messages(session_id)
 
             await self._save()
 
@@ -341,7 +453,7 @@ class SessionStorage:
         )
 
         data["sessions"].append(asdict(session))
-        data["messages"][session.session_id] = []
+        self._set_messages(session.session_id, [])
 
         _LOGGER.info(
             "💾 Saving session %s to storage (user: %s)",
@@ -405,16 +517,13 @@ class SessionStorage:
         Raises:
             ValueError: If session not found
         """
-        data = await self._load()
+        await self._load()
 
         # Verify session exists
-        session_exists = any(
-            s["session_id"] == session_id for s in data.get("sessions", [])
-        )
-        if not session_exists:
+        if self._find_session(session_id) is None:
             raise ValueError(f"Session {session_id} not found")
 
-        messages = data.get("messages", {}).get(session_id, [])
+        messages = await self._load_messages(session_id)
 
         # Deduplicate by message_id (keep last occurrence)
         seen: dict[str, dict[str, Any]] = {}
@@ -437,14 +546,17 @@ class SessionStorage:
         Raises:
             ValueError: If session not found
         """
-        data = await self._load()
+        await self._load()
 
-        if session_id not in data["messages"]:
+        session = self._find_session(session_id)
+        if session is None:
             raise ValueError(f"Session {session_id} not found")
 
+        messages = await self._load_messages(session_id)
+        index = self._message_index[session_id]
+
         # Deduplicate: skip if message_id already exists
-        existing_ids = {m["message_id"] for m in data["messages"][session_id]}
-        if message.message_id in existing_ids:
+        if message.message_id in index:
             _LOGGER.debug(
                 "Duplicate message_id %s in session %s, skipping",
                 message.message_id,
@@ -453,35 +565,36 @@ class SessionStorage:
             return
 
         # Enforce message limit - remove oldest if at max
-        if len(data["messages"][session_id]) >= MAX_MESSAGES_PER_SESSION:
-            removed_count = (
-                len(data["messages"][session_id]) - MAX_MESSAGES_PER_SESSION + 1
-            )
-            data["messages"][session_id] = data["messages"][session_id][removed_count:]
+        if len(messages) >= MAX_MESSAGES_PER_SESSION:
+            removed_count = len(messages) - MAX_MESSAGES_PER_SESSION + 1
+            for old in messages[:removed_count]:
+                if index.get(old["message_id"]) is old:
+                    del index[old["message_id"]]
+            del messages[:removed_count]
             _LOGGER.debug(
                 "Message limit reached for session %s, removed %d oldest messages",
                 session_id,
                 removed_count,
             )
 
-        data["messages"][session_id].append(asdict(message))
+        stored = asdict(message)
+        messages.append(stored)
+        index[message.message_id] = stored
 
         # Update session metadata
-        for session in data["sessions"]:
-            if session["session_id"] == session_id:
-                session["updated_at"] = datetime.now(timezone.utc).isoformat()
-                session["message_count"] = len(data["messages"][session_id])
-
-                # Update preview and auto-title from user messages
-                if message.role == "user":
-                    session["preview"] = message.content[:100]
-                    if session["title"] == "New Conversation":
-                        title_text = message.content[:40]
-                        if len(message.content) > 40:
-                            title_text += "..."
-                        session["title"] = title_text
-                break
-
+        session["updated_at"] = datetime.now(timezone.utc).isoformat()
+        session["message_count"] = len(messages)
+
+        # Update preview and auto-title from user messages
+        if message.role == "user":
+            session["preview"] = message.content[:100]
+            if session["title"] == "New Conversation":
+                title_text = message.content[:40]
+                if len(message.content) > 40:
+                    title_text += "..."
+                session["title"] = title_text
+
+        self._save_messages(session_id)
         await self._save()
 
     async def compact_session_messages(
@@ -500,8 +613,11 @@ class SessionStorage:
             summary_text: AI-generated summary of the old messages.
             keep_last: Number of most recent messages to preserve.
         """
-        data = await self._load()
-        messages = data.get("messages", {}).get(session_id, [])
+        await self._load()
+        session = self._find_session(session_id)
+        if session is None:
+            return
+        messages = await self._load_messages(session_id)
 
         if len(messages) <= keep_last + 2:
             return  # Not enough messages to compact
@@ -545,21 +661,20 @@ class SessionStorage:
 
         old_count = len(messages)
         preserved = messages[-keep_last:]
-        data["messages"][session_id] = [summary_system, summary_assistant] + preserved
+        compacted = [summary_system, summary_assistant] + preserved
+        self._set_messages(session_id, compacted)
 
         # Update session metadata
-        for session in data["sessions"]:
-            if session["session_id"] == session_id:
-                session["message_count"] = len(data["messages"][session_id])
-                break
+        session["message_count"] = len(compacted)
 
+        self._save_messages(session_id)
         await self._save()
 
         _LOGGER.info(
             "Compacted session %s storage: %d -> %d messages (kept last %d + 2 summary)",
             session_id,
             old_count,
-            len(data["messages"][session_id]),
+            len(compacted),
             keep_last,
         )
 
@@ -585,28 +700,29 @@ class SessionStorage:
         Returns:
             True if message was found and updated, False otherwise
         """
-        data = await self._load()
+        await self._load()
 
-        if session_id not in data["messages"]:
+        if self._find_session(session_id) is None:
             return False
 
-        for msg in data["messages"][session_id]:
-            if msg["message_id"] == message_id:
-                if content is not None:
-                    msg["content"] = content[:MAX_MESSAGE_LENGTH]
-                if status is not None:
-                    if status not in ("pending", "completed", "error"):
-                        raise ValueError(f"Invalid status: {status}")
-                    msg["status"] = status
-                if error_message is not None:
-                    msg["error_message"] = error_message
-                if metadata is not None:
-                    msg["metadata"] = {**msg.get("metadata", {}), **metadata}
-
-                await self._save()
-                return True
+        await self._load_messages(session_id)
+        msg = self._message_index[session_id].get(message_id)
+        if msg is None:
+            return False
 
-        return False
+        if content is not None:
+            msg["content"] = content[:MAX_MESSAGE_LENGTH]
+        if status is not None:
+            if status not in ("pending", "completed", "error"):
+                raise ValueError(f"Invalid status: {status}")
+            msg["status"] = status
+        if error_message is not None:
+            msg["error_message"] = error_message
+        if metadata is not None:
+            msg["metadata"] = {**msg.get("metadata", {}), **metadata}
+
+        self._save_messages(session_id)
+        return True
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session and its messages.
@@ -622,9 +738,9 @@ class SessionStorage:
         data["sessions"] = [
             s for s in data["sessions"] if s["session_id"] != session_id
         ]
-        data["messages"].pop(session_id, None)
 
         if len(data["sessions"]) < original_count:
+            await self._remove_messages(session_id)
             await self._save()
             _LOGGER.debug("Deleted session %s", session_id)
 
@@ -758,10 +874,12 @@ class SessionStorage:
 
         Use with caution - this permanently removes all data.
         """
+        data = await self._load()
+        for session in data["sessions"]:
+            await self._remove_messages(session["session_id"])
         self._data = {
             "version": DATA_VERSION,
             "sessions": [],
-            "messages": {},
         }
-        await self._save()
+        await self._store.async_save(self._data)
         _LOGGER.info("Cleared all sessions for user %s", self.user_id)
@@ -24,7 +24,17 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -214,6 +224,8 @@ class Tool(ABC):
         - parameters: List of ToolParameter definitions
         - category: ToolCategory for organization
         - enabled: Whether the tool is active
+        - read_only: True if the tool has no side effects, so calls to it
+          may run concurrently with other read-only calls of the same turn
         - get_system_prompt(): Custom prompt text for the AI
     """
 
@@ -226,6 +238,7 @@ class Tool(ABC):
     tier: ClassVar[ToolTier] = ToolTier.ON_DEMAND
     enabled: ClassVar[bool] = True
     requires_confirmation: ClassVar[bool] = False
+    read_only: ClassVar[bool] = False
 
     def __init__(self, hass: Any = None, config: Optional[Dict[str, Any]] = None):
         """Initialize the tool.
@@ -368,6 +381,10 @@ class ToolRegistry:
 
     _tools: ClassVar[Dict[str, Type[Tool]]] = {}
     _instances: ClassVar[Dict[str, Tool]] = {}
+    # Bumped on every register/clear so derived caches (compiled schemas,
+    # enabled IDs) know when to rebuild
+    _generation: ClassVar[int] = 0
+    _enabled_ids: ClassVar[Optional[FrozenSet[str]]] = None
 
     @classmethod
     def register(cls, tool_class: Type[T]) -> Type[T]:
@@ -392,9 +409,35 @@ class ToolRegistry:
             _LOGGER.warning(f"Overwriting existing tool registration: {tool_id}")
 
         cls._tools[tool_id] = tool_class
+        cls._invalidate()
         _LOGGER.debug(f"Registered tool: {tool_id}")
         return tool_class
 
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Mark everything derived from the registered tool set as stale."""
+        cls._generation += 1
+        cls._enabled_ids = None
+
+    @classmethod
+    def generation(cls) -> int:
+        """Return a counter that changes whenever the registry changes."""
+        return cls._generation
+
+    @classmethod
+    def enabled_tool_ids(cls) -> FrozenSet[str]:
+        """Return the IDs of all enabled tools without instantiating them.
+
+        Cached until the next ``register``/``clear``.
+        """
+        if cls._enabled_ids is None:
+            cls._enabled_ids = frozenset(
+                tool_id
+                for tool_id, tool_class in cls._tools.items()
+                if tool_class.enabled
+            )
+        return cls._enabled_ids
+
     @classmethod
     def get_tool_class(cls, tool_id: str) -> Optional[Type[Tool]]:
         """Get a tool class by its ID.
@@ -663,3 +706,4 @@ class ToolRegistry:
         """
         cls._tools.clear()
         cls._instances.clear()
+        cls._invalidate()
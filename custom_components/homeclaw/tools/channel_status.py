@@ -33,6 +33,7 @@ class CheckDiscordConnection(Tool):
     )
     short_description = "Check Discord connection and configuration status"
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
 
     async def execute(self, **kwargs: Any) -> ToolResult:
         """Return current Discord connection status."""
@@ -104,6 +105,7 @@ class GetDiscordLastTarget(Tool):
     description = "Get the latest Discord target used by this user (channel/DM) for reliable reply routing."
     short_description = "Get the latest Discord target for reply routing"
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     parameters = []
 
     async def execute(self, **kwargs: Any) -> ToolResult:
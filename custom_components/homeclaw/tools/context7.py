@@ -29,6 +29,7 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from ..http_pool import pooled_session
 from .base import Tool, ToolCategory, ToolParameter, ToolRegistry, ToolResult, ToolTier
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +92,7 @@ async def _call_mcp_tool(
     arguments: Dict[str, Any],
     api_key: Optional[str] = None,
     timeout: int = API_CONFIG["DEFAULT_TIMEOUT"],
+    hass: Any = None,
 ) -> ToolResult:
     """Call a tool on the Context7 MCP endpoint.
 
@@ -99,6 +101,7 @@ async def _call_mcp_tool(
         arguments: Arguments to pass to the tool
         api_key: Optional API key for higher rate limits
         timeout: Request timeout in seconds
+        hass: Home Assistant instance whose shared HTTP pool to use (optional)
 
     Returns:
         ToolResult with the response
@@ -126,7 +129,7 @@ async def _call_mcp_tool(
     url = f"{API_CONFIG['BASE_URL']}{API_CONFIG['ENDPOINT']}"
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session(hass) as session:
             async with session.post(
                 url,
                 headers=headers,
@@ -204,6 +207,7 @@ class Context7ResolveTool(Tool):
     )
     short_description = "Resolve a library name to Context7 documentation ID"
     category = ToolCategory.WEB
+    read_only = True
 
     parameters = [
         ToolParameter(
@@ -245,6 +249,7 @@ class Context7ResolveTool(Tool):
                 "query": query,
             },
             api_key=api_key,
+            hass=self.hass,
         )
 
         # Update title with library name
@@ -277,6 +282,7 @@ class Context7DocsTool(Tool):
     )
     short_description = "Get up-to-date library documentation and code examples"
     category = ToolCategory.WEB
+    read_only = True
 
     parameters = [
         ToolParameter(
@@ -342,6 +348,7 @@ class Context7DocsTool(Tool):
             tool_name="query-docs",
             arguments=arguments,
             api_key=api_key,
+            hass=self.hass,
         )
 
         # Update title
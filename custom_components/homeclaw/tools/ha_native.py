@@ -99,6 +99,7 @@ class GetEntityState(Tool):
     id = "get_entity_state"
     description = "Get the state and attributes of a specific entity."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -148,6 +149,7 @@ class GetEntitiesByDomain(Tool):
         "Returns lightweight info — use get_entity_state for full details."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -201,6 +203,7 @@ class GetEntityRegistrySummary(Tool):
     id = "get_entity_registry_summary"
     description = "Get a summary of all entities in the system, counted by domain, area, and device_class."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []  # No parameters
 
@@ -254,6 +257,7 @@ class GetEntityRegistry(Tool):
     id = "get_entity_registry"
     description = "Get list of entities filtered by domain, area, or device_class."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -449,6 +453,7 @@ class GetHistory(Tool):
         "Returns state and timestamp only — use get_entity_state for current attributes."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -553,6 +558,7 @@ class GetEntitiesByDeviceClass(Tool):
         "Returns lightweight info — use get_entity_state for full details."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -627,6 +633,7 @@ class GetEntitiesByArea(Tool):
         "Returns lightweight info — use get_entity_state for full details."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -689,6 +696,7 @@ class GetEntities(Tool):
         "Returns lightweight info — use get_entity_state for full details."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -769,6 +777,7 @@ class GetClimateRelatedEntities(Tool):
         "and humidity sensors. Returns lightweight info."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -824,6 +833,7 @@ class GetStatistics(Tool):
         "Get statistics (mean, min, max, sum) for an entity from the recorder."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -896,6 +906,7 @@ class GetDeviceRegistrySummary(Tool):
     id = "get_device_registry_summary"
     description = "Get a summary of all devices in the system, counted by manufacturer, area, and integration."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []
 
@@ -935,6 +946,7 @@ class GetDeviceRegistry(Tool):
     id = "get_device_registry"
     description = "Get device registry entries with filtering and pagination."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -1014,6 +1026,7 @@ class GetAreaRegistry(Tool):
     id = "get_area_registry"
     description = "Get all areas defined in Home Assistant with their details."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []
 
@@ -1045,6 +1058,7 @@ class GetWeatherData(Tool):
         "Get current weather data and forecast from available weather entities."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []
 
@@ -1098,6 +1112,7 @@ class GetCalendarEvents(Tool):
     id = "get_calendar_events"
     description = "Get calendar events from calendar entities."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -1192,6 +1207,7 @@ class GetAutomations(Tool):
     id = "get_automations"
     description = "Get automations in the system with pagination."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -1242,6 +1258,7 @@ class GetScenes(Tool):
     id = "get_scenes"
     description = "Get scenes in the system with pagination."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
@@ -1286,6 +1303,7 @@ class GetPersonData(Tool):
     id = "get_person_data"
     description = "Get person tracking information including location data."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []
 
@@ -1326,6 +1344,7 @@ class GetDashboards(Tool):
     id = "get_dashboards"
     description = "Get list of all Lovelace dashboards."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = []
 
@@ -1351,6 +1370,7 @@ class GetDashboardConfig(Tool):
     id = "get_dashboard_config"
     description = "Get configuration of a specific dashboard."
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
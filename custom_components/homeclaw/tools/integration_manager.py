@@ -58,6 +58,7 @@ class ListAvailableIntegrations(Tool):
     )
     short_description = "List available HA integrations with config flow info"
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     parameters = [
         ToolParameter(
             name="filter",
@@ -170,6 +171,7 @@ class ReadYamlConfig(Tool):
     )
     short_description = "Read current configuration.yaml content"
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     parameters = [
         ToolParameter(
             name="section",
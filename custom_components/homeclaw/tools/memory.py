@@ -171,6 +171,7 @@ class MemoryRecallTool(Tool):
         "previously stored facts from earlier conversations."
     )
     category = ToolCategory.HOME_ASSISTANT
+    read_only = True
     tier = ToolTier.CORE
     parameters = [
         ToolParameter(
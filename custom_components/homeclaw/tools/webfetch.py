@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from ..http_pool import pooled_session
 from .base import Tool, ToolCategory, ToolParameter, ToolRegistry, ToolResult, ToolTier
 
 _LOGGER = logging.getLogger(__name__)
@@ -267,6 +268,7 @@ class WebFetchTool(Tool):
     )
     short_description = "Fetch and parse content from any URL (markdown, text, or HTML)"
     category = ToolCategory.WEB
+    read_only = True
 
     parameters = [
         ToolParameter(
@@ -330,7 +332,7 @@ class WebFetchTool(Tool):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session(self.hass) as session:
                 async with session.get(
                     url,
                     headers=headers,
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from ..http_pool import pooled_session
 from .base import Tool, ToolCategory, ToolParameter, ToolRegistry, ToolResult, ToolTier
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,6 +57,7 @@ class WebSearchTool(Tool):
     )
     short_description = "Search the web for current information using Exa AI"
     category = ToolCategory.WEB
+    read_only = True
 
     parameters = [
         ToolParameter(
@@ -154,7 +156,7 @@ class WebSearchTool(Tool):
         url = f"{API_CONFIG['BASE_URL']}{API_CONFIG['ENDPOINT']}"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session(self.hass) as session:
                 async with session.post(
                     url,
                     headers=headers,
@@ -278,6 +280,7 @@ class SimpleWebSearchTool(Tool):
     )
     short_description = "Quick web search with simplified parameters"
     category = ToolCategory.WEB
+    read_only = True
     enabled = False  # Disabled by default
 
     parameters = [
@@ -326,7 +329,7 @@ class SimpleWebSearchTool(Tool):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with pooled_session(self.hass) as session:
                 async with session.get(
                     search_url,
                     headers=headers,
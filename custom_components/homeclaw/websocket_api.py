@@ -51,6 +51,7 @@ from .ws_handlers.rag import (  # noqa: F401
     ws_rag_memory_delete,
     ws_rag_optimize_analyze,
     ws_rag_optimize_run,
+    ws_rag_reindex,
     ws_rag_search,
     ws_rag_sessions,
     ws_rag_stats,
@@ -47,6 +47,7 @@ from .rag import (
     ws_rag_memory_delete,
     ws_rag_optimize_analyze,
     ws_rag_optimize_run,
+    ws_rag_reindex,
     ws_rag_search,
     ws_rag_sessions,
     ws_rag_stats,
@@ -104,6 +105,8 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
     # RAG Optimizer
     websocket_api.async_register_command(hass, ws_rag_optimize_analyze)
     websocket_api.async_register_command(hass, ws_rag_optimize_run)
+    # RAG Reindex
+    websocket_api.async_register_command(hass, ws_rag_reindex)
     # Proactive: Heartbeat
     websocket_api.async_register_command(hass, ws_proactive_config_get)
     websocket_api.async_register_command(hass, ws_proactive_config_set)
@@ -346,10 +346,12 @@ async def ws_rag_search(
         return
 
     try:
+        timings: dict[str, Any] = {}
         context = await rag.get_relevant_context(
             msg["query"],
             top_k=min(msg.get("top_k", 5), 20),
             user_id=user_id,
+            timings_out=timings,
         )
         connection.send_result(
             msg["id"],
@@ -357,6 +359,7 @@ async def ws_rag_search(
                 "query": msg["query"],
                 "context": context or "(no relevant context found)",
                 "context_length": len(context) if context else 0,
+                "timings": timings,
             },
         )
     except Exception:
@@ -501,3 +504,52 @@ async def ws_rag_optimize_run(
     except Exception as err:
         _LOGGER.exception("RAG optimization failed")
         connection.send_error(request_id, ERR_AI_ERROR, f"Optimization failed: {err}")
+
+
+# ---------------------------------------------------------------------------
+# RAG Reindex endpoint
+# ---------------------------------------------------------------------------
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "homeclaw/rag/reindex",
+    }
+)
+@websocket_api.async_response
+async def ws_rag_reindex(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Rebuild the entity index, resuming an interrupted reindex.
+
+    Streams progress events back to the frontend, then sends the final result.
+    """
+    request_id = msg["id"]
+    rag = _get_rag_manager(hass)
+
+    if not rag or not rag.is_initialized:
+        connection.send_error(request_id, ERR_STORAGE_ERROR, "RAG not initialized")
+        return
+
+    if rag.reindex_running:
+        connection.send_error(request_id, ERR_INVALID_INPUT, "Reindex already running")
+        return
+
+    async def progress_callback(event: dict[str, Any]) -> None:
+        connection.send_message(
+            {
+                "id": request_id,
+                "type": "event",
+                "event": event,
+            }
+        )
+
+    try:
+        completed = await rag.full_reindex(progress_callback)
+        connection.send_result(request_id, {"success": completed})
+
+    except Exception as err:
+        _LOGGER.exception("RAG reindex failed")
+        connection.send_error(request_id, ERR_STORAGE_ERROR, f"Reindex failed: {err}")
@@ -0,0 +1,127 @@
+"""Manual benchmark for RAG hybrid search latency - no pytest needed.
+
+Builds a throwaway SQLite store with synthetic entities and reports the
+p50/p95 latency of ``QueryEngine.hybrid_search`` (vector + FTS5 + merge)
+at several index sizes.  The query embedding is precomputed, so only the
+store and merge work is measured.
+
+Usage:
+    python tests/manual_bench_hybrid_search.py [--sizes 1000 5000 20000]
+        [--queries 200] [--dim 768] [--fusion weighted|rrf]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.homeclaw.rag.query_engine import QueryEngine  # noqa: E402
+from custom_components.homeclaw.rag.sqlite_store import SqliteStore  # noqa: E402
+
+DOMAINS = ["light", "switch", "sensor", "cover", "climate", "fan", "lock"]
+AREAS = ["Kitchen", "Bedroom", "Living Room", "Office", "Garage", "Porch", "Hall"]
+WORDS = ["lamp", "ceiling", "strip", "temperature", "humidity", "door", "window",
+         "heater", "plug", "motion", "power", "energy", "blind", "desk", "tv"]
+QUERIES = ["kitchen lamp", "bedroom temperature", "office desk plug", "garage door",
+           "living room blind", "porch motion", "hall ceiling light", "energy"]
+
+_INSERT_BATCH = 500
+
+
+class _NoEmbeddingProvider:
+    """Embedding provider stub; benchmark queries pass their own embedding."""
+
+    provider_name = "benchmark"
+
+    async def get_embeddings(self, texts):
+        raise RuntimeError("query embeddings are precomputed")
+
+
+def _entity(i: int, dim: int, rng: random.Random):
+    """Return (id, text, embedding, metadata) for synthetic entity ``i``."""
+    domain = rng.choice(DOMAINS)
+    area = rng.choice(AREAS)
+    name = f"{area} {rng.choice(WORDS)} {rng.choice(WORDS)} {i}"
+    entity_id = f"{domain}.{name.lower().replace(' ', '_')}"
+    text = f"{name} {domain} in {area} {area} {entity_id}"
+    embedding = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+    return entity_id, text, embedding, {"domain": domain, "area_name": area}
+
+
+async def _populate(store: SqliteStore, size: int, dim: int) -> None:
+    """Insert ``size`` synthetic entities."""
+    rng = random.Random(size)
+    for start in range(0, size, _INSERT_BATCH):
+        rows = [_entity(i, dim, rng) for i in range(start, min(size, start + _INSERT_BATCH))]
+        await store.add_documents(
+            [r[0] for r in rows],
+            [r[1] for r in rows],
+            [r[2] for r in rows],
+            [r[3] for r in rows],
+        )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def bench_size(size: int, queries: int, dim: int, fusion: str) -> dict:
+    """Benchmark hybrid search over ``size`` entities."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteStore(persist_directory=tmp)
+        await store.async_initialize()
+        try:
+            await _populate(store, size, dim)
+            engine = QueryEngine(
+                store=store, embedding_provider=_NoEmbeddingProvider(), fusion=fusion
+            )
+            rng = random.Random(0)
+            embedding = [rng.gauss(0.0, 1.0) for _ in range(dim)]
+
+            # Warm-up builds the resident vector index
+            await engine.hybrid_search(QUERIES[0], top_k=10, query_embedding=embedding)
+
+            samples = []
+            for i in range(queries):
+                query = QUERIES[i % len(QUERIES)]
+                started = time.perf_counter()
+                await engine.hybrid_search(query, top_k=10, query_embedding=embedding)
+                samples.append((time.perf_counter() - started) * 1000)
+        finally:
+            await store.async_shutdown()
+
+    return {
+        "size": size,
+        "p50_ms": statistics.median(samples),
+        "p95_ms": _percentile(samples, 95),
+    }
+
+
+async def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--fusion", choices=["weighted", "rrf"], default="weighted")
+    args = parser.parse_args()
+
+    print(f"hybrid_search, {args.queries} queries, dim={args.dim}, fusion={args.fusion}")
+    print(f"{'entities':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for size in args.sizes:
+        result = await bench_size(size, args.queries, args.dim, args.fusion)
+        print(f"{result['size']:>10} {result['p50_ms']:>10.2f} {result['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""Manual micro-benchmark for the streaming SSE parser - no pytest needed.
+
+Feeds a synthetic multi-megabyte OpenAI-style stream (many small deltas,
+plus one long reasoning event) to ``SSEParser`` in network-sized chunks
+and reports the throughput.  The previous string-buffer parser is
+included as a baseline.
+
+Usage:
+    python tests/manual_bench_sse_parser.py [--sizes-mb 1 4 16] [--chunk 1400]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.homeclaw.providers.adapters.stream_utils import (  # noqa: E402
+    SSEParser,
+)
+
+
+class _StrBufferParser:
+    """Baseline: decode each chunk and re-split a growing string buffer."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def feed(self, chunk: bytes) -> list[str]:
+        self._buffer += chunk.decode("utf-8", errors="ignore")
+        events = []
+        while "\n\n" in self._buffer:
+            block, self._buffer = self._buffer.split("\n\n", 1)
+            parts = [
+                line[5:].lstrip(" ")
+                for line in block.splitlines()
+                if line.startswith("data:")
+            ]
+            if parts:
+                events.append("\n".join(parts))
+        return events
+
+
+def _build_stream(size_mb: float) -> bytes:
+    """Build an SSE stream of roughly ``size_mb`` megabytes."""
+    target = int(size_mb * 1024 * 1024)
+    delta = "Włączam światło w salonie. "
+    event = (
+        "data: "
+        + json.dumps(
+            {"choices": [{"delta": {"content": delta}, "finish_reason": None}]},
+            ensure_ascii=False,
+        )
+        + "\n\n"
+    ).encode()
+    # Half small deltas, half one long reasoning event
+    small = event * (target // 2 // len(event))
+    long_event = (
+        'data: {"choices":[{"delta":{"reasoning":"'
+        + "zażółć gęślą jaźń " * (target // 2 // 30)
+        + '"}}]}\n\n'
+    ).encode()
+    return small + long_event + b"data: [DONE]\n\n"
+
+
+def _run(parser_cls, stream: bytes, chunk_size: int) -> tuple[float, int]:
+    """Feed ``stream`` in ``chunk_size`` pieces; return (seconds, event count)."""
+    parser = parser_cls()
+    events = 0
+    started = time.perf_counter()
+    for offset in range(0, len(stream), chunk_size):
+        events += len(parser.feed(stream[offset : offset + chunk_size]))
+    return time.perf_counter() - started, events
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--chunk", type=int, default=1400)
+    args = parser.parse_args()
+
+    print(f"SSE parsing, {args.chunk}-byte chunks")
+    print(f"{'MB':>6} {'events':>8} {'SSEParser ms':>14} {'str buffer ms':>14}")
+    for size_mb in args.sizes_mb:
+        stream = _build_stream(size_mb)
+        new_s, events = _run(SSEParser, stream, args.chunk)
+        old_s, _ = _run(_StrBufferParser, stream, args.chunk)
+        print(f"{size_mb:>6g} {events:>8} {new_s * 1000:>14.1f} {old_s * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
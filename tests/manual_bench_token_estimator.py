@@ -0,0 +1,157 @@
+"""Manual benchmark for token accounting - no pytest needed.
+
+Reports, per content type (prose, Polish, CJK, code, JSON tool results):
+
+- the error of the chars/3 heuristic, raw and after calibration against
+  reported usage, relative to the exact ``o200k_base`` BPE count;
+- the CPU cost of re-counting a conversation on every tool loop iteration,
+  with and without the per-message cache.
+
+The exact counts need ``tiktoken`` with its encoding available; without it
+only the CPU part runs.
+
+Usage:
+    python tests/manual_bench_token_estimator.py [--iterations 40]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components.homeclaw.core import token_estimator  # noqa: E402
+from custom_components.homeclaw.core.token_estimator import (  # noqa: E402
+    estimate_messages_tokens,
+    load_bpe_tokenizer,
+    record_prompt_usage,
+    reset_calibrations,
+    unload_bpe_tokenizer,
+)
+
+_PROSE = (
+    "The living room lights are on and the thermostat is set to 21 degrees. "
+    "Would you like me to turn off the lights when everyone has left home? "
+)
+_POLISH = (
+    "Włączyłem światło w salonie i ustawiłem termostat na 21 stopni. "
+    "Czy mam wyłączyć światła, gdy wszyscy wyjdą z domu? "
+)
+_CJK = "客厅的灯已经打开，恒温器设置为二十一度。大家离开家后要关灯吗？"
+_CODE = (
+    "async def async_turn_on(self, **kwargs: Any) -> None:\n"
+    "    await self.coordinator.client.set_state(self.entity_id, True)\n"
+    "    self.async_write_ha_state()\n"
+)
+_JSON = json.dumps(
+    [
+        {
+            "entity_id": f"sensor.room_{i}_temperature",
+            "state": f"{20 + i % 7}.{i % 10}",
+            "attributes": {"unit_of_measurement": "°C", "device_class": "temperature"},
+            "last_changed": "2025-01-01T12:00:00+00:00",
+        }
+        for i in range(40)
+    ]
+)
+
+SAMPLES = {
+    "prose": _PROSE * 40,
+    "polish": _POLISH * 40,
+    "cjk": _CJK * 60,
+    "code": _CODE * 40,
+    "json": _JSON,
+}
+
+
+def _conversation(iterations: int) -> list[list[dict]]:
+    """Message lists of successive tool loop iterations (each one longer)."""
+    messages = [{"role": "system", "content": _PROSE * 60}]
+    states = []
+    for i in range(iterations):
+        messages = [
+            *messages,
+            {"role": "user", "content": _POLISH * 2},
+            {"role": "assistant", "content": json.dumps({"tool_calls": [i]})},
+            {"role": "function", "content": _JSON},
+        ]
+        states.append(messages)
+    return states
+
+
+def bench_error() -> None:
+    """Heuristic error (raw and calibrated) against exact BPE counts."""
+    unload_bpe_tokenizer()
+    heuristic = {
+        name: estimate_messages_tokens([{"content": text}])
+        for name, text in SAMPLES.items()
+    }
+    if not load_bpe_tokenizer():
+        print("tiktoken/o200k_base unavailable - skipping the error benchmark\n")
+        return
+    exact = {
+        name: estimate_messages_tokens([{"content": text}])
+        for name, text in SAMPLES.items()
+    }
+    unload_bpe_tokenizer()
+
+    # Calibrate on a mixed prompt, as the stream loop does from usage
+    reset_calibrations()
+    mixed_raw = sum(heuristic.values())
+    record_prompt_usage("bench", mixed_raw, sum(exact.values()))
+
+    print(f"{'content':<10} {'exact':>7} {'chars/3':>8} {'error':>8} {'calibrated':>11}")
+    for name in SAMPLES:
+        raw = heuristic[name]
+        calibrated = token_estimator.calibrate(raw, "bench")
+        print(
+            f"{name:<10} {exact[name]:>7} {raw:>8} "
+            f"{(raw - exact[name]) / exact[name]:>+8.0%} "
+            f"{(calibrated - exact[name]) / exact[name]:>+11.0%}"
+        )
+    reset_calibrations()
+    print()
+
+
+def bench_cpu(iterations: int) -> None:
+    """Cost of re-counting the conversation after every tool iteration."""
+    states = _conversation(iterations)
+    counters = (("chars/3", unload_bpe_tokenizer), ("o200k_base", load_bpe_tokenizer))
+    for label, loader in counters:
+        if loader() is False:
+            continue
+        # Uncached: every message re-tokenized on every iteration
+        start = time.perf_counter()
+        for messages in states:
+            token_estimator._message_cache.clear()
+            token_estimator._text_cache.clear()
+            estimate_messages_tokens(messages)
+        uncached = time.perf_counter() - start
+
+        token_estimator._message_cache.clear()
+        start = time.perf_counter()
+        for messages in states:
+            estimate_messages_tokens(messages)
+        cached = time.perf_counter() - start
+
+        print(
+            f"{label:<11} {len(states[-1]):>4} messages, {iterations} recounts: "
+            f"uncached {uncached * 1000:8.2f} ms, cached {cached * 1000:8.2f} ms"
+        )
+    unload_bpe_tokenizer()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=40)
+    args = parser.parse_args()
+
+    bench_error()
+    bench_cpu(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
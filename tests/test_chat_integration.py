@@ -51,6 +51,12 @@ class MockStore:
     async def async_save(self, data: dict[str, Any]) -> None:
         self._data = data
 
+    def async_delay_save(self, data_func: Any, delay: float = 0) -> None:
+        self._data = data_func()
+
+    async def async_remove(self) -> None:
+        self._data = None
+
     @classmethod
     def reset_stores(cls) -> None:
         """Reset all stored data between tests."""
@@ -0,0 +1,130 @@
+"""Tests for eager tool dispatch in the streaming tool loop."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.homeclaw.core.events import CompletionEvent, ToolResultEvent
+from custom_components.homeclaw.core.stream_loop import run_tool_loop_stream
+
+READ_ONLY = {"get_entity_state", "get_history"}
+
+
+class _StreamingProvider:
+    """Provider streaming two tool calls, a pause, then (next turn) text."""
+
+    def __init__(self, calls: list[tuple[str, str]], log: list[str]) -> None:
+        self._calls = calls
+        self._log = log
+        self.turn = 0
+
+    async def get_response_stream(self, messages, **kwargs):
+        self.turn += 1
+        if self.turn > 1:
+            yield {"type": "text", "content": "done"}
+            return
+        for call_id, name in self._calls:
+            yield {"type": "tool_call", "id": call_id, "name": name, "args": {}}
+        await asyncio.sleep(0.05)  # the model is still generating
+        self._log.append("stream_end")
+
+
+def _tool_class(name):
+    tool_class = MagicMock()
+    tool_class.read_only = name in READ_ONLY
+    tool_class.requires_confirmation = False
+    return tool_class
+
+
+def _executor(log: list[str]):
+    async def _execute(tool_id, params, hass):
+        log.append(f"start:{tool_id}")
+        await asyncio.sleep(0)
+        result = MagicMock()
+        result.to_dict.return_value = {"success": True, "tool": tool_id}
+        return result
+
+    return _execute
+
+
+async def _run(calls, log, eager=True):
+    provider = _StreamingProvider(calls, log)
+    with (
+        patch(
+            "custom_components.homeclaw.core.tool_executor.ToolRegistry.get_tool_class",
+            side_effect=_tool_class,
+        ),
+        patch(
+            "custom_components.homeclaw.core.tool_executor.ToolRegistry.get_tool",
+            return_value=None,
+        ),
+        patch(
+            "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
+            side_effect=_executor(log),
+        ),
+    ):
+        events = [
+            event
+            async for event in run_tool_loop_stream(
+                provider=provider,
+                built_messages=[{"role": "user", "content": "hi"}],
+                effective_tools=None,
+                effective_max_iterations=3,
+                detect_function_call_fn=MagicMock(),
+                allowed_names=set(),
+                hass=MagicMock(),
+                denied_tools=None,
+                config=None,
+                context_window=128_000,
+                user_id="u1",
+                system_prompt=None,
+                build_provider_kwargs_fn=lambda kwargs, tools: {},
+                build_updated_messages_fn=lambda messages, text, system_prompt: messages,
+                kwargs={},
+                eager_tool_dispatch=eager,
+            )
+        ]
+    return events
+
+
+@pytest.mark.asyncio
+async def test_read_only_tools_start_before_stream_ends():
+    """Read-only calls run while the model is still streaming."""
+    log: list[str] = []
+    events = await _run([("c1", "get_entity_state"), ("c2", "get_history")], log)
+
+    assert log.index("start:get_entity_state") < log.index("stream_end")
+    assert log.index("start:get_history") < log.index("stream_end")
+    results = [e for e in events if isinstance(e, ToolResultEvent)]
+    assert [e.tool_call_id for e in results] == ["c1", "c2"]
+    assert json.loads(results[0].tool_result)["tool"] == "get_entity_state"
+    assert isinstance(events[-1], CompletionEvent)
+    # Each tool ran exactly once
+    assert log.count("start:get_entity_state") == 1
+
+
+@pytest.mark.asyncio
+async def test_calls_after_a_write_wait_for_the_stream():
+    """Nothing after a state-changing call starts early."""
+    log: list[str] = []
+    await _run(
+        [("c1", "get_entity_state"), ("c2", "call_service"), ("c3", "get_history")],
+        log,
+    )
+
+    assert log.index("start:get_entity_state") < log.index("stream_end")
+    assert log.index("start:call_service") > log.index("stream_end")
+    assert log.index("start:get_history") > log.index("start:call_service")
+
+
+@pytest.mark.asyncio
+async def test_eager_dispatch_can_be_disabled():
+    """With eager dispatch off, tools only run after the stream ends."""
+    log: list[str] = []
+    await _run([("c1", "get_entity_state")], log, eager=False)
+
+    assert log.index("start:get_entity_state") > log.index("stream_end")
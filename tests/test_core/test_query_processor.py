@@ -344,6 +344,34 @@ class TestBuildMessagesWithRagContext:
         assert len(result) == 2
         assert "RELEVANT CONTEXT" not in result[0]["content"]
 
+    @pytest.mark.asyncio
+    async def test_volatile_sections_follow_stable_prompt(self) -> None:
+        """Time and RAG context come after the cacheable stable prompt."""
+        from custom_components.homeclaw.core.prompt_layout import (
+            CACHE_PREFIX_KEY,
+            split_system_content,
+        )
+
+        processor = QueryProcessor(MockProvider())
+
+        result, _ = await processor._build_messages(
+            "Hello",
+            [],
+            system_prompt="Be helpful.",
+            rag_context="light.kitchen is on",
+            volatile_prompt="[CURRENT TIME]\nNow: 12:00",
+        )
+
+        system = result[0]
+        assert system["content"].startswith("Be helpful.\n\n[CURRENT TIME]")
+        assert system["content"].index("[CURRENT TIME]") < system["content"].index(
+            "RELEVANT CONTEXT"
+        )
+        assert system[CACHE_PREFIX_KEY] == len("Be helpful.")
+        stable, volatile = split_system_content(system)
+        assert stable == "Be helpful."
+        assert volatile.startswith("[CURRENT TIME]")
+
 
 class TestProcessWithRagContext:
     """Tests for process method with RAG context."""
@@ -508,8 +536,8 @@ class TestAgenticLoop:
                 pass
                 
         with patch(
-            "custom_components.homeclaw.tools.base.ToolRegistry.get_all_tools",
-            return_value=[EndlessTool()]
+            "custom_components.homeclaw.tools.base.ToolRegistry.enabled_tool_ids",
+            return_value=frozenset({EndlessTool.id})
         ), patch(
             "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
             new_callable=AsyncMock,
@@ -550,8 +578,8 @@ class TestAgenticLoop:
         processor = QueryProcessor(provider)
 
         with patch(
-            "custom_components.homeclaw.tools.base.ToolRegistry.get_all_tools",
-            return_value=[BrokenTool()]
+            "custom_components.homeclaw.tools.base.ToolRegistry.enabled_tool_ids",
+            return_value=frozenset({BrokenTool.id})
         ), patch(
             "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
             new_callable=AsyncMock,
@@ -614,8 +642,8 @@ class TestAgenticLoop:
         mock_result = ToolResult(output="Tool output", success=True)
 
         with patch(
-            "custom_components.homeclaw.tools.base.ToolRegistry.get_all_tools",
-            return_value=[ToolA(), ToolB()]
+            "custom_components.homeclaw.tools.base.ToolRegistry.enabled_tool_ids",
+            return_value=frozenset({ToolA.id, ToolB.id})
         ), patch(
             "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
             new_callable=AsyncMock,
@@ -696,3 +724,48 @@ class TestProcessStreamToolIds:
         )
         parsed_assistant = json.loads(assistant_message["content"])
         assert parsed_assistant["tool_calls"][0]["id"] == "toolu_123"
+
+
+class StreamingUsageProvider(StreamingToolProvider):
+    """Streaming provider that also reports token usage per call."""
+
+    async def get_response_stream(self, messages: list[dict[str, Any]], **kwargs: Any):
+        """Yield the parent's chunks followed by usage chunks."""
+        async for chunk in super().get_response_stream(messages, **kwargs):
+            yield chunk
+        yield {"type": "usage", "input_tokens": 1000, "cached_tokens": 800}
+        yield {"type": "usage", "output_tokens": 20}
+
+
+class TestProcessStreamUsage:
+    """Tests for token usage on the completion event."""
+
+    @pytest.mark.asyncio
+    async def test_usage_summed_over_model_calls(self) -> None:
+        """Usage from every streamed call ends up on the CompletionEvent."""
+        from unittest.mock import patch
+
+        from custom_components.homeclaw.core.events import CompletionEvent
+        from custom_components.homeclaw.tools.base import ToolResult
+
+        processor = QueryProcessor(StreamingUsageProvider())
+
+        with patch(
+            "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
+            new_callable=AsyncMock,
+            return_value=ToolResult(output="ok", success=True),
+        ):
+            events = [
+                event
+                async for event in processor.process_stream(
+                    query="Check kitchen light", messages=[], hass=MagicMock()
+                )
+            ]
+
+        completion = events[-1]
+        assert isinstance(completion, CompletionEvent)
+        assert completion.usage == {
+            "input_tokens": 2000,
+            "cached_tokens": 1600,
+            "output_tokens": 40,
+        }
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.homeclaw.core import token_estimator
 from custom_components.homeclaw.core.token_estimator import (
+    CALIBRATION_MAX_RATIO,
     CHARS_PER_TOKEN,
     DEFAULT_CONTEXT_WINDOW,
     DEFAULT_OUTPUT_RESERVE,
@@ -12,9 +19,25 @@ from custom_components.homeclaw.core.token_estimator import (
     compute_context_budget,
     estimate_messages_tokens,
     estimate_tokens,
+    get_token_accounting_stats,
+    load_bpe_tokenizer,
+    prompt_tokens_from_usage,
+    record_prompt_usage,
+    reset_calibrations,
+    unload_bpe_tokenizer,
 )
 
 
+@pytest.fixture(autouse=True)
+def _heuristic_counter():
+    """Every test starts with the heuristic counter and no calibration."""
+    unload_bpe_tokenizer()
+    reset_calibrations()
+    yield
+    unload_bpe_tokenizer()
+    reset_calibrations()
+
+
 class TestEstimateTokens:
     """Tests for estimate_tokens()."""
 
@@ -115,3 +138,115 @@ class TestComputeContextBudget:
             + budget["safety_buffer"]
             <= budget["total"]
         )
+
+
+def _load_word_tokenizer(monkeypatch) -> None:
+    """Load a fake BPE encoding counting one token per word."""
+    encoding = SimpleNamespace(encode_ordinary=lambda text: text.split())
+    fake = SimpleNamespace(get_encoding=lambda name: encoding)
+    monkeypatch.setitem(sys.modules, "tiktoken", fake)
+    assert load_bpe_tokenizer() is True
+
+
+class TestMessageCache:
+    """Tests for per-message memoization of BPE counts."""
+
+    def test_count_is_memoized(self, monkeypatch):
+        _load_word_tokenizer(monkeypatch)
+        msgs = [{"role": "user", "content": "turn on the light"}]
+        assert estimate_messages_tokens(msgs) == 4 + MESSAGE_OVERHEAD_TOKENS
+
+        def _fail(text):
+            raise AssertionError("message was re-tokenized")
+
+        monkeypatch.setattr(token_estimator, "estimate_tokens", _fail)
+        assert estimate_messages_tokens(msgs) == 4 + MESSAGE_OVERHEAD_TOKENS
+
+    def test_replaced_content_is_recounted(self, monkeypatch):
+        _load_word_tokenizer(monkeypatch)
+        msg = {"role": "function", "content": "x " * 3000}
+        assert estimate_messages_tokens([msg]) == 3000 + MESSAGE_OVERHEAD_TOKENS
+        msg["content"] = msg["content"][:600]
+        assert estimate_messages_tokens([msg]) == 300 + MESSAGE_OVERHEAD_TOKENS
+
+    def test_caches_do_not_keep_texts_alive(self, monkeypatch):
+        _load_word_tokenizer(monkeypatch)
+        text = "tool output " * 5000
+        refs = sys.getrefcount(text)
+        msg = {"role": "function", "content": text}
+        estimate_messages_tokens([msg])
+        del msg
+        assert sys.getrefcount(text) == refs
+
+
+class TestBpeTokenizer:
+    """Tests for switching to an exact tokenizer."""
+
+    def test_missing_tiktoken_keeps_heuristic(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "tiktoken", None)
+        assert load_bpe_tokenizer() is False
+        assert get_token_accounting_stats()["tokenizer"] == "heuristic"
+
+    def test_loaded_encoding_is_used(self, monkeypatch):
+        msg = {"role": "user", "content": "turn on the kitchen light"}
+        assert estimate_messages_tokens([msg]) == 8 + MESSAGE_OVERHEAD_TOKENS
+
+        _load_word_tokenizer(monkeypatch)
+        assert estimate_tokens("turn on the kitchen light") == 5
+        assert estimate_messages_tokens([msg]) == 5 + MESSAGE_OVERHEAD_TOKENS
+        assert get_token_accounting_stats()["tokenizer"] == "o200k_base"
+
+    def test_unavailable_encoding_keeps_heuristic(self, monkeypatch):
+        def _offline(name):
+            raise OSError("network unreachable")
+
+        monkeypatch.setitem(
+            sys.modules, "tiktoken", SimpleNamespace(get_encoding=_offline)
+        )
+        assert load_bpe_tokenizer() is False
+        assert estimate_tokens("a" * 30) == 10
+
+
+class TestCalibration:
+    """Tests for per-provider calibration from reported usage."""
+
+    def test_first_observation_sets_ratio(self):
+        msgs = [{"role": "user", "content": "a" * 3000}]
+        raw = estimate_messages_tokens(msgs)
+        record_prompt_usage("OpenAIProvider", raw, raw * 2)
+
+        assert estimate_messages_tokens(msgs, calibration_key="OpenAIProvider") == raw * 2
+        # Other providers and the raw count are unaffected
+        assert estimate_messages_tokens(msgs, calibration_key="GeminiProvider") == raw
+        assert estimate_messages_tokens(msgs) == raw
+
+    def test_ratio_is_smoothed_and_clamped(self):
+        record_prompt_usage("p", 1000, 1000)
+        record_prompt_usage("p", 1000, 2000)
+        stats = get_token_accounting_stats()["calibrations"]["p"]
+        assert stats["ratio"] == pytest.approx(1.2)
+        assert stats["samples"] == 2
+        assert stats["last_error_pct"] == -50.0
+
+        record_prompt_usage("q", 300, 30_000)
+        assert (
+            get_token_accounting_stats()["calibrations"]["q"]["ratio"]
+            == CALIBRATION_MAX_RATIO
+        )
+
+    def test_small_or_missing_usage_is_ignored(self):
+        record_prompt_usage("p", 100, 50)
+        record_prompt_usage("p", 1000, None)
+        assert get_token_accounting_stats()["calibrations"] == {}
+
+    def test_prompt_tokens_from_usage(self):
+        # OpenAI-compatible and Gemini: cached tokens are part of input_tokens
+        assert prompt_tokens_from_usage({"input_tokens": 900, "cached_tokens": 800}) == 900
+        # Anthropic: cache reads and writes are reported separately
+        assert (
+            prompt_tokens_from_usage(
+                {"input_tokens": 10, "cached_tokens": 800, "cache_write_tokens": 90}
+            )
+            == 900
+        )
+        assert prompt_tokens_from_usage({"output_tokens": 5}) is None
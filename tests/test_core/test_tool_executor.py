@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -429,3 +430,125 @@ class TestToolExecutorApproval:
 
         assert "approval_request" not in [e["type"] for e in events]
         assert execute_mock.await_count == 1
+
+
+def _tool_classes(read_only: set[str]):
+    """get_tool_class stand-in: tools in ``read_only`` are marked read-only."""
+
+    def _get(name):
+        tool_class = MagicMock()
+        tool_class.read_only = name in read_only
+        tool_class.requires_confirmation = False
+        return tool_class
+
+    return _get
+
+
+def _timed_execute(delays: dict[str, float], log: list[str], fail: set[str] = frozenset()):
+    """execute_tool stand-in sleeping per tool id and logging start/end."""
+
+    async def _execute(tool_id, params, hass):
+        log.append(f"start:{tool_id}")
+        await asyncio.sleep(delays.get(tool_id, 0))
+        log.append(f"end:{tool_id}")
+        if tool_id in fail:
+            raise RuntimeError(f"{tool_id} broke")
+        result = MagicMock()
+        result.to_dict.return_value = {"success": True, "tool": tool_id}
+        return result
+
+    return _execute
+
+
+@pytest.mark.asyncio
+class TestToolExecutorParallel:
+    """Tests for concurrent execution of read-only tool calls."""
+
+    async def _run(self, calls, read_only, delays, log, yield_mode="none", **kwargs):
+        messages: list[dict] = []
+        events: list[dict] = []
+        with (
+            patch(
+                "custom_components.homeclaw.core.tool_executor.ToolRegistry.get_tool_class",
+                side_effect=_tool_classes(read_only),
+            ),
+            patch(
+                "custom_components.homeclaw.core.tool_executor.ToolRegistry.get_tool",
+                return_value=None,
+            ),
+            patch(
+                "custom_components.homeclaw.core.tool_executor.ToolRegistry.execute_tool",
+                side_effect=_timed_execute(delays, log, kwargs.pop("fail", set())),
+            ),
+        ):
+            async for event in ToolExecutor.execute_tool_calls(
+                [FunctionCall(id=f"c_{name}", name=name, arguments={}) for name in calls],
+                hass=MagicMock(),
+                messages=messages,
+                yield_mode=yield_mode,
+                **kwargs,
+            ):
+                events.append(event)
+        return messages, events
+
+    async def test_read_only_calls_overlap_and_keep_order(self):
+        """Read-only calls run together; results follow the call order."""
+        log: list[str] = []
+        messages, _ = await self._run(
+            ["slow", "fast"], {"slow", "fast"}, {"slow": 0.05, "fast": 0}, log
+        )
+
+        assert log[:2] == ["start:slow", "start:fast"]
+        assert log.index("end:fast") < log.index("end:slow")
+        assert [m["name"] for m in messages] == ["slow", "fast"]
+        assert [m["tool_use_id"] for m in messages] == ["c_slow", "c_fast"]
+
+    async def test_mutating_call_is_a_barrier(self):
+        """State-changing tools never overlap with other calls."""
+        log: list[str] = []
+        messages, _ = await self._run(
+            ["read_a", "write", "read_b"], {"read_a", "read_b"}, {}, log
+        )
+
+        assert log == [
+            "start:read_a",
+            "end:read_a",
+            "start:write",
+            "end:write",
+            "start:read_b",
+            "end:read_b",
+        ]
+        assert [m["name"] for m in messages] == ["read_a", "write", "read_b"]
+
+    async def test_max_parallel_one_is_sequential(self):
+        """max_parallel=1 restores one-at-a-time execution."""
+        log: list[str] = []
+        await self._run(["a", "b"], {"a", "b"}, {"a": 0.01}, log, max_parallel=1)
+
+        assert log == ["start:a", "end:a", "start:b", "end:b"]
+
+    async def test_result_mode_events_in_call_order(self):
+        """'result' mode announces every call, then yields results in order."""
+        log: list[str] = []
+        _, events = await self._run(
+            ["a", "b"], {"a", "b"}, {"a": 0.02}, log, yield_mode="result"
+        )
+
+        assert [(e["type"], e["name"]) for e in events] == [
+            ("tool_call", "a"),
+            ("tool_call", "b"),
+            ("tool_result", "a"),
+            ("tool_result", "b"),
+        ]
+
+    async def test_failure_isolated_to_its_call(self):
+        """One failing read-only call does not affect its siblings."""
+        log: list[str] = []
+        messages, events = await self._run(
+            ["a", "b"], {"a", "b"}, {}, log, yield_mode="status", fail={"a"}
+        )
+
+        assert json.loads(messages[0]["content"])["error"] == "a broke"
+        assert json.loads(messages[1]["content"])["success"] is True
+        assert events[-2]["message"].startswith("✗ a failed")
+        assert events[-1]["message"] == "Tool b completed"
@@ -0,0 +1,127 @@
+"""Tests for the memoized tool-schema cache."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.homeclaw.core.token_estimator import estimate_tokens
+from custom_components.homeclaw.core.tool_schema_cache import (
+    ToolSchemaCache,
+    compile_tools,
+)
+from custom_components.homeclaw.function_calling import ToolSchemaConverter
+from custom_components.homeclaw.providers.adapters.anthropic_adapter import (
+    AnthropicAdapter,
+)
+from custom_components.homeclaw.tools.base import (
+    Tool,
+    ToolParameter,
+    ToolRegistry,
+    ToolResult,
+)
+
+
+class _LightTool(Tool):
+    id = "cache_test_light"
+    description = "Turn a light on or off"
+    parameters = [ToolParameter(name="entity_id", type="string", description="Light")]
+
+    async def execute(self, **params):
+        return ToolResult(output="ok")
+
+
+class _SensorTool(Tool):
+    id = "cache_test_sensor"
+    description = "Read a sensor"
+    enabled = False
+
+    async def execute(self, **params):
+        return ToolResult(output="ok")
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry():
+    """Register the test tools and restore the registry afterwards."""
+    with patch.dict(ToolRegistry._tools):
+        ToolRegistry.register(_LightTool)
+        ToolRegistry.register(_SensorTool)
+        yield
+    ToolRegistry._invalidate()
+    ToolSchemaCache.clear()
+
+
+def test_schemas_are_built_once():
+    """Repeated conversions reuse the same canonical dicts."""
+    tool = _LightTool()
+
+    first = ToolSchemaCache.to_openai_format([tool])
+    second = ToolSchemaCache.to_openai_format([tool])
+
+    assert first == ToolSchemaConverter.to_openai_format([tool])
+    assert first[0] is second[0]
+    assert first is not second
+
+
+def test_compile_memoized_per_adapter_and_tool_set():
+    """The provider transform runs once per tool set; results are copies."""
+    adapter = AnthropicAdapter()
+    tools = ToolSchemaCache.to_openai_format([_LightTool(), _SensorTool()])
+
+    with patch.object(
+        adapter, "transform_tools", wraps=adapter.transform_tools
+    ) as transform:
+        first = compile_tools(adapter, tools)
+        first.append("mutated")
+        second = compile_tools(adapter, list(tools))
+        compile_tools(adapter, tools[:1])
+
+    assert transform.call_count == 2
+    assert "mutated" not in second
+    assert [t["name"] for t in second] == ["cache_test_light", "cache_test_sensor"]
+
+
+def test_foreign_schemas_are_not_memoized():
+    """Hand-written schemas are transformed on every call."""
+    transform = MagicMock(return_value=[])
+    tools = [{"type": "function", "function": {"name": "cache_test_light"}}]
+
+    ToolSchemaCache.compile("test", tools, transform)
+    ToolSchemaCache.compile("test", tools, transform)
+
+    assert transform.call_count == 2
+
+
+def test_register_invalidates():
+    """Registering a tool drops compiled schemas and the enabled-ID set."""
+    first = ToolSchemaCache.to_openai_format([_LightTool()])
+    assert ToolRegistry.enabled_tool_ids() >= {"cache_test_light"}
+    assert "cache_test_sensor" not in ToolRegistry.enabled_tool_ids()
+
+    class _NewTool(_LightTool):
+        id = "cache_test_new"
+
+    ToolRegistry.register(_NewTool)
+
+    assert ToolSchemaCache.to_openai_format([_LightTool()])[0] is not first[0]
+    assert "cache_test_new" in ToolRegistry.enabled_tool_ids()
+
+
+def test_token_estimates_are_precomputed():
+    """Cached schemas use their stored estimate; others are serialized."""
+    cached = ToolSchemaCache.to_openai_format([_LightTool()])
+    foreign = {"type": "function", "function": {"name": "other", "parameters": {}}}
+
+    expected = sum(
+        estimate_tokens(json.dumps(tool, ensure_ascii=False))
+        for tool in (*cached, foreign)
+    )
+    with patch(
+        "custom_components.homeclaw.core.tool_schema_cache.estimate_tokens",
+        wraps=estimate_tokens,
+    ) as estimate:
+        assert ToolSchemaCache.estimate_tokens([*cached, foreign]) == expected
+
+    assert estimate.call_count == 1
@@ -7,7 +7,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.homeclaw import config_flow
-from custom_components.homeclaw.const import DOMAIN, CONF_LOCAL_URL, CONF_RAG_ENABLED
+from custom_components.homeclaw.const import (
+    CONF_EMBEDDING_PROVIDER,
+    CONF_LOCAL_EMBEDDING_MODEL,
+    CONF_LOCAL_EMBEDDING_URL,
+    CONF_LOCAL_URL,
+    CONF_RAG_ENABLED,
+    DOMAIN,
+)
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 pytestmark = pytest.mark.asyncio
@@ -507,3 +514,36 @@ async def test_options_flow_update_provider(hass: HomeAssistant):
     assert entry.data["openai_token"] == "new_token"
     assert entry.data["models"]["openai"] == "gpt-5"
     assert entry.data[CONF_RAG_ENABLED] is True
+
+
+async def test_options_flow_embedding_settings(hass: HomeAssistant):
+    """The RAG embedding backend can be changed from the options flow."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "ai_provider": "gemini_oauth",
+            "gemini_oauth": {"access_token": "x"},
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"ai_provider": "gemini_oauth"},
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_RAG_ENABLED: True,
+            CONF_EMBEDDING_PROVIDER: "auto",
+            CONF_LOCAL_EMBEDDING_URL: " http://ollama:11434 ",
+            CONF_LOCAL_EMBEDDING_MODEL: "",
+        },
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.data[CONF_RAG_ENABLED] is True
+    assert entry.data[CONF_EMBEDDING_PROVIDER] == "auto"
+    assert entry.data[CONF_LOCAL_EMBEDDING_URL] == "http://ollama:11434"
+    assert entry.data[CONF_LOCAL_EMBEDDING_MODEL] is None
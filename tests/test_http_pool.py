@@ -0,0 +1,110 @@
+"""Tests for the shared HTTP connection pool."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.homeclaw.http_pool import (
+    DATA_HTTP_POOL,
+    HttpPool,
+    async_close_http_pool,
+    get_http_pool,
+    get_pooled_session,
+    pooled_session,
+)
+
+
+def _fake_hass() -> SimpleNamespace:
+    return SimpleNamespace(data={})
+
+
+@pytest.mark.asyncio
+async def test_pool_is_per_hass_and_session_is_shared():
+    """Every caller on one hass gets the same session."""
+    hass = _fake_hass()
+    pool = get_http_pool(hass)
+    try:
+        assert get_http_pool(hass) is pool
+        assert get_pooled_session(hass) is get_pooled_session(hass)
+        assert get_pooled_session(hass, verify_ssl=False) is not get_pooled_session(
+            hass
+        )
+        async with pooled_session(hass) as session:
+            assert session is get_pooled_session(hass)
+    finally:
+        await async_close_http_pool(hass)
+
+
+@pytest.mark.asyncio
+async def test_shared_session_does_not_keep_cookies():
+    """The shared session ignores cookies, so none leak between callers."""
+    hass = _fake_hass()
+    try:
+        session = get_pooled_session(hass)
+        session.cookie_jar.update_cookies({"sid": "secret"})
+        assert len(session.cookie_jar) == 0
+    finally:
+        await async_close_http_pool(hass)
+
+
+@pytest.mark.asyncio
+async def test_close_removes_pool_and_reopens_on_demand():
+    """Closing forgets the pool; the next request opens a fresh one."""
+    hass = _fake_hass()
+    session = get_pooled_session(hass)
+
+    await async_close_http_pool(hass)
+
+    assert session.closed
+    assert DATA_HTTP_POOL not in hass.data
+    fresh = get_pooled_session(hass)
+    assert fresh is not session
+    assert not fresh.closed
+    await async_close_http_pool(hass)
+    # Closing twice is a no-op
+    await async_close_http_pool(hass)
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_without_hass_is_short_lived():
+    """Without hass a throwaway session is opened and closed."""
+    async with pooled_session(None) as session:
+        assert not session.closed
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_connection_reuse():
+    """Trace callbacks count requests and kept-alive connection reuse."""
+    pool = HttpPool()
+    trace = pool._trace_config()
+
+    async def _fire(signal) -> None:
+        for callback in signal:
+            await callback(None, None, None)
+
+    for reused in (False, True, True):
+        await _fire(trace.on_request_start)
+        assert pool.get_metrics()["in_flight"] == 1
+        await _fire(
+            trace.on_connection_reuseconn if reused else trace.on_connection_create_end
+        )
+        await _fire(trace.on_request_end)
+
+    metrics = pool.get_metrics()
+    assert metrics["requests"] == 3
+    assert metrics["in_flight"] == 0
+    assert metrics["peak_in_flight"] == 1
+    assert metrics["connections_created"] == 1
+    assert metrics["connections_reused"] == 2
+    assert metrics["reuse_rate_pct"] == 66.7
+
+
+def test_metrics_empty_pool():
+    """A pool with no traffic reports zeros."""
+    metrics = HttpPool(limit=50, limit_per_host=5).get_metrics()
+    assert metrics["requests"] == 0
+    assert metrics["reuse_rate_pct"] == 0
+    assert metrics["utilization_pct"] == 0
+    assert metrics["limit"] == 50
+    assert metrics["limit_per_host"] == 5
@@ -401,6 +401,36 @@ class TestFlushFromMessages:
         assert captured == 2
         mock_provider.get_response.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_ai_flush_embeds_in_one_call(
+        self, memory_manager, mock_embedding_provider
+    ) -> None:
+        """All extracted memories are embedded with a single provider call."""
+        import json
+
+        mock_provider = AsyncMock()
+        mock_provider.get_response = AsyncMock(
+            return_value=json.dumps(
+                [
+                    {"text": f"Distinct memory number {i}.", "importance": 0.6}
+                    for i in range(3)
+                ]
+            )
+        )
+        mock_embedding_provider.get_embeddings = AsyncMock(
+            return_value=[[float(i == j) for j in range(8)] for i in range(3)]
+        )
+
+        captured = await memory_manager.flush_from_messages(
+            [{"role": "user", "content": "Some conversation"}],
+            user_id="user1",
+            provider=mock_provider,
+        )
+
+        assert captured == 3
+        mock_embedding_provider.get_embeddings.assert_awaited_once()
+        assert len(mock_embedding_provider.get_embeddings.call_args.args[0]) == 3
+
     @pytest.mark.asyncio
     async def test_ai_flush_markdown_code_block(
         self, memory_manager, mock_embedding_provider
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sqlite3
 import tempfile
+import time
 
 import pytest
 
@@ -408,3 +409,193 @@ class TestStats:
 
         stats = await memory_store.get_stats(user_id="user1")
         assert stats["total"] == 1
+
+
+def _unit(index: int, dims: int = 8) -> list[float]:
+    """Orthogonal test embedding (avoids deduplication)."""
+    emb = [0.0] * dims
+    emb[index % dims] = 1.0
+    return emb
+
+
+class TestMemoryIndex:
+    """Tests for the resident per-user memory index."""
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_hit_sqlite_once_loaded(self, memory_store) -> None:
+        from unittest.mock import patch
+
+        await memory_store.store_memory(
+            text="User likes tea", embedding=_unit(0), user_id="user1"
+        )
+        await memory_store.search_memories(query_embedding=_unit(0), user_id="user1")
+
+        with (
+            patch.object(memory_store.store, "run_read") as run_read,
+            patch.object(memory_store.store, "run_write") as run_write,
+        ):
+            results = await memory_store.search_memories(
+                query_embedding=_unit(0), user_id="user1"
+            )
+
+        assert [m.text for m in results] == ["User likes tea"]
+        run_read.assert_not_called()
+        run_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_follows_writes(self, memory_store) -> None:
+        from unittest.mock import patch
+
+        first = await memory_store.store_memory(
+            text="First", embedding=_unit(0), user_id="user1", importance=0.1
+        )
+        await memory_store.store_memory(
+            text="Second", embedding=_unit(1), user_id="user1", importance=0.9
+        )
+
+        with patch(
+            "custom_components.homeclaw.memory.memory_store.MAX_MEMORIES_PER_USER", 2
+        ):
+            await memory_store.store_memory(
+                text="Third", embedding=_unit(2), user_id="user1"
+            )
+
+        # The least important memory was evicted
+        results = await memory_store.search_memories(
+            query_embedding=[1.0] * 8, user_id="user1", min_similarity=0.1
+        )
+        assert first not in {m.id for m in results}
+        assert {m.text for m in results} == {"Second", "Third"}
+
+        await memory_store.delete_user_memories("user1")
+        assert await memory_store.search_memories(
+            query_embedding=_unit(1), user_id="user1"
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_memories_leave_index_and_table(self, memory_store) -> None:
+        from unittest.mock import patch
+
+        await memory_store.store_memory(
+            text="Slept badly", embedding=_unit(0), user_id="user1", ttl_days=1
+        )
+        await memory_store.store_memory(
+            text="Permanent", embedding=_unit(1), user_id="user1"
+        )
+        assert len(
+            await memory_store.search_memories(
+                query_embedding=[1.0] * 8, user_id="user1", min_similarity=0.1
+            )
+        ) == 2
+
+        later = time.time() + 2 * 86400
+        with patch(
+            "custom_components.homeclaw.memory.memory_store.time.time",
+            return_value=later,
+        ):
+            results = await memory_store.search_memories(
+                query_embedding=[1.0] * 8, user_id="user1", min_similarity=0.1
+            )
+
+        assert [m.text for m in results] == ["Permanent"]
+        assert await memory_store.get_memory_count("user1") == 1
+
+
+class TestStoreMemoriesBatch:
+    """Tests for batched memory ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_dedups_within_batch_and_against_store(self, memory_store) -> None:
+        existing = await memory_store.store_memory(
+            text="User likes tea", embedding=_unit(0), user_id="user1", importance=0.5
+        )
+
+        ids = await memory_store.store_memories_batch(
+            [
+                {"text": "User really likes tea", "importance": 0.9},
+                {"text": "Cat is named Mruczek", "importance": 0.4},
+                {"text": "The cat is Mruczek", "importance": 0.8},
+                {"text": "Office on floor 2", "category": "bogus"},
+            ],
+            [_unit(0), _unit(1), _unit(1), _unit(2)],
+            "user1",
+            source="ai_flush",
+        )
+
+        assert ids[0] is None and ids[2] is None
+        assert ids[1] and ids[3]
+
+        memories = {m.id: m for m in await memory_store.list_memories("user1")}
+        assert len(memories) == 3
+        # Duplicates raise the importance of what they matched
+        assert memories[existing].importance == pytest.approx(0.9)
+        assert memories[ids[1]].importance == pytest.approx(0.8)
+        assert memories[ids[1]].source == "ai_flush"
+        assert memories[ids[3]].category == "other"
+
+        results = await memory_store.search_memories(
+            query_embedding=_unit(1), user_id="user1"
+        )
+        assert [m.id for m in results] == [ids[1]]
+        assert results[0].importance == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_of_stored_duplicate(self, memory_store) -> None:
+        """A duplicate of an in-batch candidate that matched a stored memory."""
+        existing = await memory_store.store_memory(
+            text="User likes tea",
+            embedding=[1.0, 0.0, 0.0],
+            user_id="user1",
+            importance=0.5,
+        )
+
+        # Second is close to the first (0.96) but not to the stored one (0.92)
+        ids = await memory_store.store_memories_batch(
+            [
+                {"text": "User enjoys tea", "importance": 0.6},
+                {"text": "User enjoys green tea", "importance": 0.9},
+            ],
+            [[1.0, 0.3, 0.0], [1.0, 0.3, 0.3]],
+            "user1",
+        )
+
+        assert ids == [None, None]
+        memories = await memory_store.list_memories("user1")
+        assert [m.id for m in memories] == [existing]
+        assert memories[0].importance == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_single_transaction_and_limit(self, memory_store) -> None:
+        from unittest.mock import patch
+
+        await memory_store.store_memory(
+            text="Old note", embedding=_unit(0), user_id="user1", importance=0.1
+        )
+        labels: list[str] = []
+        run_write = memory_store.store.run_write
+
+        async def _recording(label, fn):
+            labels.append(label)
+            return await run_write(label, fn)
+
+        with (
+            patch.object(memory_store.store, "run_write", _recording),
+            patch(
+                "custom_components.homeclaw.memory.memory_store.MAX_MEMORIES_PER_USER",
+                3,
+            ),
+        ):
+            ids = await memory_store.store_memories_batch(
+                [{"text": f"Note {i}", "importance": 0.5} for i in range(1, 4)],
+                [_unit(i) for i in range(1, 4)],
+                "user1",
+            )
+
+        assert all(ids)
+        assert labels == ["store_memories_batch"]
+        remaining = await memory_store.list_memories("user1")
+        assert {m.text for m in remaining} == {"Note 1", "Note 2", "Note 3"}
+        assert await memory_store.search_memories(
+            query_embedding=_unit(0), user_id="user1"
+        ) == []
+        assert len(await memory_store.keyword_search_memories("Note", "user1")) == 3
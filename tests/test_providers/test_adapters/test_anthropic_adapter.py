@@ -507,3 +507,82 @@ class TestExtractStreamEventsToolUse:
         adapter.extract_stream_events(delta, acc)
         chunks = adapter.extract_stream_events(stop, acc)
         assert chunks[0]["args"] == {"entity_id": "switch.fan"}
+
+
+# ---------------------------------------------------------------------------
+# prompt caching
+# ---------------------------------------------------------------------------
+
+
+class TestPromptCache:
+    """AnthropicAdapter.apply_prompt_cache marks the stable prefix."""
+
+    def test_stable_prefix_and_last_tool_marked(self) -> None:
+        from custom_components.homeclaw.core.prompt_layout import build_system_message
+
+        adapter = AnthropicAdapter()
+        stable = "You are Homeclaw. " * 400
+        system = build_system_message(stable, ["[CURRENT TIME]\nNow: 12:00"])
+        messages = [system, {"role": "user", "content": "hi"}]
+        tools = adapter.transform_tools(
+            [
+                {
+                    "type": "function",
+                    "function": {"name": n, "description": "x" * 4000, "parameters": {}},
+                }
+                for n in ("a", "b")
+            ]
+        )
+        _, system_content = adapter.transform_messages(messages)
+        payload = {"system": system_content, "tools": tools}
+
+        adapter.apply_prompt_cache(payload, messages)
+
+        assert payload["system"] == [
+            {"type": "text", "text": stable, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "[CURRENT TIME]\nNow: 12:00"},
+        ]
+        assert payload["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in payload["tools"][0]
+
+    def test_short_prompt_left_unchanged(self) -> None:
+        adapter = AnthropicAdapter()
+        messages = [{"role": "system", "content": "You are helpful."}]
+        payload = {"system": "You are helpful."}
+
+        adapter.apply_prompt_cache(payload, messages)
+
+        assert payload == {"system": "You are helpful."}
+
+    def test_usage_events(self) -> None:
+        adapter = AnthropicAdapter()
+        acc = ToolAccumulator()
+        start = {
+            "type": "message_start",
+            "message": {
+                "usage": {
+                    "input_tokens": 12,
+                    "cache_read_input_tokens": 3000,
+                    "cache_creation_input_tokens": 0,
+                    "output_tokens": 1,
+                }
+            },
+        }
+        delta = {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": 42},
+        }
+
+        assert adapter.extract_stream_events(start, acc) == [
+            {
+                "type": "usage",
+                "input_tokens": 12,
+                "output_tokens": 1,
+                "cached_tokens": 3000,
+                "cache_write_tokens": 0,
+            }
+        ]
+        assert adapter.extract_stream_events(delta, acc) == [
+            {"type": "usage", "output_tokens": 42}
+        ]
@@ -604,3 +604,31 @@ class TestExtractStreamEvents:
             {"type": "reasoning", "content": "thought"},
             {"type": "text", "content": "Answer"},
         ]
+
+    def test_final_usage_chunk(self, adapter: OpenAICompatAdapter) -> None:
+        event = {
+            "choices": [],
+            "usage": {
+                "prompt_tokens": 2100,
+                "completion_tokens": 35,
+                "prompt_tokens_details": {"cached_tokens": 1920},
+            },
+        }
+        chunks = adapter.extract_stream_events(event, ToolAccumulator())
+        assert chunks == [
+            {
+                "type": "usage",
+                "input_tokens": 2100,
+                "output_tokens": 35,
+                "cached_tokens": 1920,
+            }
+        ]
+
+    def test_prompt_layout_boundary_not_sent(self, adapter: OpenAICompatAdapter) -> None:
+        from custom_components.homeclaw.core.prompt_layout import build_system_message
+
+        system = build_system_message("Stable prompt.", ["[CURRENT TIME]"])
+        converted, _ = adapter.transform_messages([system])
+        assert converted == [
+            {"role": "system", "content": "Stable prompt.\n\n[CURRENT TIME]"}
+        ]
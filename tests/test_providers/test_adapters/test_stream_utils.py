@@ -82,6 +82,32 @@ class TestSSEParserMultilineData:
         assert r2 == ["line1\nline2"]
 
 
+class TestSSEParserBytes:
+    """SSEParser consumes raw network bytes."""
+
+    def test_multibyte_character_split_across_chunks(self) -> None:
+        """Polish diacritics split mid-character are decoded intact."""
+        raw = 'data: {"t": "zażółć gęślą"}\n\n'.encode()
+        parser = SSEParser()
+        events: list[str] = []
+        for i in range(len(raw)):
+            events.extend(parser.feed(raw[i : i + 1]))
+        assert events == ['{"t": "zażółć gęślą"}']
+
+    def test_crlf_line_endings(self) -> None:
+        parser = SSEParser()
+        assert parser.feed(b"data: one\r\n\r\ndata: two\r\n\r\n") == ["one", "two"]
+
+    def test_long_line_fed_in_many_chunks(self) -> None:
+        parser = SSEParser()
+        payload = "x" * 100_000
+        raw = f"data: {payload}\n\n".encode()
+        events: list[str] = []
+        for i in range(0, len(raw), 7):
+            events.extend(parser.feed(raw[i : i + 7]))
+        assert events == [payload]
+
+
 class TestSSEParserFlush:
     """SSEParser flush behavior."""
 
@@ -122,12 +122,13 @@ class TestGetResponse:
                 captured["json"] = json
                 return ctx
 
-            session_ctx = AsyncMock()
             session_mock = MagicMock()
             session_mock.post = MagicMock(side_effect=capture_post)
-            session_ctx.__aenter__.return_value = session_mock
 
-            with patch("aiohttp.ClientSession", return_value=session_ctx):
+            with patch(
+                "custom_components.homeclaw.providers.anthropic_oauth.provider.get_pooled_session",
+                return_value=session_mock,
+            ):
                 await provider.get_response(
                     [{"role": "user", "content": "hello"}],
                 )
@@ -72,13 +72,13 @@ class TestBaseHTTPClientAbstractMethods:
 class TestBaseHTTPClientSession:
     """Tests for BaseHTTPClient session property."""
 
-    def test_session_uses_async_get_clientsession(self, hass: HomeAssistant) -> None:
-        """Test that session property uses async_get_clientsession."""
+    def test_session_uses_get_pooled_session(self, hass: HomeAssistant) -> None:
+        """Test that session property uses get_pooled_session."""
         mock_session = MagicMock()
         config = {}
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ) as mock_get_session:
             client = ConcreteHTTPClient(hass, config)
@@ -88,6 +88,32 @@ class TestBaseHTTPClientSession:
             assert session is mock_session
 
 
+class TestBaseHTTPClientLimiter:
+    """Tests for the per-model request scheduler of BaseHTTPClient."""
+
+    def test_limiter_is_per_model(self, hass: HomeAssistant) -> None:
+        """Each model of a key gets its own limiter; the same model shares one."""
+        client = ConcreteHTTPClient(hass, {"token": "sk-a"})
+        other_client = ConcreteHTTPClient(hass, {"token": "sk-a"})
+
+        chat = client.limiter_for("gpt-a")
+
+        assert client.limiter_for("gpt-a") is chat
+        assert other_client.limiter_for("gpt-a") is chat
+        assert client.limiter_for("gpt-b") is not chat
+
+    def test_rate_limit_pauses_only_that_model(self, hass: HomeAssistant) -> None:
+        """A 429 for one model does not hold requests to another."""
+        client = ConcreteHTTPClient(hass, {"token": "sk-a"})
+        limited = client.limiter_for("gpt-a")
+        response = MagicMock(status=429, headers={"Retry-After": "30"})
+
+        assert client._observe_response(response, limited) == 30.0
+
+        assert limited.get_stats()["pauses"] == 1
+        assert client.limiter_for("gpt-b").get_stats()["pauses"] == 0
+
+
 class TestBaseHTTPClientGetResponse:
     """Tests for BaseHTTPClient get_response template method."""
 
@@ -105,7 +131,7 @@ class TestBaseHTTPClientGetResponse:
         mock_session.post = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             client = ConcreteHTTPClient(hass, config)
@@ -147,7 +173,7 @@ class TestBaseHTTPClientGetResponse:
         mock_session.post = MagicMock(return_value=MockContextManager())
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             client = ConcreteHTTPClient(hass, config)
@@ -174,7 +200,7 @@ class TestBaseHTTPClientGetResponse:
         mock_session.post = MagicMock(return_value=mock_context)
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             client = ConcreteHTTPClient(hass, config)
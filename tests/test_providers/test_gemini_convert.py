@@ -299,3 +299,26 @@ def test_process_gemini_chunk_thought_false_not_filtered() -> None:
 
     assert len(results) == 1
     assert results[0]["content"] == "Normal text"
+
+
+def test_process_gemini_chunk_reports_cached_tokens() -> None:
+    """usageMetadata becomes a usage chunk including implicit cache hits."""
+    chunk = {
+        "candidates": [{"content": {"parts": [{"text": "Hi"}]}}],
+        "usageMetadata": {
+            "promptTokenCount": 5000,
+            "candidatesTokenCount": 2,
+            "cachedContentTokenCount": 4096,
+            "totalTokenCount": 5002,
+        },
+    }
+
+    results = process_gemini_chunk(chunk)
+
+    assert {"type": "text", "content": "Hi"} in results
+    assert {
+        "type": "usage",
+        "input_tokens": 5000,
+        "output_tokens": 2,
+        "cached_tokens": 4096,
+    } in results
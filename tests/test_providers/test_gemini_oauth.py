@@ -333,14 +333,12 @@ class TestGeminiOAuthProviderGetResponse:
             )
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
+        with patch.object(provider, "_get_session") as mock_get_session:
             mock_session = MagicMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock()
             mock_session.post = MagicMock(
                 return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
             )
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             response = await provider.get_response(messages)
 
@@ -373,14 +371,12 @@ class TestGeminiOAuthProviderGetResponse:
             )
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
+        with patch.object(provider, "_get_session") as mock_get_session:
             mock_session = MagicMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock()
             mock_session.post = MagicMock(
                 return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
             )
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             await provider.get_response(messages, tools=tools)
 
@@ -436,14 +432,12 @@ class TestGeminiOAuthProviderModelSelection:
             )
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
+        with patch.object(provider, "_get_session") as mock_get_session:
             mock_session = MagicMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock()
             mock_session.post = MagicMock(
                 return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
             )
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             # Override model to gemini-3-flash
             await provider.get_response(messages, model="gemini-3-flash")
@@ -471,14 +465,12 @@ class TestGeminiOAuthProviderModelSelection:
             )
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
+        with patch.object(provider, "_get_session") as mock_get_session:
             mock_session = MagicMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock()
             mock_session.post = MagicMock(
                 return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
             )
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             # Try to use invalid model
             await provider.get_response(messages, model="invalid-model-xyz")
@@ -507,14 +499,12 @@ class TestGeminiOAuthProviderModelSelection:
             )
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
+        with patch.object(provider, "_get_session") as mock_get_session:
             mock_session = MagicMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock()
             mock_session.post = MagicMock(
                 return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response))
             )
-            mock_session_class.return_value = mock_session
+            mock_get_session.return_value = mock_session
 
             # No model override
             await provider.get_response(messages)
@@ -932,7 +922,7 @@ class TestGeminiOAuthRetryAndFallback:
                 _AsyncContextManager(success),
             ]
         )
-        provider._session = mock_session
+        provider._get_session = MagicMock(return_value=mock_session)
 
         with patch.object(provider, "_get_valid_token", AsyncMock(return_value="token")):
             with patch.object(provider, "_ensure_project_id", AsyncMock(return_value="project")):
@@ -989,7 +979,7 @@ class TestGeminiOAuthRetryAndFallback:
         mock_session = MagicMock()
         mock_session.closed = False
         mock_session.post = MagicMock(return_value=_AsyncContextManager(terminal))
-        provider._session = mock_session
+        provider._get_session = MagicMock(return_value=mock_session)
 
         with patch.object(provider, "_get_valid_token", AsyncMock(return_value="token")):
             with patch.object(provider, "_ensure_project_id", AsyncMock(return_value="project")):
@@ -1045,7 +1035,7 @@ class TestGeminiOAuthRetryAndFallback:
                 _AsyncContextManager(stream_success),
             ]
         )
-        provider._session = mock_session
+        provider._get_session = MagicMock(return_value=mock_session)
 
         with patch.object(provider, "_get_valid_token", AsyncMock(return_value="token")):
             with patch.object(provider, "_ensure_project_id", AsyncMock(return_value="project")):
@@ -1121,7 +1111,7 @@ class TestGeminiOAuthRetryAndFallback:
                 _AsyncContextManager(stream_success),
             ]
         )
-        provider._session = mock_session
+        provider._get_session = MagicMock(return_value=mock_session)
 
         with patch.object(provider, "_get_valid_token", AsyncMock(return_value="token")):
             with patch.object(provider, "_ensure_project_id", AsyncMock(return_value="project")):
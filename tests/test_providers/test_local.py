@@ -171,6 +171,19 @@ class TestLocalProviderBuildPayload:
         assert payload["messages"] == messages
         assert payload["stream"] is False
 
+    def test_build_payload_strips_cache_prefix(self, hass: HomeAssistant) -> None:
+        """The private prompt-cache boundary is not sent to Ollama."""
+        from custom_components.homeclaw.core.prompt_layout import CACHE_PREFIX_KEY
+        from custom_components.homeclaw.providers.local import LocalProvider
+
+        provider = LocalProvider(hass, {})
+        content = "stable\n\nvolatile"
+        system = {"role": "system", "content": content, CACHE_PREFIX_KEY: 6}
+        payload = provider._build_payload([system])
+
+        assert payload["messages"] == [{"role": "system", "content": content}]
+        assert CACHE_PREFIX_KEY in system
+
 
 class TestLocalProviderExtractResponse:
     """Tests for Local provider response extraction."""
@@ -490,7 +490,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = OpenAIProvider(hass, {"token": "sk-test"})
@@ -504,6 +504,37 @@ class TestOpenAIProviderGetResponseStream:
         assert chunks[0] == {"type": "text", "content": "Hello "}
         assert chunks[1] == {"type": "text", "content": "world"}
 
+    @pytest.mark.asyncio
+    async def test_stream_multibyte_split_across_chunks(self, hass: HomeAssistant) -> None:
+        """UTF-8 characters split across network chunks are not dropped."""
+        raw = b"".join(
+            _make_sse_bytes(
+                json.dumps(
+                    {"choices": [{"delta": {"content": "Włącz światło"}, "finish_reason": "stop"}]},
+                    ensure_ascii=False,
+                ),
+                "[DONE]",
+            )
+        )
+        split = raw.index("ą".encode()) + 1
+        mock_resp = _make_mock_response(200, [raw[:split], raw[split:]])
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
+
+        with patch(
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
+            return_value=mock_session,
+        ):
+            provider = OpenAIProvider(hass, {"token": "sk-test"})
+            chunks = [
+                chunk
+                async for chunk in provider.get_response_stream(
+                    [{"role": "user", "content": "hi"}]
+                )
+            ]
+
+        assert chunks == [{"type": "text", "content": "Włącz światło"}]
+
     @pytest.mark.asyncio
     async def test_stream_tool_call(self, hass: HomeAssistant) -> None:
         """SSE tool call streaming yields tool_call chunk."""
@@ -524,7 +555,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = OpenAIProvider(hass, {"token": "sk-test"})
@@ -548,7 +579,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = OpenAIProvider(hass, {"token": "sk-test"})
@@ -571,7 +602,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = OpenAIProvider(hass, {"token": "sk-test"})
@@ -599,7 +630,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = XiaomiProvider(hass, {"token": "xiaomi-key"})
@@ -637,7 +668,7 @@ class TestOpenAIProviderGetResponseStream:
         mock_session.post = MagicMock(return_value=_MockContextManager(mock_resp))
 
         with patch(
-            "custom_components.homeclaw.providers.base_client.async_get_clientsession",
+            "custom_components.homeclaw.providers.base_client.get_pooled_session",
             return_value=mock_session,
         ):
             provider = OpenAIProvider(hass, {"token": "sk-test"})
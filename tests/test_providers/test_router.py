@@ -0,0 +1,236 @@
+"""Tests for the cross-provider failover router."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.homeclaw.providers.base_client import (
+    ProviderHTTPError,
+    parse_retry_after,
+)
+from custom_components.homeclaw.providers.registry import AIProvider
+from custom_components.homeclaw.providers.router import (
+    HEALTH_MIN_SAMPLES,
+    FailoverRouter,
+    ProviderHealth,
+)
+
+
+class FakeProvider(AIProvider):
+    """Provider replaying scripted responses and stream chunks."""
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        response: str | Exception = "ok",
+        chunks: list[dict[str, Any]] | None = None,
+        first_chunk_delay: float = 0.0,
+        tools: bool = True,
+    ) -> None:
+        super().__init__(SimpleNamespace(data={}), {"model": model})
+        self.response = response
+        if chunks is None:
+            chunks = [{"type": "text", "content": model}]
+        self.chunks = chunks
+        self.first_chunk_delay = first_chunk_delay
+        self.tools = tools
+        self.calls: list[dict[str, Any]] = []
+        self.closed_streams = 0
+
+    @property
+    def supports_tools(self) -> bool:
+        return self.tools
+
+    async def get_response(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        self.calls.append(kwargs)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    async def get_response_stream(self, messages: list[dict[str, Any]], **kwargs: Any):
+        self.calls.append(kwargs)
+        try:
+            await asyncio.sleep(self.first_chunk_delay)
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed_streams += 1
+
+
+def _router(
+    primary: FakeProvider, fallbacks: dict[str, FakeProvider], **kwargs: Any
+) -> FailoverRouter:
+    return FailoverRouter(
+        SimpleNamespace(data={}),
+        "primary",
+        primary,
+        list(fallbacks),
+        fallbacks.get,
+        health=ProviderHealth(),
+        **kwargs,
+    )
+
+
+async def _collect(router: FailoverRouter, **kwargs: Any) -> list[dict[str, Any]]:
+    return [chunk async for chunk in router.get_response_stream([], **kwargs)]
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self) -> None:
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self) -> None:
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+        assert 100 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 120
+
+    def test_invalid(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("nan") is None
+
+
+class TestProviderHealth:
+    """Tests for rolling health tracking."""
+
+    def test_retry_after_sets_cooldown(self) -> None:
+        health = ProviderHealth()
+        health.record_failure("a/m", status=429, retry_after=60)
+        assert 59 < health.cooldown_remaining("a/m") <= 60
+
+    def test_non_retryable_status_has_no_cooldown(self) -> None:
+        health = ProviderHealth()
+        health.record_failure("a/m", status=400)
+        assert health.cooldown_remaining("a/m") == 0
+
+    def test_error_rate_degrades(self) -> None:
+        health = ProviderHealth()
+        for _ in range(HEALTH_MIN_SAMPLES):
+            health.record_failure("a/m", status=400)
+        assert health.is_degraded("a/m")
+        assert health.get_stats()["a/m"]["error_rate_pct"] == 100.0
+
+    def test_latency_budget_degrades(self) -> None:
+        health = ProviderHealth()
+        for latency in (0.2, 0.3, 0.4, 0.5, 3.0):
+            health.record_success("a/m", latency)
+        assert not health.is_degraded("a/m")
+        assert health.is_degraded("a/m", latency_budget=2.0)
+        stats = health.get_stats()["a/m"]
+        assert stats["p50_ms"] == 400
+        assert stats["p95_ms"] == 3000
+
+
+@pytest.mark.asyncio
+class TestFailoverRouter:
+    """Tests for FailoverRouter request routing."""
+
+    async def test_get_response_fails_over_and_honours_retry_after(self) -> None:
+        primary = FakeProvider(
+            "p-model",
+            response=ProviderHTTPError("busy", status=429, retry_after=30),
+        )
+        backup = FakeProvider("b-model", response="from backup")
+        router = _router(primary, {"backup": backup})
+
+        assert await router.get_response([], model="p-model") == "from backup"
+        # The primary's model is not sent to the fallback
+        assert backup.calls == [{}]
+
+        # The primary is skipped while its Retry-After window lasts
+        assert await router.get_response([], model="p-model") == "from backup"
+        assert len(primary.calls) == 1
+        assert router.get_stats()["failovers"] == 1
+
+    async def test_get_response_raises_last_error(self) -> None:
+        primary = FakeProvider("p", response=ProviderHTTPError("down", status=503))
+        backup = FakeProvider("b", response=RuntimeError("also down"))
+        router = _router(primary, {"backup": backup})
+
+        with pytest.raises(RuntimeError, match="also down"):
+            await router.get_response([])
+
+    async def test_all_cooling_down(self) -> None:
+        primary = FakeProvider("p", response=ProviderHTTPError("busy", status=429))
+        router = _router(primary, {})
+        with pytest.raises(ProviderHTTPError):
+            await router.get_response([])
+
+        chunks = await _collect(router)
+        assert chunks[0]["type"] == "error"
+        assert "rate limited" in chunks[0]["message"]
+
+    async def test_stream_fails_over_before_first_content(self) -> None:
+        primary = FakeProvider(
+            "p",
+            chunks=[
+                {"type": "usage", "input_tokens": 10},
+                {"type": "error", "message": "overloaded", "status": 529},
+            ],
+        )
+        backup = FakeProvider("b", chunks=[{"type": "text", "content": "hello"}])
+        router = _router(primary, {"backup": backup})
+
+        chunks = await _collect(router)
+
+        # The failed attempt's usage chunk is not forwarded
+        assert chunks == [{"type": "text", "content": "hello"}]
+        assert primary.closed_streams == 1
+        assert router.health.cooldown_remaining("primary/p") > 0
+
+    async def test_stream_error_after_content_is_passed_through(self) -> None:
+        primary = FakeProvider(
+            "p",
+            chunks=[
+                {"type": "text", "content": "partial"},
+                {"type": "error", "message": "connection reset"},
+            ],
+        )
+        backup = FakeProvider("b")
+        router = _router(primary, {"backup": backup})
+
+        chunks = await _collect(router)
+
+        assert [c["type"] for c in chunks] == ["text", "error"]
+        assert backup.calls == []
+
+    async def test_stream_skips_fallback_without_tools(self) -> None:
+        primary = FakeProvider("p", chunks=[{"type": "error", "message": "x"}])
+        no_tools = FakeProvider("n", tools=False)
+        router = _router(primary, {"no_tools": no_tools})
+
+        chunks = await _collect(router, tools=[{"type": "function"}])
+
+        assert chunks == [{"type": "error", "message": "x"}]
+        assert no_tools.calls == []
+
+    async def test_hedging_slow_first_token(self) -> None:
+        primary = FakeProvider("p", first_chunk_delay=1.0)
+        backup = FakeProvider("b", chunks=[{"type": "text", "content": "fast"}])
+        router = _router(primary, {"backup": backup}, hedge_delay=0.05)
+
+        chunks = await _collect(router)
+
+        assert chunks == [{"type": "text", "content": "fast"}]
+        assert router.get_stats()["hedges"] == 1
+        # The slow stream was cancelled and closed
+        assert primary.closed_streams == 1
+
+    async def test_degraded_primary_is_demoted(self) -> None:
+        primary = FakeProvider("p")
+        backup = FakeProvider("b")
+        router = _router(primary, {"backup": backup}, latency_budget=1.0)
+        for _ in range(HEALTH_MIN_SAMPLES):
+            router.health.record_success("primary/p", 5.0)
+
+        assert await router.get_response([]) == "ok"
+        assert primary.calls == []
+        assert len(backup.calls) == 1
@@ -0,0 +1,83 @@
+"""Tests for the RAG context result cache."""
+
+from unittest.mock import patch
+
+from custom_components.homeclaw.rag._context_cache import ContextCache, normalize_query
+
+
+def test_normalize_query():
+    """Case, whitespace and trailing punctuation do not change the key."""
+    assert normalize_query("  What's the   Temperature in the bedroom?! ") == (
+        "what's the temperature in the bedroom"
+    )
+
+
+def test_hit_and_miss_stats():
+    """Repeated queries hit; stats report the hit ratio."""
+    cache = ContextCache()
+    key = cache.make_key("Bedroom temperature?", "u1", 10)
+
+    assert cache.get(key) is None
+    cache.put(key, "ctx", "u1", ["sensor.bedroom_temp"])
+    assert cache.get(cache.make_key("bedroom  temperature", "u1", 10)) == "ctx"
+    assert cache.get(cache.make_key("bedroom temperature", "u2", 10)) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate_pct"] == 33.3
+    assert stats["entries"] == 1
+
+
+def test_ttl_expiry():
+    """Entries expire after the TTL."""
+    cache = ContextCache(ttl=10)
+    key = cache.make_key("q", None, 10)
+    with patch("custom_components.homeclaw.rag._context_cache.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        cache.put(key, "ctx", None, [])
+        mock_time.monotonic.return_value = 111.0
+        assert cache.get(key) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted when full."""
+    cache = ContextCache(max_entries=2)
+    a, b, c = (cache.make_key(q, None, 10) for q in "abc")
+    cache.put(a, "A", None, [])
+    cache.put(b, "B", None, [])
+    cache.get(a)
+    cache.put(c, "C", None, [])
+
+    assert cache.get(b) is None
+    assert cache.get(a) == "A"
+    assert cache.get(c) == "C"
+
+
+def test_invalidate_entities_is_selective():
+    """Only entries mentioning a touched entity are dropped."""
+    cache = ContextCache()
+    lamp = cache.make_key("lamp", "u1", 10)
+    temp = cache.make_key("temperature", "u1", 10)
+    cache.put(lamp, "L", "u1", ["light.lamp"])
+    cache.put(temp, "T", "u1", ["sensor.temp"])
+
+    assert cache.invalidate_entities(["light.lamp", "light.other"]) == 1
+    assert cache.get(lamp) is None
+    assert cache.get(temp) == "T"
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_invalidate_user():
+    """Memory changes drop only that user's entries; None drops all."""
+    cache = ContextCache()
+    u1 = cache.make_key("q", "u1", 10)
+    u2 = cache.make_key("q", "u2", 10)
+    cache.put(u1, "1", "u1", [])
+    cache.put(u2, "2", "u2", [])
+
+    assert cache.invalidate_user("u1") == 1
+    assert cache.get(u2) == "2"
+    assert cache.invalidate_user(None) == 1
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,213 @@
+"""Tests for the parallel RAG context retrieval pipeline."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.homeclaw.rag.context_retriever import RAGContextRetriever
+
+QUERY_VECTOR = [0.1, 0.2, 0.3]
+
+
+def _make_retriever(hass):
+    """Build a retriever with every component mocked."""
+    entity = MagicMock()
+    entity.id = "light.kitchen"
+    entity.distance = 0.1
+
+    query_engine = MagicMock()
+    query_engine.hybrid_search = AsyncMock(return_value=[entity])
+    query_engine.build_compressed_context = MagicMock(
+        return_value=[{"entity_id": "light.kitchen", "state": "on"}]
+    )
+
+    intent_detector = MagicMock()
+    intent_detector.detect_intent = AsyncMock(return_value={"domain": "light"})
+
+    embedding_provider = MagicMock()
+    embedding_provider.get_embeddings = AsyncMock(return_value=[QUERY_VECTOR])
+
+    store = MagicMock()
+    store.search_session_chunks = AsyncMock(return_value=[])
+    store.keyword_search_sessions = AsyncMock(return_value=[])
+
+    memory_manager = MagicMock()
+    memory_manager.recall_for_query = AsyncMock(
+        return_value=[{"text": "likes warm light"}]
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+
+    return RAGContextRetriever(
+        hass=hass,
+        query_engine=query_engine,
+        intent_detector=intent_detector,
+        embedding_provider=embedding_provider,
+        store=store,
+        indexer=MagicMock(remove_entity=AsyncMock()),
+        memory_manager=memory_manager,
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_embedded_once_and_shared(hass):
+    """The query is embedded once and the vector reaches every stage."""
+    retriever = _make_retriever(hass)
+
+    context = await retriever.get_relevant_context("kitchen light", user_id="u1")
+
+    data = json.loads(context)
+    assert data["relevant_entities"][0]["entity_id"] == "light.kitchen"
+    assert data["long_term_memories"] == [{"text": "likes warm light"}]
+
+    retriever._embedding_provider.get_embeddings.assert_awaited_once()
+    retriever._intent_detector.detect_intent.assert_awaited_once_with(
+        "kitchen light", query_embedding=QUERY_VECTOR
+    )
+    assert (
+        retriever._query_engine.hybrid_search.call_args.kwargs["query_embedding"]
+        == QUERY_VECTOR
+    )
+    retriever._memory_manager.recall_for_query.assert_awaited_once_with(
+        "kitchen light", "u1", query_embedding=QUERY_VECTOR
+    )
+    assert (
+        retriever._store.search_session_chunks.call_args.kwargs["query_embedding"]
+        == QUERY_VECTOR
+    )
+
+
+@pytest.mark.asyncio
+async def test_slow_branch_is_dropped(hass):
+    """A branch missing its deadline is dropped; the others still contribute."""
+    retriever = _make_retriever(hass)
+
+    async def _slow_recall(*args, **kwargs):
+        await asyncio.sleep(10)
+        return [{"text": "never"}]
+
+    retriever._memory_manager.recall_for_query = _slow_recall
+
+    with patch(
+        "custom_components.homeclaw.rag.context_retriever.MEMORY_BRANCH_TIMEOUT",
+        0.05,
+    ):
+        timings: dict = {}
+        context = await retriever.get_relevant_context(
+            "kitchen light", user_id="u1", timings_out=timings
+        )
+
+    data = json.loads(context)
+    assert "relevant_entities" in data
+    assert "long_term_memories" not in data
+
+    assert timings["dropped"] == ["memories"]
+    assert {"embedding", "intent", "entities", "sessions", "memories"} <= set(
+        timings["stages_ms"]
+    )
+    assert timings["total_ms"] < 5000
+
+
+@pytest.mark.asyncio
+async def test_branches_run_concurrently(hass):
+    """Entity, session and memory branches overlap instead of running in sequence."""
+    retriever = _make_retriever(hass)
+    running = 0
+    peak = 0
+
+    def _tracked(result):
+        async def _call(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return result
+
+        return _call
+
+    retriever._query_engine.hybrid_search = _tracked([])
+    retriever._store.search_session_chunks = _tracked([])
+    retriever._memory_manager.recall_for_query = _tracked([])
+
+    await retriever.get_relevant_context("kitchen light", user_id="u1")
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_falls_back_per_stage(hass):
+    """If the shared embedding fails, stages still run with their own fallback."""
+    retriever = _make_retriever(hass)
+    retriever._embedding_provider.get_embeddings = AsyncMock(
+        side_effect=RuntimeError("quota")
+    )
+
+    timings: dict = {}
+    context = await retriever.get_relevant_context("kitchen light", timings_out=timings)
+
+    assert "relevant_entities" in json.loads(context)
+    assert "embedding" in timings["failed"]
+    retriever._intent_detector.detect_intent.assert_awaited_once_with(
+        "kitchen light", query_embedding=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_served_from_cache(hass):
+    """A repeated query is answered from the cache until an entity changes."""
+    from custom_components.homeclaw.rag._context_cache import ContextCache
+
+    retriever = _make_retriever(hass)
+    retriever._context_cache = cache = ContextCache()
+
+    first = await retriever.get_relevant_context("Kitchen light", user_id="u1")
+    timings: dict = {}
+    second = await retriever.get_relevant_context(
+        "kitchen light?", user_id="u1", timings_out=timings
+    )
+
+    assert first and second == first
+    assert timings["cached"] is True
+    retriever._query_engine.hybrid_search.assert_awaited_once()
+
+    cache.invalidate_entities(["light.kitchen"])
+    await retriever.get_relevant_context("kitchen light", user_id="u1")
+    assert retriever._query_engine.hybrid_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_degraded_context_not_cached(hass):
+    """A retrieval with a dropped branch is not cached."""
+    from custom_components.homeclaw.rag._context_cache import ContextCache
+
+    retriever = _make_retriever(hass)
+    retriever._context_cache = cache = ContextCache()
+    retriever._memory_manager.recall_for_query = AsyncMock(side_effect=RuntimeError)
+
+    await retriever.get_relevant_context("kitchen light", user_id="u1")
+
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_keep_their_own_timings(hass):
+    """Each call reports its own timings even when calls overlap."""
+    retriever = _make_retriever(hass)
+    slow: dict = {}
+    fast: dict = {}
+
+    async def _search(query, *args, **kwargs):
+        await asyncio.sleep(0.05 if query == "slow" else 0)
+        return []
+
+    retriever._query_engine.hybrid_search = _search
+
+    await asyncio.gather(
+        retriever.get_relevant_context("slow", timings_out=slow),
+        retriever.get_relevant_context("fast", timings_out=fast),
+    )
+
+    assert slow["total_ms"] > fast["total_ms"]
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.homeclaw.rag._gemini_embed import _retry_delay
 from custom_components.homeclaw.rag.embeddings import (
     CachedEmbeddingProvider,
     EmbeddingError,
@@ -16,6 +17,7 @@ from custom_components.homeclaw.rag.embeddings import (
     OpenAIEmbeddings,
     _hash_text,
     _is_retryable_error,
+    async_create_embedding_provider,
     create_embedding_provider,
     get_embedding_for_query,
 )
@@ -90,6 +92,30 @@ class TestOpenAIEmbeddings:
                 await provider.get_embeddings(["text"])
 
 
+def _gemini_response(status=200, payload=None, text="", headers=None):
+    """Build a mocked aiohttp response usable as an async context manager."""
+    resp = AsyncMock()
+    resp.status = status
+    resp.json = AsyncMock(return_value=payload or {})
+    resp.text = AsyncMock(return_value=text)
+    resp.headers = headers or {}
+    return AsyncMock(__aenter__=AsyncMock(return_value=resp), __aexit__=AsyncMock())
+
+
+def _batch_payload(count, dim=768):
+    """batchEmbedContents response body with ``count`` embeddings."""
+    return {"embeddings": [{"values": [float(i)] * dim} for i in range(count)]}
+
+
+def _pooled_session(*responses):
+    """Mocked long-lived session returning ``responses`` in order."""
+    session = MagicMock()
+    session.closed = False
+    session.close = AsyncMock()
+    session.post = MagicMock(side_effect=list(responses))
+    return session
+
+
 class TestGeminiApiKeyEmbeddings:
     """Tests for Gemini API key embedding provider."""
 
@@ -105,45 +131,147 @@ class TestGeminiApiKeyEmbeddings:
 
     @pytest.mark.asyncio
     async def test_get_embeddings_success(self, provider):
-        """Test successful embedding generation."""
-        mock_response = {"embedding": {"values": [0.1] * 768}}
+        """Test successful embedding generation via batchEmbedContents."""
+        provider._session = _pooled_session(_gemini_response(payload=_batch_payload(1)))
 
-        mock_response_obj = AsyncMock()
-        mock_response_obj.status = 200
-        mock_response_obj.json = AsyncMock(return_value=mock_response)
+        embeddings = await provider.get_embeddings(["text1"])
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(
-            return_value=AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_response_obj),
-                __aexit__=AsyncMock(),
-            )
+        assert len(embeddings) == 1
+        assert len(embeddings[0]) == 768
+        url = provider._session.post.call_args.args[0]
+        assert url.endswith("gemini-embedding-001:batchEmbedContents")
+        headers = provider._session.post.call_args.kwargs["headers"]
+        assert headers["x-goog-api-key"] == "test-gemini-key"
+        assert "key=" not in url
+
+    @pytest.mark.asyncio
+    async def test_get_embeddings_api_error(self, provider):
+        """Test API error handling."""
+        provider._session = _pooled_session(
+            _gemini_response(status=400, text="Bad Request")
         )
 
-        with patch("aiohttp.ClientSession") as mock_session_class:
-            mock_session_class.return_value = AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_session), __aexit__=AsyncMock()
-            )
+        with pytest.raises(EmbeddingError, match="Gemini API embedding failed"):
+            await provider.get_embeddings(["text"])
+
+    @pytest.mark.asyncio
+    async def test_batches_split_and_keep_order(self, provider):
+        """Texts are split into API-sized batches; result order is preserved."""
+        provider._session = _pooled_session(
+            _gemini_response(payload=_batch_payload(100)),
+            _gemini_response(payload=_batch_payload(50)),
+        )
 
-            embeddings = await provider.get_embeddings(["text1"])
+        embeddings = await provider.get_embeddings([f"t{i}" for i in range(150)])
 
-            assert len(embeddings) == 1
-            assert len(embeddings[0]) == 768
+        assert len(embeddings) == 150
+        assert provider._session.post.call_count == 2
+        first = provider._session.post.call_args_list[0].kwargs["json"]["requests"]
+        second = provider._session.post.call_args_list[1].kwargs["json"]["requests"]
+        assert [r["content"]["parts"][0]["text"] for r in first[:2]] == ["t0", "t1"]
+        assert second[0]["content"]["parts"][0]["text"] == "t100"
+        assert second[0]["model"] == "models/gemini-embedding-001"
+        assert embeddings[100][0] == 0.0  # first embedding of the second batch
 
     @pytest.mark.asyncio
-    async def test_get_embeddings_api_error(self, provider):
-        """Test API error handling."""
+    async def test_session_is_reused(self, provider):
+        """One pooled session serves consecutive calls."""
+        provider._session = _pooled_session(
+            _gemini_response(payload=_batch_payload(1)),
+            _gemini_response(payload=_batch_payload(1)),
+        )
+        session = provider._session
+
         with patch("aiohttp.ClientSession") as mock_session_class:
-            mock_session = AsyncMock()
-            mock_session_class.return_value.__aenter__.return_value = mock_session
+            await provider.get_embeddings(["a"])
+            await provider.get_embeddings(["b"])
+            mock_session_class.assert_not_called()
 
-            mock_response_obj = AsyncMock()
-            mock_response_obj.status = 400
-            mock_response_obj.text = AsyncMock(return_value="Bad Request")
-            mock_session.post.return_value.__aenter__.return_value = mock_response_obj
+        assert provider._session is session
+        await provider.async_close()
+        session.close.assert_awaited_once()
+        assert provider._session is None
 
-            with pytest.raises(EmbeddingError, match="Gemini API embedding failed"):
-                await provider.get_embeddings(["text"])
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_delay(self, provider):
+        """A 429 pauses the token bucket for the server's retryDelay, then retries."""
+        body = (
+            '{"error": {"code": 429, "details": [{"@type": '
+            '"type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "13s"}]}}'
+        )
+        provider._session = _pooled_session(
+            _gemini_response(status=429, text=body),
+            _gemini_response(payload=_batch_payload(1)),
+        )
+        provider._limiter = MagicMock(acquire=AsyncMock(return_value=0.0))
+
+        embeddings = await provider.get_embeddings(["text"])
+
+        assert len(embeddings) == 1
+        provider._limiter.pause.assert_called_once_with(13.0)
+        assert provider._limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_requests(self, provider):
+        """Without batchEmbedContents, texts go through concurrent embedContent calls."""
+        provider._session = _pooled_session(
+            _gemini_response(status=404, text="Not Found"),
+            _gemini_response(payload={"embedding": {"values": [0.1] * 768}}),
+            _gemini_response(payload={"embedding": {"values": [0.2] * 768}}),
+        )
+
+        embeddings = await provider.get_embeddings(["a", "b"])
+
+        assert [e[0] for e in embeddings] == [0.1, 0.2]
+        assert provider._batch_supported is False
+        urls = [c.args[0] for c in provider._session.post.call_args_list]
+        assert urls[0].endswith(":batchEmbedContents")
+        assert all(u.endswith(":embedContent") for u in urls[1:])
+
+    @pytest.mark.asyncio
+    async def test_only_failed_chunk_is_re_embedded(self, provider):
+        """A malformed batch response re-embeds just that chunk, one text at a time."""
+        provider._session = _pooled_session(
+            _gemini_response(payload=_batch_payload(100)),
+            _gemini_response(payload=_batch_payload(1)),  # 1 embedding for 2 texts
+            _gemini_response(payload={"embedding": {"values": [0.1] * 768}}),
+            _gemini_response(payload={"embedding": {"values": [0.2] * 768}}),
+        )
+
+        embeddings = await provider.get_embeddings([f"t{i}" for i in range(102)])
+
+        assert len(embeddings) == 102
+        assert [e[0] for e in embeddings[100:]] == [0.1, 0.2]
+        assert provider._batch_supported is True
+        urls = [c.args[0] for c in provider._session.post.call_args_list]
+        assert [u.rsplit(":", 1)[1] for u in urls] == [
+            "batchEmbedContents",
+            "batchEmbedContents",
+            "embedContent",
+            "embedContent",
+        ]
+
+
+class TestRetryDelay:
+    """Tests for the 429 retry delay of the Gemini embedding transport."""
+
+    def test_google_retry_info(self):
+        """retryDelay from a google.rpc.RetryInfo detail is honoured."""
+        body = (
+            '{"error": {"code": 429, "details": ['
+            '{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "1.5s"}'
+            "]}}"
+        )
+        assert _retry_delay(body, {}, 0) == 1.5
+
+    def test_retry_after_header(self):
+        """Falls back to the Retry-After header."""
+        assert _retry_delay("Too Many Requests", {"Retry-After": "7"}, 0) == 7.0
+
+    def test_backoff_without_hint(self):
+        """No hint -> jittered exponential backoff, capped."""
+        assert 0 < _retry_delay("{}", {"Retry-After": "soon"}, 1) <= 4 * 1.3
+        assert _retry_delay("not json", {}, 10) == 60.0
 
 
 class TestGeminiOAuthEmbeddings:
@@ -162,34 +290,18 @@ class TestGeminiOAuthEmbeddings:
     @pytest.mark.asyncio
     async def test_get_embeddings_success(self, provider):
         """Test successful embedding generation with OAuth."""
-        mock_response = {"embedding": {"values": [0.1] * 768}}
+        provider._session = _pooled_session(_gemini_response(payload=_batch_payload(1)))
 
-        mock_response_obj = AsyncMock()
-        mock_response_obj.status = 200
-        mock_response_obj.json = AsyncMock(return_value=mock_response)
+        embeddings = await provider.get_embeddings(["text1"])
 
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(
-            return_value=AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_response_obj),
-                __aexit__=AsyncMock(),
-            )
-        )
-
-        with patch("aiohttp.ClientSession") as mock_session_class:
-            mock_session_class.return_value = AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_session), __aexit__=AsyncMock()
-            )
-
-            embeddings = await provider.get_embeddings(["text1"])
-
-            assert len(embeddings) == 1
-            assert len(embeddings[0]) == 768
+        assert len(embeddings) == 1
+        assert len(embeddings[0]) == 768
+        headers = provider._session.post.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer test_access_token"
 
     @pytest.mark.asyncio
     async def test_get_embeddings_token_refresh(self, hass):
         """Test token refresh when expired."""
-        from custom_components.homeclaw.rag import embeddings as embeddings_module
         from custom_components.homeclaw import gemini_oauth
 
         # Create a real MockConfigEntry instead of using the MagicMock fixture
@@ -207,20 +319,7 @@ class TestGeminiOAuthEmbeddings:
         config_entry.add_to_hass(hass)
 
         provider = GeminiOAuthEmbeddings(hass=hass, config_entry=config_entry)
-
-        mock_response = {"embedding": {"values": [0.1] * 768}}
-
-        mock_response_obj = AsyncMock()
-        mock_response_obj.status = 200
-        mock_response_obj.json = AsyncMock(return_value=mock_response)
-
-        mock_session = MagicMock()
-        mock_session.post = MagicMock(
-            return_value=AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_response_obj),
-                __aexit__=AsyncMock(),
-            )
-        )
+        provider._session = _pooled_session(_gemini_response(payload=_batch_payload(1)))
 
         mock_refresh = AsyncMock(
             return_value={
@@ -230,19 +329,14 @@ class TestGeminiOAuthEmbeddings:
             }
         )
 
-        with (
-            patch("aiohttp.ClientSession") as mock_session_class,
-            patch.object(gemini_oauth, "refresh_token", mock_refresh),
-        ):
-            mock_session_class.return_value = AsyncMock(
-                __aenter__=AsyncMock(return_value=mock_session), __aexit__=AsyncMock()
-            )
-
+        with patch.object(gemini_oauth, "refresh_token", mock_refresh):
             embeddings = await provider.get_embeddings(["text"])
 
-            # Verify refresh was called
-            mock_refresh.assert_called_once()
+            # Verify refresh was called (on the pooled session)
+            mock_refresh.assert_called_once_with(provider._session, "test_refresh_token")
             assert len(embeddings) == 1
+            headers = provider._session.post.call_args.kwargs["headers"]
+            assert headers["Authorization"] == "Bearer new_token"
 
 
 class TestCreateEmbeddingProvider:
@@ -307,6 +401,92 @@ class TestCreateEmbeddingProvider:
         with pytest.raises(EmbeddingError, match="No embedding provider available"):
             create_embedding_provider(hass, config)
 
+    def test_local_embedding_url_preferred(self, hass):
+        """An explicit local embedding endpoint wins over cloud keys."""
+        config = {
+            "openai_token": "sk-test-key",
+            "local_embedding_url": "http://ollama:11434",
+            "local_embedding_model": "bge-m3",
+        }
+
+        provider = create_embedding_provider(hass, config)
+
+        assert provider.provider_name == "local_endpoint"
+        assert provider.url == "http://ollama:11434/v1/embeddings"
+        assert provider.dimension == 1024
+
+    def test_local_chat_server_used_after_cloud_keys(self, hass):
+        """The local chat server is used when no cloud key is configured."""
+        config = {"ai_provider": "local", "local_url": "http://ollama:11434/api/chat"}
+
+        provider = create_embedding_provider(hass, config)
+
+        assert provider.provider_name == "local_endpoint"
+
+    def test_local_model_requested_without_fastembed_raises(self, hass):
+        """Selecting the CPU model without fastembed fails loudly."""
+        config = {"embedding_provider": "local", "openai_token": "sk-test-key"}
+
+        with (
+            patch(
+                "custom_components.homeclaw.rag._local_embed.fastembed_available",
+                return_value=False,
+            ),
+            pytest.raises(EmbeddingError, match="fastembed"),
+        ):
+            create_embedding_provider(hass, config)
+
+    def test_local_model_is_last_resort(self, hass):
+        """With fastembed installed, the CPU model replaces the final error."""
+        config = {"ai_provider": "anthropic"}
+
+        with patch(
+            "custom_components.homeclaw.rag._local_embed.fastembed_available",
+            return_value=True,
+        ):
+            provider = create_embedding_provider(hass, config)
+
+        assert provider.provider_name == "local_model"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_local_endpoint_falls_through(self, hass):
+        """A local server that is down at startup yields the next provider."""
+        config = {
+            "openai_token": "sk-test-key",
+            "local_embedding_url": "http://ollama:11434",
+            "local_embedding_model": "custom",
+        }
+
+        with patch(
+            "custom_components.homeclaw.rag._local_embed.LocalEndpointEmbeddings"
+            ".get_embeddings",
+            AsyncMock(side_effect=EmbeddingError("connection refused")),
+        ):
+            provider = await async_create_embedding_provider(hass, config)
+
+        assert provider.provider_name == "openai"
+        assert config["local_embedding_url"] == "http://ollama:11434"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_local_endpoint_keeps_indexed_dimension(self, hass):
+        """With a known index dimension the probe waits for the first embed."""
+        config = {
+            "local_embedding_url": "http://ollama:11434",
+            "local_embedding_model": "custom",
+        }
+
+        with patch(
+            "custom_components.homeclaw.rag._local_embed.LocalEndpointEmbeddings"
+            ".get_embeddings",
+            AsyncMock(side_effect=EmbeddingError("connection refused")),
+        ):
+            provider = await async_create_embedding_provider(
+                hass, config, stored_dimension=768
+            )
+
+        assert provider.provider_name == "local_endpoint"
+        assert provider.dimension == 768
+
 
 class TestGetEmbeddingForQuery:
     """Tests for the query embedding helper."""
@@ -395,9 +575,9 @@ class TestCachedEmbeddingProvider:
     def mock_store(self):
         """Create a mock SQLite store for cache operations."""
         store = MagicMock()
-        store.cache_lookup = MagicMock(return_value={})  # No cache hits by default
-        store.cache_upsert = MagicMock()
-        store.cache_prune = MagicMock()
+        store.async_cache_lookup = AsyncMock(return_value={})  # No cache hits by default
+        store.async_cache_upsert = AsyncMock()
+        store.async_cache_prune = AsyncMock()
         return store
 
     def test_properties(self, mock_inner, mock_store):
@@ -416,13 +596,13 @@ class TestCachedEmbeddingProvider:
         assert len(result) == 1
         mock_inner.get_embeddings.assert_called_once_with(["hello"])
         # Should have stored the result in cache
-        mock_store.cache_upsert.assert_called_once()
+        mock_store.async_cache_upsert.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_cache_hit_skips_provider(self, mock_inner, mock_store):
         """Test that cache hit skips the API call."""
         text_hash = _hash_text("hello")
-        mock_store.cache_lookup.return_value = {text_hash: [0.5] * 768}
+        mock_store.async_cache_lookup.return_value = {text_hash: [0.5] * 768}
 
         cached = CachedEmbeddingProvider(inner=mock_inner, store=mock_store)
         result = await cached.get_embeddings(["hello"])
@@ -431,13 +611,13 @@ class TestCachedEmbeddingProvider:
         # Inner provider should NOT be called (cache hit)
         mock_inner.get_embeddings.assert_not_called()
         # No new entries to cache
-        mock_store.cache_upsert.assert_not_called()
+        mock_store.async_cache_upsert.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_partial_cache_hit(self, mock_inner, mock_store):
         """Test mixed cache hits and misses."""
         hash_a = _hash_text("cached text")
-        mock_store.cache_lookup.return_value = {hash_a: [0.1] * 768}
+        mock_store.async_cache_lookup.return_value = {hash_a: [0.1] * 768}
 
         mock_inner.get_embeddings = AsyncMock(return_value=[[0.2] * 768])
 
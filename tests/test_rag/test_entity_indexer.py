@@ -8,6 +8,7 @@ from dataclasses import dataclass
 # Note: homeassistant mocks are set up in conftest.py
 
 from custom_components.homeclaw.rag.entity_indexer import (
+    EMBEDDING_BATCH_SIZE,
     EntityDocument,
     EntityIndexer,
 )
@@ -53,6 +54,11 @@ class TestEntityIndexer:
         store.delete_documents = AsyncMock()
         store.clear_collection = AsyncMock()
         store.get_document_count = AsyncMock(return_value=0)
+        store.get_embed_hashes = AsyncMock(return_value={})
+        store.update_documents_text = AsyncMock(return_value=0)
+        store.begin_shadow_reindex = AsyncMock(return_value={})
+        store.write_shadow_documents = AsyncMock(return_value=0)
+        store.swap_shadow_table = AsyncMock(return_value=0)
         return store
 
     @pytest.fixture
@@ -248,9 +254,104 @@ class TestEntityIndexer:
         finally:
             ar_module.async_get = original_ar_async_get
 
-        # Should clear and then add
-        mock_store.clear_collection.assert_called_once()
-        mock_store.add_documents.assert_called()
+        # Built into the shadow table and swapped in; the live table is never cleared
+        mock_store.clear_collection.assert_not_called()
+        mock_store.begin_shadow_reindex.assert_called_once()
+        written = mock_store.write_shadow_documents.call_args.kwargs
+        assert sorted(written["ids"]) == ["light.one", "light.two"]
+        assert len(written["embed_hashes"]) == 2
+        mock_store.swap_shadow_table.assert_called_once_with(["light.one", "light.two"])
+
+    @pytest.fixture
+    def registry(self, indexer):
+        """Install a registry of 120 lights (three embedding batches)."""
+        entries = [
+            MockEntityEntry(entity_id=f"light.l{i:03d}", name=f"Light {i}")
+            for i in range(120)
+        ]
+        mock_registry = MagicMock()
+        mock_registry.entities = {e.entity_id: e for e in entries}
+        mock_registry.async_get = lambda eid: mock_registry.entities.get(eid)
+        indexer._get_entity_registry = lambda: mock_registry
+        return mock_registry
+
+    @pytest.mark.asyncio
+    async def test_full_reindex_pipeline_batches_and_progress(
+        self, indexer, registry, mock_store, mock_embedding_provider
+    ):
+        """Batches are embedded and written once each, with progress events."""
+        events = []
+
+        async def progress(event):
+            events.append(event)
+
+        assert await indexer.full_reindex(progress) is True
+
+        assert mock_embedding_provider.get_embeddings.call_count == 3
+        written = [
+            doc_id
+            for call in mock_store.write_shadow_documents.call_args_list
+            for doc_id in call.kwargs["ids"]
+        ]
+        assert sorted(written) == sorted(registry.entities)
+        assert events[0] == {"type": "start", "total": 120, "resumed": 0}
+        # Batches may finish in any order; the running count ends at the total
+        progress_counts = [e["indexed"] for e in events if e["type"] == "progress"]
+        assert len(progress_counts) == 3
+        assert progress_counts[-1] == 120
+        assert events[-1]["type"] == "complete"
+        assert not indexer.reindex_running
+
+    @pytest.mark.asyncio
+    async def test_full_reindex_resumes_checkpoint(
+        self, indexer, registry, mock_store, mock_embedding_provider
+    ):
+        """Rows already in the shadow table are not embedded again."""
+        docs = [await indexer._get_entity_data(eid) for eid in list(registry.entities)[:100]]
+        mock_store.begin_shadow_reindex.return_value = {
+            doc.id: doc.embed_hash for doc in docs
+        }
+
+        assert await indexer.full_reindex() is True
+
+        mock_embedding_provider.get_embeddings.assert_called_once()
+        assert len(mock_embedding_provider.get_embeddings.call_args[0][0]) == 20
+        mock_store.swap_shadow_table.assert_called_once()
+        assert indexer.get_stats()["embeddings_avoided"] == 100
+
+    @pytest.mark.asyncio
+    async def test_full_reindex_failed_batch_keeps_live_index(
+        self, indexer, registry, mock_store, mock_embedding_provider
+    ):
+        """A failed embedding batch leaves the checkpoint to be resumed."""
+        calls = 0
+
+        async def flaky(texts):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("rate limited")
+            return [[0.1] * 768 for _ in texts]
+
+        mock_embedding_provider.get_embeddings.side_effect = flaky
+
+        assert await indexer.full_reindex() is False
+
+        assert mock_store.write_shadow_documents.call_count == 2
+        mock_store.swap_shadow_table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_reindex_write_error_stops_pipeline(
+        self, indexer, registry, mock_store
+    ):
+        """A store failure cancels the other stages and propagates."""
+        mock_store.write_shadow_documents.side_effect = RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await indexer.full_reindex()
+
+        mock_store.swap_shadow_table.assert_not_called()
+        assert not indexer.reindex_running
 
     @pytest.mark.asyncio
     async def test_index_entities_batch(
@@ -297,6 +398,105 @@ class TestEntityIndexer:
 
         mock_store.upsert_documents.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_state_only_change_skips_embedding(
+        self, indexer, mock_store, mock_embedding_provider
+    ):
+        """A state flip refreshes text/metadata without re-embedding."""
+        mock_registry = MagicMock()
+        mock_registry.async_get = lambda eid: MockEntityEntry(
+            entity_id=eid, name="Desk Lamp"
+        )
+        indexer._get_entity_registry = lambda: mock_registry
+
+        current = {"state": "on"}
+
+        def get_state(entity_id):
+            return MockState(
+                entity_id=entity_id,
+                state=current["state"],
+                attributes={"friendly_name": "Desk Lamp"},
+            )
+
+        with patch("homeassistant.core.StateMachine.get", side_effect=get_state):
+            await indexer.index_entities_batch(["light.desk"])
+
+            # State is stored and searchable but not embedded
+            upsert = mock_store.upsert_documents.call_args.kwargs
+            assert "turned on" in upsert["texts"][0]
+            embedded = mock_embedding_provider.get_embeddings.call_args[0][0]
+            assert "turned on" not in embedded[0]
+
+            mock_store.get_embed_hashes.return_value = {
+                "light.desk": upsert["embed_hashes"][0]
+            }
+            current["state"] = "off"
+            await indexer.index_entities_batch(["light.desk"])
+
+        assert mock_embedding_provider.get_embeddings.call_count == 1
+        assert mock_store.upsert_documents.call_count == 1
+        update = mock_store.update_documents_text.call_args.kwargs
+        assert update["ids"] == ["light.desk"]
+        assert "turned off" in update["texts"][0]
+        assert update["metadatas"][0]["state"] == "off"
+        assert indexer.get_stats() == {
+            "embeddings_generated": 1,
+            "embeddings_avoided": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_rename_reembeds(self, indexer, mock_store, mock_embedding_provider):
+        """A changed stable description is embedded again."""
+        mock_store.get_embed_hashes.return_value = {"light.desk": "stale"}
+        mock_registry = MagicMock()
+        mock_registry.async_get = lambda eid: MockEntityEntry(
+            entity_id=eid, name="Desk Lamp"
+        )
+        indexer._get_entity_registry = lambda: mock_registry
+
+        await indexer.index_entity("light.desk")
+
+        mock_embedding_provider.get_embeddings.assert_called_once()
+        mock_store.update_documents_text.assert_not_called()
+        mock_store.upsert_documents.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reembed_unhashed(self, indexer, mock_store, mock_embedding_provider):
+        """Rows stored without an embed hash are embedded again, in batches."""
+        entity_ids = [f"light.lamp_{i}" for i in range(EMBEDDING_BATCH_SIZE + 1)]
+        mock_store.get_unhashed_ids = AsyncMock(return_value=entity_ids)
+        mock_registry = MagicMock()
+        mock_registry.async_get = lambda eid: MockEntityEntry(entity_id=eid, name=eid)
+        indexer._get_entity_registry = lambda: mock_registry
+
+        assert await indexer.reembed_unhashed() == len(entity_ids)
+
+        assert mock_embedding_provider.get_embeddings.call_count == 2
+        written = [
+            call.kwargs["embed_hashes"]
+            for call in mock_store.upsert_documents.call_args_list
+        ]
+        assert sum(len(hashes) for hashes in written) == len(entity_ids)
+        assert all(all(hashes) for hashes in written)
+
+    @pytest.mark.asyncio
+    async def test_reembed_unhashed_drops_orphans(self, indexer, mock_store):
+        """Unhashed rows of entities gone from the registry are deleted."""
+        mock_store.get_unhashed_ids = AsyncMock(
+            return_value=["light.desk", "light.removed"]
+        )
+        mock_store.delete_documents = AsyncMock()
+        mock_registry = MagicMock()
+        mock_registry.async_get = lambda eid: (
+            MockEntityEntry(entity_id=eid, name=eid) if eid == "light.desk" else None
+        )
+        indexer._get_entity_registry = lambda: mock_registry
+
+        assert await indexer.reembed_unhashed() == 2
+
+        mock_store.delete_documents.assert_awaited_once_with(["light.removed"])
+        mock_store.upsert_documents.assert_called_once()
+
 
 class TestEntityDocument:
     """Tests for EntityDocument dataclass."""
@@ -195,6 +195,23 @@ class TestEntityRegistryEventHandler:
         mock_indexer.remove_entity.assert_called_once_with("light.old")
         mock_indexer.index_entity.assert_called_once_with("light.new")
 
+    @pytest.mark.asyncio
+    async def test_context_cache_invalidation(self, mock_hass, mock_indexer):
+        """Removed/updated entities drop their cached contexts; creation clears all."""
+        cache = Mock()
+        handler = EntityRegistryEventHandler(
+            mock_hass, mock_indexer, context_cache=cache
+        )
+
+        await handler._on_entity_removed("light.old")
+        cache.invalidate_entities.assert_called_once_with(["light.old"])
+
+        await handler._on_entity_updated("light.lamp", {"name": {}})
+        cache.invalidate_entities.assert_called_with(["light.lamp"])
+
+        await handler._on_entity_added("light.new")
+        cache.clear.assert_called_once()
+
 
 class TestStateChangeHandler:
     """Tests for StateChangeHandler."""
@@ -297,3 +314,17 @@ class TestStateChangeHandler:
         await handler._handle_state_changed(event)
 
         mock_indexer.index_entity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pending_reindex_invalidates_context_cache(
+        self, mock_hass, mock_indexer
+    ):
+        """Entities reindexed on shutdown drop their cached contexts."""
+        cache = Mock()
+        handler = StateChangeHandler(mock_hass, mock_indexer, context_cache=cache)
+        handler._pending_updates = {"light.a": 0.0}
+
+        await handler.async_stop()
+
+        mock_indexer.index_entity.assert_awaited_once_with("light.a")
+        assert list(cache.invalidate_entities.call_args.args[0]) == ["light.a"]
@@ -1,6 +1,7 @@
 """Tests for semantic intent detector."""
 
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.homeclaw.rag.intent_detector import (
@@ -60,28 +61,28 @@ class TestIntentDetector:
         """Test initialization caches all prototype embeddings."""
         detector = IntentDetector(embedding_provider=mock_embedding_provider)
 
-        # Mock get_embedding_for_query to return predictable embeddings
-        call_count = 0
+        # Mock the batch helper to return predictable embeddings
+        calls = []
 
-        async def mock_embedding(provider, query):
-            nonlocal call_count
-            call_count += 1
-            return [float(call_count), 0.0, 0.0]  # Different embedding each call
+        async def mock_embeddings(provider, queries):
+            calls.append(queries)
+            return [[float(i + 1), 0.0, 0.0] for i in range(len(queries))]
 
         import custom_components.homeclaw.rag.intent_detector as module
 
-        original_func = module.get_embedding_for_query
-        module.get_embedding_for_query = mock_embedding
+        original_func = module.get_embeddings_for_queries
+        module.get_embeddings_for_queries = mock_embeddings
 
         try:
             await detector.async_initialize()
 
             assert detector._initialized is True
-            # Should have cached embeddings for all prototypes
+            # Should have cached embeddings for all prototypes, in one call
             total_prototypes = sum(len(p) for p in INTENT_PROTOTYPES.values())
             assert len(detector._prototype_cache) == total_prototypes
+            assert len(calls) == 1
         finally:
-            module.get_embedding_for_query = original_func
+            module.get_embeddings_for_queries = original_func
 
     @pytest.mark.asyncio
     async def test_async_initialize_already_initialized(self, mock_embedding_provider):
@@ -206,6 +207,73 @@ class TestIntentDetector:
         assert stats["cached_prototypes"] == 2
 
 
+class TestPrototypePersistence:
+    """Tests for persisted prototype embeddings and the stacked matcher."""
+
+    @pytest_asyncio.fixture
+    async def store(self, tmp_path):
+        from custom_components.homeclaw.rag.sqlite_store import SqliteStore
+
+        store = SqliteStore(persist_directory=str(tmp_path))
+        await store.async_initialize()
+        yield store
+        await store.async_shutdown()
+
+    @staticmethod
+    def _provider():
+        provider = MagicMock()
+        provider.provider_name = "test_provider"
+        provider.dimension = 4
+        provider.model = "test-model"
+        provider.get_embeddings = AsyncMock(
+            side_effect=lambda texts: [
+                [1.0, float(i % 7), float(i % 3), 0.5] for i in range(len(texts))
+            ]
+        )
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_prototypes_embedded_once_across_restarts(self, store):
+        first = self._provider()
+        await IntentDetector(embedding_provider=first, store=store).async_initialize()
+        first.get_embeddings.assert_awaited_once()
+
+        second = self._provider()
+        detector = IntentDetector(embedding_provider=second, store=store)
+        await detector.async_initialize()
+
+        second.get_embeddings.assert_not_called()
+        total_prototypes = sum(len(p) for p in INTENT_PROTOTYPES.values())
+        assert len(detector._prototype_cache) == total_prototypes
+
+    @pytest.mark.asyncio
+    async def test_model_change_re_embeds(self, store):
+        await IntentDetector(
+            embedding_provider=self._provider(), store=store
+        ).async_initialize()
+
+        changed = self._provider()
+        changed.model = "other-model"
+        await IntentDetector(embedding_provider=changed, store=store).async_initialize()
+
+        changed.get_embeddings.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_best_prototype_per_intent_type(self):
+        detector = IntentDetector(embedding_provider=self._provider())
+        detector._initialized = True
+        detector._prototype_cache = {
+            "domain:light:turn on the light": [1.0, 0.0, 0.0],
+            "domain:fan:turn on the fan": [0.8, 0.6, 0.0],
+            "area:kitchen:in the kitchen": [0.0, 0.0, 1.0],
+            "area:bedroom:in the bedroom": [0.9, 0.0, 0.44],
+        }
+
+        result = await detector.detect_intent("x", query_embedding=[1.0, 0.05, 0.1])
+
+        assert result == {"domain": "light", "area": "bedroom"}
+
+
 class TestIntentPrototypes:
     """Tests for intent prototype configuration."""
 
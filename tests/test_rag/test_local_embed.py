@@ -0,0 +1,184 @@
+"""Tests for the on-box embedding providers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.homeclaw.rag._local_embed import (
+    LocalEndpointEmbeddings,
+    LocalModelEmbeddings,
+    fastembed_available,
+    normalize_embeddings_url,
+)
+from custom_components.homeclaw.rag.embeddings import EmbeddingError
+
+
+def _response(status=200, payload=None, text=""):
+    """Build a mocked aiohttp response usable as an async context manager."""
+    resp = AsyncMock()
+    resp.status = status
+    resp.json = AsyncMock(return_value=payload or {})
+    resp.text = AsyncMock(return_value=text)
+    return AsyncMock(
+        __aenter__=AsyncMock(return_value=resp), __aexit__=AsyncMock(return_value=False)
+    )
+
+
+def _openai_payload(count, dim=4, reverse=False):
+    """/v1/embeddings response body with ``count`` embeddings."""
+    items = [{"index": i, "embedding": [float(i)] * dim} for i in range(count)]
+    return {"data": list(reversed(items)) if reverse else items}
+
+
+def _session(*responses):
+    """Mocked long-lived session returning ``responses`` in order."""
+    session = MagicMock()
+    session.closed = False
+    session.close = AsyncMock()
+    session.post = MagicMock(side_effect=list(responses))
+    return session
+
+
+class _FakeEncoder:
+    """Stand-in for fastembed.TextEmbedding recording its batches."""
+
+    def __init__(self, dim=3):
+        self.dim = dim
+        self.calls = []
+
+    def embed(self, texts, batch_size):
+        self.calls.append((list(texts), batch_size))
+        for i, _ in enumerate(texts):
+            yield [float(i)] * self.dim
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://ollama:11434", "http://ollama:11434/v1/embeddings"),
+        ("http://ollama:11434/api/chat", "http://ollama:11434/v1/embeddings"),
+        ("http://ollama:11434/api/generate/", "http://ollama:11434/v1/embeddings"),
+        ("http://lmstudio:1234/v1", "http://lmstudio:1234/v1/embeddings"),
+        ("http://lmstudio:1234/v1/embeddings", "http://lmstudio:1234/v1/embeddings"),
+    ],
+)
+def test_normalize_embeddings_url(url, expected):
+    """Local server URLs map onto the OpenAI-compatible embeddings path."""
+    assert normalize_embeddings_url(url) == expected
+
+
+def test_fastembed_available_does_not_import():
+    """Detection only looks the package up; the import happens on model load."""
+    with (
+        patch(
+            "custom_components.homeclaw.rag._local_embed.importlib.util.find_spec",
+            return_value=None,
+        ) as find_spec,
+        patch("builtins.__import__") as import_,
+    ):
+        assert fastembed_available() is False
+
+    find_spec.assert_called_once_with("fastembed")
+    import_.assert_not_called()
+
+
+class TestLocalEndpointEmbeddings:
+    """Tests for the OpenAI-compatible local endpoint provider."""
+
+    def test_properties(self):
+        """Known models resolve their dimension without a request."""
+        provider = LocalEndpointEmbeddings(url="http://ollama:11434/api/chat")
+        assert provider.url == "http://ollama:11434/v1/embeddings"
+        assert provider.dimension == 768
+        assert provider.provider_name == "local_endpoint"
+
+    @pytest.mark.asyncio
+    async def test_batches_and_preserves_order(self):
+        """Texts are sent in batches and results are ordered by index."""
+        provider = LocalEndpointEmbeddings(url="http://host:8080", batch_size=2)
+        provider._session = _session(
+            _response(payload=_openai_payload(2, reverse=True)),
+            _response(payload=_openai_payload(1)),
+        )
+
+        embeddings = await provider.get_embeddings(["a", "b", "c"])
+
+        assert embeddings == [[0.0] * 4, [1.0] * 4, [0.0] * 4]
+        assert provider._session.post.call_count == 2
+        first = provider._session.post.call_args_list[0]
+        assert first.kwargs["json"] == {"model": "nomic-embed-text", "input": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test_setup_probes_unknown_dimension(self):
+        """Unknown models learn their dimension from a probe request."""
+        provider = LocalEndpointEmbeddings(url="http://host:8080", model="custom")
+        provider._session = _session(_response(payload=_openai_payload(1, dim=5)))
+        assert provider.dimension == 0
+
+        await provider.async_setup()
+
+        assert provider.dimension == 5
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self):
+        """Non-200 answers raise EmbeddingError."""
+        provider = LocalEndpointEmbeddings(url="http://host:8080")
+        provider._session = _session(_response(status=404, text="model not found"))
+
+        with pytest.raises(EmbeddingError, match="404"):
+            await provider.get_embeddings(["a"])
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        """Closing releases the pooled session."""
+        provider = LocalEndpointEmbeddings(url="http://host:8080")
+        session = _session()
+        provider._session = session
+
+        await provider.async_close()
+
+        session.close.assert_awaited_once()
+        assert provider._session is None
+
+
+class TestLocalModelEmbeddings:
+    """Tests for the on-CPU model provider."""
+
+    @pytest.mark.asyncio
+    async def test_batched_inference_off_loop(self):
+        """All texts go to the encoder in one call on the worker thread."""
+        provider = LocalModelEmbeddings(batch_size=8)
+        encoder = _FakeEncoder()
+
+        with patch.object(LocalModelEmbeddings, "_load_encoder", return_value=encoder):
+            embeddings = await provider.get_embeddings(["a", "b"], task_type="X")
+            await provider.get_embeddings(["c"])
+
+        assert embeddings == [[0.0] * 3, [1.0] * 3]
+        assert encoder.calls == [(["a", "b"], 8), (["c"], 8)]
+        assert provider.dimension == 384
+        await provider.async_close()
+        assert provider._executor is None
+
+    @pytest.mark.asyncio
+    async def test_setup_learns_unknown_dimension(self):
+        """Models outside the known table probe their dimension once."""
+        provider = LocalModelEmbeddings(model="custom/model")
+
+        with patch.object(
+            LocalModelEmbeddings, "_load_encoder", return_value=_FakeEncoder(dim=7)
+        ):
+            await provider.async_setup()
+
+        assert provider.dimension == 7
+        await provider.async_close()
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_raises(self):
+        """Without fastembed the provider raises a clear EmbeddingError."""
+        provider = LocalModelEmbeddings()
+
+        with patch.dict("sys.modules", {"fastembed": None}):
+            with pytest.raises(EmbeddingError, match="fastembed"):
+                await provider.get_embeddings(["a"])
+        await provider.async_close()
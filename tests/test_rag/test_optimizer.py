@@ -28,6 +28,10 @@ def mock_store():
     store = MagicMock()
     store._conn = MagicMock()
     store._initialized = True
+    # Reads run on the DB worker; hand the mock connection to the callable
+    store.run_read = AsyncMock(
+        side_effect=lambda label, func, *args: func(store._conn, *args)
+    )
     store.get_session_chunk_stats = AsyncMock(
         return_value={
             "total_chunks": 25,
@@ -624,8 +628,8 @@ class TestGetSessionChunkGroups:
         assert groups == {"s1": 10, "s2": 5}
 
     async def test_handles_no_connection(self, optimizer, mock_store):
-        """Test handling when store connection is None."""
-        mock_store._conn = None
+        """Test handling when the store is closed."""
+        mock_store.run_read.side_effect = RuntimeError("DB worker not running")
 
         groups = await optimizer._get_session_chunk_groups()
         assert groups == {}
@@ -1,5 +1,7 @@
 """Tests for query engine."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,8 +13,10 @@ from custom_components.homeclaw.rag.query_engine import (
     MAX_CONTEXT_LENGTH,
     build_fts_query,
     merge_hybrid_results,
+    HYBRID_FUSION_RRF,
     HYBRID_VECTOR_WEIGHT,
     HYBRID_TEXT_WEIGHT,
+    RRF_K,
 )
 
 
@@ -482,6 +486,33 @@ class TestMergeHybridResults:
         # vector_score=1.0, text_score=0: final = 0.7 * 1.0 = 0.7
         assert abs(merged[0].distance - 0.3) < 0.01
 
+    def test_rrf_uses_ranks_not_scores(self):
+        """RRF ranks by position, ignoring the score scales of each search."""
+        vector = [
+            SearchResult(id="a", text="A", metadata={}, distance=0.10),
+            SearchResult(id="b", text="B", metadata={}, distance=0.11),
+        ]
+        keyword = [
+            SearchResult(id="b", text="B", metadata={}, distance=0.9),
+            SearchResult(id="c", text="C", metadata={}, distance=0.0),
+        ]
+
+        merged = merge_hybrid_results(vector, keyword, fusion=HYBRID_FUSION_RRF)
+
+        assert [r.id for r in merged] == ["b", "a", "c"]
+        # b: rank 2 by vector, rank 1 by keyword
+        expected = (RRF_K + 1) * (0.7 / (RRF_K + 2) + 0.3 / (RRF_K + 1))
+        assert merged[0].distance == pytest.approx(1.0 - expected)
+
+    def test_rrf_top_in_both_scores_one(self):
+        """A result ranked first by both searches gets a perfect score."""
+        vector = [SearchResult(id="a", text="A", metadata={}, distance=0.4)]
+        keyword = [SearchResult(id="a", text="A", metadata={}, distance=0.6)]
+
+        merged = merge_hybrid_results(vector, keyword, fusion=HYBRID_FUSION_RRF)
+
+        assert merged[0].distance == pytest.approx(0.0)
+
 
 class TestHybridSearch:
     """Tests for QueryEngine.hybrid_search method."""
@@ -615,3 +646,71 @@ class TestHybridSearch:
         # Should request 5 * 4 = 20 candidates from vector search
         call_args = mock_store.search.call_args
         assert call_args[1]["n_results"] == 20
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_runs_keyword_while_embedding(
+        self, query_engine, mock_store, mock_embedding_provider
+    ):
+        """The keyword search does not wait for the query embedding."""
+        started = []
+        release = asyncio.Event()
+
+        async def slow_embedding(texts):
+            started.append("embedding")
+            await release.wait()
+            return [[0.1] * 768]
+
+        async def keyword_search(**kwargs):
+            started.append("keyword")
+            release.set()
+            return []
+
+        mock_embedding_provider.get_embeddings = AsyncMock(side_effect=slow_embedding)
+        mock_store.keyword_search = AsyncMock(side_effect=keyword_search)
+
+        await asyncio.wait_for(query_engine.hybrid_search("bedroom light"), 1)
+
+        assert sorted(started) == ["embedding", "keyword"]
+        mock_store.search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_rrf_option(self, mock_store, mock_embedding_provider):
+        """The engine-level fusion option selects reciprocal rank fusion."""
+        engine = QueryEngine(
+            store=mock_store,
+            embedding_provider=mock_embedding_provider,
+            fusion=HYBRID_FUSION_RRF,
+        )
+        mock_store.search.return_value = [
+            SearchResult(id="a", text="A", metadata={}, distance=0.5)
+        ]
+        mock_store.keyword_search.return_value = [
+            SearchResult(id="a", text="A", metadata={}, distance=0.9)
+        ]
+
+        results = await engine.hybrid_search("a", top_k=5)
+
+        assert results[0].distance == pytest.approx(0.0)
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_rrf_min_similarity_on_vector_scores(
+        self, mock_store, mock_embedding_provider
+    ):
+        """With RRF the threshold filters raw vector similarity before fusing."""
+        engine = QueryEngine(
+            store=mock_store,
+            embedding_provider=mock_embedding_provider,
+            fusion=HYBRID_FUSION_RRF,
+        )
+        mock_store.search.return_value = [
+            SearchResult(id="close", text="Close", metadata={}, distance=0.2),
+            SearchResult(id="far", text="Far", metadata={}, distance=0.9),
+        ]
+        mock_store.keyword_search.return_value = [
+            SearchResult(id="kw", text="Kw", metadata={}, distance=0.5)
+        ]
+
+        results = await engine.hybrid_search("a", top_k=5, min_similarity=0.5)
+
+        # "far" ranks second (RRF score ~0.69) but its similarity is 0.1
+        assert [r.id for r in results] == ["close", "kw"]
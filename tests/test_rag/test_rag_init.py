@@ -1,9 +1,10 @@
 "Unit tests for the RAGManager facade."
 
+import asyncio
 import json
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 from homeassistant.core import HomeAssistant
 from custom_components.homeclaw.rag import RAGManager
@@ -51,6 +52,7 @@ def mock_dependencies():
         mock_store.async_shutdown = AsyncMock()
         mock_store.get_metadata = AsyncMock(return_value=None)
         mock_store.set_metadata = AsyncMock()
+        mock_store.get_reindex_checkpoint = AsyncMock(return_value=None)
         mock_store.get_cache_stats = AsyncMock(
             return_value={"entries": 0, "total_bytes": 0, "total_mb": 0}
         )
@@ -71,6 +73,7 @@ def mock_dependencies():
         mock_emb = MagicMock()
         mock_emb.provider_name = "test_provider"
         mock_emb.dimension = 1536
+        mock_emb.async_setup = AsyncMock()
         mock_create_emb.return_value = mock_emb
 
         # CachedEmbeddingProvider wrapper: return a mock that delegates provider_name/dimension
@@ -86,6 +89,7 @@ def mock_dependencies():
         mock_indexer.full_reindex = AsyncMock()
         mock_indexer.index_entity = AsyncMock()
         mock_indexer.remove_entity = AsyncMock()
+        mock_indexer.reembed_unhashed = AsyncMock(return_value=0)
 
         mock_query = mock_query_cls.return_value
         mock_query.search_entities = AsyncMock(return_value=[])
@@ -206,6 +210,80 @@ async def test_async_initialize_empty_store_reindex(hass, mock_dependencies):
     mock_dependencies["indexer"].full_reindex.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_async_initialize_resumes_interrupted_reindex(hass, mock_dependencies):
+    """An unfinished reindex checkpoint is resumed on start."""
+    mock_dependencies["store"].get_reindex_checkpoint.return_value = {
+        "signature": "test_provider:1536",
+        "written": 50,
+    }
+    rag = RAGManager(hass, {})
+
+    await rag.async_initialize()
+
+    mock_dependencies["indexer"].full_reindex.assert_called_once()
+    mock_dependencies["store"].clear_collection.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_initialize_reembeds_in_background(hass, mock_dependencies):
+    """Unhashed rows are re-embedded after init without blocking it."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _reembed():
+        started.set()
+        await release.wait()
+        return 0
+
+    mock_dependencies["indexer"].reembed_unhashed = AsyncMock(side_effect=_reembed)
+    rag = RAGManager(hass, {})
+
+    await rag.async_initialize()
+
+    assert rag.is_initialized
+    await asyncio.wait_for(started.wait(), 1)
+    release.set()
+    await hass.async_block_till_done()
+    mock_dependencies["indexer"].reembed_unhashed.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_initialize_reembed_failure_is_contained(hass, mock_dependencies):
+    """A failing background re-embed leaves RAG initialized."""
+    mock_dependencies["indexer"].reembed_unhashed = AsyncMock(
+        side_effect=RuntimeError("quota")
+    )
+    rag = RAGManager(hass, {})
+
+    await rag.async_initialize()
+    await hass.async_block_till_done()
+
+    assert rag.is_initialized
+
+
+@pytest.mark.asyncio
+async def test_async_shutdown_cancels_reembed(hass, mock_dependencies):
+    """Shutdown cancels a re-embed that is still running."""
+    cancelled = asyncio.Event()
+
+    async def _reembed():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_dependencies["indexer"].reembed_unhashed = AsyncMock(side_effect=_reembed)
+    rag = RAGManager(hass, {})
+    await rag.async_initialize()
+    await asyncio.sleep(0)
+
+    await rag.async_shutdown()
+
+    assert cancelled.is_set()
+
+
 @pytest.mark.asyncio
 async def test_async_initialize_exception(hass, mock_dependencies):
     """Test exception during initialization is logged and raised."""
@@ -247,7 +325,11 @@ async def test_get_relevant_context_success(hass, mock_dependencies):
     assert isinstance(result["relevant_entities"], list)
     assert result["relevant_entities"][0]["entity_id"] == "light.living_room"
     mock_dependencies["query"].hybrid_search.assert_called_with(
-        query="turn on light", top_k=10, where=None, min_similarity=0.5
+        query="turn on light",
+        top_k=10,
+        where=None,
+        min_similarity=0.5,
+        query_embedding=ANY,
     )
     mock_dependencies["query"].build_compressed_context.assert_called_with(
         [mock_result]
@@ -317,6 +399,7 @@ async def test_get_relevant_context_with_intent(hass, mock_dependencies):
         top_k=10,
         where={"device_class": "temperature"},
         min_similarity=0.5,
+        query_embedding=ANY,
     )
 
 
@@ -394,6 +477,7 @@ async def test_get_relevant_context_domain_priority_over_device_class(
         top_k=10,
         where={"domain": "media_player", "area_name": "living_room"},
         min_similarity=0.5,
+        query_embedding=ANY,
     )
 
 
@@ -471,6 +555,7 @@ async def test_get_stats(hass, mock_dependencies):
     assert stats["embedding_provider"] == "test_provider"
     assert stats["embedding_dimension"] == 1536
     assert stats["learned_categories"] == 1  # mocked dict has 1 item
+    assert stats["token_accounting"]["tokenizer"] in ("heuristic", "o200k_base")
     # Cache stats may or may not be present depending on provider type
     # (CachedEmbeddingProvider is mocked, isinstance check may not match)
 
@@ -0,0 +1,30 @@
+"""Tests for the embedding token-bucket rate limiter."""
+
+import time
+
+import pytest
+
+from custom_components.homeclaw.rag._rate_limit import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_then_rate():
+    """A full bucket serves its burst immediately, then refills at ``rate``."""
+    bucket = TokenBucket(rate=50.0, capacity=2.0)
+
+    assert await bucket.acquire() == pytest.approx(0.0, abs=0.01)
+    assert await bucket.acquire() == pytest.approx(0.0, abs=0.01)
+    waited = await bucket.acquire()
+    assert waited == pytest.approx(0.02, abs=0.015)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_callers():
+    """pause() holds every caller until the delay has elapsed."""
+    bucket = TokenBucket(rate=1000.0, capacity=5.0)
+    bucket.pause(0.05)
+
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.045
+    assert bucket.get_stats()["pauses"] == 1
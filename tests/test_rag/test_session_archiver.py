@@ -59,9 +59,11 @@ def _make_store(sessions: dict[str, list[dict]] | None = None):
         }
     )
 
-    # Simulate _conn for direct SQL queries
+    # Reads run on the DB worker; hand a mock connection to the callable
     mock_conn = MagicMock()
-    store._conn = mock_conn
+    store.run_read = AsyncMock(
+        side_effect=lambda label, func, *args: func(mock_conn, *args)
+    )
 
     # Cursor that responds to different queries
     mock_cursor = MagicMock()
@@ -328,7 +330,7 @@ class TestFindOldSessions:
     async def test_handles_db_error(self):
         """Returns empty dict on database error."""
         store = MagicMock()
-        store._conn = None
+        store.run_read = AsyncMock(side_effect=RuntimeError("DB error"))
 
         result = await _find_old_sessions(store, time.time())
         assert result == {}
@@ -369,7 +371,7 @@ class TestCollectChunks:
     async def test_handles_db_error(self):
         """Returns empty list on database error."""
         store = MagicMock()
-        store._conn = None
+        store.run_read = AsyncMock(side_effect=RuntimeError("DB error"))
 
         result = await _collect_chunks(store, {"s1": 2})
         assert result == []
@@ -39,9 +39,9 @@ class TestSessionIndexer:
     def mock_store(self):
         """Create a mock SqliteStore."""
         store = MagicMock()
-        store.get_session_hash = AsyncMock(return_value=None)
+        store.get_session_index_state = AsyncMock(return_value=None)
         store.delete_session_chunks = AsyncMock()
-        store.add_session_chunks = AsyncMock()
+        store.sync_session_chunks = AsyncMock(return_value=0)
         store.get_session_chunk_stats = AsyncMock(
             return_value={
                 "total_chunks": 0,
@@ -78,11 +78,12 @@ class TestSessionIndexer:
         result = await indexer.index_session("sess1", rounds, force=True)
 
         assert result == 1
-        mock_store.delete_session_chunks.assert_called_once_with("sess1")
-        mock_store.add_session_chunks.assert_called_once()
+        mock_store.sync_session_chunks.assert_called_once()
 
-        call_kwargs = mock_store.add_session_chunks.call_args.kwargs
+        call_kwargs = mock_store.sync_session_chunks.call_args.kwargs
         assert len(call_kwargs["ids"]) == 1
+        assert call_kwargs["live_ids"] == call_kwargs["ids"]
+        assert len(call_kwargs["round_hashes"]) == 1
         assert "Has 5 lights" not in call_kwargs["texts"][0]
         assert "What lights do I have?" in call_kwargs["texts"][0]
 
@@ -90,7 +91,7 @@ class TestSessionIndexer:
         """Session with 0 valid rounds is skipped."""
         result = await indexer.index_session("sess1", [])
         assert result == 0
-        mock_store.delete_session_chunks.assert_not_called()
+        mock_store.sync_session_chunks.assert_not_called()
 
     async def test_index_session_delta_threshold(
         self, indexer, mock_store, mock_provider
@@ -101,7 +102,7 @@ class TestSessionIndexer:
 
         result = await indexer.index_session("sess1", rounds)
         assert result == 0
-        mock_store.delete_session_chunks.assert_not_called()
+        mock_store.sync_session_chunks.assert_not_called()
 
     async def test_index_session_delta_exceeded(
         self, indexer, mock_store, mock_provider
@@ -138,11 +139,15 @@ class TestSessionIndexer:
         )
         expected_hash = _hash_text(full_text)
 
-        mock_store.get_session_hash.return_value = expected_hash
+        mock_store.get_session_index_state.return_value = {
+            "content_hash": expected_hash,
+            "round_count": 0,
+            "round_hashes": [],
+        }
 
         result = await indexer.index_session("sess1", rounds, force=False)
         assert result == 0
-        mock_store.delete_session_chunks.assert_not_called()
+        mock_store.sync_session_chunks.assert_not_called()
 
     async def test_index_session_embedding_failure(
         self, indexer, mock_store, mock_provider
@@ -153,7 +158,63 @@ class TestSessionIndexer:
 
         result = await indexer.index_session("sess1", rounds, force=True)
         assert result == 0
-        mock_store.delete_session_chunks.assert_not_called()
+        mock_store.sync_session_chunks.assert_not_called()
+
+    async def test_only_new_rounds_are_embedded(
+        self, indexer, mock_store, mock_provider
+    ):
+        """A second pass embeds the appended rounds only and drops removed ones."""
+        rounds = [
+            {"user_message": f"q{i}", "assistant_message": f"a{i}"} for i in range(4)
+        ]
+        mock_provider.get_embeddings.return_value = [[0.1, 0.2, 0.3]] * 4
+        await indexer.index_session("sess1", rounds)
+        first = mock_store.sync_session_chunks.call_args.kwargs
+
+        mock_store.get_session_index_state.return_value = {
+            "content_hash": first["content_hash"],
+            "round_count": 4,
+            "round_hashes": first["round_hashes"],
+        }
+        rounds[1] = {"user_message": "edited", "assistant_message": "a1"}
+        rounds += [
+            {"user_message": f"q{i}", "assistant_message": f"a{i}"} for i in (4, 5)
+        ]
+        mock_provider.get_embeddings.return_value = [[0.1, 0.2, 0.3]] * 3
+
+        result = await indexer.index_session("sess1", rounds)
+
+        assert result == 3
+        texts = mock_provider.get_embeddings.call_args[0][0]
+        assert [t.split("\n")[0] for t in texts] == [
+            "User: edited",
+            "User: q4",
+            "User: q5",
+        ]
+        second = mock_store.sync_session_chunks.call_args.kwargs
+        assert len(second["live_ids"]) == 6
+        assert second["live_ids"][0] == first["live_ids"][0]
+        assert second["live_ids"][1] != first["live_ids"][1]
+        assert [m["round_index"] for m in second["metadatas"]] == [1, 4, 5]
+
+    async def test_delta_state_survives_restart(
+        self, indexer, mock_store, mock_provider
+    ):
+        """The round count is seeded from the persisted session state."""
+        mock_store.get_session_index_state.return_value = {
+            "content_hash": "old",
+            "round_count": 3,
+            "round_hashes": [],
+        }
+        rounds = [
+            {"user_message": f"q{i}", "assistant_message": f"a{i}"} for i in range(4)
+        ]
+
+        result = await indexer.index_session("sess1", rounds)
+
+        assert result == 0
+        assert indexer._delta_tracker["sess1"] == 3
+        mock_provider.get_embeddings.assert_not_called()
 
     async def test_remove_session(self, indexer, mock_store):
         """Test removing session from index."""
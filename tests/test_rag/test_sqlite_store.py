@@ -566,6 +566,48 @@ async def test_fts5_sync_on_upsert(tmp_path):
     await store.async_shutdown()
 
 
+@pytest.mark.asyncio
+async def test_update_documents_text_keeps_embedding(tmp_path):
+    """Text-only updates refresh FTS and the index but not the vector."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.upsert_documents(
+        ["light.test"],
+        ["Desk Lamp light on"],
+        [[1.0, 0.0]],
+        [{"domain": "light", "state": "on"}],
+        embed_hashes=["h1"],
+    )
+    # Warm the resident index so it has to follow the update
+    await store.search([1.0, 0.0], n_results=1)
+
+    updated = await store.update_documents_text(
+        ["light.test", "light.missing"],
+        ["Desk Lamp light off", "Nothing"],
+        [{"domain": "light", "state": "off"}, {}],
+    )
+
+    assert updated == 1
+    assert await store.get_embed_hashes(["light.test", "light.missing"]) == {
+        "light.test": "h1"
+    }
+    doc = await store.get_document("light.test")
+    assert doc.text == "Desk Lamp light off"
+    assert doc.metadata["state"] == "off"
+
+    results = await store.search([1.0, 0.0], n_results=1)
+    assert results[0].text == "Desk Lamp light off"
+    assert results[0].distance == pytest.approx(0.0)
+
+    fts_table = DEFAULT_TABLE_NAME + FTS_TABLE_SUFFIX
+    cursor = store._conn.cursor()
+    cursor.execute(f"SELECT text FROM {fts_table} WHERE entity_id = ?", ("light.test",))
+    assert [row["text"] for row in cursor.fetchall()] == ["Desk Lamp light off"]
+
+    await store.async_shutdown()
+
+
 @pytest.mark.asyncio
 async def test_fts5_sync_on_delete(tmp_path):
     """Test FTS5 data is removed when deleting documents."""
@@ -657,6 +699,43 @@ async def test_keyword_search_exact_match(tmp_path):
     await store.async_shutdown()
 
 
+@pytest.mark.asyncio
+async def test_keyword_search_joins_metadata(tmp_path):
+    """Metadata comes from a single joined query, not a lookup per hit."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.add_documents(
+        ["light.a", "light.b"],
+        ["Porch Lamp", "Porch Spot"],
+        [[1.0, 0.0], [0.0, 1.0]],
+        [{"domain": "light", "area_name": "Porch"}, {"domain": "light"}],
+    )
+
+    statements = []
+    original = store.run_read
+
+    async def traced_run_read(label, fn, *args):
+        def _traced(c, *a):
+            c.set_trace_callback(statements.append)
+            try:
+                return fn(c, *a)
+            finally:
+                c.set_trace_callback(None)
+
+        return await original(label, _traced, *args)
+
+    store.run_read = traced_run_read
+    results = await store.keyword_search('"porch"', n_results=5)
+
+    assert {r.id for r in results} == {"light.a", "light.b"}
+    assert {r.id: r.metadata.get("area_name") for r in results}["light.a"] == "Porch"
+    # No per-hit metadata lookup against the entity table
+    assert not [sql for sql in statements if "FROM ha_entities WHERE id" in sql]
+    assert len([sql for sql in statements if "MATCH" in sql]) == 1
+
+    await store.async_shutdown()
+
+
 @pytest.mark.asyncio
 async def test_keyword_search_multi_token(tmp_path):
     """Test FTS5 keyword search with multiple AND tokens."""
@@ -1123,6 +1202,124 @@ async def test_delete_session_chunks(tmp_path):
     await store.async_shutdown()
 
 
+@pytest.mark.asyncio
+async def test_sync_session_chunks_applies_delta(tmp_path):
+    """sync_session_chunks upserts changed chunks and drops stale ones."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.sync_session_chunks(
+        "sess1",
+        ids=["r0", "r1"],
+        texts=["round zero", "round one"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0]],
+        metadatas=[{"timestamp": "2024-03-01T10:00:00"}] * 2,
+        live_ids=["r0", "r1"],
+        content_hash="h1",
+        round_hashes=["a", "b"],
+    )
+    # Warm the resident index so it has to follow the delta
+    await store.search_session_chunks([0.0, 1.0], n_results=5)
+
+    removed = await store.sync_session_chunks(
+        "sess1",
+        ids=["r1b", "r2"],
+        texts=["round one edited", "round two"],
+        embeddings=[[0.0, 1.0], [0.6, 0.8]],
+        metadatas=[{"timestamp": "2024-03-02T10:00:00"}] * 2,
+        live_ids=["r0", "r1b", "r2"],
+        content_hash="h2",
+        round_hashes=["a", "c", "d"],
+    )
+
+    assert removed == 1
+    cursor = store._conn.cursor()
+    cursor.execute("SELECT id FROM session_chunks ORDER BY id")
+    assert [row["id"] for row in cursor.fetchall()] == ["r0", "r1b", "r2"]
+    cursor.execute("SELECT COUNT(*) FROM session_chunks_fts WHERE chunk_id = 'r1'")
+    assert cursor.fetchone()[0] == 0
+
+    hits = await store.search_session_chunks([0.0, 1.0], n_results=5)
+    assert "r1" not in {hit.id for hit in hits}
+    assert hits[0].id == "r1b"
+
+    state = await store.get_session_index_state("sess1")
+    assert state == {"content_hash": "h2", "round_count": 3, "round_hashes": ["a", "c", "d"]}
+    assert await store.get_session_index_state("other") is None
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shadow_reindex_swaps_atomically(tmp_path):
+    """The live table serves until the shadow table is swapped in."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.add_documents(
+        ["light.old", "light.new_entity"],
+        ["Old Lamp", "Added During Reindex"],
+        [[1.0, 0.0], [0.0, 1.0]],
+        [{"domain": "light"}, {"domain": "light"}],
+        embed_hashes=["h-old", "h-new"],
+    )
+
+    assert await store.begin_shadow_reindex("prov:2") == {}
+    written = await store.write_shadow_documents(
+        ["light.kitchen", "light.gone"],
+        ["Kitchen Lamp", "Removed Lamp"],
+        [[0.6, 0.8], [1.0, 0.0]],
+        [{"domain": "light", "area_name": "Kitchen"}, {"domain": "light"}],
+        ["h1", "h2"],
+    )
+    assert written == 2
+    assert (await store.get_reindex_checkpoint())["written"] == 2
+
+    # Live table untouched while the reindex runs
+    results = await store.search([1.0, 0.0], n_results=5)
+    assert {r.id for r in results} == {"light.old", "light.new_entity"}
+
+    count = await store.swap_shadow_table(["light.kitchen", "light.new_entity"])
+
+    assert count == 2
+    assert await store.get_reindex_checkpoint() is None
+    results = await store.search([0.6, 0.8], n_results=5)
+    assert [r.id for r in results][0] == "light.kitchen"
+    assert {r.id for r in results} == {"light.kitchen", "light.new_entity"}
+    # Carried-over rows lose their hash so the next update re-embeds them
+    assert await store.get_embed_hashes(["light.kitchen", "light.new_entity"]) == {
+        "light.kitchen": "h1"
+    }
+    hits = await store.keyword_search('"kitchen"', n_results=5)
+    assert [hit.id for hit in hits] == ["light.kitchen"]
+    assert await store.keyword_search('"removed"', n_results=5) == []
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shadow_reindex_resume(tmp_path):
+    """A checkpoint survives a restart and is resumed for the same signature."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.begin_shadow_reindex("prov:2")
+    await store.write_shadow_documents(
+        ["light.a"], ["A"], [[1.0, 0.0]], [{}], ["ha"]
+    )
+    await store.async_shutdown()
+
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    assert (await store.get_reindex_checkpoint())["signature"] == "prov:2"
+    assert await store.begin_shadow_reindex("prov:2") == {"light.a": "ha"}
+
+    # A different provider starts over
+    assert await store.begin_shadow_reindex("other:3") == {}
+    assert (await store.get_reindex_checkpoint())["written"] == 0
+
+    await store.async_shutdown()
+
+
 @pytest.mark.asyncio
 async def test_get_session_hash(tmp_path):
     """Test retrieving stored session content hash."""
@@ -1361,3 +1558,433 @@ async def test_default_table_name_is_valid(tmp_path):
     assert store._initialized is True
     assert store.table_name == DEFAULT_TABLE_NAME
     await store.async_shutdown()
+
+
+# --- Resident vector index ---
+
+
+def _brute_force_ids(query, docs, n):
+    """Reference ranking using the pure-Python cosine distance."""
+    ranked = sorted(docs, key=lambda d: _cosine_distance(query, d[1]))
+    return [doc_id for doc_id, _ in ranked[:n]]
+
+
+@pytest.mark.asyncio
+async def test_vector_index_matches_brute_force(tmp_path):
+    """Top-k from the index matches an exhaustive cosine scan."""
+    import random
+
+    rng = random.Random(42)
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    docs = [(f"e{i}", [rng.uniform(-1, 1) for _ in range(16)]) for i in range(300)]
+    await store.add_documents(
+        [d[0] for d in docs],
+        [d[0] for d in docs],
+        [d[1] for d in docs],
+    )
+
+    query = [rng.uniform(-1, 1) for _ in range(16)]
+    results = await store.search(query, n_results=10)
+
+    assert [r.id for r in results] == _brute_force_ids(query, docs, 10)
+    expected = _cosine_distance(query, docs[int(results[0].id[1:])][1])
+    assert results[0].distance == pytest.approx(expected, abs=1e-5)
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_vector_index_stays_in_sync(tmp_path):
+    """Writes after the index is built are reflected in subsequent searches."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.add_documents(
+        ["a", "b"], ["a", "b"], [[1.0, 0.0], [0.0, 1.0]], [{"domain": "light"}] * 2
+    )
+    assert (await store.search([1.0, 0.0], n_results=1))[0].id == "a"
+    assert store._vector_index is not None
+
+    # Upsert moves "b" onto the query direction
+    await store.upsert_documents(["b"], ["b2"], [[1.0, 0.01]], [{"domain": "switch"}])
+    results = await store.search([1.0, 0.01], n_results=1)
+    assert results[0].id == "b"
+    assert results[0].text == "b2"
+    assert results[0].metadata == {"domain": "switch"}
+
+    # Delete swaps rows internally -- remaining docs must still resolve
+    await store.add_documents(["c"], ["c"], [[0.0, -1.0]], [{"domain": "light"}])
+    await store.delete_documents(["a"])
+    results = await store.search([0.0, -1.0], n_results=5, where={"domain": "light"})
+    assert [r.id for r in results] == ["c"]
+
+    await store.clear_collection()
+    assert await store.search([1.0, 0.0]) == []
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_vector_index_dimension_mismatch(tmp_path):
+    """Vectors of a different dimension score as dissimilar, like cosine_similarity."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.add_documents(
+        ["two", "three"], ["two", "three"], [[1.0, 0.0], [1.0, 0.0, 0.0]]
+    )
+
+    results = await store.search([1.0, 0.0, 0.0], n_results=2)
+    assert [r.id for r in results] == ["three", "two"]
+    assert results[0].distance == pytest.approx(0.0, abs=1e-6)
+    assert results[1].distance == pytest.approx(1.0)
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_vector_index_metadata_is_copied(tmp_path):
+    """Mutating returned metadata must not corrupt the resident index."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.add_documents(["a"], ["a"], [[1.0, 0.0]], [{"domain": "light"}])
+
+    results = await store.search([1.0, 0.0])
+    results[0].metadata["domain"] = "mutated"
+
+    results = await store.search([1.0, 0.0], where={"domain": "light"})
+    assert len(results) == 1
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_vector_index_pure_python_fallback(tmp_path, monkeypatch):
+    """Without NumPy the index falls back to pre-normalized Python lists."""
+    from custom_components.homeclaw.rag import _vector_index
+
+    monkeypatch.setattr(_vector_index, "np", None)
+    assert _vector_index.numpy_available() is False
+
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.add_documents(
+        ["1", "2", "3"],
+        ["apple", "banana", "cherry"],
+        [[1.0, 0.0], [0.0, 1.0], [0.707, 0.707]],
+        [{"type": "fruit"}, {"type": "fruit"}, {"type": "berry"}],
+    )
+
+    results = await store.search([1.0, 0.0], n_results=3, min_similarity=0.5)
+    assert [r.id for r in results] == ["1", "3"]
+    assert results[0].distance == pytest.approx(0.0)
+
+    await store.delete_documents(["1"])
+    results = await store.search([1.0, 0.0], n_results=3, where={"type": "fruit"})
+    assert [r.id for r in results] == ["2"]
+
+    await store.async_shutdown()
+
+
+# --- Month-partitioned session chunk index ---
+
+
+async def _add_dated_chunks(store, session_id, chunks):
+    """Add (id, embedding, timestamp) chunks for one session."""
+    await store.add_session_chunks(
+        ids=[c[0] for c in chunks],
+        texts=[f"text {c[0]}" for c in chunks],
+        embeddings=[c[1] for c in chunks],
+        metadatas=[{"timestamp": c[2], "start_msg": i} for i, c in enumerate(chunks)],
+        session_id=session_id,
+        content_hash=f"h-{session_id}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_index_matches_brute_force(tmp_path):
+    """Top-k over all partitions matches an exhaustive cosine scan."""
+    import random
+
+    rng = random.Random(7)
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    docs = [(f"s{i}", [rng.uniform(-1, 1) for _ in range(8)]) for i in range(120)]
+    await _add_dated_chunks(
+        store,
+        "sess",
+        [(d[0], d[1], f"2024-{i % 12 + 1:02d}-10T12:00:00+00:00") for i, d in enumerate(docs)],
+    )
+
+    query = [rng.uniform(-1, 1) for _ in range(8)]
+    results = await store.search_session_chunks(query, n_results=7)
+
+    assert [r.id for r in results] == _brute_force_ids(query, docs, 7)
+    assert results[0].text == f"text {results[0].id}"
+    assert results[0].metadata["session_id"] == "sess"
+    assert len(store._session_index.partition_keys) == 12
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_session_index_date_range_prunes_partitions(tmp_path, monkeypatch):
+    """Date-bounded searches only score the overlapping month partitions."""
+    from custom_components.homeclaw.rag._vector_index import VectorIndex
+
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await _add_dated_chunks(
+        store,
+        "sess",
+        [
+            ("jan", [1.0, 0.0], "2024-01-20T08:00:00+00:00"),
+            ("feb_early", [1.0, 0.1], "2024-02-01T08:00:00+00:00"),
+            ("feb_late", [1.0, 0.2], "2024-02-28T08:00:00+00:00"),
+            ("mar", [1.0, 0.3], "2024-03-05T08:00:00+00:00"),
+            ("undated", [1.0, 0.0], ""),
+        ],
+    )
+    await store.search_session_chunks([1.0, 0.0])  # build the index
+
+    searched = []
+    original = VectorIndex.search
+
+    def _tracking_search(self, *args, **kwargs):
+        searched.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(VectorIndex, "search", _tracking_search)
+    results = await store.search_session_chunks(
+        [1.0, 0.0], n_results=10, start_date="2024-02-10", end_date="2024-02-29"
+    )
+
+    assert [r.id for r in results] == ["feb_late"]
+    partitions = store._session_index._partitions
+    assert partitions["2024-01"] not in searched
+    assert partitions["2024-03"] not in searched
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_session_index_stays_in_sync(tmp_path):
+    """Adds, re-dated chunks and deletes after the build are reflected."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await _add_dated_chunks(store, "s1", [("a", [1.0, 0.0], "2024-05-01T00:00:00Z")])
+    await _add_dated_chunks(store, "s2", [("b", [0.0, 1.0], "2024-05-02T00:00:00Z")])
+    assert [r.id for r in await store.search_session_chunks([1.0, 0.0], n_results=1)] == ["a"]
+
+    # Re-indexing moves "a" to another month and another session
+    await store.delete_session_chunks("s1")
+    await _add_dated_chunks(store, "s3", [("a", [1.0, 0.0], "2024-06-01T00:00:00Z")])
+    results = await store.search_session_chunks([1.0, 0.0], n_results=5, end_date="2024-05-31")
+    assert [r.id for r in results] == ["b"]
+    results = await store.search_session_chunks([1.0, 0.0], n_results=1)
+    assert results[0].metadata["session_id"] == "s3"
+
+    await store.delete_session_chunks("s2")
+    await store.delete_session_chunks("s3")
+    assert await store.search_session_chunks([1.0, 0.0]) == []
+    assert store._session_index.partition_keys == []
+
+    await store.async_shutdown()
+
+
+# --- Quantized embedding storage ---
+
+
+def test_quantized_blob_roundtrip():
+    """float16 / int8 blobs are self-describing and decode approximately."""
+    from custom_components.homeclaw.rag._quantize import blob_format
+    from custom_components.homeclaw.rag._store_utils import (
+        blob_to_embedding,
+        embedding_to_blob,
+    )
+
+    vector = [0.5, -0.25, 0.125, -1.0, 0.0, 0.75]
+    for fmt, size, tolerance in (
+        ("float32", 24, 1e-7),
+        ("float16", 4 + 12, 1e-3),
+        ("int8", 8 + 6, 1.0 / 127),
+    ):
+        blob = embedding_to_blob(vector, fmt)
+        assert len(blob) == size
+        assert blob_format(blob) == fmt
+        assert blob_to_embedding(blob) == pytest.approx(vector, abs=tolerance)
+
+    # Legacy raw float32 blobs (including all-zero ones) keep decoding
+    assert blob_format(bytes(16)) == "float32"
+    assert blob_to_embedding(bytes(8)) == [0.0, 0.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("fmt", "rescored"), [("int8", False), ("float16", True)])
+async def test_quantized_store_search(tmp_path, fmt, rescored):
+    """Quantized stores keep smaller blobs and rank like a float scan.
+
+    Only float16 hits are rescored: int8 blobs hold the index's own codes.
+    """
+    import random
+
+    rng = random.Random(3)
+    store = SqliteStore(persist_directory=str(tmp_path), embedding_format=fmt)
+    await store.async_initialize()
+
+    docs = [(f"e{i}", [rng.uniform(-1, 1) for _ in range(64)]) for i in range(200)]
+    await store.add_documents([d[0] for d in docs], [d[0] for d in docs], [d[1] for d in docs])
+    await _add_dated_chunks(
+        store, "sess", [(d[0], d[1], "2024-01-01T00:00:00Z") for d in docs[:50]]
+    )
+
+    blob_size = store._conn.execute(
+        f"SELECT LENGTH(embedding) FROM {DEFAULT_TABLE_NAME} LIMIT 1"
+    ).fetchone()[0]
+    assert blob_size == (8 + 64 if fmt == "int8" else 4 + 128)
+
+    labels: list[str] = []
+    run_read = store.run_read
+
+    async def _spy(label, func, *args):
+        labels.append(label)
+        return await run_read(label, func, *args)
+
+    store.run_read = _spy
+
+    query = docs[17][1]
+    results = await store.search(query, n_results=5)
+    assert results[0].id == "e17"
+    assert results[0].distance == pytest.approx(0.0, abs=1e-3)
+    assert store._vector_index.quantized
+    assert store._vector_index.nbytes < 256 * 64 * 4 / 3
+    assert ("search_rescore" in labels) is rescored
+
+    results = await store.search_session_chunks(query, n_results=3, min_similarity=0.99)
+    assert [r.id for r in results] == ["e17"]
+    assert results[0].text == "text e17"
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_get_unhashed_ids(tmp_path):
+    """Rows written without an embed hash are reported for re-embedding."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.add_documents(["a", "b"], ["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+    await store.upsert_documents(["b"], ["b"], [[0.0, 1.0]], embed_hashes=["h"])
+
+    assert await store.get_unhashed_ids() == ["a"]
+    assert await store.get_embed_hashes(["a", "b"]) == {"b": "h"}
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_embedding_format_migration(tmp_path):
+    """Changing the format converts every embedding table and records a marker."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    await store.add_documents(["a", "b"], ["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+    await _add_dated_chunks(store, "s", [("c", [0.6, 0.8], "2024-01-01T00:00:00Z")])
+    await store.async_cache_upsert("p", "m", [("h", [0.3, 0.4])])
+    assert await store.get_metadata("embedding_format") == "float32"
+    await store.async_shutdown()
+
+    store = SqliteStore(persist_directory=str(tmp_path), embedding_format="int8")
+    await store.async_initialize()
+    for table in (DEFAULT_TABLE_NAME, "session_chunks", "embedding_cache"):
+        headers = store._conn.execute(
+            f"SELECT DISTINCT substr(embedding, 1, 4) FROM {table}"
+        ).fetchall()
+        assert [row[0] for row in headers] == [b"q8\xc0\x7f"], table
+    assert await store.get_metadata("embedding_format") == "int8"
+    assert (await store.search([1.0, 0.1], n_results=1))[0].id == "a"
+    assert (await store.async_cache_lookup("p", "m", ["h"]))["h"] == pytest.approx(
+        [0.3, 0.4], abs=0.01
+    )
+    await store.async_shutdown()
+
+    # Back to float32: blobs decode to the quantized values, no header left
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+    size = store._conn.execute(
+        "SELECT LENGTH(embedding) FROM session_chunks WHERE id = 'c'"
+    ).fetchone()[0]
+    assert size == 8
+    results = await store.search_session_chunks([0.6, 0.8])
+    assert results[0].distance == pytest.approx(0.0, abs=1e-3)
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_invalid_embedding_format_raises(tmp_path):
+    """Unknown embedding formats are rejected at initialization."""
+    store = SqliteStore(persist_directory=str(tmp_path), embedding_format="int4")
+    with pytest.raises(ValueError, match="Invalid embedding format"):
+        await store.async_initialize()
+
+
+@pytest.mark.asyncio
+async def test_db_worker_enables_wal_and_records_metrics(tmp_path):
+    """The store runs in WAL mode and tracks per-operation latency."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await store.add_documents(["1"], ["text"], [[1.0, 0.0]], [{}])
+    assert await store.get_document_count() == 1
+
+    metrics = store.get_db_metrics()
+    assert metrics["journal_mode"] == "wal"
+    assert metrics["pending_writes"] == 0
+    assert metrics["pending_reads"] == 0
+    assert metrics["operations"]["add_documents"]["count"] == 1
+    assert metrics["operations"]["get_document_count"]["count"] >= 1
+    assert metrics["read_connections_open"] >= 1
+
+    await store.async_shutdown()
+    assert store.get_db_metrics() == {}
+
+
+@pytest.mark.asyncio
+async def test_db_worker_rolls_back_failed_write(tmp_path):
+    """A write job that raises leaves no partial changes behind."""
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    def _failing(conn):
+        conn.execute(
+            "INSERT INTO rag_metadata (key, value, updated_at) VALUES ('k', 'v', 0)"
+        )
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await store.run_write("failing", _failing)
+
+    assert await store.get_metadata("k") is None
+    assert store.get_db_metrics()["operations"]["failing"]["errors"] == 1
+
+    await store.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_db_worker_concurrent_reads_see_committed_writes(tmp_path):
+    """Pooled readers run concurrently and observe every committed write."""
+    import asyncio
+
+    store = SqliteStore(persist_directory=str(tmp_path))
+    await store.async_initialize()
+
+    await asyncio.gather(
+        *(
+            store.add_documents([str(i)], [f"t{i}"], [[float(i), 1.0]], [{}])
+            for i in range(10)
+        )
+    )
+    counts = await asyncio.gather(*(store.get_document_count() for _ in range(8)))
+    assert counts == [10] * 8
+
+    await store.async_shutdown()
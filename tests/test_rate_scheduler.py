@@ -0,0 +1,168 @@
+"""Tests for per-credential request scheduling."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.homeclaw.rate_scheduler import (
+    AccountLimiter,
+    Priority,
+    get_account_limiter,
+    parse_reset,
+    request_priority,
+)
+
+
+async def _request(
+    limiter: AccountLimiter,
+    order: list[str],
+    label: str,
+    priority: Priority = Priority.INTERACTIVE,
+    source: str = "chat",
+) -> None:
+    with request_priority(priority, source):
+        await limiter.acquire()
+    order.append(label)
+
+
+def test_parse_reset_durations():
+    assert parse_reset("1s") == 1.0
+    assert parse_reset("20ms") == 0.02
+    assert parse_reset("1m30.5s") == 90.5
+    assert parse_reset("6m0s") == 360.0
+
+
+def test_parse_reset_timestamp_and_invalid():
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_reset(reset_at.isoformat().replace("+00:00", "Z")) <= 30
+    assert parse_reset(None) is None
+    assert parse_reset("") is None
+    assert parse_reset("soon") is None
+
+
+def test_limiter_is_shared_per_host_and_credential():
+    hass = SimpleNamespace(data={})
+    chat = get_account_limiter(hass, "https://api.openai.com/v1/chat/completions", "sk-a")
+    embed = get_account_limiter(hass, "https://api.openai.com/v1/embeddings", "sk-a")
+    other = get_account_limiter(hass, "https://api.openai.com/v1/embeddings", "sk-b")
+    assert chat is embed
+    assert other is not chat
+    # The key itself is never stored
+    assert "sk-a" not in chat.name
+
+
+def test_limiter_is_per_model():
+    hass = SimpleNamespace(data={})
+    url = "https://api.openai.com/v1/chat/completions"
+    chat = get_account_limiter(hass, url, "sk-a", model="gpt-a")
+    assert get_account_limiter(hass, url, "sk-a", model="gpt-a") is chat
+    assert get_account_limiter(hass, url, "sk-a", model="gpt-b") is not chat
+    assert get_account_limiter(hass, url, "sk-a") is not chat
+    assert chat.name.endswith(":gpt-a")
+
+
+@pytest.mark.asyncio
+async def test_unlimited_account_does_not_wait():
+    limiter = AccountLimiter("test")
+    assert await limiter.acquire(10_000) == 0.0
+    assert limiter.get_stats()["granted"]["interactive"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_the_queue():
+    limiter = AccountLimiter("test", rpm=600)  # one request per 0.1s
+    limiter._requests.available = 0
+    order: list[str] = []
+
+    bulk = asyncio.create_task(
+        _request(limiter, order, "bulk", Priority.BULK, "rag_optimizer")
+    )
+    background = asyncio.create_task(
+        _request(limiter, order, "background", Priority.BACKGROUND, "heartbeat")
+    )
+    await asyncio.sleep(0)
+    chat = asyncio.create_task(_request(limiter, order, "chat"))
+
+    await asyncio.gather(bulk, background, chat)
+    assert order == ["chat", "background", "bulk"]
+
+
+@pytest.mark.asyncio
+async def test_sources_are_served_round_robin():
+    limiter = AccountLimiter("test", rpm=1200)
+    limiter._requests.available = 0
+    order: list[str] = []
+
+    tasks = [
+        asyncio.create_task(
+            _request(limiter, order, f"a{i}", Priority.BACKGROUND, "scheduler")
+        )
+        for i in range(3)
+    ]
+    tasks.append(
+        asyncio.create_task(
+            _request(limiter, order, "b0", Priority.BACKGROUND, "subagent")
+        )
+    )
+    await asyncio.gather(*tasks)
+    assert order == ["a0", "b0", "a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_all_requests():
+    limiter = AccountLimiter("test")
+    limiter.pause(0.1)
+    waited = await limiter.acquire()
+    assert waited >= 0.09
+    assert limiter.get_stats()["pauses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_learns_limits_from_headers():
+    limiter = AccountLimiter("test")
+    limiter.learn(
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29000",
+            "x-ratelimit-reset-tokens": "2s",
+        }
+    )
+    stats = limiter.get_stats()
+    assert stats["rpm"] == 500
+    assert stats["tpm"] == 30000
+
+
+@pytest.mark.asyncio
+async def test_configured_limits_win_and_exhausted_budget_waits_for_reset():
+    limiter = AccountLimiter("test", rpm=100)
+    limiter.learn(
+        {
+            "anthropic-ratelimit-requests-limit": "4000",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": (
+                datetime.now(timezone.utc) + timedelta(seconds=0.2)
+            ).isoformat(),
+        }
+    )
+    assert limiter.get_stats()["rpm"] == 100
+    assert await limiter.acquire() > 0.05
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_skipped():
+    limiter = AccountLimiter("test", rpm=600)
+    limiter._requests.available = 0
+    order: list[str] = []
+
+    cancelled = asyncio.create_task(_request(limiter, order, "cancelled"))
+    await asyncio.sleep(0)
+    served = asyncio.create_task(_request(limiter, order, "served"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await served
+    assert order == ["served"]
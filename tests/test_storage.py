@@ -44,6 +44,12 @@ class MockStore:
     async def async_save(self, data: dict[str, Any]) -> None:
         self._data = data
 
+    def async_delay_save(self, data_func: Any, delay: float = 0) -> None:
+        self._data = data_func()
+
+    async def async_remove(self) -> None:
+        self._data = None
+
 
 @pytest.fixture
 def mock_store_patch():
@@ -943,12 +949,15 @@ class TestSessionStoragePersistence:
     @pytest.mark.asyncio
     async def test_data_persists_across_instances(self, hass) -> None:
         """Test that data persists when creating new storage instances."""
-        # Shared store to simulate persistence
-        shared_store = MockStore(hass, STORAGE_VERSION, "shared")
+        # Stores keyed by storage key to simulate files persisting on disk
+        files: dict[str, MockStore] = {}
+
+        def open_store(hass, version, key):
+            return files.setdefault(key, MockStore(hass, version, key))
 
         with patch(
             "custom_components.homeclaw.storage.Store",
-            return_value=shared_store,
+            side_effect=open_store,
         ):
             # Create session with first instance
             storage1 = SessionStorage(hass, "persist_user")
@@ -977,6 +986,121 @@ class TestSessionStoragePersistence:
         assert messages[0].content == "Test persistence"
 
 
+class TestPerSessionMessageStorage:
+    """Tests for the v4 layout (index + one message store per session)."""
+
+    @staticmethod
+    def _keyed_stores():
+        files: dict[str, MockStore] = {}
+
+        def open_store(hass, version, key):
+            return files.setdefault(key, MockStore(hass, version, key))
+
+        return files, open_store
+
+    @pytest.mark.asyncio
+    async def test_v3_blob_split_into_session_stores(self, hass) -> None:
+        """Messages of a v3 document move into per-session stores."""
+        now = datetime.now(timezone.utc).isoformat()
+        files, open_store = self._keyed_stores()
+        index = open_store(hass, STORAGE_VERSION, "homeclaw_user_data_split_user")
+        index._data = {
+            "version": 3,
+            "sessions": [
+                {
+                    "session_id": "s1",
+                    "title": "Test",
+                    "created_at": now,
+                    "updated_at": now,
+                    "provider": "anthropic",
+                    "message_count": 1,
+                    "metadata": {},
+                }
+            ],
+            "messages": {
+                "s1": [
+                    {
+                        "message_id": "m1",
+                        "session_id": "s1",
+                        "role": "user",
+                        "content": "Hello",
+                        "timestamp": now,
+                        "content_blocks": [],
+                        "tool_call_id": "",
+                    }
+                ]
+            },
+        }
+
+        with patch(
+            "custom_components.homeclaw.storage.Store", side_effect=open_store
+        ):
+            storage = SessionStorage(hass, "split_user")
+            messages = await storage.get_session_messages("s1")
+
+        assert [m.content for m in messages] == ["Hello"]
+        assert index._data["version"] == DATA_VERSION
+        assert "messages" not in index._data
+        session_store = files["homeclaw_sessions/split_user/s1"]
+        assert session_store._data["messages"][0]["message_id"] == "m1"
+
+    @pytest.mark.asyncio
+    async def test_message_updates_only_touch_session_store(self, hass) -> None:
+        """Editing a message rewrites its session's store, not the index."""
+        files, open_store = self._keyed_stores()
+
+        with patch(
+            "custom_components.homeclaw.storage.Store", side_effect=open_store
+        ):
+            storage = SessionStorage(hass, "inc_user")
+            session = await storage.create_session(provider="anthropic")
+            await storage.add_message(
+                session.session_id,
+                Message(
+                    message_id="m1",
+                    session_id=session.session_id,
+                    role="assistant",
+                    content="",
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                    status="pending",
+                ),
+            )
+            index = files["homeclaw_user_data_inc_user"]
+            index.async_delay_save = MagicMock()
+
+            assert await storage.update_message(
+                session.session_id, "m1", content="Done", status="completed"
+            )
+
+        index.async_delay_save.assert_not_called()
+        stored = files[f"homeclaw_sessions/inc_user/{session.session_id}"]._data
+        assert stored["messages"][0]["content"] == "Done"
+
+    @pytest.mark.asyncio
+    async def test_delete_session_removes_message_store(self, hass) -> None:
+        """Deleting a session removes its message store."""
+        files, open_store = self._keyed_stores()
+
+        with patch(
+            "custom_components.homeclaw.storage.Store", side_effect=open_store
+        ):
+            storage = SessionStorage(hass, "del_user")
+            session = await storage.create_session(provider="anthropic")
+            await storage.add_message(
+                session.session_id,
+                Message(
+                    message_id="m1",
+                    session_id=session.session_id,
+                    role="user",
+                    content="Hi",
+                    timestamp=datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            await storage.delete_session(session.session_id)
+
+        assert files[f"homeclaw_sessions/del_user/{session.session_id}"]._data is None
+
+
 class TestSessionStorageClearAll:
     """Tests for clear all functionality."""
 